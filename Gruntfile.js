@@ -7,16 +7,42 @@ module.exports = function (grunt) {
     // Time how long tasks take
     require('time-grunt')(grunt);
 
+    // Architectures bundled by the release task, besides the complete library
+    var releaseArchs = ['aarch64', 'arm', 'mips', 'm68k', 'sparc', 'x86'];
+
+    // Build profile passed with --profile=<profile>, --profiling, and the
+    // heap sizes passed with --total-memory=<size> and --max-memory=<size>
+    var profileOption = function () {
+        var options = '';
+        if (grunt.option('profile')) {
+            options += ' --profile=' + grunt.option('profile');
+        }
+        if (grunt.option('profiling')) {
+            options += ' --profiling';
+        }
+        ['total-memory', 'max-memory'].forEach(function (name) {
+            if (grunt.option(name)) {
+                options += ' --' + name + '=' + grunt.option(name);
+            }
+        });
+        return options;
+    };
+
     // Project configuration
     grunt.initConfig({
         exec: {
             emscripten: {
                 cmd: function (arch) {
-                    if (typeof arch === 'undefined') {
-                        return 'python build.py build'
-                    } else {
-                        return 'python build.py build ' + arch;
+                    var cmd = 'python build.py build' + profileOption();
+                    if (typeof arch !== 'undefined') {
+                        cmd += ' ' + arch;
                     }
+                    return cmd;
+                }
+            },
+            release: {
+                cmd: function () {
+                    return 'python build.py release' + profileOption() + ' ' + releaseArchs.join(' ');
                 }
             }
         },
@@ -25,9 +51,16 @@ module.exports = function (grunt) {
                 src: [
                     'src/libunicorn<%= lib.suffix %>.out.js',
                     'src/unicorn-wrapper.js',
-                    'src/unicorn-constants.js',
+                    'src/unicorn-constants<%= lib.suffix %>.js',
                 ],
                 dest: 'dist/unicorn<%= lib.suffix %>.min.js'
+            },
+            loader: {
+                src: [
+                    'src/unicorn-loader.js',
+                    'src/unicorn-constants-core.js',
+                ],
+                dest: 'dist/unicorn-loader.min.js'
             }
         },
         connect: {
@@ -52,6 +85,7 @@ module.exports = function (grunt) {
                     'demos/*.css',
                     'demos/*.js',
                     'dist/*.js',
+                    'dist/*.wasm',
                 ],
                 options: {
                     livereload: '<%= connect.options.livereload %>'
@@ -63,24 +97,43 @@ module.exports = function (grunt) {
     // Project tasks
     grunt.registerTask('build', 'Build for specific architecture', function (arch) {
         if (typeof arch === 'undefined') {
-            grunt.config.set('lib.suffix', '');
             grunt.task.run('exec:emscripten');
-            grunt.task.run('concat');
+            grunt.task.run('bundle');
         } else {
-            grunt.config.set('lib.suffix', '-'+arch);
             grunt.task.run('exec:emscripten:'+arch);
-            grunt.task.run('concat');
+            grunt.task.run('bundle:'+arch);
         }
+        grunt.task.run('pool');
+        grunt.task.run('concat:loader');
     });
-    grunt.registerTask('release', [
-        'build',
-        'build:aarch64',
-        'build:arm',
-        'build:mips',
-        'build:m68k',
-        'build:sparc',
-        'build:x86',
-    ]);
+    grunt.registerTask('bundle', 'Bundle a compiled library for specific architecture', function (arch) {
+        if (typeof arch === 'undefined') {
+            grunt.config.set('lib.suffix', '');
+        } else {
+            grunt.config.set('lib.suffix', '-'+arch);
+        }
+        grunt.task.run('concat:dist');
+        grunt.task.run('wasm');
+    });
+    grunt.registerTask('wasm', 'Copy WebAssembly binary next to the bundle', function () {
+        var suffix = grunt.config.get('lib.suffix');
+        var src = 'src/libunicorn' + suffix + '.out.wasm';
+        var dest = 'dist/unicorn' + suffix + '.wasm';
+        if (grunt.file.exists(src)) {
+            grunt.file.copy(src, dest);
+        } else if (grunt.file.exists(dest)) {
+            grunt.file.delete(dest);
+        }
+    });
+    grunt.registerTask('pool', 'Copy the worker pool next to the bundles', function () {
+        grunt.file.copy('src/unicorn-pool.js', 'dist/unicorn-pool.js');
+    });
+    grunt.registerTask('release', ['exec:release', 'bundle'].concat(
+        releaseArchs.map(function (arch) {
+            return 'bundle:' + arch;
+        }),
+        ['pool', 'concat:loader']
+    ));
     grunt.registerTask('serve', [
         'connect',
         'watch',
@@ -0,0 +1,199 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Emulation throughput benchmarks for the dist/unicorn-<arch>.min.js bundles.
+ *
+ * Usage: node bench/run.js [--arch=x86,arm,...] [--runs=N] [--dist=dir] [--output=file.json]
+ */
+
+'use strict';
+
+var fs = require('fs');
+var path = require('path');
+var vm = require('vm');
+
+var workloads = require('./workloads.js');
+
+// Options
+var options = {
+    arch: Object.keys(workloads.archs).join(','),
+    runs: '5',
+    dist: path.join(__dirname, '..', 'dist'),
+    output: ''
+};
+process.argv.slice(2).forEach(function (arg) {
+    var match = /^--([a-z]+)=(.*)$/.exec(arg);
+    if (!match || !(match[1] in options)) {
+        console.error('Usage: node bench/run.js [--arch=x86,arm,...] [--runs=N] [--dist=dir] [--output=file.json]');
+        process.exit(1);
+    }
+    options[match[1]] = match[2];
+});
+var runs = Math.max(parseInt(options.runs, 10), 1);
+
+// Timing helpers
+function now() {
+    var t = process.hrtime();
+    return t[0] * 1e3 + t[1] / 1e6;
+}
+function median(values) {
+    var sorted = values.slice().sort(function (a, b) { return a - b; });
+    var mid = sorted.length >> 1;
+    return (sorted.length % 2) ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+function round(value) {
+    return Math.round(value * 1000) / 1000;
+}
+
+// Evaluate a bundle in its own context and return its `uc` object
+function loadBundle(file) {
+    var context = vm.createContext({
+        console: console,
+        process: process,
+        require: require,
+        setTimeout: setTimeout,
+        clearTimeout: clearTimeout
+    });
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, {filename: file});
+    return context.uc;
+}
+
+function hexToBytes(hex) {
+    hex = hex.replace(/\s+/g, '');
+    var bytes = new Uint8Array(hex.length / 2);
+    for (var i = 0; i < bytes.length; i++) {
+        bytes[i] = parseInt(hex.substr(2 * i, 2), 16);
+    }
+    return bytes;
+}
+
+/**
+ * Runs a workload on a fresh engine, optionally with a hook attached, or with
+ * an instruction trace buffer if hookType is 'trace'.
+ * The first run also translates the guest code, the remaining ones reuse the
+ * translated blocks. Returns the time of the first run, the median time of
+ * the others in milliseconds, and the number of hook calls per run.
+ */
+function runWorkload(uc, spec, workload, hookType) {
+    var mode = spec.mode.reduce(function (mode, name) { return mode | uc[name]; }, 0);
+    var e = new uc.Unicorn(uc[spec.arch], mode);
+    var code = hexToBytes(workload.code);
+    var end = workloads.CODE_ADDRESS + code.length;
+    e.mem_map(workloads.CODE_ADDRESS, workloads.CODE_SIZE, uc.PROT_ALL);
+    e.mem_map(workloads.DATA_ADDRESS, workloads.DATA_SIZE, uc.PROT_ALL);
+    e.mem_write(workloads.CODE_ADDRESS, code);
+
+    var calls = 0;
+    var hook = null;
+    if (hookType === 'trace') {
+        e.trace_start(uc.HOOK_CODE, function (records, count) { calls += count; });
+    } else if (typeof hookType !== 'undefined') {
+        hook = e.hook_add(hookType, function () { calls++; });
+    }
+    var times = [];
+    for (var i = 0; i <= runs; i++) {
+        Object.keys(workload.regs).forEach(function (name) {
+            e.reg_write_type(uc[name], spec.type, workload.regs[name]);
+        });
+        e.reg_write_type(uc[spec.counter], spec.type, workload.iterations);
+        var start = now();
+        e.emu_start(workloads.CODE_ADDRESS, end, 0, 0);
+        times.push(now() - start);
+    }
+    if (hook) {
+        e.hook_del(hook);
+    }
+    if (hookType === 'trace') {
+        e.trace_stop();
+    }
+    e.close();
+    return {first: times[0], time: median(times.slice(1)), calls: calls / (runs + 1)};
+}
+
+function benchArch(name, spec) {
+    var file = path.join(options.dist, 'unicorn-' + name + '.min.js');
+    if (!fs.existsSync(file)) {
+        console.error('Skipping ' + name + ': ' + file + ' not found');
+        return null;
+    }
+    var start = now();
+    var uc = loadBundle(file);
+    var result = {load_ms: round(now() - start)};
+
+    // Engine creation: the first uc_open after loading and subsequent ones
+    var mode = spec.mode.reduce(function (mode, name) { return mode | uc[name]; }, 0);
+    var opens = [];
+    for (var i = 0; i <= runs; i++) {
+        start = now();
+        var e = new uc.Unicorn(uc[spec.arch], mode);
+        opens.push(now() - start);
+        e.close();
+    }
+    result.open_cold_ms = round(opens[0]);
+    result.open_ms = round(median(opens.slice(1)));
+
+    // Let the JavaScript engine optimize the interpreter before measuring
+    Object.keys(spec.workloads).forEach(function (workloadName) {
+        runWorkload(uc, spec, spec.workloads[workloadName]);
+    });
+
+    result.workloads = {};
+    Object.keys(spec.workloads).forEach(function (workloadName) {
+        var workload = spec.workloads[workloadName];
+        var base = runWorkload(uc, spec, workload);
+        var code = runWorkload(uc, spec, workload, uc.HOOK_CODE);
+        var block = runWorkload(uc, spec, workload, uc.HOOK_BLOCK);
+        var mem = runWorkload(uc, spec, workload, uc.HOOK_MEM_READ | uc.HOOK_MEM_WRITE);
+        var time = base.time;
+        var hooks = {
+            code: {median_ms: round(code.time), overhead: round(code.time / time)},
+            block: {median_ms: round(block.time), overhead: round(block.time / time)},
+            mem: {median_ms: round(mem.time), overhead: round(mem.time / time)}
+        };
+        // Bundles built before the trace buffer was added lack trace_start
+        if (typeof uc.Unicorn.prototype.trace_start === 'function') {
+            var trace = runWorkload(uc, spec, workload, 'trace');
+            hooks.trace = {median_ms: round(trace.time), overhead: round(trace.time / time)};
+        }
+        result.workloads[workloadName] = {
+            iterations: workload.iterations,
+            instructions: code.calls,
+            blocks: block.calls,
+            memory_accesses: mem.calls,
+            first_ms: round(base.first),
+            median_ms: round(time),
+            instructions_per_second: Math.round(code.calls / time * 1e3),
+            blocks_per_second: Math.round(block.calls / time * 1e3),
+            hooks: hooks
+        };
+        console.error(name + '/' + workloadName + ': ' +
+            (code.calls / time / 1e3).toFixed(2) + ' MIPS, ' +
+            (block.calls / time / 1e3).toFixed(2) + ' M blocks/s, ' +
+            'hook overhead code x' + (code.time / time).toFixed(2) +
+            ', mem x' + (mem.time / time).toFixed(2));
+    });
+    return result;
+}
+
+var report = {
+    date: new Date().toISOString(),
+    node: process.version,
+    runs: runs,
+    archs: {}
+};
+options.arch.split(',').forEach(function (name) {
+    if (!(name in workloads.archs)) {
+        console.error('Unknown architecture: ' + name);
+        process.exit(1);
+    }
+    var result = benchArch(name, workloads.archs[name]);
+    if (result) {
+        report.archs[name] = result;
+    }
+});
+
+var json = JSON.stringify(report, null, 2);
+if (options.output) {
+    fs.writeFileSync(options.output, json + '\n');
+} else {
+    console.log(json);
+}
@@ -0,0 +1,265 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Guest workloads used by the benchmark suite.
+ *
+ * Every workload is a loop that runs from CODE_ADDRESS until the end of its
+ * code. The loop counter register is initialized to the number of iterations,
+ * the remaining registers are initialized from `regs`. Register and constant
+ * names are resolved against the `uc` object of the loaded bundle.
+ */
+
+'use strict';
+
+var CODE_ADDRESS = 0x10000;
+var CODE_SIZE    = 0x1000;
+var DATA_ADDRESS = 0x100000;
+var DATA_SIZE    = 0x200000;
+
+// Buffers used by the load/store workloads
+var SRC_ADDRESS   = 0x100000;
+var DST_ADDRESS   = 0x200000;
+var STACK_ADDRESS = 0x2ff000;
+
+module.exports = {
+    CODE_ADDRESS: CODE_ADDRESS,
+    CODE_SIZE: CODE_SIZE,
+    DATA_ADDRESS: DATA_ADDRESS,
+    DATA_SIZE: DATA_SIZE,
+
+    archs: {
+        aarch64: {
+            arch: 'ARCH_ARM64',
+            mode: ['MODE_ARM'],
+            type: 'i64',
+            counter: 'ARM64_REG_X1',
+            // Loops end with a nop: emulation does not stop when the `until`
+            // address directly follows a conditional branch.
+            workloads: {
+                // add x0, x0, x1; mul x2, x0, x3; eor x4, x4, x2
+                // sub x1, x1, #1; cbnz x1, loop; nop
+                arith: {
+                    code: '0000018b 027c039b 840002ca 210400d1 81ffffb5 1f2003d5',
+                    iterations: 200000,
+                    regs: {ARM64_REG_X3: 3}
+                },
+                // ldr x0, [x4], #8; str x0, [x5], #8
+                // sub x1, x1, #1; cbnz x1, loop; nop
+                memcpy: {
+                    code: '808440f8 a08400f8 210400d1 a1ffffb5 1f2003d5',
+                    iterations: 0x20000,
+                    regs: {ARM64_REG_X4: SRC_ADDRESS, ARM64_REG_X5: DST_ADDRESS}
+                },
+                // tbz w1, #0, even; add x0, x0, #3; b next
+                // even: sub x0, x0, #1
+                // next: sub x1, x1, #1; cbnz x1, loop; nop
+                branch: {
+                    code: '61000036 000c0091 02000014 000400d1 210400d1 61ffffb5 1f2003d5',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // Enable FP/SIMD in CPACR_EL1, then:
+                // fmov d1, #1.5
+                // loop: ucvtf d2, x1; fmul d3, d2, d1; fadd d4, d4, d3
+                // fsqrt d5, d4; udiv x6, x1, x7; sub x1, x1, #1; cbnz x1, loop
+                // nop
+                helper: {
+                    code: '401038d5 00046cb2 401018d5 01106f1e ' +
+                          '2200639e 4308611e 8428631e 85c0611e 2608c79a 210400d1 41ffffb5 1f2003d5',
+                    iterations: 100000,
+                    regs: {ARM64_REG_X7: 7}
+                }
+            }
+        },
+        arm: {
+            arch: 'ARCH_ARM',
+            mode: ['MODE_ARM'],
+            type: 'i32',
+            counter: 'ARM_REG_R1',
+            workloads: {
+                // add r0, r0, r1; mul r2, r0, r3; eor r4, r4, r2
+                // subs r1, r1, #1; bne loop
+                arith: {
+                    code: '010080e0 900302e0 024024e0 011051e2 faffff1a',
+                    iterations: 200000,
+                    regs: {ARM_REG_R3: 3}
+                },
+                // ldr r0, [r4], #4; str r0, [r5], #4
+                // subs r1, r1, #1; bne loop
+                memcpy: {
+                    code: '040094e4 040085e4 011051e2 fbffff1a',
+                    iterations: 0x40000,
+                    regs: {ARM_REG_R4: SRC_ADDRESS, ARM_REG_R5: DST_ADDRESS}
+                },
+                // tst r1, #1; beq even; add r0, r0, #3; b next
+                // even: sub r0, r0, #1
+                // next: subs r1, r1, #1; bne loop
+                branch: {
+                    code: '010011e3 0100000a 030080e2 000000ea 010040e2 011051e2 f8ffff1a',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // Enable VFP in CPACR and FPEXC, then:
+                // vmov.f64 d1, #1.5
+                // loop: vmov s0, r1; vcvt.f64.u32 d2, s0; vmul.f64 d3, d2, d1
+                // vadd.f64 d4, d4, d3; vsqrt.f64 d5, d4; subs r1, r1, #1; bne loop
+                helper: {
+                    code: '500f11ee 0f0680e3 500f01ee 0101a0e3 100ae8ee 081bb7ee ' +
+                          '101a00ee 402bb8ee 013b22ee 034b34ee c45bb1ee 011051e2 f8ffff1a',
+                    iterations: 100000,
+                    regs: {}
+                }
+            }
+        },
+        m68k: {
+            arch: 'ARCH_M68K',
+            mode: ['MODE_BIG_ENDIAN'],
+            type: 'i32',
+            counter: 'M68K_REG_D1',
+            workloads: {
+                // add.l d1, d0; move.l d0, d2; mulu.l d3, d2; eor.l d2, d4
+                // subq.l #1, d1; bne loop
+                arith: {
+                    code: 'd081 2400 4c03 2000 b584 5381 66f2',
+                    iterations: 200000,
+                    regs: {M68K_REG_D3: 3}
+                },
+                // move.l (a0)+, (a1)+; subq.l #1, d1; bne loop
+                memcpy: {
+                    code: '22d8 5381 66fa',
+                    iterations: 0x40000,
+                    regs: {M68K_REG_A0: SRC_ADDRESS, M68K_REG_A1: DST_ADDRESS}
+                },
+                // btst #0, d1; beq even; addq.l #3, d0; bra next
+                // even: subq.l #1, d0
+                // next: subq.l #1, d1; bne loop
+                branch: {
+                    code: '0801 0000 6704 5680 6002 5380 5381 66f0',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // move.l d1, d0; divu.l d3, d0; add.l d0, d4
+                // subq.l #1, d1; bne loop
+                helper: {
+                    code: '2001 4c43 0000 d880 5381 66f4',
+                    iterations: 100000,
+                    regs: {M68K_REG_D3: 7}
+                }
+            }
+        },
+        mips: {
+            arch: 'ARCH_MIPS',
+            mode: ['MODE_MIPS32', 'MODE_BIG_ENDIAN'],
+            type: 'i32',
+            counter: 'MIPS_REG_5',
+            workloads: {
+                // addu $2, $2, $5; mul $3, $2, $7; xor $8, $8, $3
+                // addiu $5, $5, -1; bnez $5, loop; nop
+                arith: {
+                    code: '00451021 70471802 01034026 24a5ffff 14a0fffb 00000000',
+                    iterations: 200000,
+                    regs: {MIPS_REG_7: 3}
+                },
+                // lw $2, 0($8); sw $2, 0($9); addiu $8, $8, 4
+                // addiu $5, $5, -1; bnez $5, loop; addiu $9, $9, 4
+                memcpy: {
+                    code: '8d020000 ad220000 25080004 24a5ffff 14a0fffb 25290004',
+                    iterations: 0x40000,
+                    regs: {MIPS_REG_8: SRC_ADDRESS, MIPS_REG_9: DST_ADDRESS}
+                },
+                // andi $3, $5, 1; beqz $3, even; nop; b next; addiu $2, $2, 3
+                // even: addiu $2, $2, -1
+                // next: addiu $5, $5, -1; bnez $5, loop; nop
+                branch: {
+                    code: '30a30001 10600003 00000000 10000002 24420003 2442ffff ' +
+                          '24a5ffff 14a0fff8 00000000',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // divu $zero, $5, $7; mflo $3; addu $8, $8, $3
+                // addiu $5, $5, -1; bnez $5, loop; nop
+                helper: {
+                    code: '00a7001b 00001812 01034021 24a5ffff 14a0fffb 00000000',
+                    iterations: 100000,
+                    regs: {MIPS_REG_7: 7}
+                }
+            }
+        },
+        sparc: {
+            arch: 'ARCH_SPARC',
+            mode: ['MODE_SPARC32', 'MODE_BIG_ENDIAN'],
+            type: 'i32',
+            counter: 'SPARC_REG_O1',
+            workloads: {
+                // add %o0, %o1, %o0; smul %o0, %o3, %o2; xor %o4, %o2, %o4
+                // subcc %o1, 1, %o1; bne loop; nop
+                arith: {
+                    code: '90020009 945a000b 981b000a 92a26001 12bffffc 01000000',
+                    iterations: 200000,
+                    regs: {SPARC_REG_O3: 3}
+                },
+                // ld [%o4], %o0; st %o0, [%o5]; add %o4, 4, %o4
+                // subcc %o1, 1, %o1; bne loop; add %o5, 4, %o5
+                memcpy: {
+                    code: 'd0030000 d0234000 98032004 92a26001 12bffffc 9a036004',
+                    iterations: 0x40000,
+                    regs: {SPARC_REG_O4: SRC_ADDRESS, SPARC_REG_O5: DST_ADDRESS}
+                },
+                // andcc %o1, 1, %g0; be even; nop; ba next; add %o0, 3, %o0
+                // even: sub %o0, 1, %o0
+                // next: subcc %o1, 1, %o1; bne loop; nop
+                branch: {
+                    code: '808a6001 02800004 01000000 10800003 90022003 90222001 ' +
+                          '92a26001 12bffff9 01000000',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // wr %g0, 0, %y; udiv %o1, %o3, %o2; add %o4, %o2, %o4
+                // subcc %o1, 1, %o1; bne loop; nop
+                helper: {
+                    code: '81802000 9472400b 9803000a 92a26001 12bffffc 01000000',
+                    iterations: 100000,
+                    regs: {SPARC_REG_O3: 7}
+                }
+            }
+        },
+        x86: {
+            arch: 'ARCH_X86',
+            mode: ['MODE_32'],
+            type: 'i32',
+            counter: 'X86_REG_ECX',
+            workloads: {
+                // add eax, ecx; imul edx, eax, 3; xor ebx, edx
+                // dec ecx; jnz loop
+                arith: {
+                    code: '01c8 6bd003 31d3 49 75f6',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // mov eax, [esi]; mov [edi], eax; add esi, 4; add edi, 4
+                // dec ecx; jnz loop
+                memcpy: {
+                    code: '8b06 8907 83c604 83c704 49 75f3',
+                    iterations: 0x40000,
+                    regs: {X86_REG_ESI: SRC_ADDRESS, X86_REG_EDI: DST_ADDRESS}
+                },
+                // test ecx, 1; jz even; add eax, 3; jmp next
+                // even: sub eax, 1
+                // next: dec ecx; jnz loop
+                branch: {
+                    code: 'f7c101000000 7405 83c003 eb03 83e801 49 75ed',
+                    iterations: 200000,
+                    regs: {}
+                },
+                // mov esi, SRC; mov edi, DST; push ecx; mov ecx, 64; rep movsd
+                // pop ecx; xor edx, edx; mov eax, ecx; div ebx
+                // dec ecx; jnz loop
+                helper: {
+                    code: 'be00001000 bf00002000 51 b940000000 f3a5 ' +
+                          '59 31d2 89c8 f7f3 49 75e4',
+                    iterations: 20000,
+                    regs: {X86_REG_EBX: 7, X86_REG_ESP: STACK_ADDRESS}
+                }
+            }
+        }
+    }
+};
@@ -4,10 +4,20 @@
 # This scripts compiles the original Unicorn framework to JavaScript
 
 import os
+import collections
+import contextlib
+import re
 import glob
+import gzip
+import hashlib
+import io
+import json
+import multiprocessing
 import shutil
 import stat
+import subprocess
 import sys
+import time
 
 EXPORTED_FUNCTIONS = [
     '_uc_version',
@@ -36,104 +46,384 @@ EXPORTED_FUNCTIONS = [
     '_uc_free',
     '_uc_context_save',
     '_uc_context_restore',
+    '_ucjs_trace_open',
+    '_ucjs_trace_close',
+    '_ucjs_coverage_open',
+    '_ucjs_coverage_close',
+    '_ucjs_coverage_reset',
+    '_ucjs_coverage_new_bits',
+    '_ucjs_snapshot_take',
+    '_ucjs_snapshot_restore',
+    '_ucjs_snapshot_mark',
+    '_ucjs_snapshot_dirty',
+    '_ucjs_snapshot_free',
+    '_ucjs_open',
+    '_ucjs_memory_usage_get',
+    '_ucjs_emu_counter',
+    '_ucjs_tb_flush',
 ]
 
-EXPORTED_CONSTANTS = [
-    'bindings/python/unicorn/arm64_const.py',
-    'bindings/python/unicorn/arm_const.py',
-    'bindings/python/unicorn/m68k_const.py',
-    'bindings/python/unicorn/mips_const.py',
-    'bindings/python/unicorn/sparc_const.py',
-    'bindings/python/unicorn/x86_const.py',
-    'bindings/python/unicorn/unicorn_const.py',
-    'bindings/python/unicorn/arm64_const.py',
+# Exported only by profiling builds
+PROFILING_EXPORTED_FUNCTIONS = [
+    '_ucjs_profile_get',
+    '_ucjs_profile_reset',
+    '_ucjs_profile_op_name',
+    '_ucjs_profile_helper_name',
+    '_ucjs_profile_offset',
 ]
 
+# Constants of the Python bindings, shared by all targets and of each target
+CORE_CONSTANTS = 'bindings/python/unicorn/unicorn_const.py'
+TARGET_CONSTANTS = collections.OrderedDict([
+    ('aarch64', 'bindings/python/unicorn/arm64_const.py'),
+    ('arm', 'bindings/python/unicorn/arm_const.py'),
+    ('m68k', 'bindings/python/unicorn/m68k_const.py'),
+    ('mips', 'bindings/python/unicorn/mips_const.py'),
+    ('sparc', 'bindings/python/unicorn/sparc_const.py'),
+    ('x86', 'bindings/python/unicorn/x86_const.py'),
+])
+
+# Runs of constants with consecutive values shorter than this are assigned
+# one by one, longer ones are defined from a list of names
+CONSTANTS_MIN_RUN = 4
+
+# Build profiles (Emscripten output format and optimization flags)
+BUILD_PROFILES = {
+    'asmjs-size': {
+        'wasm': False,
+        'flags': ['-Os'],
+    },
+    'wasm-size': {
+        'wasm': True,
+        'flags': ['-Os'],
+    },
+    'wasm-speed': {
+        'wasm': True,
+        'flags': ['-O3', '--llvm-lto 1'],
+    },
+}
+DEFAULT_PROFILE = 'asmjs-size'
+
+# Initial heap size of Emscripten, used unless --total-memory is given
+DEFAULT_TOTAL_MEMORY = 16 * 1024 * 1024
+
+# Heap sizes must be multiples of the WebAssembly page size, or of 16 MB in
+# asm.js, keyed by the 'wasm' setting of the build profile
+HEAP_ALIGNMENT = {True: 64 * 1024, False: 16 * 1024 * 1024}
+
+# Architectures built by the release action, besides the complete library
+RELEASE_ARCHS = ['aarch64', 'arm', 'mips', 'm68k', 'sparc', 'x86']
+
 # Directories
+BUILD_DIR = os.path.abspath("build")
 UNICORN_DIR = os.path.abspath("unicorn")
 UNICORN_QEMU_DIR = os.path.join(UNICORN_DIR, "qemu")
 ORIGINAL_QEMU_DIR = os.path.abspath("externals/qemu-2.2.1")
 
-def generateConstants():
-    out = open('src/unicorn-constants.js', 'w')
-    for path in EXPORTED_CONSTANTS:
-        path = os.path.join(UNICORN_DIR, path)
-        with open(path, 'r') as f:
-            code = f.read()
-            code = code.replace('\nUC_', '\nuc.')
-            code = code.replace('#', '//')
-        out.write(code)
-    out.close()
+# Records patch and header generation state inside the Unicorn tree
+MANIFEST_NAME = ".unicornjs-manifest.json"
+
+def parseConstants(path):
+    """
+    Parses a constants file of the Python bindings into (name, value) pairs
+    """
+    constants = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            m = re.match(r'^UC_([0-9A-Za-z_]+)\s*=\s*(-?(?:0x[0-9A-Fa-f]+|[0-9]+))$', line)
+            if not m:
+                raise ValueError("Unexpected line in %s: %r" % (path, line))
+            constants.append((m.group(1), int(m.group(2), 0)))
+    return constants
+
+def generateConstants(targets=[]):
+    """
+    Writes the core constants and those of the given targets (all of them by
+    default) to src/unicorn-constants*.js, and only the core constants, used
+    by the loader, to src/unicorn-constants-core.js
+    """
+    suffix = ''
+    if targets:
+        suffix = '-' + '-'.join(targets)
+    writeConstants('src/unicorn-constants%s.js' % suffix, targets or TARGET_CONSTANTS.keys())
+    writeConstants('src/unicorn-constants-core.js', [])
+
+def writeConstants(output, names):
+    constants = collections.OrderedDict()
+    for path in [CORE_CONSTANTS] + [TARGET_CONSTANTS[name] for name in names]:
+        for name, value in parseConstants(os.path.join(UNICORN_DIR, path)):
+            if constants.setdefault(name, value) != value:
+                raise ValueError("Conflicting values for constant %s" % name)
+    items = constants.items()
+    lines = []
+    i = 0
+    while i < len(items):
+        j = i + 1
+        while j < len(items) and items[j][1] == items[j - 1][1] + 1:
+            j += 1
+        run = items[i:j]
+        if len(run) < CONSTANTS_MIN_RUN:
+            lines.extend('uc.%s = %d;' % item for item in run)
+        else:
+            prefix = os.path.commonprefix([name for name, value in run])
+            prefix = prefix[:prefix.rfind('_') + 1]
+            lines.append("define('%s', %d, '%s');" % (prefix, run[0][1],
+                ' '.join(name[len(prefix):] for name, value in run)))
+        i = j
+    with open(output, 'w') as f:
+        f.write('// Unicorn.js constants [%s]. AUTO-GENERATED FILE, DO NOT EDIT\n' % ', '.join(['core'] + list(names)))
+        f.write('(function (define) {\n')
+        f.write('\n'.join(lines) + '\n')
+        f.write('})(function (prefix, value, names) {\n')
+        f.write('    names = names.split(\' \');\n')
+        f.write('    for (var i = 0; i < names.length; i++) {\n')
+        f.write('        uc[prefix + names[i]] = value + i;\n')
+        f.write('    }\n')
+        f.write('});\n')
 
 #############
 # Utilities #
 #############
 
+# Pending edits for each file, applied by applyPatches()
+PATCHES = collections.OrderedDict()
+
+def addPatch(path, edit):
+    PATCHES.setdefault(path, []).append(edit)
+
 # Replace strings in files
 def replace(path, replacements):
-    pathBak = path + ".bak"
-    if os.path.exists(pathBak):
-        return
-    shutil.move(path, pathBak)
-    fin = open(pathBak, "rt")
-    fout = open(path, "wt")
-    for line in fin:
-        for string in replacements:
-            line = line.replace(string, replacements[string])
-        fout.write(line)
-    fin.close()
-    fout.close()
+    # Sorted, so the manifest digest does not depend on dict ordering
+    items = sorted(replacements.items(), key=lambda item: (-len(item[0]), item[0]))
+    addPatch(path, ('replace', tuple(items)))
 
 # Insert strings in files after a specific line
 def insert(path, match, strings):
-    pathBak = path + ".bak"
-    if os.path.exists(pathBak):
-        return
-    shutil.move(path, pathBak)
-    fin = open(pathBak, "rt")
-    fout = open(path, "wt")
-    for line in fin:
-        fout.write(line)
-        if match.strip() == line.strip():
-            for string in strings:
-                fout.write(string + "\n")
-    fin.close()
-    fout.close()
+    addPatch(path, ('insert', match, tuple(strings)))
 
 # Append strings at the end of the file
 def append(path, code):
-    pathBak = path + ".bak"
-    if os.path.exists(pathBak):
-        return
-    shutil.copy(path, pathBak)
-    with open(path, 'a') as f:
-        f.write(code)
+    addPatch(path, ('append', code))
 
 # Prepend strings at the beginning of the file
 def prepend(path, code):
+    addPatch(path, ('prepend', code))
+
+class PatchError(Exception):
+    pass
+
+class PatchPlan(object):
+    """
+    All edits for one file, compiled into a single matcher
+    """
+    def __init__(self, edits):
+        self.replacements = {}
+        self.inserts = {}
+        self.prepends = []
+        self.appends = []
+        for edit in edits:
+            kind = edit[0]
+            if kind == 'replace':
+                for string, replacement in edit[1]:
+                    if '\n' in string:
+                        raise PatchError("Multi-line pattern: %r" % string)
+                    if self.replacements.get(string, replacement) != replacement:
+                        raise PatchError("Conflicting replacements for: %r" % string)
+                    self.replacements[string] = replacement
+            elif kind == 'insert':
+                self.inserts.setdefault(edit[1].strip(), []).extend(edit[2])
+            elif kind == 'prepend':
+                self.prepends.append(edit[1])
+            elif kind == 'append':
+                self.appends.append(edit[1])
+        # Longest strings first, so overlapping keys match leftmost-longest
+        strings = sorted(self.replacements, key=lambda string: (-len(string), string))
+        self.matcher = None
+        if strings:
+            self.matcher = re.compile('|'.join(re.escape(string) for string in strings))
+
+    def apply(self, lines):
+        """
+        Patches an iterable of lines in a single pass.
+        Returns the patched code and the number of matches of each pattern.
+        """
+        counts = dict((string, 0) for string in self.replacements)
+        counts.update((match, 0) for match in self.inserts)
+        def substitute(m):
+            counts[m.group(0)] += 1
+            return self.replacements[m.group(0)]
+        out = list(self.prepends)
+        for line in lines:
+            # Inserts match against the original line
+            match = line.strip()
+            strings = self.inserts.get(match)
+            if self.matcher:
+                line = self.matcher.sub(substitute, line)
+            out.append(line)
+            if strings is not None:
+                counts[match] += 1
+                for string in strings:
+                    out.append(string + "\n")
+        out.extend(self.appends)
+        return ''.join(out), counts
+
+# Load the build manifest of a Unicorn tree
+def loadManifest(unicorn_dir=UNICORN_DIR):
+    path = os.path.join(unicorn_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Save the build manifest of a Unicorn tree
+def saveManifest(manifest, unicorn_dir=UNICORN_DIR):
+    path = os.path.join(unicorn_dir, MANIFEST_NAME)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, separators=(',', ': '))
+
+# Patch one file (runs in a worker process)
+def patchFile(args):
+    path, edits, previous = args
+    # The .bak file keeps the pristine source
     pathBak = path + ".bak"
-    if os.path.exists(pathBak):
-        return
-    shutil.move(path, pathBak)
-    fin = open(pathBak, 'r')
-    fout = open(path, 'w')
-    fout.write(code)
-    fout.write(fin.read())
-    fout.close()
-    fin.close()
-
-# Copy directory contents to another folder without overwriting files
-def copytree(src, dst, symlinks=False, ignore=None):
+    if not os.path.exists(pathBak):
+        if not os.path.exists(path):
+            return path, None, None, False
+        shutil.copy2(path, pathBak)
+    with open(pathBak, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha1(source + repr(edits)).hexdigest()
+    if previous == digest and os.path.exists(path):
+        return path, digest, None, False
+    code, counts = PatchPlan(edits).apply(source.splitlines(True))
+    if 0 in counts.values():
+        return path, None, counts, False
+    # Only touch files whose contents change, so make rebuilds only them
+    current = None
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            current = f.read()
+    changed = code != current
+    if changed:
+        with open(path, 'wb') as f:
+            f.write(code)
+    return path, digest, counts, changed
+
+# Apply all pending edits to files whose sources or patches changed
+def applyPatches():
+    manifest = loadManifest()
+    files = manifest.setdefault('files', {})
+    matches = manifest.setdefault('matches', {})
+    jobs = []
+    for path, edits in PATCHES.items():
+        key = os.path.relpath(path, UNICORN_DIR)
+        jobs.append((path, edits, files.get(key)))
+    PATCHES.clear()
+    pool = multiprocessing.Pool(min(len(jobs), multiprocessing.cpu_count()) or 1)
+    results = pool.map(patchFile, jobs)
+    pool.close()
+    pool.join()
+    errors = []
+    for path, digest, counts, changed in results:
+        key = os.path.relpath(path, UNICORN_DIR)
+        if counts is None and digest is None:
+            errors.append("%s: file not found" % key)
+            continue
+        if counts is not None:
+            matches[key] = counts
+            if changed:
+                print "Patching %s" % key
+                for pattern in sorted(counts):
+                    print "  %4d x %s" % (counts[pattern], pattern.strip()[:72])
+            for pattern in sorted(counts):
+                if counts[pattern] == 0:
+                    errors.append("%s: pattern not found: %s" % (key, pattern.strip()))
+        if digest is None:
+            files.pop(key, None)
+        else:
+            files[key] = digest
+    saveManifest(manifest)
+    if errors:
+        raise PatchError("Patches no longer apply:\n  " + "\n  ".join(errors))
+
+# Hash the contents of a list of files
+def hashFiles(paths):
+    sha1 = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            sha1.update(f.read())
+    return sha1.hexdigest()
+
+# List the files tracked by the git checkout of a folder, relative to it, or
+# return None if it is not a git checkout
+def trackedFiles(path):
+    try:
+        output = subprocess.check_output(['git', 'ls-files'], cwd=path,
+            stderr=open(os.devnull, 'w'))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return set(output.splitlines())
+
+# Copy directory contents to another folder. Files that already exist are
+# left alone, unless an earlier call copied them in: those are recorded in
+# copied (path relative to dst -> source digest) and updated when their
+# source changes. Trees patched before copied was recorded are recognized
+# by the files being untracked by git, if known. Patched files are updated
+# through their pristine .bak copy.
+def copytree(src, dst, copied, tracked=None, root=None):
+    root = root or dst
     if not os.path.exists(dst):
         os.makedirs(dst)
     for item in os.listdir(src):
         s = os.path.join(src, item)
         d = os.path.join(dst, item)
         if os.path.isdir(s):
-            copytree(s, d, symlinks, ignore)
-        elif not os.path.exists(d):
+            copytree(s, d, copied, tracked, root)
+            continue
+        key = os.path.relpath(d, root)
+        digest = hashFiles([s])
+        if os.path.exists(d) or os.path.exists(d + ".bak"):
+            previous = copied.get(key)
+            if previous is None and (tracked is None or key in tracked):
+                continue
+            if previous == digest:
+                continue
+            if os.path.exists(d + ".bak"):
+                d += ".bak"
+        shutil.copy2(s, d)
+        copied[key] = digest
+
+# Mirror a directory into another folder, copying only files that differ
+def synctree(src, dst):
+    if not os.path.exists(dst):
+        os.makedirs(dst)
+    for item in os.listdir(src):
+        if item in ['.git', MANIFEST_NAME]:
+            continue
+        s = os.path.join(src, item)
+        d = os.path.join(dst, item)
+        if os.path.islink(s):
+            if not os.path.lexists(d):
+                os.symlink(os.readlink(s), d)
+        elif os.path.isdir(s):
+            synctree(s, d)
+        elif item.endswith(('.o', '.a', '.d')):
+            continue
+        else:
+            ss = os.stat(s)
+            if os.path.exists(d):
+                ds = os.stat(d)
+                if ss.st_size == ds.st_size and int(ss.st_mtime) == int(ds.st_mtime):
+                    continue
             shutil.copy2(s, d)
 
+# Run a shell command, optionally redirecting its output to a log file
+def run(cmd, cwd=None, log=None):
+    return subprocess.call(cmd, shell=True, cwd=cwd, stdout=log, stderr=log)
+
 
 ############
 # Patching #
@@ -146,7 +436,8 @@ for d in xrange(5):
     for f in glob.glob(path.replace('/**', '/*' * d)):
         f = f.replace('\\\\', '/')
         m = re.match(r'qemu\/([0-9A-Za-z_]+)\-softmmu.*', f)
-        shutil.move(f, f[:-2] + '-' + m.group(1) + '.o')
+        if not f.endswith('-' + m.group(1) + '.o'):
+            shutil.move(f, f[:-2] + '-' + m.group(1) + '.o')
 """
 
 PATCH_UNALIGNED_MEMACCESS = """
@@ -197,16 +488,13 @@ PATCH_UNALIGNED_MEMACCESS = """
 }
 """
 
+# Helpers are called through adapters taking one 32-bit word per 32-bit
+# argument and two per 64-bit argument, the layout used by tcg_gen_callN on
+# 32-bit hosts. The interpreter reads only the words an adapter takes.
 PATCH_HELPER_ADAPTER_PROTO = """
-#define GEN_ADAPTER_ARGS \\
-  uint32_t a1, uint32_t a2, uint32_t a3, uint32_t a4, uint32_t a5, \\
-  uint32_t a6, uint32_t a7, uint32_t a8, uint32_t a9, uint32_t a10
+#ifndef GEN_ADAPTER_PROTO
+#define GEN_ADAPTER_PROTO
 
-#define GEN_ADAPTER_DECLARE(name) \\
-    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS);
-"""
-
-PATCH_HELPER_ADAPTER_GEN = """
 // Compile-time dispatch
 #define CAT(a, ...) PRIMITIVE_CAT(a, __VA_ARGS__)
 #define PRIMITIVE_CAT(a, ...) a ## __VA_ARGS__
@@ -219,6 +507,51 @@ PATCH_HELPER_ADAPTER_GEN = """
 #define CHECK(...) CHECK_N(__VA_ARGS__, 0)
 #define CHECK_N(x, n, ...) n
 
+// 64-bit type detection
+#define WIDE_TYPE_i64 ()
+#define WIDE_PROBE(alias)           WIDE_PROBE_PROXY(WIDE_TYPE_##alias)
+#define WIDE_PROBE_PROXY(...)       WIDE_PROBE_PRIMITIVE(__VA_ARGS__)
+#define WIDE_PROBE_PRIMITIVE(x)     WIDE_PROBE_COMBINE_ x
+#define WIDE_PROBE_COMBINE_(...)    PROBE(~)
+#define IS_WIDE_ALIAS(alias)        CHECK(WIDE_PROBE(alias))
+#define IS_WIDE(type)               IS_WIDE_ALIAS(dh_alias(type))
+
+// Parameters
+#define GEN_ADAPTER_PARAM_NARROW(n) uint32_t a##n
+#define GEN_ADAPTER_PARAM_WIDE(n)   uint32_t a##n, uint32_t a##n##_hi
+#define GEN_ADAPTER_PARAM(n, t) \\
+    IIF(IS_WIDE(t)) (GEN_ADAPTER_PARAM_WIDE, GEN_ADAPTER_PARAM_NARROW)(n)
+
+#define GEN_ADAPTER_PARAMS_0() void
+#define GEN_ADAPTER_PARAMS_1(t1) \\
+    GEN_ADAPTER_PARAM(1, t1)
+#define GEN_ADAPTER_PARAMS_2(t1, t2) \\
+    GEN_ADAPTER_PARAMS_1(t1), GEN_ADAPTER_PARAM(2, t2)
+#define GEN_ADAPTER_PARAMS_3(t1, t2, t3) \\
+    GEN_ADAPTER_PARAMS_2(t1, t2), GEN_ADAPTER_PARAM(3, t3)
+#define GEN_ADAPTER_PARAMS_4(t1, t2, t3, t4) \\
+    GEN_ADAPTER_PARAMS_3(t1, t2, t3), GEN_ADAPTER_PARAM(4, t4)
+#define GEN_ADAPTER_PARAMS_5(t1, t2, t3, t4, t5) \\
+    GEN_ADAPTER_PARAMS_4(t1, t2, t3, t4), GEN_ADAPTER_PARAM(5, t5)
+
+// Adapter declaration
+#define GEN_ADAPTER_DECLARE_0(name) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_0());
+#define GEN_ADAPTER_DECLARE_1(name, t1) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_1(t1));
+#define GEN_ADAPTER_DECLARE_2(name, t1, t2) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_2(t1, t2));
+#define GEN_ADAPTER_DECLARE_3(name, t1, t2, t3) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_3(t1, t2, t3));
+#define GEN_ADAPTER_DECLARE_4(name, t1, t2, t3, t4) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_4(t1, t2, t3, t4));
+#define GEN_ADAPTER_DECLARE_5(name, t1, t2, t3, t4, t5) \\
+    uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_5(t1, t2, t3, t4, t5));
+
+#endif
+"""
+
+PATCH_HELPER_ADAPTER_GEN = PATCH_HELPER_ADAPTER_PROTO + """
 // Void type detection
 #define VOID_TYPE_void ()
 #define VOID_TYPE_noreturn ()
@@ -250,14 +583,15 @@ PATCH_HELPER_ADAPTER_GEN = """
 #define IS_GLOB(name)               CHECK(GLOB_PROBE(name))
 
 // Arguments
-#define A1 (a1 | ((uint64_t)a2  << 32))
-#define A2 (a3 | ((uint64_t)a4  << 32))
-#define A3 (a5 | ((uint64_t)a6  << 32))
-#define A4 (a7 | ((uint64_t)a8  << 32))
-#define A5 (a9 | ((uint64_t)a10 << 32))
-#define GEN_ADAPTER_ARGS \\
-  uint32_t a1, uint32_t a2, uint32_t a3, uint32_t a4, uint32_t a5, \\
-  uint32_t a6, uint32_t a7, uint32_t a8, uint32_t a9, uint32_t a10
+#define GEN_ADAPTER_ARG_NARROW(n)   ((uintptr_t)a##n)
+#define GEN_ADAPTER_ARG_WIDE(n)     (a##n | ((uint64_t)a##n##_hi << 32))
+#define GEN_ADAPTER_ARG(n, t) \\
+    (dh_ctype(t))IIF(IS_WIDE(t)) (GEN_ADAPTER_ARG_WIDE, GEN_ADAPTER_ARG_NARROW)(n)
+#define A1(t1) GEN_ADAPTER_ARG(1, t1)
+#define A2(t2) GEN_ADAPTER_ARG(2, t2)
+#define A3(t3) GEN_ADAPTER_ARG(3, t3)
+#define A4(t4) GEN_ADAPTER_ARG(4, t4)
+#define A5(t5) GEN_ADAPTER_ARG(5, t5)
 
 // Adapter definition
 #define GEN_ADAPTER_0_VOID(name) \\
@@ -265,52 +599,52 @@ PATCH_HELPER_ADAPTER_GEN = """
 #define GEN_ADAPTER_0_NONVOID(name) \\
     return HELPER(name)();
 #define GEN_ADAPTER_0_DEFINE(name, ret) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_0()) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_0_VOID(name), GEN_ADAPTER_0_NONVOID(name)) \\
 }
 
 #define GEN_ADAPTER_1_VOID(name, t1) \\
-    HELPER(name)((dh_ctype(t1))A1); return 0;
+    HELPER(name)(A1(t1)); return 0;
 #define GEN_ADAPTER_1_NONVOID(name, t1) \\
-    return HELPER(name)((dh_ctype(t1))A1);
+    return HELPER(name)(A1(t1));
 #define GEN_ADAPTER_1_DEFINE(name, ret, t1) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_1(t1)) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_1_VOID(name, t1), GEN_ADAPTER_1_NONVOID(name, t1)) \\
 }
 
 #define GEN_ADAPTER_2_VOID(name, t1, t2) \\
-    HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2); return 0;
+    HELPER(name)(A1(t1), A2(t2)); return 0;
 #define GEN_ADAPTER_2_NONVOID(name, t1, t2) \\
-    return HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2);
+    return HELPER(name)(A1(t1), A2(t2));
 #define GEN_ADAPTER_2_DEFINE(name, ret, t1, t2) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_2(t1, t2)) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_2_VOID(name, t1, t2), GEN_ADAPTER_2_NONVOID(name, t1, t2)) \\
 }
 
 #define GEN_ADAPTER_3_VOID(name, t1, t2, t3) \\
-    HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3); return 0;
+    HELPER(name)(A1(t1), A2(t2), A3(t3)); return 0;
 #define GEN_ADAPTER_3_NONVOID(name, t1, t2, t3) \\
-    return HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3);
+    return HELPER(name)(A1(t1), A2(t2), A3(t3));
 #define GEN_ADAPTER_3_DEFINE(name, ret, t1, t2, t3) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_3(t1, t2, t3)) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_3_VOID(name, t1, t2, t3), GEN_ADAPTER_3_NONVOID(name, t1, t2, t3)) \\
 }
 
 #define GEN_ADAPTER_4_VOID(name, t1, t2, t3, t4) \\
-    HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3, (dh_ctype(t4))A4); return 0;
+    HELPER(name)(A1(t1), A2(t2), A3(t3), A4(t4)); return 0;
 #define GEN_ADAPTER_4_NONVOID(name, t1, t2, t3, t4) \\
-    return HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3, (dh_ctype(t4))A4);
+    return HELPER(name)(A1(t1), A2(t2), A3(t3), A4(t4));
 #define GEN_ADAPTER_4_DEFINE(name, ret, t1, t2, t3, t4) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_4(t1, t2, t3, t4)) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_4_VOID(name, t1, t2, t3, t4), GEN_ADAPTER_4_NONVOID(name, t1, t2, t3, t4)) \\
 }
 
 #define GEN_ADAPTER_5_VOID(name, t1, t2, t3, t4, t5) \\
-    HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3, (dh_ctype(t4))A4, (dh_ctype(t5))A5); return 0;
+    HELPER(name)(A1(t1), A2(t2), A3(t3), A4(t4), A5(t5)); return 0;
 #define GEN_ADAPTER_5_NONVOID(name, t1, t2, t3, t4, t5) \\
-    return HELPER(name)((dh_ctype(t1))A1, (dh_ctype(t2))A2, (dh_ctype(t3))A3, (dh_ctype(t4))A4, (dh_ctype(t5))A5);
+    return HELPER(name)(A1(t1), A2(t2), A3(t3), A4(t4), A5(t5));
 #define GEN_ADAPTER_5_DEFINE(name, ret, t1, t2, t3, t4, t5) \\
-uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
+uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_PARAMS_5(t1, t2, t3, t4, t5)) { \\
     IIF(IS_VOID(ret)) (GEN_ADAPTER_5_VOID(name, t1, t2, t3, t4, t5), GEN_ADAPTER_5_NONVOID(name, t1, t2, t3, t4, t5)) \\
 }
 
@@ -338,6 +672,1110 @@ uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS) { \\
 #endif
 """
 
+# Instructions counted by the last uc_emu_start, read by emu_start_async to
+# tell slices that used up their count from guests that stopped by themselves
+PATCH_EMU_COUNTER = """
+
+// Unicorn.js: Instruction counter of uc_emu_start. Once the count is used up,
+// the instruction stopping the emulation is counted too.
+UNICORN_EXPORT
+size_t ucjs_emu_counter(uc_engine *uc)
+{
+    return uc->emu_counter;
+}
+"""
+
+# Flags TLB entries of pages lacking the Unicorn permission of an access, so
+# that the inline TLB checks of TCI leave them to the softmmu helpers without
+# looking up the region of each access
+PATCH_TLB_PROT = """
+/* Unicorn.js: TLB flag of pages whose region lacks a permission. The softmmu
+   helpers check the region as before, and otherwise ignore the flag. */
+static inline target_ulong ucjs_tlb_prot(struct uc_struct *uc,
+                                         target_ulong vaddr, uint32_t perm)
+{
+    MemoryRegion *mr = memory_mapping(uc, vaddr);
+    return (mr != NULL && !(mr->perms & perm)) ? TLB_UCJS_PROT : 0;
+}
+"""
+
+# Flushes the TLB through a function of the target, after permission changes
+# that the flags of its entries depend on
+PATCH_TLB_FLUSH_COMMON = """
+// Unicorn.js: Flushes the TLB
+static void ucjs_tlb_flush_common(struct uc_struct *uc)
+{
+    tlb_flush(uc->cpu, 1);
+}
+"""
+
+# Flushes translated blocks through a function of the target, as uc.c is
+# shared by all targets
+PATCH_TB_FLUSH_COMMON = """
+// Unicorn.js: Flushes translated blocks
+static void ucjs_tb_flush_common(struct uc_struct *uc)
+{
+    tb_flush(uc->cpu->env_ptr);
+}
+"""
+
+PATCH_TB_FLUSH = """
+
+// Unicorn.js: Drops translated blocks, so code written at the same addresses
+// since is translated again
+UNICORN_EXPORT
+void ucjs_tb_flush(uc_engine *uc)
+{
+    uc->ucjs_tb_flush(uc);
+}
+"""
+
+# Records executed instructions and blocks into a ring buffer, read in bulk by
+# the wrapper. Layout of ucjs_trace (32-bit words): records, capacity, head,
+# count, dropped, flush, hooks[2]. Each record holds 4 words: address (low,
+# high), size and hook type.
+PATCH_TRACE_BUFFER = """
+
+// Unicorn.js: Trace buffer
+typedef void (*ucjs_trace_flush_t)(void *trace);
+
+typedef struct ucjs_trace {
+    uint32_t *records;
+    uint32_t capacity;
+    uint32_t head;
+    uint32_t count;
+    uint32_t dropped;
+    ucjs_trace_flush_t flush;
+    uc_hook hooks[2];
+} ucjs_trace;
+
+static void ucjs_trace_push(ucjs_trace *trace, uint64_t address, uint32_t size, uint32_t type)
+{
+    uint32_t *record;
+    if (trace->count == trace->capacity) {
+        if (trace->flush) {
+            trace->flush(trace);
+        }
+        // Overwrite the oldest record if nothing was drained
+        if (trace->count == trace->capacity) {
+            trace->count--;
+            trace->dropped++;
+        }
+    }
+    record = trace->records + 4 * trace->head;
+    record[0] = (uint32_t)address;
+    record[1] = (uint32_t)(address >> 32);
+    record[2] = size;
+    record[3] = type;
+    trace->head = (trace->head + 1 == trace->capacity) ? 0 : trace->head + 1;
+    trace->count++;
+}
+
+static void ucjs_trace_code(uc_engine *uc, uint64_t address, uint32_t size, void *user_data)
+{
+    ucjs_trace_push((ucjs_trace *)user_data, address, size, UC_HOOK_CODE);
+}
+
+static void ucjs_trace_block(uc_engine *uc, uint64_t address, uint32_t size, void *user_data)
+{
+    ucjs_trace_push((ucjs_trace *)user_data, address, size, UC_HOOK_BLOCK);
+}
+
+UNICORN_EXPORT
+uc_err ucjs_trace_close(uc_engine *uc, ucjs_trace *trace)
+{
+    uc_err err = UC_ERR_OK;
+    int i;
+    for (i = 0; i < 2; i++) {
+        if (trace->hooks[i] && err == UC_ERR_OK) {
+            err = uc_hook_del(uc, trace->hooks[i]);
+        }
+    }
+    free(trace->records);
+    free(trace);
+    return err;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_trace_open(uc_engine *uc, ucjs_trace **result, int types,
+    uint32_t capacity, ucjs_trace_flush_t flush, uint64_t begin, uint64_t end)
+{
+    ucjs_trace *trace;
+    uc_err err = UC_ERR_OK;
+    if (capacity == 0 || !(types & (UC_HOOK_CODE | UC_HOOK_BLOCK))) {
+        return UC_ERR_ARG;
+    }
+    trace = calloc(1, sizeof(ucjs_trace));
+    if (trace == NULL) {
+        return UC_ERR_NOMEM;
+    }
+    trace->records = malloc(capacity * 4 * sizeof(uint32_t));
+    if (trace->records == NULL) {
+        free(trace);
+        return UC_ERR_NOMEM;
+    }
+    trace->capacity = capacity;
+    trace->flush = flush;
+    // Block records precede the records of their instructions
+    if (types & UC_HOOK_BLOCK) {
+        err = uc_hook_add(uc, &trace->hooks[0], UC_HOOK_BLOCK, ucjs_trace_block, trace, begin, end);
+    }
+    if (err == UC_ERR_OK && (types & UC_HOOK_CODE)) {
+        err = uc_hook_add(uc, &trace->hooks[1], UC_HOOK_CODE, ucjs_trace_code, trace, begin, end);
+    }
+    if (err != UC_ERR_OK) {
+        ucjs_trace_close(uc, trace);
+        return err;
+    }
+    *result = trace;
+    return UC_ERR_OK;
+}
+"""
+
+# AFL-style edge coverage: a HOOK_BLOCK callback hashes (previous, current)
+# block pairs into a 64 KB hit count bitmap at the start of ucjs_coverage.
+# The virgin map keeps the hit count buckets never seen before.
+PATCH_COVERAGE_MAP = """
+
+// Unicorn.js: Edge coverage
+#define UCJS_COVERAGE_SIZE 0x10000
+
+typedef struct ucjs_coverage {
+    uint8_t bitmap[UCJS_COVERAGE_SIZE];
+    uint8_t virgin[UCJS_COVERAGE_SIZE];
+    uint32_t prev;
+    uc_hook hook;
+} ucjs_coverage;
+
+static void ucjs_coverage_block(uc_engine *uc, uint64_t address, uint32_t size, void *user_data)
+{
+    ucjs_coverage *coverage = (ucjs_coverage *)user_data;
+    uint32_t cur = (uint32_t)((address >> 4) ^ (address << 8)) & (UCJS_COVERAGE_SIZE - 1);
+    coverage->bitmap[cur ^ coverage->prev]++;
+    coverage->prev = cur >> 1;
+}
+
+// Hit counts are compared in buckets: 1, 2, 3, 4-7, 8-15, 16-31, 32-127, 128+
+static uint8_t ucjs_coverage_bucket(uint8_t count)
+{
+    if (count <= 2)   return count;
+    if (count == 3)   return 4;
+    if (count <= 7)   return 8;
+    if (count <= 15)  return 16;
+    if (count <= 31)  return 32;
+    if (count <= 127) return 64;
+    return 128;
+}
+
+UNICORN_EXPORT
+void ucjs_coverage_reset(ucjs_coverage *coverage, int virgin)
+{
+    memset(coverage->bitmap, 0, UCJS_COVERAGE_SIZE);
+    coverage->prev = 0;
+    if (virgin) {
+        memset(coverage->virgin, 0xFF, UCJS_COVERAGE_SIZE);
+    }
+}
+
+UNICORN_EXPORT
+uint32_t ucjs_coverage_new_bits(ucjs_coverage *coverage)
+{
+    uint32_t *words = (uint32_t *)coverage->bitmap;
+    uint32_t count = 0;
+    uint32_t i, j;
+    uint8_t bits;
+    for (i = 0; i < UCJS_COVERAGE_SIZE / 4; i++) {
+        if (words[i] == 0) {
+            continue;
+        }
+        for (j = 4 * i; j < 4 * i + 4; j++) {
+            bits = ucjs_coverage_bucket(coverage->bitmap[j]) & coverage->virgin[j];
+            if (bits) {
+                coverage->virgin[j] &= ~bits;
+                count++;
+            }
+        }
+    }
+    return count;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_coverage_close(uc_engine *uc, ucjs_coverage *coverage)
+{
+    uc_err err = UC_ERR_OK;
+    if (coverage->hook) {
+        err = uc_hook_del(uc, coverage->hook);
+    }
+    free(coverage);
+    return err;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_coverage_open(uc_engine *uc, ucjs_coverage **result, uint64_t begin, uint64_t end)
+{
+    ucjs_coverage *coverage;
+    uc_err err;
+    coverage = calloc(1, sizeof(ucjs_coverage));
+    if (coverage == NULL) {
+        return UC_ERR_NOMEM;
+    }
+    ucjs_coverage_reset(coverage, 1);
+    err = uc_hook_add(uc, &coverage->hook, UC_HOOK_BLOCK, ucjs_coverage_block, coverage, begin, end);
+    if (err != UC_ERR_OK) {
+        ucjs_coverage_close(uc, coverage);
+        return err;
+    }
+    *result = coverage;
+    return UC_ERR_OK;
+}
+"""
+
+# Snapshots of the CPU context and of all mapped memory. Guest stores,
+# uc_mem_write and the wrapper mark the pages written since the snapshot in
+# a bitmap per region, so restoring copies back only those.
+PATCH_SNAPSHOT_PRIV = """
+// Unicorn.js: Snapshots of the engine, which track the pages written since
+// they were taken
+struct ucjs_snapshot;
+void ucjs_snapshots_mark(struct uc_struct *uc, uint64_t address, uint32_t size);
+
+#define UCJS_SNAPSHOTS_MARK(uc, address, size) do { \\
+    if ((uc)->ucjs_snapshots) { \\
+        ucjs_snapshots_mark((uc), (address), (size)); \\
+    } \\
+} while (0)
+"""
+
+PATCH_SNAPSHOT = """
+
+// Unicorn.js: Snapshots
+#define UCJS_PAGE_BITS 12
+#define UCJS_PAGE_SIZE (1 << UCJS_PAGE_BITS)
+
+typedef struct ucjs_snapshot_region {
+    uint64_t begin;
+    uint64_t end;
+    uint8_t *data;
+    uint32_t *bitmap;
+} ucjs_snapshot_region;
+
+typedef struct ucjs_snapshot_page {
+    uint32_t region;
+    uint32_t page;
+} ucjs_snapshot_page;
+
+typedef struct ucjs_snapshot {
+    uc_context *context;
+    ucjs_snapshot_region *regions;
+    uint32_t count;
+    ucjs_snapshot_page *pages;
+    uint32_t dirty;
+    uint32_t hint;
+    struct ucjs_snapshot *next;     // Next snapshot of the engine
+} ucjs_snapshot;
+
+static void ucjs_snapshot_mark_region(ucjs_snapshot *snapshot, uint32_t index,
+    uint64_t first, uint64_t last)
+{
+    ucjs_snapshot_region *region = &snapshot->regions[index];
+    uint32_t page, end;
+    if (first < region->begin) {
+        first = region->begin;
+    }
+    if (last > region->end) {
+        last = region->end;
+    }
+    end = (uint32_t)((last - region->begin) >> UCJS_PAGE_BITS);
+    for (page = (uint32_t)((first - region->begin) >> UCJS_PAGE_BITS); page <= end; page++) {
+        if (!(region->bitmap[page >> 5] & (1 << (page & 31)))) {
+            region->bitmap[page >> 5] |= 1 << (page & 31);
+            snapshot->pages[snapshot->dirty].region = index;
+            snapshot->pages[snapshot->dirty].page = page;
+            snapshot->dirty++;
+        }
+    }
+}
+
+UNICORN_EXPORT
+void ucjs_snapshot_mark(ucjs_snapshot *snapshot, uint64_t address, uint32_t size)
+{
+    ucjs_snapshot_region *region;
+    uint64_t last;
+    uint32_t i;
+    if (size == 0) {
+        return;
+    }
+    last = address + size - 1;
+    // Most writes hit the same region as the previous one
+    region = &snapshot->regions[snapshot->hint];
+    if (snapshot->count && address >= region->begin && last <= region->end) {
+        ucjs_snapshot_mark_region(snapshot, snapshot->hint, address, last);
+        return;
+    }
+    for (i = 0; i < snapshot->count; i++) {
+        region = &snapshot->regions[i];
+        if (last >= region->begin && address <= region->end) {
+            ucjs_snapshot_mark_region(snapshot, i, address, last);
+            snapshot->hint = i;
+        }
+    }
+}
+
+// Marks a write in all snapshots of the engine. Called by guest stores and
+// uc_mem_write, through UCJS_SNAPSHOTS_MARK.
+void ucjs_snapshots_mark(struct uc_struct *uc, uint64_t address, uint32_t size)
+{
+    ucjs_snapshot *snapshot;
+    for (snapshot = uc->ucjs_snapshots; snapshot != NULL; snapshot = snapshot->next) {
+        ucjs_snapshot_mark(snapshot, address, size);
+    }
+}
+
+UNICORN_EXPORT
+uint32_t ucjs_snapshot_dirty(ucjs_snapshot *snapshot)
+{
+    return snapshot->dirty;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_snapshot_free(uc_engine *uc, ucjs_snapshot *snapshot)
+{
+    ucjs_snapshot **link;
+    uint32_t i;
+    for (link = &uc->ucjs_snapshots; *link != NULL; link = &(*link)->next) {
+        if (*link == snapshot) {
+            *link = snapshot->next;
+            break;
+        }
+    }
+    if (snapshot->context) {
+        uc_free(snapshot->context);
+    }
+    if (snapshot->regions) {
+        for (i = 0; i < snapshot->count; i++) {
+            free(snapshot->regions[i].data);
+            free(snapshot->regions[i].bitmap);
+        }
+        free(snapshot->regions);
+    }
+    free(snapshot->pages);
+    free(snapshot);
+    return UC_ERR_OK;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_snapshot_take(uc_engine *uc, ucjs_snapshot **result)
+{
+    ucjs_snapshot *snapshot;
+    ucjs_snapshot_region *region;
+    uc_mem_region *regions = NULL;
+    uint32_t i, pages = 0;
+    uint64_t size;
+    uc_err err;
+    snapshot = calloc(1, sizeof(ucjs_snapshot));
+    if (snapshot == NULL) {
+        return UC_ERR_NOMEM;
+    }
+    err = uc_context_alloc(uc, &snapshot->context);
+    if (err == UC_ERR_OK) {
+        err = uc_context_save(uc, snapshot->context);
+    }
+    if (err == UC_ERR_OK) {
+        err = uc_mem_regions(uc, &regions, &snapshot->count);
+    }
+    if (err == UC_ERR_OK) {
+        snapshot->regions = calloc(snapshot->count + 1, sizeof(ucjs_snapshot_region));
+        if (snapshot->regions == NULL) {
+            err = UC_ERR_NOMEM;
+        }
+    }
+    for (i = 0; err == UC_ERR_OK && i < snapshot->count; i++) {
+        region = &snapshot->regions[i];
+        region->begin = regions[i].begin;
+        region->end = regions[i].end;
+        size = region->end - region->begin + 1;
+        region->data = malloc(size);
+        // Regions of targets with 1 KB pages might end inside a page
+        region->bitmap = calloc((((size + UCJS_PAGE_SIZE - 1) >> UCJS_PAGE_BITS) + 31) / 32,
+            sizeof(uint32_t));
+        if (region->data == NULL || region->bitmap == NULL) {
+            err = UC_ERR_NOMEM;
+            break;
+        }
+        err = uc_mem_read(uc, region->begin, region->data, size);
+        pages += (uint32_t)((size + UCJS_PAGE_SIZE - 1) >> UCJS_PAGE_BITS);
+    }
+    if (regions) {
+        uc_free(regions);
+    }
+    // Each page is listed at most once
+    if (err == UC_ERR_OK) {
+        snapshot->pages = malloc((pages + 1) * sizeof(ucjs_snapshot_page));
+        if (snapshot->pages == NULL) {
+            err = UC_ERR_NOMEM;
+        }
+    }
+    if (err != UC_ERR_OK) {
+        ucjs_snapshot_free(uc, snapshot);
+        return err;
+    }
+    snapshot->next = uc->ucjs_snapshots;
+    uc->ucjs_snapshots = snapshot;
+    *result = snapshot;
+    return UC_ERR_OK;
+}
+
+// Whether the memory mapped now is the memory mapped when the snapshot was
+// taken. Protection changes are allowed, they only split regions.
+static bool ucjs_snapshot_mapped(uc_engine *uc, ucjs_snapshot *snapshot)
+{
+    ucjs_snapshot_region *region;
+    MemoryRegion *mr;
+    uint64_t address, mapped = 0, size = 0;
+    uint32_t i;
+    for (i = 0; i < uc->mapped_block_count; i++) {
+        mapped += uc->mapped_blocks[i]->end - uc->mapped_blocks[i]->addr;
+    }
+    for (i = 0; i < snapshot->count; i++) {
+        region = &snapshot->regions[i];
+        size += region->end - region->begin + 1;
+        for (address = region->begin; ; address = mr->end) {
+            mr = memory_mapping(uc, address);
+            if (mr == NULL) {
+                return false;
+            }
+            if (mr->end - 1 >= region->end) {
+                break;
+            }
+        }
+    }
+    return mapped == size;
+}
+
+UNICORN_EXPORT
+uc_err ucjs_snapshot_restore(uc_engine *uc, ucjs_snapshot *snapshot)
+{
+    ucjs_snapshot_region *region;
+    ucjs_snapshot_page *page;
+    uint64_t offset, size;
+    uc_err err = UC_ERR_OK;
+    uint32_t i;
+    if (!ucjs_snapshot_mapped(uc, snapshot)) {
+        return UC_ERR_MAP;
+    }
+    // Pages stay marked while they are written, so only the other
+    // snapshots record these writes
+    for (i = 0; i < snapshot->dirty && err == UC_ERR_OK; i++) {
+        page = &snapshot->pages[i];
+        region = &snapshot->regions[page->region];
+        offset = (uint64_t)page->page << UCJS_PAGE_BITS;
+        size = region->end - region->begin + 1 - offset;
+        if (size > UCJS_PAGE_SIZE) {
+            size = UCJS_PAGE_SIZE;
+        }
+        err = uc_mem_write(uc, region->begin + offset, region->data + offset, (size_t)size);
+    }
+    for (i = 0; i < snapshot->dirty; i++) {
+        page = &snapshot->pages[i];
+        region = &snapshot->regions[page->region];
+        region->bitmap[page->page >> 5] &= ~(1 << (page->page & 31));
+    }
+    snapshot->dirty = 0;
+    if (err != UC_ERR_OK) {
+        return err;
+    }
+    return uc_context_restore(uc, snapshot->context);
+}
+"""
+
+# Interpreter profiling counters, only compiled when UCJS_PROFILING is
+# defined by build.py --profiling. The wrapper reads them at the offsets
+# returned by ucjs_profile_offset.
+PATCH_PROFILING_PRIV = """
+#ifdef UCJS_PROFILING
+// Unicorn.js: Profiling counters
+#define UCJS_PROFILE_OPS 256
+
+typedef struct ucjs_profile_helper {
+    uint64_t calls;
+    const char *name;
+    const void *func;
+} ucjs_profile_helper;
+
+typedef struct ucjs_profile_block {
+    uint64_t pc;
+    uint64_t execs;
+    uint64_t translations;
+} ucjs_profile_block;
+
+// Open addressing hash map from 64-bit keys to array indices plus one
+typedef struct ucjs_profile_map {
+    uint64_t *keys;
+    uint32_t *values;
+    uint32_t capacity;
+    uint32_t count;
+} ucjs_profile_map;
+
+typedef struct ucjs_profile {
+    uint64_t ops[UCJS_PROFILE_OPS];
+    uint64_t tlb_misses;
+    uint64_t tb_flushes;
+    const char *const *op_names;
+    uint32_t nb_ops;
+    ucjs_profile_helper *helpers;
+    uint32_t nb_helpers;
+    uint32_t helpers_capacity;
+    ucjs_profile_block *blocks;
+    uint32_t nb_blocks;
+    uint32_t blocks_capacity;
+    ucjs_profile_map helper_map;    // Function pointer to helpers
+    ucjs_profile_map block_map;     // Guest PC to blocks
+    ucjs_profile_map code_map;      // Bytecode address to blocks, until flushed
+} ucjs_profile;
+
+ucjs_profile *ucjs_profile_get(struct uc_struct *uc);
+void ucjs_profile_free(struct uc_struct *uc);
+void ucjs_profile_helper_add(struct uc_struct *uc, const void *func, const char *name);
+void ucjs_profile_translate(struct uc_struct *uc, uint64_t pc, const void *code);
+void ucjs_profile_flush(struct uc_struct *uc);
+void ucjs_profile_tlb_miss(struct uc_struct *uc);
+void ucjs_profile_exec(ucjs_profile *profile, const void *code);
+void ucjs_profile_call(ucjs_profile *profile, const void *func);
+#endif
+"""
+
+PATCH_PROFILING = """
+
+#ifdef UCJS_PROFILING
+// Unicorn.js: Profiling counters
+static uint32_t ucjs_profile_hash(uint64_t key)
+{
+    key ^= key >> 33;
+    key *= 0xff51afd7ed558ccdULL;
+    key ^= key >> 33;
+    return (uint32_t)key;
+}
+
+// Returns the slot of a key, or the empty slot where it would be stored
+static uint32_t ucjs_profile_slot(ucjs_profile_map *map, uint64_t key)
+{
+    uint32_t mask = map->capacity - 1;
+    uint32_t i = ucjs_profile_hash(key) & mask;
+    while (map->values[i] && map->keys[i] != key) {
+        i = (i + 1) & mask;
+    }
+    return i;
+}
+
+static uint32_t ucjs_profile_map_get(ucjs_profile_map *map, uint64_t key)
+{
+    if (map->count == 0) {
+        return 0;
+    }
+    return map->values[ucjs_profile_slot(map, key)];
+}
+
+static bool ucjs_profile_map_set(ucjs_profile_map *map, uint64_t key, uint32_t value)
+{
+    ucjs_profile_map grown;
+    uint32_t i;
+    // Keep the load factor below 1/2
+    if (2 * (map->count + 1) > map->capacity) {
+        grown.capacity = map->capacity ? 2 * map->capacity : 256;
+        grown.count = 0;
+        grown.keys = malloc(grown.capacity * sizeof(uint64_t));
+        grown.values = calloc(grown.capacity, sizeof(uint32_t));
+        if (grown.keys == NULL || grown.values == NULL) {
+            free(grown.keys);
+            free(grown.values);
+            return false;
+        }
+        for (i = 0; i < map->capacity; i++) {
+            if (map->values[i]) {
+                ucjs_profile_map_set(&grown, map->keys[i], map->values[i]);
+            }
+        }
+        free(map->keys);
+        free(map->values);
+        *map = grown;
+    }
+    i = ucjs_profile_slot(map, key);
+    if (!map->values[i]) {
+        map->count++;
+    }
+    map->keys[i] = key;
+    map->values[i] = value;
+    return true;
+}
+
+static void ucjs_profile_map_clear(ucjs_profile_map *map)
+{
+    if (map->capacity) {
+        memset(map->values, 0, map->capacity * sizeof(uint32_t));
+    }
+    map->count = 0;
+}
+
+// Makes room for one more item in a growable array
+static bool ucjs_profile_reserve(void **items, uint32_t *capacity, uint32_t count, size_t size)
+{
+    void *grown;
+    uint32_t n;
+    if (count < *capacity) {
+        return true;
+    }
+    n = *capacity ? 2 * *capacity : 64;
+    grown = realloc(*items, n * size);
+    if (grown == NULL) {
+        return false;
+    }
+    *items = grown;
+    *capacity = n;
+    return true;
+}
+
+static ucjs_profile_block *ucjs_profile_block_get(ucjs_profile *profile, uint64_t pc)
+{
+    ucjs_profile_block *block;
+    uint32_t index = ucjs_profile_map_get(&profile->block_map, pc);
+    if (index) {
+        return &profile->blocks[index - 1];
+    }
+    if (!ucjs_profile_reserve((void **)&profile->blocks, &profile->blocks_capacity,
+            profile->nb_blocks, sizeof(ucjs_profile_block)) ||
+        !ucjs_profile_map_set(&profile->block_map, pc, profile->nb_blocks + 1)) {
+        return NULL;
+    }
+    block = &profile->blocks[profile->nb_blocks++];
+    memset(block, 0, sizeof(ucjs_profile_block));
+    block->pc = pc;
+    return block;
+}
+
+// Counters are allocated on first use
+UNICORN_EXPORT
+ucjs_profile *ucjs_profile_get(uc_engine *uc)
+{
+    if (uc->ucjs_profile == NULL) {
+        uc->ucjs_profile = calloc(1, sizeof(ucjs_profile));
+    }
+    return uc->ucjs_profile;
+}
+
+void ucjs_profile_free(uc_engine *uc)
+{
+    ucjs_profile *profile = uc->ucjs_profile;
+    if (profile == NULL) {
+        return;
+    }
+    free(profile->helpers);
+    free(profile->blocks);
+    free(profile->helper_map.keys);
+    free(profile->helper_map.values);
+    free(profile->block_map.keys);
+    free(profile->block_map.values);
+    free(profile->code_map.keys);
+    free(profile->code_map.values);
+    free(profile);
+    uc->ucjs_profile = NULL;
+}
+
+// Called when a call to a helper is generated
+void ucjs_profile_helper_add(uc_engine *uc, const void *func, const char *name)
+{
+    ucjs_profile *profile = ucjs_profile_get(uc);
+    ucjs_profile_helper *helper;
+    if (profile == NULL || ucjs_profile_map_get(&profile->helper_map, (uintptr_t)func)) {
+        return;
+    }
+    if (!ucjs_profile_reserve((void **)&profile->helpers, &profile->helpers_capacity,
+            profile->nb_helpers, sizeof(ucjs_profile_helper)) ||
+        !ucjs_profile_map_set(&profile->helper_map, (uintptr_t)func, profile->nb_helpers + 1)) {
+        return;
+    }
+    helper = &profile->helpers[profile->nb_helpers++];
+    helper->calls = 0;
+    helper->name = name;
+    helper->func = func;
+}
+
+// Called when the block at pc is translated to the bytecode at code
+void ucjs_profile_translate(uc_engine *uc, uint64_t pc, const void *code)
+{
+    ucjs_profile *profile = ucjs_profile_get(uc);
+    ucjs_profile_block *block;
+    if (profile == NULL || (block = ucjs_profile_block_get(profile, pc)) == NULL) {
+        return;
+    }
+    block->translations++;
+    ucjs_profile_map_set(&profile->code_map, (uintptr_t)code,
+        (uint32_t)(block - profile->blocks) + 1);
+}
+
+// Called when the translation buffer is flushed, which frees all bytecode
+void ucjs_profile_flush(uc_engine *uc)
+{
+    ucjs_profile *profile = ucjs_profile_get(uc);
+    if (profile == NULL) {
+        return;
+    }
+    profile->tb_flushes++;
+    ucjs_profile_map_clear(&profile->code_map);
+}
+
+void ucjs_profile_tlb_miss(uc_engine *uc)
+{
+    ucjs_profile *profile = ucjs_profile_get(uc);
+    if (profile) {
+        profile->tlb_misses++;
+    }
+}
+
+// Called by the interpreter when entering a block
+void ucjs_profile_exec(ucjs_profile *profile, const void *code)
+{
+    uint32_t index;
+    if (profile == NULL) {
+        return;
+    }
+    index = ucjs_profile_map_get(&profile->code_map, (uintptr_t)code);
+    if (index) {
+        profile->blocks[index - 1].execs++;
+    }
+}
+
+// Called by the interpreter before calling a helper
+void ucjs_profile_call(ucjs_profile *profile, const void *func)
+{
+    uint32_t index;
+    if (profile == NULL) {
+        return;
+    }
+    index = ucjs_profile_map_get(&profile->helper_map, (uintptr_t)func);
+    if (index) {
+        profile->helpers[index - 1].calls++;
+    }
+}
+
+// Clears all counters, keeping the known helpers and blocks
+UNICORN_EXPORT
+void ucjs_profile_reset(ucjs_profile *profile)
+{
+    uint32_t i;
+    memset(profile->ops, 0, sizeof(profile->ops));
+    profile->tlb_misses = 0;
+    profile->tb_flushes = 0;
+    for (i = 0; i < profile->nb_helpers; i++) {
+        profile->helpers[i].calls = 0;
+    }
+    for (i = 0; i < profile->nb_blocks; i++) {
+        profile->blocks[i].execs = 0;
+        profile->blocks[i].translations = 0;
+    }
+}
+
+UNICORN_EXPORT
+const char *ucjs_profile_op_name(ucjs_profile *profile, uint32_t op)
+{
+    return (op < profile->nb_ops) ? profile->op_names[op] : "";
+}
+
+UNICORN_EXPORT
+const char *ucjs_profile_helper_name(ucjs_profile *profile, uint32_t index)
+{
+    return (index < profile->nb_helpers) ? profile->helpers[index].name : "";
+}
+
+// Byte offsets of the fields read by the wrapper, in this order: ops,
+// tlb_misses, tb_flushes, nb_ops, helpers, nb_helpers, blocks, nb_blocks,
+// then the size of a helper and the offset of its calls, then the size of a
+// block and the offsets of its pc, execs and translations. 64-bit counters
+// and pointers to the arrays are read at the offsets, other fields are
+// 32-bit. Returns 0 past the last field.
+UNICORN_EXPORT
+uint32_t ucjs_profile_offset(uint32_t field)
+{
+    static const uint32_t offsets[] = {
+        offsetof(ucjs_profile, ops),
+        offsetof(ucjs_profile, tlb_misses),
+        offsetof(ucjs_profile, tb_flushes),
+        offsetof(ucjs_profile, nb_ops),
+        offsetof(ucjs_profile, helpers),
+        offsetof(ucjs_profile, nb_helpers),
+        offsetof(ucjs_profile, blocks),
+        offsetof(ucjs_profile, nb_blocks),
+        sizeof(ucjs_profile_helper),
+        offsetof(ucjs_profile_helper, calls),
+        sizeof(ucjs_profile_block),
+        offsetof(ucjs_profile_block, pc),
+        offsetof(ucjs_profile_block, execs),
+        offsetof(ucjs_profile_block, translations),
+    };
+    return (field < sizeof(offsets) / sizeof(offsets[0])) ? offsets[field] : 0;
+}
+#endif
+"""
+
+# Interval index of the hook ranges of each type. The begin and end of every
+# hook split the address space in segments, each with a list of the hooks
+# covering it, so lookups are a binary search. Hooks with begin > end cover
+# every segment. The index is rebuilt on the next lookup after uc_hook_add or
+# uc_hook_del. Callbacks may delete hooks while a list is walked, so deleted
+# hooks are skipped and only freed once uc_emu_start returns.
+PATCH_HOOK_INDEX_PRIV = """
+// Unicorn.js: Interval index of the hooks of one type
+struct ucjs_hook_index {
+    uint64_t *starts;           // First address of each segment, sorted
+    struct list_item **heads;   // Hooks covering each segment, or NULL
+    struct list_item *items;    // Storage of the lists
+    uint32_t count;             // Number of segments
+    bool dirty;                 // Rebuilt on the next lookup
+};
+
+struct list_item *ucjs_hooks_at(struct uc_struct *uc, int idx, uint64_t addr);
+void ucjs_hooks_changed(struct uc_struct *uc);
+void ucjs_hooks_delete(struct uc_struct *uc, struct hook *hook);
+void ucjs_hooks_collect(struct uc_struct *uc);
+void ucjs_hooks_free(struct uc_struct *uc);
+
+// Skips hooks deleted since the index was built. They are only freed once
+// emulation stops, so a callback can delete any hook while a loop runs.
+static inline struct list_item *ucjs_hooks_live(struct list_item *cur)
+{
+    while (cur != NULL && ((struct hook *)cur->data)->ucjs_deleted) {
+        cur = cur->next;
+    }
+    return cur;
+}
+
+// for loop macro to loop over the hooks of a type covering an address
+#define HOOK_FOREACH_BOUNDED(uc, addr, hh, idx)                       \\
+    struct list_item *cur;                                            \\
+    for (                                                             \\
+        cur = ucjs_hooks_at((uc), idx##_IDX, (addr));                 \\
+        (cur = ucjs_hooks_live(cur)) != NULL                          \\
+            && ((hh) = (struct hook *)cur->data)                      \\
+            /* stop excuting callbacks on stop request */             \\
+            && !uc->stop_request;                                     \\
+        cur = cur->next)
+"""
+
+PATCH_HOOK_INDEX = """
+
+// Unicorn.js: Interval index of the hooks of each type
+static int ucjs_hooks_compare(const void *a, const void *b)
+{
+    uint64_t x = *(const uint64_t *)a;
+    uint64_t y = *(const uint64_t *)b;
+    return (x > y) - (x < y);
+}
+
+static bool ucjs_hooks_build(struct uc_struct *uc, int idx)
+{
+    struct ucjs_hook_index *index = &uc->hook_index[idx];
+    struct list_item *cur, *prev, **heads, *items;
+    struct hook *hook;
+    uint64_t *starts;
+    uint32_t nb_hooks = 0, nb_items = 0, count = 1, i, j;
+
+    for (cur = uc->hook[idx].head; cur != NULL; cur = cur->next) {
+        nb_hooks++;
+    }
+    starts = malloc((2 * nb_hooks + 1) * sizeof(uint64_t));
+    if (starts == NULL) {
+        return false;
+    }
+    // Segment boundaries
+    starts[0] = 0;
+    for (cur = uc->hook[idx].head; cur != NULL; cur = cur->next) {
+        hook = (struct hook *)cur->data;
+        if (hook->begin > hook->end) {
+            continue;
+        }
+        starts[count++] = hook->begin;
+        if (hook->end != UINT64_MAX) {
+            starts[count++] = hook->end + 1;
+        }
+    }
+    qsort(starts, count, sizeof(uint64_t), ucjs_hooks_compare);
+    for (i = 1, j = 1; i < count; i++) {
+        if (starts[i] != starts[j - 1]) {
+            starts[j++] = starts[i];
+        }
+    }
+    count = j;
+    // Segments are either inside or outside of each range, so checking
+    // their first address is enough
+    for (i = 0; i < count; i++) {
+        for (cur = uc->hook[idx].head; cur != NULL; cur = cur->next) {
+            if (HOOK_BOUND_CHECK((struct hook *)cur->data, starts[i])) {
+                nb_items++;
+            }
+        }
+    }
+    heads = malloc(count * sizeof(struct list_item *));
+    items = malloc((nb_items ? nb_items : 1) * sizeof(struct list_item));
+    if (heads == NULL || items == NULL) {
+        free(starts);
+        free(heads);
+        free(items);
+        return false;
+    }
+    // Lists keep the order of the hooks
+    for (i = 0, j = 0; i < count; i++) {
+        heads[i] = NULL;
+        prev = NULL;
+        for (cur = uc->hook[idx].head; cur != NULL; cur = cur->next) {
+            if (!HOOK_BOUND_CHECK((struct hook *)cur->data, starts[i])) {
+                continue;
+            }
+            items[j].data = cur->data;
+            items[j].next = NULL;
+            if (prev != NULL) {
+                prev->next = &items[j];
+            } else {
+                heads[i] = &items[j];
+            }
+            prev = &items[j++];
+        }
+    }
+    free(index->starts);
+    free(index->heads);
+    free(index->items);
+    index->starts = starts;
+    index->heads = heads;
+    index->items = items;
+    index->count = count;
+    index->dirty = false;
+    return true;
+}
+
+// Returns the hooks of a type whose range contains an address, or NULL
+struct list_item *ucjs_hooks_at(struct uc_struct *uc, int idx, uint64_t addr)
+{
+    struct ucjs_hook_index *index = &uc->hook_index[idx];
+    uint32_t lo, hi, mid;
+
+    if (uc->hook[idx].head == NULL) {
+        return NULL;
+    }
+    if (index->dirty || index->starts == NULL) {
+        if (!ucjs_hooks_build(uc, idx)) {
+            // Out of memory: callers also check the bounds of each hook
+            return uc->hook[idx].head;
+        }
+    }
+    // starts[lo] <= addr < starts[hi]
+    lo = 0;
+    hi = index->count;
+    while (hi - lo > 1) {
+        mid = lo + (hi - lo) / 2;
+        if (index->starts[mid] <= addr) {
+            lo = mid;
+        } else {
+            hi = mid;
+        }
+    }
+    return index->heads[lo];
+}
+
+void ucjs_hooks_changed(struct uc_struct *uc)
+{
+    int i;
+    for (i = 0; i < UC_HOOK_MAX; i++) {
+        uc->hook_index[i].dirty = true;
+    }
+}
+
+// Called by uc_hook_del before it unlinks the hook. The extra reference
+// keeps the hook alive until ucjs_hooks_collect, as loops running in the
+// current access or instruction may still reach it through the index.
+void ucjs_hooks_delete(struct uc_struct *uc, struct hook *hook)
+{
+    ucjs_hooks_changed(uc);
+    if (hook->ucjs_deleted) {
+        return;
+    }
+    if (list_append(&uc->ucjs_hooks_deleted, hook) == NULL) {
+        return;
+    }
+    hook->ucjs_deleted = true;
+    hook->refs++;
+}
+
+// Frees deleted hooks, once no hook loop can be running
+void ucjs_hooks_collect(struct uc_struct *uc)
+{
+    struct list_item *cur;
+    for (cur = uc->ucjs_hooks_deleted.head; cur != NULL; cur = cur->next) {
+        free(cur->data);
+    }
+    list_clear(&uc->ucjs_hooks_deleted);
+}
+
+void ucjs_hooks_free(struct uc_struct *uc)
+{
+    int i;
+    ucjs_hooks_collect(uc);
+    for (i = 0; i < UC_HOOK_MAX; i++) {
+        free(uc->hook_index[i].starts);
+        free(uc->hook_index[i].heads);
+        free(uc->hook_index[i].items);
+        memset(&uc->hook_index[i], 0, sizeof(uc->hook_index[i]));
+    }
+}
+"""
+
+# Translation buffer size requested by ucjs_open, and memory usage counters
+# kept up to date by translate-all.c. Layout of ucjs_memory_usage (32-bit
+# words): mapped (2), regions, tb_size, tb_used, tb_blocks, tb_flushes.
+PATCH_MEMORY_USAGE_PRIV = """
+// Unicorn.js: Translation buffer size of the engine being opened, or 0
+extern size_t ucjs_open_tb_size;
+
+typedef struct ucjs_memory_usage {
+    uint64_t mapped;        // Bytes of mapped guest memory
+    uint32_t regions;       // Number of mapped regions
+    uint32_t tb_size;       // Bytes of the translation buffer
+    uint32_t tb_used;       // Bytes used by translated blocks
+    uint32_t tb_blocks;     // Number of translated blocks
+    uint32_t tb_flushes;    // Flushes of the translation buffer
+} ucjs_memory_usage;
+"""
+
+PATCH_MEMORY_USAGE = """
+
+// Unicorn.js: Memory usage
+size_t ucjs_open_tb_size = 0;
+
+// Opens an engine with a translation buffer of tb_size bytes (0 for the
+// default size, clamped to at least 1 MB)
+UNICORN_EXPORT
+uc_err ucjs_open(uc_arch arch, uc_mode mode, uint32_t tb_size, uc_engine **result)
+{
+    uc_err err;
+    ucjs_open_tb_size = tb_size;
+    err = uc_open(arch, mode, result);
+    ucjs_open_tb_size = 0;
+    return err;
+}
+
+UNICORN_EXPORT
+void ucjs_memory_usage_get(uc_engine *uc, ucjs_memory_usage *usage)
+{
+    uint32_t i;
+    memset(usage, 0, sizeof(*usage));
+    for (i = 0; i < uc->mapped_block_count; i++) {
+        usage->mapped += uc->mapped_blocks[i]->end - uc->mapped_blocks[i]->addr;
+    }
+    usage->regions = uc->mapped_block_count;
+    usage->tb_size = uc->ucjs_tb_size;
+    usage->tb_used = uc->ucjs_tb_used;
+    usage->tb_blocks = uc->ucjs_tb_blocks;
+    usage->tb_flushes = uc->ucjs_tb_flushes;
+}
+"""
+
 def patchUnicornTCI():
     """
     Patches Unicorn's QEMU fork to add the TCG Interpreter backend
@@ -346,12 +1784,11 @@ def patchUnicornTCI():
     replace(os.path.join(UNICORN_QEMU_DIR, "configure"), {
         "tcg_interpreter=\"no\"": "tcg_interpreter=\"yes\""
     })
-    # Add executable permissions for the new configure file
-    path = os.path.join(UNICORN_QEMU_DIR, "configure")
-    st = os.stat(path)
-    os.chmod(path, st.st_mode | stat.S_IEXEC)
     # Copy missing TCI source files and patch them with Unicorn updates
-    copytree(ORIGINAL_QEMU_DIR, UNICORN_QEMU_DIR)
+    manifest = loadManifest()
+    copytree(ORIGINAL_QEMU_DIR, UNICORN_QEMU_DIR, manifest.setdefault('copied', {}),
+        trackedFiles(UNICORN_QEMU_DIR))
+    saveManifest(manifest)
     replace(os.path.join(UNICORN_QEMU_DIR, "tcg/tci/tcg-target.c"), {
         "tcg_target_available_regs": "s->tcg_target_available_regs",
         "tcg_target_call_clobber_regs": "s->tcg_target_call_clobber_regs",
@@ -366,6 +1803,65 @@ def patchUnicornTCI():
             "obj-$(CONFIG_TCG_INTERPRETER) += tci.o"
         ]
     )
+    # Fuse pairs of opcodes into superinstructions of the interpreter, except
+    # across labels and blocks, whose code might jump between the two
+    insert(os.path.join(UNICORN_QEMU_DIR, "tcg/tcg.h"),
+        "tcg_insn_unit *code_ptr;", [
+            "    tcg_insn_unit *ucjs_fuse_ptr;  /* Unicorn.js: Opcode the next one can fuse with */",
+            "    tcg_insn_unit *ucjs_fuse_end;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "tcg/tcg.c"), "s->nb_labels = 0;", [
+        "    s->ucjs_fuse_ptr = NULL;",
+    ])
+    insert(os.path.join(UNICORN_QEMU_DIR, "tcg/tcg.c"), "assert(!l->has_value);", [
+        "    s->ucjs_fuse_ptr = NULL;",
+    ])
+    # Flag TLB entries of pages without the permission of an access, checked
+    # by the inline TLB lookups of TCI
+    insert(os.path.join(UNICORN_QEMU_DIR, "include/exec/cpu-all.h"),
+        "#define TLB_MMIO        (1 << 5)", [
+            "/* Unicorn.js: Set if the region of the page lacks the permission of the",
+            "   access. The smallest target pages (1 KB) leave room for this bit. */",
+            "#define TLB_UCJS_PROT   (1 << 6)",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "cputlb.c"), '#include "uc_priv.h"', [
+        PATCH_TLB_PROT
+    ])
+    replace(os.path.join(UNICORN_QEMU_DIR, "cputlb.c"), {
+        "        te->addr_read = address;":
+        "        te->addr_read = address | ucjs_tlb_prot(cpu->uc, vaddr, UC_PROT_READ);",
+        "            te->addr_write = address | TLB_NOTDIRTY;":
+        "            te->addr_write = address | TLB_NOTDIRTY | ucjs_tlb_prot(cpu->uc, vaddr, UC_PROT_WRITE);",
+        "            te->addr_write = address;":
+        "            te->addr_write = address | ucjs_tlb_prot(cpu->uc, vaddr, UC_PROT_WRITE);",
+    })
+    replace(os.path.join(UNICORN_QEMU_DIR, "softmmu_template.h"), {
+        "    if (unlikely(tlb_addr & ~TARGET_PAGE_MASK)) {":
+        "    if (unlikely(tlb_addr & ~(TARGET_PAGE_MASK | TLB_UCJS_PROT))) {",
+    })
+    # Changing permissions only flushes the TLB along with the read-only flag
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "uc_readonly_mem_t readonly_mem;", [
+            "    uc_args_uc_t ucjs_tlb_flush;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "unicorn_common.h"),
+        "void free_code_gen_buffer(struct uc_struct *uc);", [
+            PATCH_TLB_FLUSH_COMMON
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "unicorn_common.h"),
+        "uc->readonly_mem = memory_region_set_readonly;", [
+            "    uc->ucjs_tlb_flush = ucjs_tlb_flush_common;",
+        ]
+    )
+    insert(os.path.join(UNICORN_DIR, "uc.c"),
+        "uc->readonly_mem(mr, (perms & UC_PROT_WRITE) == 0);", [
+            "        uc->ucjs_tlb_flush(uc);",
+        ]
+    )
     # Add TCI symbols
     insert(os.path.join(UNICORN_QEMU_DIR, "header_gen.py"),
         "symbols = (", [
@@ -373,12 +1869,9 @@ def patchUnicornTCI():
             "    'tcg_qemu_tb_exec',",
         ]
     )
-    # Update platform headers with new symbols
-    cmd = "bash -c \"cd " + UNICORN_QEMU_DIR + " && ./gen_all_header.sh\""
-    os.system(cmd)
 
 
-def patchUnicornJS():
+def patchUnicornJS(profiling=False):
     """
     Patches Unicorn files to target JavaScript
     """
@@ -413,22 +1906,22 @@ def patchUnicornJS():
         # Declare adapters
         "#define DEF_HELPER_FLAGS_0(name, flags, ret) \\":"""
          #define DEF_HELPER_FLAGS_0(name, flags, ret) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_0(name) \\""",
         "#define DEF_HELPER_FLAGS_1(name, flags, ret, t1) \\":"""
          #define DEF_HELPER_FLAGS_1(name, flags, ret, t1) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_1(name, t1) \\""",
         "#define DEF_HELPER_FLAGS_2(name, flags, ret, t1, t2) \\":"""
          #define DEF_HELPER_FLAGS_2(name, flags, ret, t1, t2) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_2(name, t1, t2) \\""",
         "#define DEF_HELPER_FLAGS_3(name, flags, ret, t1, t2, t3) \\":"""
          #define DEF_HELPER_FLAGS_3(name, flags, ret, t1, t2, t3) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_3(name, t1, t2, t3) \\""",
         "#define DEF_HELPER_FLAGS_4(name, flags, ret, t1, t2, t3, t4) \\":"""
          #define DEF_HELPER_FLAGS_4(name, flags, ret, t1, t2, t3, t4) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_4(name, t1, t2, t3, t4) \\""",
         "#define DEF_HELPER_FLAGS_5(name, flags, ret, t1, t2, t3, t4, t5) \\":"""
          #define DEF_HELPER_FLAGS_5(name, flags, ret, t1, t2, t3, t4, t5) \\
-         GEN_ADAPTER_DECLARE(name) \\""",
+         GEN_ADAPTER_DECLARE_5(name, t1, t2, t3, t4, t5) \\""",
     })
     replace(os.path.join(UNICORN_QEMU_DIR, "include/exec/helper-gen.h"), {
         # Adapter helpers
@@ -467,11 +1960,11 @@ def patchUnicornJS():
         #undef DEF_HELPER_FLAGS_2
         #define DEF_HELPER_FLAGS_2(name, flags, ret, t1, t2) \\
             dh_ctype(ret) HELPER(name) (dh_ctype(t1), dh_ctype(t2)); \\
-            uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS); \\
+            GEN_ADAPTER_DECLARE_2(name, t1, t2) \\
             GEN_ADAPTER_2_DEFINE(name, ret, t1, t2)
         #define DEF_HELPER_FLAGS_4(name, flags, ret, t1, t2, t3, t4) \\
             dh_ctype(ret) HELPER(name) (dh_ctype(t1), dh_ctype(t2), dh_ctype(t3), dh_ctype(t4)); \\
-            uint64_t glue(adapter_helper_, name)(GEN_ADAPTER_ARGS); \\
+            GEN_ADAPTER_DECLARE_4(name, t1, t2, t3, t4) \\
             GEN_ADAPTER_4_DEFINE(name, ret, t1, t2, t3, t4)
         DEF_HELPER_4(uc_tracecode, void, i32, i32, ptr, i64)
         #include "tcg-runtime.h"
@@ -482,57 +1975,247 @@ def patchUnicornJS():
         "func = glue(adapter_helper_, NAME)"
     })
     # Add arch-suffixes to adapters
-    header_gen_patched = False
-    with open(os.path.join(UNICORN_QEMU_DIR, "header_gen.py"), 'r') as f:
-        if 'adapter_' in f.read():
-            header_gen_patched = True
-    if header_gen_patched == False:
-        os.remove(os.path.join(UNICORN_QEMU_DIR, "header_gen.py.bak"))
-        replace(os.path.join(UNICORN_QEMU_DIR, "header_gen.py"), {
-            '      print("#define %s %s_%s" %(s, s, arch))':
-            '      print("#define %s %s_%s" %(s, s, arch))\n'
-            '      if s.startswith("helper_"):\n'
-            '          s = "adapter_" + s\n'
-            '          print("#define %s %s_%s" %(s, s, arch))',
-        })
+    replace(os.path.join(UNICORN_QEMU_DIR, "header_gen.py"), {
+        '      print("#define %s %s_%s" %(s, s, arch))':
+        '      print("#define %s %s_%s" %(s, s, arch))\n'
+        '      if s.startswith("helper_"):\n'
+        '          s = "adapter_" + s\n'
+        '          print("#define %s %s_%s" %(s, s, arch))',
+    })
     # Define adapters
     translate_pat = os.path.join(UNICORN_QEMU_DIR, "target-*/translate.c")
     for fpath in glob.glob(translate_pat):
         prepend(fpath, '#define GEN_ADAPTER_DEFINE\n')
-    # Fix register allocation for arguments
+    # Pass the number of argument words to the TCI call, which selects the
+    # adapter signature. All of them, so calls with arguments on the stack
+    # fail the check in tcg_out_call.
     replace(os.path.join(UNICORN_QEMU_DIR, "tcg/tcg.c"), {
-        "int is_64bit = ":
-        "int is_64bit = 1;//",
-        # Explicit casts of non-64bit arguments in tcg_gen_callN
-        "sizemask = info->sizemask;":"""
-         sizemask = info->sizemask;
-
-         for (i = 0; i < nargs; i++) {
-             int is_64bit = sizemask & (1 << (i+1)*2);
-             if (!is_64bit) {
-                 TCGArg ext_arg = tcg_temp_new_i64(s);
-                 tcg_gen_ext32u_i64(s, ext_arg, args[i]);
-                 args[i] = GET_TCGV_I64(ext_arg);
-             }
-         }
-        """
+        "static void tcg_out_call(TCGContext *s, tcg_insn_unit *target);":
+        "static void tcg_out_call(TCGContext *s, tcg_insn_unit *target, int nb_words);",
+        "    tcg_out_call(s, func_addr);":
+        "    tcg_out_call(s, func_addr, nb_params);",
     })
+    # Split regions mapped with uc_mem_map_ptr into regions sharing the same
+    # storage, instead of copying their contents into new allocations, so
+    # memory views stay aliased after partial unmaps and protection changes
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "size_t l_size, m_size, r_size;", [
+        "    uint8_t *host = NULL;",
+        "    RAMBlock *block;",
+        "    QTAILQ_FOREACH(block, &uc->ram_list.blocks, next) {",
+        "        // RAM_PREALLOC is private to exec.c",
+        "        if (block->mr == mr && (block->flags & 1))",
+        "            host = block->host;",
+        "    }",
+    ])
+    replace(os.path.join(UNICORN_DIR, "uc.c"), {
+        "    backup = copy_region(uc, mr);":
+        "    backup = host ? host : copy_region(uc, mr);",
+        "uc_mem_map(uc, begin, l_size, perms)":
+        "(host ? uc_mem_map_ptr(uc, begin, l_size, perms, host) : uc_mem_map(uc, begin, l_size, perms))",
+        "uc_mem_map(uc, address, m_size, perms)":
+        "(host ? uc_mem_map_ptr(uc, address, m_size, perms, host + l_size) : uc_mem_map(uc, address, m_size, perms))",
+        "uc_mem_map(uc, chunk_end, r_size, perms)":
+        "(host ? uc_mem_map_ptr(uc, chunk_end, r_size, perms, host + l_size + m_size) : uc_mem_map(uc, chunk_end, r_size, perms))",
+        "if (uc_mem_write(uc, ":
+        "if (!host && uc_mem_write(uc, ",
+        "    free(backup);":
+        "    if (!host)\n        free(backup);",
+    })
+    # Add the instruction counter of time-sliced emulation
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_EMU_COUNTER)
+    # Flush translated blocks between jobs of worker pools
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "uc_readonly_mem_t readonly_mem;", [
+            "    uc_args_uc_t ucjs_tb_flush;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "unicorn_common.h"),
+        "void free_code_gen_buffer(struct uc_struct *uc);", [
+            PATCH_TB_FLUSH_COMMON
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "unicorn_common.h"),
+        "uc->readonly_mem = memory_region_set_readonly;", [
+            "    uc->ucjs_tb_flush = ucjs_tb_flush_common;",
+        ]
+    )
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_TB_FLUSH)
+    # Add the trace buffer
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_TRACE_BUFFER)
+    # Add the edge coverage bitmap
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_COVERAGE_MAP)
+    # Add snapshots with dirty page tracking, marked by guest stores (the
+    # softmmu helpers, and the inline TLB checks of TCI and of cpu_st*) and
+    # by uc_mem_write
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "MemoryRegion *memory_mapping(struct uc_struct* uc, uint64_t address);", [
+            PATCH_SNAPSHOT_PRIV
+        ]
+    )
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "struct list hook[UC_HOOK_MAX];", [
+            "    struct ucjs_snapshot *ucjs_snapshots;",
+        ]
+    )
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_SNAPSHOT)
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "const uint8_t *bytes = _bytes;", [
+        "    UCJS_SNAPSHOTS_MARK(uc, address, size);",
+    ])
+    insert(os.path.join(UNICORN_QEMU_DIR, "softmmu_template.h"), "// Unicorn: callback on memory write", [
+        "    UCJS_SNAPSHOTS_MARK(uc, addr, DATA_SIZE);",
+    ])
+    insert(os.path.join(UNICORN_QEMU_DIR, "include/exec/cpu_ldst.h"), '#include "tcg.h"', [
+        "struct uc_struct;",
+        "void ucjs_snapshots_mark(struct uc_struct *uc, uint64_t address, uint32_t size);",
+    ])
+    replace(os.path.join(UNICORN_QEMU_DIR, "include/exec/cpu_ldst_template.h"), {
+        "        glue(glue(st, SUFFIX), _raw)(hostaddr, v);":
+        "        ucjs_snapshots_mark(env->uc, addr, DATA_SIZE);\n"
+        "        glue(glue(st, SUFFIX), _raw)(hostaddr, v);",
+    })
+    # Look up hooks in an interval index of their ranges, instead of checking
+    # every hook of a type on each instruction, block or memory access
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "#define HOOK_EXISTS(uc, idx) ((uc)->hook[idx##_IDX].head != NULL)", [
+            PATCH_HOOK_INDEX_PRIV
+        ]
+    )
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "int refs;            // reference count to free hook stored in multiple lists", [
+        "    bool ucjs_deleted;   // Unicorn.js: deleted, freed once emulation stops",
+    ])
+    replace(os.path.join(UNICORN_DIR, "include/uc_priv.h"), {
+        "#define HOOK_EXISTS_BOUNDED(uc, idx, addr) _hook_exists_bounded((uc)->hook[idx##_IDX].head, addr)":
+        "#define HOOK_EXISTS_BOUNDED(uc, idx, addr) (ucjs_hooks_at((uc), idx##_IDX, (addr)) != NULL)",
+    })
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "struct list hook[UC_HOOK_MAX];", [
+            "    struct ucjs_hook_index hook_index[UC_HOOK_MAX];",
+            "    struct list ucjs_hooks_deleted;",
+        ]
+    )
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_HOOK_INDEX)
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "*hh = (uc_hook)hook;", [
+        "    ucjs_hooks_changed(uc);",
+    ])
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "struct hook *hook = (struct hook *)hh;", [
+        "    ucjs_hooks_delete(uc, hook);",
+    ])
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "uc->emulation_done = true;", [
+        "    ucjs_hooks_collect(uc);",
+    ])
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "free(uc->mapped_blocks);", [
+        "    ucjs_hooks_free(uc);",
+    ])
+    replace(os.path.join(UNICORN_DIR, "uc.c"), {
+        "    struct list_item *cur = uc->hook[type].head;":
+        "    struct list_item *cur = ucjs_hooks_at(uc, type, address);",
+        "    while (cur != NULL && !uc->stop_request) {":
+        "    while ((cur = ucjs_hooks_live(cur)) != NULL && !uc->stop_request) {",
+    })
+    replace(os.path.join(UNICORN_QEMU_DIR, "softmmu_template.h"), {
+        "HOOK_FOREACH(uc, hook, UC_HOOK_MEM_":
+        "HOOK_FOREACH_BOUNDED(uc, addr, hook, UC_HOOK_MEM_",
+    })
+    # Open engines with a given translation buffer size, and keep track of
+    # the memory they use
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "uint64_t next_pc;   // save next PC for some special cases", [
+            "    size_t ucjs_tb_size;        // Unicorn.js: Translation buffer usage",
+            "    size_t ucjs_tb_used;",
+            "    uint32_t ucjs_tb_blocks;",
+            "    uint32_t ucjs_tb_flushes;",
+        ]
+    )
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "MemoryRegion *memory_mapping(struct uc_struct* uc, uint64_t address);", [
+            PATCH_MEMORY_USAGE_PRIV
+        ]
+    )
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_MEMORY_USAGE)
+    replace(os.path.join(UNICORN_QEMU_DIR, "accel.c"), {
+        "ms->uc->tcg_exec_init(ms->uc, TCG_TB_SIZE * 1024 * 1024);":
+        "ms->uc->tcg_exec_init(ms->uc, ucjs_open_tb_size);",
+    })
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "code_gen_alloc(uc, tb_size);", [
+            "    uc->ucjs_tb_size = ((TCGContext *)uc->tcg_ctx)->code_gen_buffer_size;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "code_gen_size + CODE_GEN_ALIGN - 1) & ~(CODE_GEN_ALIGN - 1));", [
+            "    env->uc->ucjs_tb_used = (uint8_t *)tcg_ctx->code_gen_ptr - (uint8_t *)tcg_ctx->code_gen_buffer;",
+            "    env->uc->ucjs_tb_blocks = tcg_ctx->tb_ctx.nb_tbs;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "tcg_ctx->code_gen_ptr = tb->tc_ptr;", [
+            "        uc->ucjs_tb_used = (uint8_t *)tcg_ctx->code_gen_ptr - (uint8_t *)tcg_ctx->code_gen_buffer;",
+            "        uc->ucjs_tb_blocks = tcg_ctx->tb_ctx.nb_tbs - 1;",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "tcg_ctx->tb_ctx.tb_flush_count++;", [
+            "    uc->ucjs_tb_used = 0;",
+            "    uc->ucjs_tb_blocks = 0;",
+            "    uc->ucjs_tb_flushes++;",
+        ]
+    )
+    # Add the profiling counters, compiled only in profiling builds
+    if profiling:
+        prepend(os.path.join(UNICORN_DIR, "include/uc_priv.h"), "#define UCJS_PROFILING 1\n")
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "uint64_t next_pc;   // save next PC for some special cases", [
+            "#ifdef UCJS_PROFILING",
+            "    struct ucjs_profile *ucjs_profile;",
+            "#endif",
+        ]
+    )
+    insert(os.path.join(UNICORN_DIR, "include/uc_priv.h"),
+        "MemoryRegion *memory_mapping(struct uc_struct* uc, uint64_t address);", [
+            PATCH_PROFILING_PRIV
+        ]
+    )
+    append(os.path.join(UNICORN_DIR, "uc.c"), PATCH_PROFILING)
+    insert(os.path.join(UNICORN_DIR, "uc.c"), "free(uc->mapped_blocks);", [
+        "#ifdef UCJS_PROFILING",
+        "    ucjs_profile_free(uc);",
+        "#endif",
+    ])
+    insert(os.path.join(UNICORN_QEMU_DIR, "tcg/tcg.c"),
+        "info = g_hash_table_lookup(s->helpers, (gpointer)func);", [
+            "#ifdef UCJS_PROFILING",
+            "    ucjs_profile_helper_add(s->uc, func, info->name);",
+            "#endif",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "cpu_gen_code(env, tb, &code_gen_size);  // qq", [
+            "#ifdef UCJS_PROFILING",
+            "    ucjs_profile_translate(env->uc, tb->pc, tb->tc_ptr);",
+            "#endif",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "translate-all.c"),
+        "tcg_ctx->tb_ctx.tb_flush_count++;", [
+            "#ifdef UCJS_PROFILING",
+            "    ucjs_profile_flush(uc);",
+            "#endif",
+        ]
+    )
+    insert(os.path.join(UNICORN_QEMU_DIR, "cputlb.c"),
+        "unsigned vidx = env->vtlb_index++ % CPU_VTLB_SIZE;", [
+            "#ifdef UCJS_PROFILING",
+            "    ucjs_profile_tlb_miss(env->uc);",
+            "#endif",
+        ]
+    )
     # Fix unaligned reads
     append(os.path.join(UNICORN_QEMU_DIR, "include/qemu-common.h"),
         PATCH_UNALIGNED_MEMACCESS)
-    replace(os.path.join(UNICORN_QEMU_DIR, "include/exec/exec-all.h"), {
-        "    *(uint32_t *)jmp_addr = addr - (jmp_addr + 4);":
-        "    UNALIGNED_WRITE32_LE(jmp_addr, addr - (jmp_addr + 4));"
-    })
+    # Bytecode constants and jump targets are aligned by the TCI backend,
+    # only guest memory accesses can be unaligned
     replace(os.path.join(UNICORN_QEMU_DIR, "tci.c"), {
-        "*(tcg_target_ulong *)(*tb_ptr)":
-        "UNALIGNED_READ32_LE(*tb_ptr)",
-        "*(uint32_t *)(*tb_ptr)":
-        "UNALIGNED_READ32_LE(*tb_ptr)",
-        "*(int32_t *)(*tb_ptr)":
-        "UNALIGNED_READ32_LE(*tb_ptr)",
-        "*(uint64_t *)tb_ptr":
-        "UNALIGNED_READ64_LE(tb_ptr)",
         # Stores
         "*(uint16_t *)(t1 + t2) = t0":
         "UNALIGNED_WRITE16_LE(t1 + t2, t0)",
@@ -550,70 +2233,446 @@ def patchUnicornJS():
     })
 
 
+def generateHeaders():
+    """
+    Updates platform headers with new symbols, unless their inputs are unchanged
+    """
+    manifest = loadManifest()
+    digest = hashFiles([
+        os.path.join(UNICORN_QEMU_DIR, "header_gen.py"),
+        os.path.join(UNICORN_QEMU_DIR, "gen_all_header.sh"),
+    ])
+    if manifest.get('headers') == digest:
+        return
+    cmd = "bash -c \"cd " + UNICORN_QEMU_DIR + " && ./gen_all_header.sh\""
+    os.system(cmd)
+    manifest['headers'] = digest
+    saveManifest(manifest)
+
+
+def patchUnicorn(report=None, profiling=False):
+    """
+    Patches Unicorn, re-patching only files whose sources or patches changed
+    """
+    with phase(report, 'patch'):
+        patchUnicornTCI()
+        patchUnicornJS(profiling)
+        try:
+            applyPatches()
+        except PatchError as e:
+            print e
+            exit(1)
+    # Add executable permissions for the new configure file
+    path = os.path.join(UNICORN_QEMU_DIR, "configure")
+    st = os.stat(path)
+    os.chmod(path, st.st_mode | stat.S_IEXEC)
+    with phase(report, 'headers'):
+        generateHeaders()
+
+
+def restoreObjects(unicorn_dir):
+    """
+    Undoes rename_objects.py, so make finds its previous objects and timestamps
+    """
+    path = os.path.join(unicorn_dir, 'qemu/*softmmu/**/*.o')
+    for d in xrange(5):
+        for f in glob.glob(path.replace('/**', '/*' * d)):
+            m = re.match(r'.*\/([0-9A-Za-z_]+)\-softmmu\/.*', f.replace('\\', '/'))
+            if not m:
+                continue
+            suffix = '-' + m.group(1) + '.o'
+            if f.endswith(suffix) and not os.path.exists(f[:-len(suffix)] + '.o'):
+                os.rename(f, f[:-len(suffix)] + '.o')
+
+
 ############
 # Building #
 ############
 
-def compileUnicorn(targets):
-    # Patching Unicorn's QEMU fork
-    patchUnicornTCI()
-    patchUnicornJS()
+# Makes the loader fetch the WebAssembly binary by its final name in dist/
+PRE_JS_WASM = """
+if (!Module['locateFile']) {
+    Module['locateFile'] = function (path, prefix) {
+        if (path.slice(-5) === '.wasm') {
+            path = '%s';
+        }
+        return (prefix || '') + path;
+    };
+}
+"""
+
+def parseSize(value):
+    """
+    Parses a size in bytes, with an optional K, M or G suffix
+    """
+    m = re.match(r'^(\d+)([KMG]?)$', value.strip().upper())
+    if not m:
+        raise ValueError("Invalid size: %s" % value)
+    return int(m.group(1)) << {'': 0, 'K': 10, 'M': 20, 'G': 30}[m.group(2)]
+
+
+def checkMemory(memory, profile):
+    """
+    Validates the initial and maximum heap sizes of a build profile.
+    Returns an error message, or None.
+    """
+    wasm = BUILD_PROFILES[profile]['wasm']
+    total = memory.get('total') or DEFAULT_TOTAL_MEMORY
+    maximum = memory.get('max')
+    alignment = HEAP_ALIGNMENT[wasm]
+    for name, size in [('total-memory', memory.get('total')), ('max-memory', maximum)]:
+        if size is not None and (size <= 0 or size % alignment):
+            return "--%s must be a multiple of %d bytes in %s builds" % (
+                name, alignment, 'WebAssembly' if wasm else 'asm.js')
+    if maximum is not None and maximum < total:
+        return "--max-memory must not be smaller than the initial heap (%d bytes)" % total
+    if maximum is not None and maximum != total and not wasm:
+        return "asm.js heaps cannot grow up to a limit, use --max-memory=%d for a fixed heap" % total
+    return None
+
+
+def memoryFlags(memory):
+    """
+    Emscripten flags for the initial and maximum heap sizes. The heap grows
+    on demand up to the maximum, and has a fixed size if both are equal.
+    """
+    total = memory.get('total')
+    maximum = memory.get('max')
+    flags = ''
+    if total is not None:
+        flags += ' -s TOTAL_MEMORY=%d' % total
+    if maximum is not None and maximum == (total or DEFAULT_TOTAL_MEMORY):
+        flags += ' -s ALLOW_MEMORY_GROWTH=0'
+    else:
+        flags += ' -s ALLOW_MEMORY_GROWTH=1'
+        if maximum is not None:
+            flags += ' -s WASM_MEM_MAX=%d' % maximum
+    return flags
+
+
+def compileUnicorn(targets, profile=DEFAULT_PROFILE, unicorn_dir=UNICORN_DIR, log=None, clean=False, report=None,
+                   profiling=False, memory={}):
+    """
+    Builds Unicorn in the given tree and compiles it to src/libunicorn*.out.js.
+    Returns the exit code of the first failing step, or 0 on success.
+    Timings, object counts and artifact sizes are stored in report.
+    The initial and maximum heap sizes are given in memory['total'] and
+    memory['max'], in bytes.
+    """
+    settings = BUILD_PROFILES[profile]
+    suffix = ''
+    if targets:
+        suffix = '-' + '-'.join(targets)
 
-    # Emscripten: Make
-    os.chdir('unicorn')
-    os.system('make clean')
+    # Emscripten: Make (incrementally, unless the target set or profiling changed)
+    manifest = loadManifest(unicorn_dir)
+    if (clean or manifest.get('targets') != targets or
+            manifest.get('profiling', False) != profiling):
+        run('make clean', cwd=unicorn_dir, log=log)
+    else:
+        restoreObjects(unicorn_dir)
     if os.name == 'posix':
         cmd = ''
         if targets:
             cmd += 'UNICORN_ARCHS="%s" ' % (' '.join(targets))
         cmd += 'emmake make'
-        os.system(cmd)
-    os.chdir('..')
+        start = time.time()
+        with phase(report, 'make'):
+            ret = run(cmd, cwd=unicorn_dir, log=log)
+        if report is not None:
+            report['objects'] = countObjects(unicorn_dir, start)
+        if ret != 0:
+            return ret
+        manifest = loadManifest(unicorn_dir)
+        manifest['targets'] = targets
+        manifest['profiling'] = profiling
+        saveManifest(manifest, unicorn_dir)
 
     # Compile static library to JavaScript
     methods = ['ccall', 'getValue', 'setValue', 'addFunction', 'removeFunction', 'writeArrayToMemory']
     cmd = 'emcc'
-    cmd += ' -Os --memory-init-file 0'
-    cmd += ' unicorn/libunicorn.a'
-    cmd += ' -s EXPORTED_FUNCTIONS=\"[\''+ '\', \''.join(EXPORTED_FUNCTIONS) +'\']\"'
+    cmd += ' ' + ' '.join(settings['flags'])
+    cmd += ' --memory-init-file 0'
+    cmd += ' ' + os.path.join(unicorn_dir, 'libunicorn.a')
+    exported = EXPORTED_FUNCTIONS
+    if profiling:
+        exported = exported + PROFILING_EXPORTED_FUNCTIONS
+    cmd += ' -s EXPORTED_FUNCTIONS=\"[\''+ '\', \''.join(exported) +'\']\"'
     cmd += ' -s EXTRA_EXPORTED_RUNTIME_METHODS=\"[\''+ '\', \''.join(methods) +'\']\"'
     cmd += ' -s RESERVED_FUNCTION_POINTERS=256'
-    cmd += ' -s ALLOW_MEMORY_GROWTH=1'
+    cmd += memoryFlags(memory)
     cmd += ' -s MODULARIZE=1'
-    cmd += ' -s WASM=0'
     cmd += ' -s EXPORT_NAME="\'MUnicorn\'"'
-    if targets:
-        cmd += ' -o src/libunicorn-%s.out.js' % ('-'.join(targets))
+    if settings['wasm']:
+        # Loader in src/libunicorn*.out.js, binary in src/libunicorn*.out.wasm
+        pre_js = 'src/libunicorn%s.pre.js' % suffix
+        with open(pre_js, 'w') as f:
+            f.write(PRE_JS_WASM % ('unicorn%s.wasm' % suffix))
+        cmd += ' -s WASM=1'
+        cmd += ' --pre-js ' + pre_js
     else:
-        cmd += ' -o src/libunicorn.out.js'
-    os.system(cmd)
+        cmd += ' -s WASM=0'
+        # Avoid shipping a stale binary from a previous WebAssembly build
+        wasm = 'src/libunicorn%s.out.wasm' % suffix
+        if os.path.exists(wasm):
+            os.remove(wasm)
+    cmd += ' -o src/libunicorn%s.out.js' % suffix
+    with phase(report, 'emcc'):
+        ret = run(cmd, log=log)
+    if settings['wasm']:
+        os.remove(pre_js)
+    if report is not None:
+        report['artifacts'] = artifactSizes(suffix)
+    return ret
+
+
+def compileRelease(args):
+    """
+    Worker for the release action: builds one target set in its own work tree
+    """
+    targets, profile, clean, profiling, memory = args
+    name = '-'.join(targets) or 'all'
+    workdir = os.path.join(BUILD_DIR, name)
+    unicorn_dir = os.path.join(workdir, 'unicorn')
+    if not os.path.exists(workdir):
+        os.makedirs(workdir)
+    synctree(UNICORN_DIR, unicorn_dir)
+    log_path = os.path.join(workdir, 'build.log')
+    report = {}
+    with open(log_path, 'w') as log:
+        ret = compileUnicorn(targets, profile, unicorn_dir, log, clean, report, profiling, memory)
+    return name, ret, log_path, report
+
+
+def release(archs, profile=DEFAULT_PROFILE, clean=False, report=None, profiling=False, memory={}):
+    """
+    Builds the complete library and one library per architecture in parallel
+    """
+    jobs = [([], profile, clean, profiling, memory)] + [([arch], profile, clean, profiling, memory)
+        for arch in archs]
+    pool = multiprocessing.Pool(min(len(jobs), multiprocessing.cpu_count()))
+    failed = []
+    for name, ret, log_path, target_report in pool.imap_unordered(compileRelease, jobs):
+        with open(log_path, 'r') as log:
+            sys.stdout.write(log.read())
+        print "[%s] %s (log: %s)" % (name, 'failed' if ret else 'done', log_path)
+        if ret != 0:
+            failed.append(name)
+        if report is not None:
+            report.setdefault('targets', {})[name] = target_report
+    pool.close()
+    pool.join()
+    return failed
+
+
+#############
+# Reporting #
+#############
+
+# Phases that got slower by less than this many seconds are not regressions
+TIME_SLACK = 1.0
+
+# Record the wall time of a build phase
+@contextlib.contextmanager
+def phase(report, name):
+    start = time.time()
+    try:
+        yield
+    finally:
+        if report is not None:
+            report.setdefault('phases', {})[name] = round(time.time() - start, 3)
+
+# Count object files in a tree, and how many were written since a given time
+def countObjects(unicorn_dir, since):
+    total = 0
+    rebuilt = 0
+    for root, dirs, files in os.walk(unicorn_dir):
+        for name in files:
+            if name.endswith('.o'):
+                total += 1
+                if os.path.getmtime(os.path.join(root, name)) >= since:
+                    rebuilt += 1
+    return {'total': total, 'rebuilt': rebuilt}
+
+# Raw and gzipped sizes of the compiled library
+def artifactSizes(suffix):
+    sizes = {}
+    for path in ['src/libunicorn%s.out.js' % suffix, 'src/libunicorn%s.out.wasm' % suffix]:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=9) as f:
+            f.write(data)
+        sizes[os.path.basename(path)] = {'size': len(data), 'gzip': len(buf.getvalue())}
+    return sizes
+
+def saveReport(report, path):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True, separators=(',', ': '))
+    print "Build report: %s" % path
+
+def compareReports(old, new, threshold=5.0, time_threshold=25.0):
+    """
+    Prints the differences between two build reports.
+    Returns the list of sizes and times that grew above their threshold.
+    """
+    regressions = []
+    def check(label, a, b, limit, unit, slack=0):
+        if a is None or b is None:
+            return
+        delta = 100.0 * (b - a) / a if a else 0.0
+        flag = ''
+        if delta > limit and b - a > slack:
+            flag = '  <-- regression'
+            regressions.append(label)
+        print "  %-48s %12s %12s %+8.2f%%%s" % (label, '%s%s' % (a, unit), '%s%s' % (b, unit), delta, flag)
+    print "  %-48s %12s %12s %9s" % ('', 'old', 'new', 'change')
+    for name in sorted(old.get('phases', {})):
+        check('phase %s' % name, old['phases'][name],
+            new.get('phases', {}).get(name), time_threshold, 's', TIME_SLACK)
+    old_targets = old.get('targets', {})
+    new_targets = new.get('targets', {})
+    for target in sorted(old_targets):
+        if target not in new_targets:
+            print "  %s: missing from new report" % target
+            continue
+        a = old_targets[target]
+        b = new_targets[target]
+        for name in sorted(a.get('phases', {})):
+            check('%s: phase %s' % (target, name), a['phases'][name],
+                b.get('phases', {}).get(name), time_threshold, 's', TIME_SLACK)
+        for artifact in sorted(a.get('artifacts', {})):
+            for kind in ['size', 'gzip']:
+                check('%s: %s (%s)' % (target, artifact, kind),
+                    a['artifacts'][artifact][kind],
+                    b.get('artifacts', {}).get(artifact, {}).get(kind), threshold, 'B')
+    return regressions
+
+
+def parseOptions(args):
+    """
+    Splits command-line arguments into --key=value options and positionals
+    """
+    options = {}
+    positionals = []
+    for arg in args:
+        if arg.startswith('--'):
+            key, _, value = arg[2:].partition('=')
+            options[key] = value
+        else:
+            positionals.append(arg)
+    return options, positionals
 
 
 def exit_usage():
-    print "Usage: %s <action> [<targets>...]\n" % (sys.argv[0])
+    print "Usage: %s <action> [--profile=<profile>] [--profiling] [--total-memory=<size>] [--max-memory=<size>]" % (sys.argv[0])
+    print "       [--clean] [--report=<path>] [<targets>...]\n"
     print "List of actions:"
     print " - patch: Patch Unicorn only"
     print " - build: Patch Unicorn and build Unicorn.js"
+    print " - release: Patch Unicorn and build all targets in parallel"
+    print " - compare: Compare two build reports: compare <old.json> <new.json>"
+    print "   [--threshold=<size %%>] [--time-threshold=<time %%>]"
+    print "Options:"
+    print " - profiling: Count interpreted opcodes, helper calls, blocks, TLB misses and flushes"
+    print " - total-memory: Initial heap size, e.g. 64M (default: 16M)"
+    print " - max-memory: Maximum heap size (WebAssembly only, unless equal to the initial size)"
+    print "List of targets: %s" % ', '.join(TARGET_CONSTANTS)
+    print "List of profiles:"
+    for name in sorted(BUILD_PROFILES):
+        settings = BUILD_PROFILES[name]
+        default = ' (default)' if name == DEFAULT_PROFILE else ''
+        print " - %s: %s %s%s" % (name,
+            'WebAssembly' if settings['wasm'] else 'asm.js',
+            ' '.join(settings['flags']), default)
     exit(1)
 
 if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        exit_usage()
+    action = sys.argv[1]
+    options, args = parseOptions(sys.argv[2:])
+    # Compare build reports
+    if action == 'compare':
+        if len(args) != 2:
+            exit_usage()
+        with open(args[0], 'r') as f:
+            old = json.load(f)
+        with open(args[1], 'r') as f:
+            new = json.load(f)
+        regressions = compareReports(old, new,
+            float(options.get('threshold', 5)),
+            float(options.get('time-threshold', 25)))
+        if regressions:
+            print "Regressions: %s" % ', '.join(regressions)
+            exit(1)
+        exit(0)
     # Initialize Unicorn submodule if necessary
-    if not os.listdir(UNICORN_DIR):
+    if not os.path.exists(UNICORN_DIR) or not os.listdir(UNICORN_DIR):
         os.system("git submodule update --init")
     # Compile Unicorn
-    if len(sys.argv) < 2:
+    profile = options.get('profile', DEFAULT_PROFILE)
+    if profile not in BUILD_PROFILES:
+        print "Unknown build profile: %s\n" % profile
+        exit_usage()
+    clean = 'clean' in options
+    profiling = 'profiling' in options
+    memory = {}
+    try:
+        for key, option in [('total', 'total-memory'), ('max', 'max-memory')]:
+            if option in options:
+                memory[key] = parseSize(options[option])
+    except ValueError as e:
+        print "%s\n" % e
+        exit_usage()
+    error = checkMemory(memory, profile)
+    if error:
+        print "%s\n" % error
+        exit_usage()
+    report = {'action': action, 'profile': profile, 'profiling': profiling,
+        'total_memory': memory.get('total'), 'max_memory': memory.get('max'),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    report_path = options.get('report', os.path.join(BUILD_DIR, 'report.json'))
+    unknown = [target for target in args if target not in TARGET_CONSTANTS]
+    if action in ['build', 'release'] and unknown:
+        print "Unknown targets: %s\n" % ', '.join(unknown)
         exit_usage()
-    action = sys.argv[1]
     if action == 'patch':
-        patchUnicornTCI()
-        patchUnicornJS()
+        patchUnicorn(profiling=profiling)
     elif action == 'build':
-        patchUnicornTCI()
-        patchUnicornJS()
-        targets = sorted(sys.argv[2:])
+        patchUnicorn(report, profiling)
+        targets = sorted(args)
+        if os.name in ['posix']:
+            generateConstants(targets)
+            target_report = {}
+            ret = compileUnicorn(targets, profile, clean=clean, report=target_report,
+                profiling=profiling, memory=memory)
+            name = '-'.join(targets) or 'all'
+            report['targets'] = {name: target_report}
+            saveReport(report, report_path)
+            if ret != 0:
+                print "Failed targets: %s" % name
+                exit(1)
+        else:
+            print "Your operating system is not supported by this script:"
+            print "Please, use Emscripten to compile Unicorn manually to src/libunicorn.out.js"
+    elif action == 'release':
+        patchUnicorn(report, profiling)
+        archs = sorted(args) or RELEASE_ARCHS
         if os.name in ['posix']:
             generateConstants()
-            compileUnicorn(targets)
+            for arch in archs:
+                generateConstants([arch])
+            failed = release(archs, profile, clean, report, profiling, memory)
+            saveReport(report, report_path)
+            if failed:
+                print "Failed targets: %s" % ', '.join(failed)
+                exit(1)
         else:
             print "Your operating system is not supported by this script:"
             print "Please, use Emscripten to compile Unicorn manually to src/libunicorn.out.js"
@@ -397,13 +397,36 @@ void tci_disas(uint8_t opc)
 }
 #endif
 
+/* Unicorn.js: Pad the bytecode so that the next constant of the given size
+   is naturally aligned, and the interpreter can read it with a single load. */
+static void tci_out_align(TCGContext *s, size_t size)
+{
+    while ((uintptr_t)s->code_ptr & (size - 1)) {
+        tcg_out8(s, 0);
+    }
+}
+
+/* Write aligned constant (32 bit). */
+static void tci_out32(TCGContext *s, uint32_t v)
+{
+    tci_out_align(s, sizeof(v));
+    tcg_out32(s, v);
+}
+
+/* Write aligned constant (64 bit). */
+static void tci_out64(TCGContext *s, uint64_t v)
+{
+    tci_out_align(s, sizeof(v));
+    tcg_out64(s, v);
+}
+
 /* Write value (native size). */
 static void tcg_out_i(TCGContext *s, tcg_target_ulong v)
 {
     if (TCG_TARGET_REG_BITS == 32) {
-        tcg_out32(s, v);
+        tci_out32(s, v);
     } else {
-        tcg_out64(s, v);
+        tci_out64(s, v);
     }
 }
 
@@ -439,7 +462,7 @@ static void tcg_out_ri32(TCGContext *s, int const_arg, TCGArg arg)
     if (const_arg) {
         assert(const_arg == 1);
         tcg_out8(s, TCG_CONST);
-        tcg_out32(s, arg);
+        tci_out32(s, arg);
     } else {
         tcg_out_r(s, arg);
     }
@@ -452,7 +475,7 @@ static void tcg_out_ri64(TCGContext *s, int const_arg, TCGArg arg)
     if (const_arg) {
         assert(const_arg == 1);
         tcg_out8(s, TCG_CONST);
-        tcg_out64(s, arg);
+        tci_out64(s, arg);
     } else {
         tcg_out_r(s, arg);
     }
@@ -467,11 +490,66 @@ static void tci_out_label(TCGContext *s, TCGArg arg)
         tcg_out_i(s, label->u.value);
         assert(label->u.value);
     } else {
+        tci_out_align(s, sizeof(tcg_target_ulong));
         tcg_out_reloc(s, s->code_ptr, sizeof(tcg_target_ulong), arg, 0);
         s->code_ptr += sizeof(tcg_target_ulong);
     }
 }
 
+/* Unicorn.js: Fuses the opcode with the one emitted just before it, if that
+   one was the last of a block without labels, by extending it in place into
+   a superinstruction. This saves one dispatch in the interpreter. The result
+   of the first opcode is still written, as later opcodes might use it. */
+static bool tci_out_fused(TCGContext *s, TCGOpcode opc, const TCGArg *args,
+                          const int *const_args)
+{
+    uint8_t *first = s->ucjs_fuse_ptr;
+    int other;
+
+    if (first == NULL || s->code_ptr != s->ucjs_fuse_end) {
+        return false;
+    }
+    if (opc == INDEX_op_brcond_i32 && first[0] == INDEX_op_setcond_i32 &&
+        args[0] == first[2] && const_args[1] && (uint32_t)args[1] == 0 &&
+        (args[2] == TCG_COND_NE || args[2] == TCG_COND_EQ)) {
+        /* setcond_i32 t0, t1, t2, cond; brcond_i32 t0, 0, ne/eq, label */
+        first[0] = INDEX_op_tci_setcond_brcond_i32;
+        tcg_out8(s, args[2] == TCG_COND_NE);    /* branch if set */
+        tci_out_label(s, args[3]);
+    } else if (opc == INDEX_op_add_i32 && first[0] == INDEX_op_ld_i32 &&
+               ((!const_args[1] && args[1] == first[2]) ||
+                (!const_args[2] && args[2] == first[2]))) {
+        /* ld_i32 t0, t1, offset; add_i32 t2, t0, ri */
+        other = (!const_args[1] && args[1] == first[2]) ? 2 : 1;
+        first[0] = INDEX_op_tci_ld_add_i32;
+        tcg_out_r(s, args[0]);
+        tcg_out_ri32(s, const_args[other], args[other]);
+    } else if (opc == INDEX_op_brcond_i32 && first[0] == INDEX_op_ld_i32 &&
+               args[0] == first[2]) {
+        /* ld_i32 t0, t1, offset; brcond_i32 t0, ri, cond, label */
+        first[0] = INDEX_op_tci_ld_brcond_i32;
+        tcg_out_ri32(s, const_args[1], args[1]);
+        tcg_out8(s, args[2]);   /* condition */
+        tci_out_label(s, args[3]);
+    } else {
+        return false;
+    }
+    first[1] = s->code_ptr - first;
+    s->ucjs_fuse_ptr = NULL;
+    return true;
+}
+
+/* Unicorn.js: Records the opcode just emitted as the first of a fused pair */
+static void tci_out_fusable(TCGContext *s, TCGOpcode opc, uint8_t *start)
+{
+    if (opc == INDEX_op_setcond_i32 || opc == INDEX_op_ld_i32) {
+        s->ucjs_fuse_ptr = start;
+        s->ucjs_fuse_end = s->code_ptr;
+    } else {
+        s->ucjs_fuse_ptr = NULL;
+    }
+}
+
 static void tcg_out_ld(TCGContext *s, TCGType type, TCGReg ret, TCGReg arg1,
                        intptr_t arg2)
 {
@@ -480,7 +558,10 @@ static void tcg_out_ld(TCGContext *s, TCGType type, TCGReg ret, TCGReg arg1,
         tcg_out_op_t(s, INDEX_op_ld_i32);
         tcg_out_r(s, ret);
         tcg_out_r(s, arg1);
-        tcg_out32(s, arg2);
+        tci_out32(s, arg2);
+        old_code_ptr[1] = s->code_ptr - old_code_ptr;
+        tci_out_fusable(s, INDEX_op_ld_i32, old_code_ptr);
+        return;
     } else {
         assert(type == TCG_TYPE_I64);
 #if TCG_TARGET_REG_BITS == 64
@@ -488,7 +569,7 @@ static void tcg_out_ld(TCGContext *s, TCGType type, TCGReg ret, TCGReg arg1,
         tcg_out_r(s, ret);
         tcg_out_r(s, arg1);
         assert(arg2 == (int32_t)arg2);
-        tcg_out32(s, arg2);
+        tci_out32(s, arg2);
 #else
         TODO();
 #endif
@@ -518,13 +599,13 @@ static void tcg_out_movi(TCGContext *s, TCGType type,
     if (type == TCG_TYPE_I32 || arg == arg32) {
         tcg_out_op_t(s, INDEX_op_movi_i32);
         tcg_out_r(s, t0);
-        tcg_out32(s, arg32);
+        tci_out32(s, arg32);
     } else {
         assert(type == TCG_TYPE_I64);
 #if TCG_TARGET_REG_BITS == 64
         tcg_out_op_t(s, INDEX_op_movi_i64);
         tcg_out_r(s, t0);
-        tcg_out64(s, arg);
+        tci_out64(s, arg);
 #else
         TODO();
 #endif
@@ -532,11 +613,16 @@ static void tcg_out_movi(TCGContext *s, TCGType type,
     old_code_ptr[1] = s->code_ptr - old_code_ptr;
 }
 
-static inline void tcg_out_call(TCGContext *s, tcg_insn_unit *arg)
+/* Unicorn.js: The number of argument words selects the adapter signature.
+   tci_call reads them from registers only, so none may go on the stack. */
+static inline void tcg_out_call(TCGContext *s, tcg_insn_unit *arg,
+                                int nb_words)
 {
     uint8_t *old_code_ptr = s->code_ptr;
+    assert(nb_words >= 0 && nb_words <= 10);
     tcg_out_op_t(s, INDEX_op_call);
     tcg_out_ri(s, 1, (uintptr_t)arg);
+    tcg_out8(s, nb_words);
     old_code_ptr[1] = s->code_ptr - old_code_ptr;
 }
 
@@ -545,16 +631,20 @@ static void tcg_out_op(TCGContext *s, TCGOpcode opc, const TCGArg *args,
 {
     uint8_t *old_code_ptr = s->code_ptr;
 
+    if (tci_out_fused(s, opc, args, const_args)) {
+        return;
+    }
     tcg_out_op_t(s, opc);
 
     switch (opc) {
     case INDEX_op_exit_tb:
-        tcg_out64(s, args[0]);
+        tci_out64(s, args[0]);
         break;
     case INDEX_op_goto_tb:
         if (s->tb_jmp_offset) {
             /* Direct jump method. */
             assert(args[0] < ARRAY_SIZE(s->tb_jmp_offset));
+            tci_out_align(s, sizeof(uint32_t));
             s->tb_jmp_offset[args[0]] = tcg_current_code_size(s);
             tcg_out32(s, 0);
         } else {
@@ -613,7 +703,7 @@ static void tcg_out_op(TCGContext *s, TCGOpcode opc, const TCGArg *args,
         tcg_out_r(s, args[0]);
         tcg_out_r(s, args[1]);
         assert(args[2] == (int32_t)args[2]);
-        tcg_out32(s, args[2]);
+        tci_out32(s, args[2]);
         break;
     case INDEX_op_add_i32:
     case INDEX_op_sub_i32:
@@ -816,6 +906,7 @@ static void tcg_out_op(TCGContext *s, TCGOpcode opc, const TCGArg *args,
         tcg_abort();
     }
     old_code_ptr[1] = s->code_ptr - old_code_ptr;
+    tci_out_fusable(s, opc, old_code_ptr);
 }
 
 static void tcg_out_st(TCGContext *s, TCGType type, TCGReg arg, TCGReg arg1,
@@ -826,14 +917,14 @@ static void tcg_out_st(TCGContext *s, TCGType type, TCGReg arg, TCGReg arg1,
         tcg_out_op_t(s, INDEX_op_st_i32);
         tcg_out_r(s, arg);
         tcg_out_r(s, arg1);
-        tcg_out32(s, arg2);
+        tci_out32(s, arg2);
     } else {
         assert(type == TCG_TYPE_I64);
 #if TCG_TARGET_REG_BITS == 64
         tcg_out_op_t(s, INDEX_op_st_i64);
         tcg_out_r(s, arg);
         tcg_out_r(s, arg1);
-        tcg_out32(s, arg2);
+        tci_out32(s, arg2);
 #else
         TODO();
 #endif
@@ -859,7 +950,7 @@ static void tcg_target_init(TCGContext *s)
 #endif
 
     /* The current code uses uint8_t for tcg operations. */
-    assert(ARRAY_SIZE(tcg_op_defs) <= UINT8_MAX);
+    assert(TCI_NB_OPS <= UINT8_MAX);
 
     /* Registers available for 32 bit operations. */
     tcg_regset_set32(tcg_target_available_regs[TCG_TYPE_I32], 0,
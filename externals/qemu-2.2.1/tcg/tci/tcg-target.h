@@ -173,6 +173,15 @@ typedef enum {
 #define TCG_TARGET_CALL_STACK_OFFSET    0
 #define TCG_TARGET_STACK_ALIGN          16
 
+/* Unicorn.js: Superinstructions of the interpreter, numbered after the TCG
+   opcodes. The backend extends a setcond_i32 followed by a brcond_i32 on its
+   result, and an ld_i32 followed by an add_i32 or a brcond_i32 of its result,
+   in place. */
+#define INDEX_op_tci_setcond_brcond_i32 NB_OPS
+#define INDEX_op_tci_ld_add_i32         (NB_OPS + 1)
+#define INDEX_op_tci_ld_brcond_i32      (NB_OPS + 2)
+#define TCI_NB_OPS                      (NB_OPS + 3)
+
 void tci_disas(uint8_t opc);
 
 uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr);
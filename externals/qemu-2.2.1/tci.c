@@ -28,6 +28,7 @@
 #include "exec/exec-all.h"           /* MAX_OPC_PARAM_IARGS */
 #include "exec/cpu_ldst.h"
 #include "tcg-op.h"
+#include "uc_priv.h"                 /* HOOK_EXISTS, memory_mapping */
 
 /* Marker for missing code. */
 #define TODO() \
@@ -41,11 +42,21 @@
 # error Fix needed, number of supported input arguments changed!
 #endif
 #if TCG_TARGET_REG_BITS == 32
-typedef uint64_t (*helper_function)(tcg_target_ulong, tcg_target_ulong,
-                                    tcg_target_ulong, tcg_target_ulong,
-                                    tcg_target_ulong, tcg_target_ulong,
-                                    tcg_target_ulong, tcg_target_ulong,
-                                    tcg_target_ulong, tcg_target_ulong);
+/* Unicorn.js: Helpers are called through adapters taking one argument per
+   32-bit word they use, so calls are dispatched on the number of words. */
+#define W tcg_target_ulong
+typedef uint64_t (*helper_function_0)(void);
+typedef uint64_t (*helper_function_1)(W);
+typedef uint64_t (*helper_function_2)(W, W);
+typedef uint64_t (*helper_function_3)(W, W, W);
+typedef uint64_t (*helper_function_4)(W, W, W, W);
+typedef uint64_t (*helper_function_5)(W, W, W, W, W);
+typedef uint64_t (*helper_function_6)(W, W, W, W, W, W);
+typedef uint64_t (*helper_function_7)(W, W, W, W, W, W, W);
+typedef uint64_t (*helper_function_8)(W, W, W, W, W, W, W, W);
+typedef uint64_t (*helper_function_9)(W, W, W, W, W, W, W, W, W);
+typedef uint64_t (*helper_function_10)(W, W, W, W, W, W, W, W, W, W);
+#undef W
 #else
 typedef uint64_t (*helper_function)(tcg_target_ulong, tcg_target_ulong,
                                     tcg_target_ulong, tcg_target_ulong,
@@ -156,10 +167,18 @@ static uint64_t tci_uint64(uint32_t high, uint32_t low)
 }
 #endif
 
+/* Unicorn.js: Skip the padding before a naturally aligned constant. */
+static inline void tci_align(uint8_t **tb_ptr, size_t size)
+{
+    *tb_ptr = (uint8_t *)(((uintptr_t)*tb_ptr + size - 1) & ~(uintptr_t)(size - 1));
+}
+
 /* Read constant (native size) from bytecode. */
 static tcg_target_ulong tci_read_i(uint8_t **tb_ptr)
 {
-    tcg_target_ulong value = *(tcg_target_ulong *)(*tb_ptr);
+    tcg_target_ulong value;
+    tci_align(tb_ptr, sizeof(value));
+    value = *(tcg_target_ulong *)(*tb_ptr);
     *tb_ptr += sizeof(value);
     return value;
 }
@@ -167,7 +186,9 @@ static tcg_target_ulong tci_read_i(uint8_t **tb_ptr)
 /* Read unsigned constant (32 bit) from bytecode. */
 static uint32_t tci_read_i32(uint8_t **tb_ptr)
 {
-    uint32_t value = *(uint32_t *)(*tb_ptr);
+    uint32_t value;
+    tci_align(tb_ptr, sizeof(value));
+    value = *(uint32_t *)(*tb_ptr);
     *tb_ptr += sizeof(value);
     return value;
 }
@@ -175,7 +196,9 @@ static uint32_t tci_read_i32(uint8_t **tb_ptr)
 /* Read signed constant (32 bit) from bytecode. */
 static int32_t tci_read_s32(uint8_t **tb_ptr)
 {
-    int32_t value = *(int32_t *)(*tb_ptr);
+    int32_t value;
+    tci_align(tb_ptr, sizeof(value));
+    value = *(int32_t *)(*tb_ptr);
     *tb_ptr += sizeof(value);
     return value;
 }
@@ -184,7 +207,9 @@ static int32_t tci_read_s32(uint8_t **tb_ptr)
 /* Read constant (64 bit) from bytecode. */
 static uint64_t tci_read_i64(uint8_t **tb_ptr)
 {
-    uint64_t value = *(uint64_t *)(*tb_ptr);
+    uint64_t value;
+    tci_align(tb_ptr, sizeof(value));
+    value = *(uint64_t *)(*tb_ptr);
     *tb_ptr += sizeof(value);
     return value;
 }
@@ -420,35 +445,120 @@ static bool tci_compare64(uint64_t u0, uint64_t u1, TCGCond condition)
 }
 
 #ifdef CONFIG_SOFTMMU
+/* Unicorn.js: Returns the host address of a guest access that hits the TLB,
+   as the fast path generated by the native backends does. Returns NULL if
+   the access must go through the softmmu helpers instead: TLB misses, MMIO,
+   watchpoints, pages with translated code and pages whose region lacks the
+   permission (all flagged in the TLB entry), accesses crossing pages, and
+   accesses that memory hooks cover. */
+static inline void *tci_tlb_lookup(CPUArchState *env, target_ulong addr,
+                                   int mmu_idx, int size, int is_store)
+{
+    struct uc_struct *uc = env->uc;
+    int index = (addr >> TARGET_PAGE_BITS) & (CPU_TLB_SIZE - 1);
+    CPUTLBEntry *entry = &env->tlb_table[mmu_idx][index];
+    target_ulong tlb_addr = is_store ? entry->addr_write : entry->addr_read;
+
+    if ((addr & TARGET_PAGE_MASK) !=
+        (tlb_addr & (TARGET_PAGE_MASK | TLB_INVALID_MASK))) {
+        return NULL;
+    }
+    if (tlb_addr & ~TARGET_PAGE_MASK) {
+        return NULL;
+    }
+#ifdef ALIGNED_ONLY
+    if (addr & (size - 1)) {
+        return NULL;
+    }
+#endif
+    if ((addr & ~TARGET_PAGE_MASK) + size > TARGET_PAGE_SIZE) {
+        return NULL;
+    }
+    /* Hooks on other ranges, looked up in their index, do not matter */
+    if (is_store) {
+        if (HOOK_EXISTS(uc, UC_HOOK_MEM_WRITE) &&
+            HOOK_EXISTS_BOUNDED(uc, UC_HOOK_MEM_WRITE, addr)) {
+            return NULL;
+        }
+    } else {
+        if ((HOOK_EXISTS(uc, UC_HOOK_MEM_READ) &&
+             HOOK_EXISTS_BOUNDED(uc, UC_HOOK_MEM_READ, addr)) ||
+            (HOOK_EXISTS(uc, UC_HOOK_MEM_READ_AFTER) &&
+             HOOK_EXISTS_BOUNDED(uc, UC_HOOK_MEM_READ_AFTER, addr))) {
+            return NULL;
+        }
+    }
+    return (void *)((uintptr_t)addr + entry->addend);
+}
+
+#define TCI_LD(name, type, size, host_load, helper)                         \
+static inline type name(CPUArchState *env, target_ulong addr,               \
+                        int mmu_idx, uintptr_t retaddr)                     \
+{                                                                           \
+    void *host = tci_tlb_lookup(env, addr, mmu_idx, size, 0);               \
+    if (host) {                                                             \
+        return host_load(host);                                             \
+    }                                                                       \
+    return helper(env, addr, mmu_idx, retaddr);                             \
+}
+
+#define TCI_ST(name, type, size, host_store, helper)                        \
+static inline void name(CPUArchState *env, target_ulong addr, type val,     \
+                        int mmu_idx, uintptr_t retaddr)                     \
+{                                                                           \
+    void *host = tci_tlb_lookup(env, addr, mmu_idx, size, 1);               \
+    if (host) {                                                             \
+        UCJS_SNAPSHOTS_MARK(env->uc, addr, size);                           \
+        host_store(host, val);                                              \
+        return;                                                             \
+    }                                                                       \
+    helper(env, addr, val, mmu_idx, retaddr);                               \
+}
+
+TCI_LD(tci_ld_ub,   uint8_t,  1, ldub_p,    helper_ret_ldub_mmu)
+TCI_LD(tci_ld_leuw, uint16_t, 2, lduw_le_p, helper_le_lduw_mmu)
+TCI_LD(tci_ld_leul, uint32_t, 4, ldl_le_p,  helper_le_ldul_mmu)
+TCI_LD(tci_ld_leq,  uint64_t, 8, ldq_le_p,  helper_le_ldq_mmu)
+TCI_LD(tci_ld_beuw, uint16_t, 2, lduw_be_p, helper_be_lduw_mmu)
+TCI_LD(tci_ld_beul, uint32_t, 4, ldl_be_p,  helper_be_ldul_mmu)
+TCI_LD(tci_ld_beq,  uint64_t, 8, ldq_be_p,  helper_be_ldq_mmu)
+TCI_ST(tci_st_b,    uint8_t,  1, stb_p,     helper_ret_stb_mmu)
+TCI_ST(tci_st_lew,  uint16_t, 2, stw_le_p,  helper_le_stw_mmu)
+TCI_ST(tci_st_lel,  uint32_t, 4, stl_le_p,  helper_le_stl_mmu)
+TCI_ST(tci_st_leq,  uint64_t, 8, stq_le_p,  helper_le_stq_mmu)
+TCI_ST(tci_st_bew,  uint16_t, 2, stw_be_p,  helper_be_stw_mmu)
+TCI_ST(tci_st_bel,  uint32_t, 4, stl_be_p,  helper_be_stl_mmu)
+TCI_ST(tci_st_beq,  uint64_t, 8, stq_be_p,  helper_be_stq_mmu)
+
 # define mmuidx          tci_read_i(&tb_ptr)
 # define qemu_ld_ub \
-    helper_ret_ldub_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_ub(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_leuw \
-    helper_le_lduw_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_leuw(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_leul \
-    helper_le_ldul_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_leul(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_leq \
-    helper_le_ldq_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_leq(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_beuw \
-    helper_be_lduw_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_beuw(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_beul \
-    helper_be_ldul_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_beul(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_ld_beq \
-    helper_be_ldq_mmu(env, taddr, mmuidx, (uintptr_t)tb_ptr)
+    tci_ld_beq(env, taddr, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_b(X) \
-    helper_ret_stb_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_b(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_lew(X) \
-    helper_le_stw_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_lew(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_lel(X) \
-    helper_le_stl_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_lel(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_leq(X) \
-    helper_le_stq_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_leq(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_bew(X) \
-    helper_be_stw_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_bew(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_bel(X) \
-    helper_be_stl_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_bel(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 # define qemu_st_beq(X) \
-    helper_be_stq_mmu(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
+    tci_st_beq(env, taddr, X, mmuidx, (uintptr_t)tb_ptr)
 #else
 # define qemu_ld_ub      ldub_p(g2h(taddr))
 # define qemu_ld_leuw    lduw_le_p(g2h(taddr))
@@ -466,17 +576,120 @@ static bool tci_compare64(uint64_t u0, uint64_t u1, TCGCond condition)
 # define qemu_st_beq(X)  stq_be_p(g2h(taddr), X)
 #endif
 
-/* Interpret pseudo code in tb. */
+#if TCG_TARGET_REG_BITS == 32
+/* Call a helper adapter, reading only the registers holding its arguments. */
+static uint64_t tci_call(tcg_target_ulong func, unsigned nb_words)
+{
+    tcg_target_ulong a[10];
+
+    switch (nb_words) {
+    case 10:
+        a[9] = tci_read_reg(TCG_REG_R10);
+        /* fall through */
+    case 9:
+        a[8] = tci_read_reg(TCG_REG_R9);
+        /* fall through */
+    case 8:
+        a[7] = tci_read_reg(TCG_REG_R8);
+        /* fall through */
+    case 7:
+        a[6] = tci_read_reg(TCG_REG_R7);
+        /* fall through */
+    case 6:
+        a[5] = tci_read_reg(TCG_REG_R6);
+        /* fall through */
+    case 5:
+        a[4] = tci_read_reg(TCG_REG_R5);
+        /* fall through */
+    case 4:
+        a[3] = tci_read_reg(TCG_REG_R3);
+        /* fall through */
+    case 3:
+        a[2] = tci_read_reg(TCG_REG_R2);
+        /* fall through */
+    case 2:
+        a[1] = tci_read_reg(TCG_REG_R1);
+        /* fall through */
+    case 1:
+        a[0] = tci_read_reg(TCG_REG_R0);
+        /* fall through */
+    case 0:
+        break;
+    default:
+        /* tcg_out_call never emits more than 10 argument words. */
+        fprintf(stderr, "TCI: helper call with %u argument words\n", nb_words);
+        tcg_abort();
+    }
+
+    switch (nb_words) {
+    case 0:
+        return ((helper_function_0)func)();
+    case 1:
+        return ((helper_function_1)func)(a[0]);
+    case 2:
+        return ((helper_function_2)func)(a[0], a[1]);
+    case 3:
+        return ((helper_function_3)func)(a[0], a[1], a[2]);
+    case 4:
+        return ((helper_function_4)func)(a[0], a[1], a[2], a[3]);
+    case 5:
+        return ((helper_function_5)func)(a[0], a[1], a[2], a[3], a[4]);
+    case 6:
+        return ((helper_function_6)func)(a[0], a[1], a[2], a[3], a[4], a[5]);
+    case 7:
+        return ((helper_function_7)func)(a[0], a[1], a[2], a[3], a[4], a[5],
+                                         a[6]);
+    case 8:
+        return ((helper_function_8)func)(a[0], a[1], a[2], a[3], a[4], a[5],
+                                         a[6], a[7]);
+    case 9:
+        return ((helper_function_9)func)(a[0], a[1], a[2], a[3], a[4], a[5],
+                                         a[6], a[7], a[8]);
+    case 10:
+        return ((helper_function_10)func)(a[0], a[1], a[2], a[3], a[4], a[5],
+                                          a[6], a[7], a[8], a[9]);
+    }
+    tcg_abort();
+}
+#endif
+
+#ifdef UCJS_PROFILING
+/* Unicorn.js: Opcode names reported by the profiling counters. */
+static const char *const tci_op_names[] = {
+#define DEF(name, oargs, iargs, cargs, flags) #name,
+#include "tcg-opc.h"
+    "tci_setcond_brcond_i32",
+    "tci_ld_add_i32",
+    "tci_ld_brcond_i32",
+};
+#endif
+
+/* Interpret pseudo code in tb.
+   Unicorn.js: Instructions keep their variable width, with aligned constants
+   and a few fused pairs. Decoding blocks ahead of time into fixed-width
+   instructions is a separate follow-up, to be weighed against the larger
+   translation buffer it needs. */
 uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
 {
     long tcg_temps[CPU_TEMP_BUF_NLONGS];
     uintptr_t sp_value = (uintptr_t)(tcg_temps + CPU_TEMP_BUF_NLONGS);
     uintptr_t next_tb = 0;
+#ifdef UCJS_PROFILING
+    ucjs_profile *profile = ucjs_profile_get(env->uc);
+#endif
 
     tci_reg[TCG_AREG0] = (tcg_target_ulong)env;
     tci_reg[TCG_REG_CALL_STACK] = sp_value;
     assert(tb_ptr);
 
+#ifdef UCJS_PROFILING
+    if (profile) {
+        profile->op_names = tci_op_names;
+        profile->nb_ops = ARRAY_SIZE(tci_op_names);
+    }
+    ucjs_profile_exec(profile, tb_ptr);
+#endif
+
     for (;;) {
         TCGOpcode opc = tb_ptr[0];
 #if !defined(NDEBUG)
@@ -505,7 +718,14 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
         /* Skip opcode and size entry. */
         tb_ptr += 2;
 
-        switch (opc) {
+#ifdef UCJS_PROFILING
+        if (profile) {
+            profile->ops[opc]++;
+        }
+#endif
+
+        /* Superinstructions are numbered past the TCGOpcode values */
+        switch ((unsigned)opc) {
         case INDEX_op_end:
         case INDEX_op_nop:
             break;
@@ -521,17 +741,12 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
             break;
         case INDEX_op_call:
             t0 = tci_read_ri(&tb_ptr);
+            t1 = *tb_ptr++;
+#ifdef UCJS_PROFILING
+            ucjs_profile_call(profile, (void *)t0);
+#endif
 #if TCG_TARGET_REG_BITS == 32
-            tmp64 = ((helper_function)t0)(tci_read_reg(TCG_REG_R0),
-                                          tci_read_reg(TCG_REG_R1),
-                                          tci_read_reg(TCG_REG_R2),
-                                          tci_read_reg(TCG_REG_R3),
-                                          tci_read_reg(TCG_REG_R5),
-                                          tci_read_reg(TCG_REG_R6),
-                                          tci_read_reg(TCG_REG_R7),
-                                          tci_read_reg(TCG_REG_R8),
-                                          tci_read_reg(TCG_REG_R9),
-                                          tci_read_reg(TCG_REG_R10));
+            tmp64 = tci_call(t0, t1);
             tci_write_reg(TCG_REG_R0, tmp64);
             tci_write_reg(TCG_REG_R1, tmp64 >> 32);
 #else
@@ -572,6 +787,21 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
             tci_write_reg64(t0, tci_compare64(t1, t2, condition));
             break;
 #endif
+        case INDEX_op_tci_setcond_brcond_i32:
+            t0 = *tb_ptr++;
+            t1 = tci_read_r32(&tb_ptr);
+            t2 = tci_read_ri32(&tb_ptr);
+            condition = *tb_ptr++;
+            tmp32 = tci_compare32(t1, t2, condition);
+            tci_write_reg32(t0, tmp32);
+            tmp8 = *tb_ptr++;
+            label = tci_read_label(&tb_ptr);
+            if (tmp32 == tmp8) {
+                assert(tb_ptr == old_code_ptr + op_size);
+                tb_ptr = (uint8_t *)label;
+                continue;
+            }
+            break;
         case INDEX_op_mov_i32:
             t0 = *tb_ptr++;
             t1 = tci_read_r32(&tb_ptr);
@@ -604,6 +834,31 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
             t2 = tci_read_s32(&tb_ptr);
             tci_write_reg32(t0, *(uint32_t *)(t1 + t2));
             break;
+        case INDEX_op_tci_ld_add_i32:
+            t0 = *tb_ptr++;
+            t1 = tci_read_r(&tb_ptr);
+            t2 = tci_read_s32(&tb_ptr);
+            tmp32 = *(uint32_t *)(t1 + t2);
+            tci_write_reg32(t0, tmp32);
+            t0 = *tb_ptr++;
+            t1 = tci_read_ri32(&tb_ptr);
+            tci_write_reg32(t0, tmp32 + t1);
+            break;
+        case INDEX_op_tci_ld_brcond_i32:
+            t0 = *tb_ptr++;
+            t1 = tci_read_r(&tb_ptr);
+            t2 = tci_read_s32(&tb_ptr);
+            tmp32 = *(uint32_t *)(t1 + t2);
+            tci_write_reg32(t0, tmp32);
+            t1 = tci_read_ri32(&tb_ptr);
+            condition = *tb_ptr++;
+            label = tci_read_label(&tb_ptr);
+            if (tci_compare32(tmp32, t1, condition)) {
+                assert(tb_ptr == old_code_ptr + op_size);
+                tb_ptr = (uint8_t *)label;
+                continue;
+            }
+            break;
         case INDEX_op_st8_i32:
             t0 = tci_read_r8(&tb_ptr);
             t1 = tci_read_r(&tb_ptr);
@@ -1109,6 +1364,7 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
             break;
 #endif
         case INDEX_op_exit_tb:
+            tci_align(&tb_ptr, sizeof(uint64_t));
             next_tb = *(uint64_t *)tb_ptr;
             goto exit;
             break;
@@ -1116,6 +1372,12 @@ uintptr_t tcg_qemu_tb_exec(CPUArchState *env, uint8_t *tb_ptr)
             t0 = tci_read_i32(&tb_ptr);
             assert(tb_ptr == old_code_ptr + op_size);
             tb_ptr += (int32_t)t0;
+#ifdef UCJS_PROFILING
+            /* Chained to the next block, see tb_set_jmp_target. */
+            if (t0 != 0) {
+                ucjs_profile_exec(profile, tb_ptr);
+            }
+#endif
             continue;
         case INDEX_op_qemu_ld_i32:
             t0 = *tb_ptr++;
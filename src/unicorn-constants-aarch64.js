@@ -0,0 +1,71 @@
+// Unicorn.js constants [core, aarch64]. AUTO-GENERATED FILE, DO NOT EDIT
+(function (define) {
+uc.API_MAJOR = 1;
+uc.API_MINOR = 0;
+uc.VERSION_MAJOR = 1;
+uc.VERSION_MINOR = 0;
+uc.VERSION_EXTRA = 1;
+uc.SECOND_SCALE = 1000000;
+uc.MILISECOND_SCALE = 1000;
+define('ARCH_', 1, 'ARM ARM64 MIPS X86 PPC SPARC M68K MAX');
+uc.MODE_LITTLE_ENDIAN = 0;
+uc.MODE_BIG_ENDIAN = 1073741824;
+uc.MODE_ARM = 0;
+uc.MODE_THUMB = 16;
+uc.MODE_MCLASS = 32;
+uc.MODE_V8 = 64;
+uc.MODE_MICRO = 16;
+uc.MODE_MIPS3 = 32;
+uc.MODE_MIPS32R6 = 64;
+uc.MODE_MIPS32 = 4;
+uc.MODE_MIPS64 = 8;
+uc.MODE_16 = 2;
+uc.MODE_32 = 4;
+uc.MODE_64 = 8;
+uc.MODE_PPC32 = 4;
+uc.MODE_PPC64 = 8;
+uc.MODE_QPX = 16;
+uc.MODE_SPARC32 = 4;
+uc.MODE_SPARC64 = 8;
+uc.MODE_V9 = 16;
+define('ERR_', 0, 'OK NOMEM ARCH HANDLE MODE VERSION READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED HOOK INSN_INVALID MAP WRITE_PROT READ_PROT FETCH_PROT ARG READ_UNALIGNED WRITE_UNALIGNED FETCH_UNALIGNED HOOK_EXIST RESOURCE EXCEPTION');
+define('MEM_', 16, 'READ WRITE FETCH READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED WRITE_PROT READ_PROT FETCH_PROT READ_AFTER');
+uc.HOOK_INTR = 1;
+uc.HOOK_INSN = 2;
+uc.HOOK_CODE = 4;
+uc.HOOK_BLOCK = 8;
+uc.HOOK_MEM_READ_UNMAPPED = 16;
+uc.HOOK_MEM_WRITE_UNMAPPED = 32;
+uc.HOOK_MEM_FETCH_UNMAPPED = 64;
+uc.HOOK_MEM_READ_PROT = 128;
+uc.HOOK_MEM_WRITE_PROT = 256;
+uc.HOOK_MEM_FETCH_PROT = 512;
+uc.HOOK_MEM_READ = 1024;
+uc.HOOK_MEM_WRITE = 2048;
+uc.HOOK_MEM_FETCH = 4096;
+uc.HOOK_MEM_READ_AFTER = 8192;
+uc.HOOK_MEM_UNMAPPED = 112;
+uc.HOOK_MEM_PROT = 896;
+uc.HOOK_MEM_READ_INVALID = 144;
+uc.HOOK_MEM_WRITE_INVALID = 288;
+uc.HOOK_MEM_FETCH_INVALID = 576;
+uc.HOOK_MEM_INVALID = 1008;
+uc.HOOK_MEM_VALID = 7168;
+uc.QUERY_MODE = 1;
+uc.QUERY_PAGE_SIZE = 2;
+uc.PROT_NONE = 0;
+uc.PROT_READ = 1;
+uc.PROT_WRITE = 2;
+uc.PROT_EXEC = 4;
+uc.PROT_ALL = 7;
+define('ARM64_REG_', 0, 'INVALID X29 X30 NZCV SP WSP WZR XZR B0 B1 B2 B3 B4 B5 B6 B7 B8 B9 B10 B11 B12 B13 B14 B15 B16 B17 B18 B19 B20 B21 B22 B23 B24 B25 B26 B27 B28 B29 B30 B31 D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 H0 H1 H2 H3 H4 H5 H6 H7 H8 H9 H10 H11 H12 H13 H14 H15 H16 H17 H18 H19 H20 H21 H22 H23 H24 H25 H26 H27 H28 H29 H30 H31 Q0 Q1 Q2 Q3 Q4 Q5 Q6 Q7 Q8 Q9 Q10 Q11 Q12 Q13 Q14 Q15 Q16 Q17 Q18 Q19 Q20 Q21 Q22 Q23 Q24 Q25 Q26 Q27 Q28 Q29 Q30 Q31 S0 S1 S2 S3 S4 S5 S6 S7 S8 S9 S10 S11 S12 S13 S14 S15 S16 S17 S18 S19 S20 S21 S22 S23 S24 S25 S26 S27 S28 S29 S30 S31 W0 W1 W2 W3 W4 W5 W6 W7 W8 W9 W10 W11 W12 W13 W14 W15 W16 W17 W18 W19 W20 W21 W22 W23 W24 W25 W26 W27 W28 W29 W30 X0 X1 X2 X3 X4 X5 X6 X7 X8 X9 X10 X11 X12 X13 X14 X15 X16 X17 X18 X19 X20 X21 X22 X23 X24 X25 X26 X27 X28 V0 V1 V2 V3 V4 V5 V6 V7 V8 V9 V10 V11 V12 V13 V14 V15 V16 V17 V18 V19 V20 V21 V22 V23 V24 V25 V26 V27 V28 V29 V30 V31 PC ENDING');
+uc.ARM64_REG_IP1 = 215;
+uc.ARM64_REG_IP0 = 216;
+uc.ARM64_REG_FP = 1;
+uc.ARM64_REG_LR = 2;
+})(function (prefix, value, names) {
+    names = names.split(' ');
+    for (var i = 0; i < names.length; i++) {
+        uc[prefix + names[i]] = value + i;
+    }
+});
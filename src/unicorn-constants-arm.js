@@ -0,0 +1,71 @@
+// Unicorn.js constants [core, arm]. AUTO-GENERATED FILE, DO NOT EDIT
+(function (define) {
+uc.API_MAJOR = 1;
+uc.API_MINOR = 0;
+uc.VERSION_MAJOR = 1;
+uc.VERSION_MINOR = 0;
+uc.VERSION_EXTRA = 1;
+uc.SECOND_SCALE = 1000000;
+uc.MILISECOND_SCALE = 1000;
+define('ARCH_', 1, 'ARM ARM64 MIPS X86 PPC SPARC M68K MAX');
+uc.MODE_LITTLE_ENDIAN = 0;
+uc.MODE_BIG_ENDIAN = 1073741824;
+uc.MODE_ARM = 0;
+uc.MODE_THUMB = 16;
+uc.MODE_MCLASS = 32;
+uc.MODE_V8 = 64;
+uc.MODE_MICRO = 16;
+uc.MODE_MIPS3 = 32;
+uc.MODE_MIPS32R6 = 64;
+uc.MODE_MIPS32 = 4;
+uc.MODE_MIPS64 = 8;
+uc.MODE_16 = 2;
+uc.MODE_32 = 4;
+uc.MODE_64 = 8;
+uc.MODE_PPC32 = 4;
+uc.MODE_PPC64 = 8;
+uc.MODE_QPX = 16;
+uc.MODE_SPARC32 = 4;
+uc.MODE_SPARC64 = 8;
+uc.MODE_V9 = 16;
+define('ERR_', 0, 'OK NOMEM ARCH HANDLE MODE VERSION READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED HOOK INSN_INVALID MAP WRITE_PROT READ_PROT FETCH_PROT ARG READ_UNALIGNED WRITE_UNALIGNED FETCH_UNALIGNED HOOK_EXIST RESOURCE EXCEPTION');
+define('MEM_', 16, 'READ WRITE FETCH READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED WRITE_PROT READ_PROT FETCH_PROT READ_AFTER');
+uc.HOOK_INTR = 1;
+uc.HOOK_INSN = 2;
+uc.HOOK_CODE = 4;
+uc.HOOK_BLOCK = 8;
+uc.HOOK_MEM_READ_UNMAPPED = 16;
+uc.HOOK_MEM_WRITE_UNMAPPED = 32;
+uc.HOOK_MEM_FETCH_UNMAPPED = 64;
+uc.HOOK_MEM_READ_PROT = 128;
+uc.HOOK_MEM_WRITE_PROT = 256;
+uc.HOOK_MEM_FETCH_PROT = 512;
+uc.HOOK_MEM_READ = 1024;
+uc.HOOK_MEM_WRITE = 2048;
+uc.HOOK_MEM_FETCH = 4096;
+uc.HOOK_MEM_READ_AFTER = 8192;
+uc.HOOK_MEM_UNMAPPED = 112;
+uc.HOOK_MEM_PROT = 896;
+uc.HOOK_MEM_READ_INVALID = 144;
+uc.HOOK_MEM_WRITE_INVALID = 288;
+uc.HOOK_MEM_FETCH_INVALID = 576;
+uc.HOOK_MEM_INVALID = 1008;
+uc.HOOK_MEM_VALID = 7168;
+uc.QUERY_MODE = 1;
+uc.QUERY_PAGE_SIZE = 2;
+uc.PROT_NONE = 0;
+uc.PROT_READ = 1;
+uc.PROT_WRITE = 2;
+uc.PROT_EXEC = 4;
+uc.PROT_ALL = 7;
+define('ARM_REG_', 0, 'INVALID APSR APSR_NZCV CPSR FPEXC FPINST FPSCR FPSCR_NZCV FPSID ITSTATE LR PC SP SPSR D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 FPINST2 MVFR0 MVFR1 MVFR2 Q0 Q1 Q2 Q3 Q4 Q5 Q6 Q7 Q8 Q9 Q10 Q11 Q12 Q13 Q14 Q15 R0 R1 R2 R3 R4 R5 R6 R7 R8 R9 R10 R11 R12 S0 S1 S2 S3 S4 S5 S6 S7 S8 S9 S10 S11 S12 S13 S14 S15 S16 S17 S18 S19 S20 S21 S22 S23 S24 S25 S26 S27 S28 S29 S30 S31 C1_C0_2 C13_C0_2 C13_C0_3 ENDING');
+uc.ARM_REG_R13 = 12;
+uc.ARM_REG_R14 = 10;
+uc.ARM_REG_R15 = 11;
+define('ARM_REG_', 75, 'SB SL FP IP');
+})(function (prefix, value, names) {
+    names = names.split(' ');
+    for (var i = 0; i < names.length; i++) {
+        uc[prefix + names[i]] = value + i;
+    }
+});
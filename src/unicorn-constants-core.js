@@ -0,0 +1,66 @@
+// Unicorn.js constants [core]. AUTO-GENERATED FILE, DO NOT EDIT
+(function (define) {
+uc.API_MAJOR = 1;
+uc.API_MINOR = 0;
+uc.VERSION_MAJOR = 1;
+uc.VERSION_MINOR = 0;
+uc.VERSION_EXTRA = 1;
+uc.SECOND_SCALE = 1000000;
+uc.MILISECOND_SCALE = 1000;
+define('ARCH_', 1, 'ARM ARM64 MIPS X86 PPC SPARC M68K MAX');
+uc.MODE_LITTLE_ENDIAN = 0;
+uc.MODE_BIG_ENDIAN = 1073741824;
+uc.MODE_ARM = 0;
+uc.MODE_THUMB = 16;
+uc.MODE_MCLASS = 32;
+uc.MODE_V8 = 64;
+uc.MODE_MICRO = 16;
+uc.MODE_MIPS3 = 32;
+uc.MODE_MIPS32R6 = 64;
+uc.MODE_MIPS32 = 4;
+uc.MODE_MIPS64 = 8;
+uc.MODE_16 = 2;
+uc.MODE_32 = 4;
+uc.MODE_64 = 8;
+uc.MODE_PPC32 = 4;
+uc.MODE_PPC64 = 8;
+uc.MODE_QPX = 16;
+uc.MODE_SPARC32 = 4;
+uc.MODE_SPARC64 = 8;
+uc.MODE_V9 = 16;
+define('ERR_', 0, 'OK NOMEM ARCH HANDLE MODE VERSION READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED HOOK INSN_INVALID MAP WRITE_PROT READ_PROT FETCH_PROT ARG READ_UNALIGNED WRITE_UNALIGNED FETCH_UNALIGNED HOOK_EXIST RESOURCE EXCEPTION');
+define('MEM_', 16, 'READ WRITE FETCH READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED WRITE_PROT READ_PROT FETCH_PROT READ_AFTER');
+uc.HOOK_INTR = 1;
+uc.HOOK_INSN = 2;
+uc.HOOK_CODE = 4;
+uc.HOOK_BLOCK = 8;
+uc.HOOK_MEM_READ_UNMAPPED = 16;
+uc.HOOK_MEM_WRITE_UNMAPPED = 32;
+uc.HOOK_MEM_FETCH_UNMAPPED = 64;
+uc.HOOK_MEM_READ_PROT = 128;
+uc.HOOK_MEM_WRITE_PROT = 256;
+uc.HOOK_MEM_FETCH_PROT = 512;
+uc.HOOK_MEM_READ = 1024;
+uc.HOOK_MEM_WRITE = 2048;
+uc.HOOK_MEM_FETCH = 4096;
+uc.HOOK_MEM_READ_AFTER = 8192;
+uc.HOOK_MEM_UNMAPPED = 112;
+uc.HOOK_MEM_PROT = 896;
+uc.HOOK_MEM_READ_INVALID = 144;
+uc.HOOK_MEM_WRITE_INVALID = 288;
+uc.HOOK_MEM_FETCH_INVALID = 576;
+uc.HOOK_MEM_INVALID = 1008;
+uc.HOOK_MEM_VALID = 7168;
+uc.QUERY_MODE = 1;
+uc.QUERY_PAGE_SIZE = 2;
+uc.PROT_NONE = 0;
+uc.PROT_READ = 1;
+uc.PROT_WRITE = 2;
+uc.PROT_EXEC = 4;
+uc.PROT_ALL = 7;
+})(function (prefix, value, names) {
+    names = names.split(' ');
+    for (var i = 0; i < names.length; i++) {
+        uc[prefix + names[i]] = value + i;
+    }
+});
@@ -0,0 +1,72 @@
+// Unicorn.js constants [core, mips]. AUTO-GENERATED FILE, DO NOT EDIT
+(function (define) {
+uc.API_MAJOR = 1;
+uc.API_MINOR = 0;
+uc.VERSION_MAJOR = 1;
+uc.VERSION_MINOR = 0;
+uc.VERSION_EXTRA = 1;
+uc.SECOND_SCALE = 1000000;
+uc.MILISECOND_SCALE = 1000;
+define('ARCH_', 1, 'ARM ARM64 MIPS X86 PPC SPARC M68K MAX');
+uc.MODE_LITTLE_ENDIAN = 0;
+uc.MODE_BIG_ENDIAN = 1073741824;
+uc.MODE_ARM = 0;
+uc.MODE_THUMB = 16;
+uc.MODE_MCLASS = 32;
+uc.MODE_V8 = 64;
+uc.MODE_MICRO = 16;
+uc.MODE_MIPS3 = 32;
+uc.MODE_MIPS32R6 = 64;
+uc.MODE_MIPS32 = 4;
+uc.MODE_MIPS64 = 8;
+uc.MODE_16 = 2;
+uc.MODE_32 = 4;
+uc.MODE_64 = 8;
+uc.MODE_PPC32 = 4;
+uc.MODE_PPC64 = 8;
+uc.MODE_QPX = 16;
+uc.MODE_SPARC32 = 4;
+uc.MODE_SPARC64 = 8;
+uc.MODE_V9 = 16;
+define('ERR_', 0, 'OK NOMEM ARCH HANDLE MODE VERSION READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED HOOK INSN_INVALID MAP WRITE_PROT READ_PROT FETCH_PROT ARG READ_UNALIGNED WRITE_UNALIGNED FETCH_UNALIGNED HOOK_EXIST RESOURCE EXCEPTION');
+define('MEM_', 16, 'READ WRITE FETCH READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED WRITE_PROT READ_PROT FETCH_PROT READ_AFTER');
+uc.HOOK_INTR = 1;
+uc.HOOK_INSN = 2;
+uc.HOOK_CODE = 4;
+uc.HOOK_BLOCK = 8;
+uc.HOOK_MEM_READ_UNMAPPED = 16;
+uc.HOOK_MEM_WRITE_UNMAPPED = 32;
+uc.HOOK_MEM_FETCH_UNMAPPED = 64;
+uc.HOOK_MEM_READ_PROT = 128;
+uc.HOOK_MEM_WRITE_PROT = 256;
+uc.HOOK_MEM_FETCH_PROT = 512;
+uc.HOOK_MEM_READ = 1024;
+uc.HOOK_MEM_WRITE = 2048;
+uc.HOOK_MEM_FETCH = 4096;
+uc.HOOK_MEM_READ_AFTER = 8192;
+uc.HOOK_MEM_UNMAPPED = 112;
+uc.HOOK_MEM_PROT = 896;
+uc.HOOK_MEM_READ_INVALID = 144;
+uc.HOOK_MEM_WRITE_INVALID = 288;
+uc.HOOK_MEM_FETCH_INVALID = 576;
+uc.HOOK_MEM_INVALID = 1008;
+uc.HOOK_MEM_VALID = 7168;
+uc.QUERY_MODE = 1;
+uc.QUERY_PAGE_SIZE = 2;
+uc.PROT_NONE = 0;
+uc.PROT_READ = 1;
+uc.PROT_WRITE = 2;
+uc.PROT_EXEC = 4;
+uc.PROT_ALL = 7;
+define('MIPS_REG_', 0, 'INVALID PC 0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 DSPCCOND DSPCARRY DSPEFI DSPOUTFLAG DSPOUTFLAG16_19 DSPOUTFLAG20 DSPOUTFLAG21 DSPOUTFLAG22 DSPOUTFLAG23 DSPPOS DSPSCOUNT AC0 AC1 AC2 AC3 CC0 CC1 CC2 CC3 CC4 CC5 CC6 CC7 F0 F1 F2 F3 F4 F5 F6 F7 F8 F9 F10 F11 F12 F13 F14 F15 F16 F17 F18 F19 F20 F21 F22 F23 F24 F25 F26 F27 F28 F29 F30 F31 FCC0 FCC1 FCC2 FCC3 FCC4 FCC5 FCC6 FCC7 W0 W1 W2 W3 W4 W5 W6 W7 W8 W9 W10 W11 W12 W13 W14 W15 W16 W17 W18 W19 W20 W21 W22 W23 W24 W25 W26 W27 W28 W29 W30 W31 HI LO P0 P1 P2 MPL0 MPL1 MPL2 ENDING');
+define('MIPS_REG_', 2, 'ZERO AT V0 V1 A0 A1 A2 A3 T0 T1 T2 T3 T4 T5 T6 T7 S0 S1 S2 S3 S4 S5 S6 S7 T8 T9 K0 K1 GP SP FP');
+uc.MIPS_REG_S8 = 32;
+uc.MIPS_REG_RA = 33;
+define('MIPS_REG_', 45, 'HI0 HI1 HI2 HI3');
+define('MIPS_REG_', 45, 'LO0 LO1 LO2 LO3');
+})(function (prefix, value, names) {
+    names = names.split(' ');
+    for (var i = 0; i < names.length; i++) {
+        uc[prefix + names[i]] = value + i;
+    }
+});
@@ -1,2689 +1,88 @@
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [arm64_const.py]
-
-// ARM64 registers
-
-uc.ARM64_REG_INVALID = 0
-uc.ARM64_REG_X29 = 1
-uc.ARM64_REG_X30 = 2
-uc.ARM64_REG_NZCV = 3
-uc.ARM64_REG_SP = 4
-uc.ARM64_REG_WSP = 5
-uc.ARM64_REG_WZR = 6
-uc.ARM64_REG_XZR = 7
-uc.ARM64_REG_B0 = 8
-uc.ARM64_REG_B1 = 9
-uc.ARM64_REG_B2 = 10
-uc.ARM64_REG_B3 = 11
-uc.ARM64_REG_B4 = 12
-uc.ARM64_REG_B5 = 13
-uc.ARM64_REG_B6 = 14
-uc.ARM64_REG_B7 = 15
-uc.ARM64_REG_B8 = 16
-uc.ARM64_REG_B9 = 17
-uc.ARM64_REG_B10 = 18
-uc.ARM64_REG_B11 = 19
-uc.ARM64_REG_B12 = 20
-uc.ARM64_REG_B13 = 21
-uc.ARM64_REG_B14 = 22
-uc.ARM64_REG_B15 = 23
-uc.ARM64_REG_B16 = 24
-uc.ARM64_REG_B17 = 25
-uc.ARM64_REG_B18 = 26
-uc.ARM64_REG_B19 = 27
-uc.ARM64_REG_B20 = 28
-uc.ARM64_REG_B21 = 29
-uc.ARM64_REG_B22 = 30
-uc.ARM64_REG_B23 = 31
-uc.ARM64_REG_B24 = 32
-uc.ARM64_REG_B25 = 33
-uc.ARM64_REG_B26 = 34
-uc.ARM64_REG_B27 = 35
-uc.ARM64_REG_B28 = 36
-uc.ARM64_REG_B29 = 37
-uc.ARM64_REG_B30 = 38
-uc.ARM64_REG_B31 = 39
-uc.ARM64_REG_D0 = 40
-uc.ARM64_REG_D1 = 41
-uc.ARM64_REG_D2 = 42
-uc.ARM64_REG_D3 = 43
-uc.ARM64_REG_D4 = 44
-uc.ARM64_REG_D5 = 45
-uc.ARM64_REG_D6 = 46
-uc.ARM64_REG_D7 = 47
-uc.ARM64_REG_D8 = 48
-uc.ARM64_REG_D9 = 49
-uc.ARM64_REG_D10 = 50
-uc.ARM64_REG_D11 = 51
-uc.ARM64_REG_D12 = 52
-uc.ARM64_REG_D13 = 53
-uc.ARM64_REG_D14 = 54
-uc.ARM64_REG_D15 = 55
-uc.ARM64_REG_D16 = 56
-uc.ARM64_REG_D17 = 57
-uc.ARM64_REG_D18 = 58
-uc.ARM64_REG_D19 = 59
-uc.ARM64_REG_D20 = 60
-uc.ARM64_REG_D21 = 61
-uc.ARM64_REG_D22 = 62
-uc.ARM64_REG_D23 = 63
-uc.ARM64_REG_D24 = 64
-uc.ARM64_REG_D25 = 65
-uc.ARM64_REG_D26 = 66
-uc.ARM64_REG_D27 = 67
-uc.ARM64_REG_D28 = 68
-uc.ARM64_REG_D29 = 69
-uc.ARM64_REG_D30 = 70
-uc.ARM64_REG_D31 = 71
-uc.ARM64_REG_H0 = 72
-uc.ARM64_REG_H1 = 73
-uc.ARM64_REG_H2 = 74
-uc.ARM64_REG_H3 = 75
-uc.ARM64_REG_H4 = 76
-uc.ARM64_REG_H5 = 77
-uc.ARM64_REG_H6 = 78
-uc.ARM64_REG_H7 = 79
-uc.ARM64_REG_H8 = 80
-uc.ARM64_REG_H9 = 81
-uc.ARM64_REG_H10 = 82
-uc.ARM64_REG_H11 = 83
-uc.ARM64_REG_H12 = 84
-uc.ARM64_REG_H13 = 85
-uc.ARM64_REG_H14 = 86
-uc.ARM64_REG_H15 = 87
-uc.ARM64_REG_H16 = 88
-uc.ARM64_REG_H17 = 89
-uc.ARM64_REG_H18 = 90
-uc.ARM64_REG_H19 = 91
-uc.ARM64_REG_H20 = 92
-uc.ARM64_REG_H21 = 93
-uc.ARM64_REG_H22 = 94
-uc.ARM64_REG_H23 = 95
-uc.ARM64_REG_H24 = 96
-uc.ARM64_REG_H25 = 97
-uc.ARM64_REG_H26 = 98
-uc.ARM64_REG_H27 = 99
-uc.ARM64_REG_H28 = 100
-uc.ARM64_REG_H29 = 101
-uc.ARM64_REG_H30 = 102
-uc.ARM64_REG_H31 = 103
-uc.ARM64_REG_Q0 = 104
-uc.ARM64_REG_Q1 = 105
-uc.ARM64_REG_Q2 = 106
-uc.ARM64_REG_Q3 = 107
-uc.ARM64_REG_Q4 = 108
-uc.ARM64_REG_Q5 = 109
-uc.ARM64_REG_Q6 = 110
-uc.ARM64_REG_Q7 = 111
-uc.ARM64_REG_Q8 = 112
-uc.ARM64_REG_Q9 = 113
-uc.ARM64_REG_Q10 = 114
-uc.ARM64_REG_Q11 = 115
-uc.ARM64_REG_Q12 = 116
-uc.ARM64_REG_Q13 = 117
-uc.ARM64_REG_Q14 = 118
-uc.ARM64_REG_Q15 = 119
-uc.ARM64_REG_Q16 = 120
-uc.ARM64_REG_Q17 = 121
-uc.ARM64_REG_Q18 = 122
-uc.ARM64_REG_Q19 = 123
-uc.ARM64_REG_Q20 = 124
-uc.ARM64_REG_Q21 = 125
-uc.ARM64_REG_Q22 = 126
-uc.ARM64_REG_Q23 = 127
-uc.ARM64_REG_Q24 = 128
-uc.ARM64_REG_Q25 = 129
-uc.ARM64_REG_Q26 = 130
-uc.ARM64_REG_Q27 = 131
-uc.ARM64_REG_Q28 = 132
-uc.ARM64_REG_Q29 = 133
-uc.ARM64_REG_Q30 = 134
-uc.ARM64_REG_Q31 = 135
-uc.ARM64_REG_S0 = 136
-uc.ARM64_REG_S1 = 137
-uc.ARM64_REG_S2 = 138
-uc.ARM64_REG_S3 = 139
-uc.ARM64_REG_S4 = 140
-uc.ARM64_REG_S5 = 141
-uc.ARM64_REG_S6 = 142
-uc.ARM64_REG_S7 = 143
-uc.ARM64_REG_S8 = 144
-uc.ARM64_REG_S9 = 145
-uc.ARM64_REG_S10 = 146
-uc.ARM64_REG_S11 = 147
-uc.ARM64_REG_S12 = 148
-uc.ARM64_REG_S13 = 149
-uc.ARM64_REG_S14 = 150
-uc.ARM64_REG_S15 = 151
-uc.ARM64_REG_S16 = 152
-uc.ARM64_REG_S17 = 153
-uc.ARM64_REG_S18 = 154
-uc.ARM64_REG_S19 = 155
-uc.ARM64_REG_S20 = 156
-uc.ARM64_REG_S21 = 157
-uc.ARM64_REG_S22 = 158
-uc.ARM64_REG_S23 = 159
-uc.ARM64_REG_S24 = 160
-uc.ARM64_REG_S25 = 161
-uc.ARM64_REG_S26 = 162
-uc.ARM64_REG_S27 = 163
-uc.ARM64_REG_S28 = 164
-uc.ARM64_REG_S29 = 165
-uc.ARM64_REG_S30 = 166
-uc.ARM64_REG_S31 = 167
-uc.ARM64_REG_W0 = 168
-uc.ARM64_REG_W1 = 169
-uc.ARM64_REG_W2 = 170
-uc.ARM64_REG_W3 = 171
-uc.ARM64_REG_W4 = 172
-uc.ARM64_REG_W5 = 173
-uc.ARM64_REG_W6 = 174
-uc.ARM64_REG_W7 = 175
-uc.ARM64_REG_W8 = 176
-uc.ARM64_REG_W9 = 177
-uc.ARM64_REG_W10 = 178
-uc.ARM64_REG_W11 = 179
-uc.ARM64_REG_W12 = 180
-uc.ARM64_REG_W13 = 181
-uc.ARM64_REG_W14 = 182
-uc.ARM64_REG_W15 = 183
-uc.ARM64_REG_W16 = 184
-uc.ARM64_REG_W17 = 185
-uc.ARM64_REG_W18 = 186
-uc.ARM64_REG_W19 = 187
-uc.ARM64_REG_W20 = 188
-uc.ARM64_REG_W21 = 189
-uc.ARM64_REG_W22 = 190
-uc.ARM64_REG_W23 = 191
-uc.ARM64_REG_W24 = 192
-uc.ARM64_REG_W25 = 193
-uc.ARM64_REG_W26 = 194
-uc.ARM64_REG_W27 = 195
-uc.ARM64_REG_W28 = 196
-uc.ARM64_REG_W29 = 197
-uc.ARM64_REG_W30 = 198
-uc.ARM64_REG_X0 = 199
-uc.ARM64_REG_X1 = 200
-uc.ARM64_REG_X2 = 201
-uc.ARM64_REG_X3 = 202
-uc.ARM64_REG_X4 = 203
-uc.ARM64_REG_X5 = 204
-uc.ARM64_REG_X6 = 205
-uc.ARM64_REG_X7 = 206
-uc.ARM64_REG_X8 = 207
-uc.ARM64_REG_X9 = 208
-uc.ARM64_REG_X10 = 209
-uc.ARM64_REG_X11 = 210
-uc.ARM64_REG_X12 = 211
-uc.ARM64_REG_X13 = 212
-uc.ARM64_REG_X14 = 213
-uc.ARM64_REG_X15 = 214
-uc.ARM64_REG_X16 = 215
-uc.ARM64_REG_X17 = 216
-uc.ARM64_REG_X18 = 217
-uc.ARM64_REG_X19 = 218
-uc.ARM64_REG_X20 = 219
-uc.ARM64_REG_X21 = 220
-uc.ARM64_REG_X22 = 221
-uc.ARM64_REG_X23 = 222
-uc.ARM64_REG_X24 = 223
-uc.ARM64_REG_X25 = 224
-uc.ARM64_REG_X26 = 225
-uc.ARM64_REG_X27 = 226
-uc.ARM64_REG_X28 = 227
-uc.ARM64_REG_V0 = 228
-uc.ARM64_REG_V1 = 229
-uc.ARM64_REG_V2 = 230
-uc.ARM64_REG_V3 = 231
-uc.ARM64_REG_V4 = 232
-uc.ARM64_REG_V5 = 233
-uc.ARM64_REG_V6 = 234
-uc.ARM64_REG_V7 = 235
-uc.ARM64_REG_V8 = 236
-uc.ARM64_REG_V9 = 237
-uc.ARM64_REG_V10 = 238
-uc.ARM64_REG_V11 = 239
-uc.ARM64_REG_V12 = 240
-uc.ARM64_REG_V13 = 241
-uc.ARM64_REG_V14 = 242
-uc.ARM64_REG_V15 = 243
-uc.ARM64_REG_V16 = 244
-uc.ARM64_REG_V17 = 245
-uc.ARM64_REG_V18 = 246
-uc.ARM64_REG_V19 = 247
-uc.ARM64_REG_V20 = 248
-uc.ARM64_REG_V21 = 249
-uc.ARM64_REG_V22 = 250
-uc.ARM64_REG_V23 = 251
-uc.ARM64_REG_V24 = 252
-uc.ARM64_REG_V25 = 253
-uc.ARM64_REG_V26 = 254
-uc.ARM64_REG_V27 = 255
-uc.ARM64_REG_V28 = 256
-uc.ARM64_REG_V29 = 257
-uc.ARM64_REG_V30 = 258
-uc.ARM64_REG_V31 = 259
-
-// pseudo registers
-uc.ARM64_REG_PC = 260
-uc.ARM64_REG_ENDING = 261
-
-// alias registers
-uc.ARM64_REG_IP1 = 215
-uc.ARM64_REG_IP0 = 216
-uc.ARM64_REG_FP = 1
-uc.ARM64_REG_LR = 2
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [arm_const.py]
-
-// ARM registers
-
-uc.ARM_REG_INVALID = 0
-uc.ARM_REG_APSR = 1
-uc.ARM_REG_APSR_NZCV = 2
-uc.ARM_REG_CPSR = 3
-uc.ARM_REG_FPEXC = 4
-uc.ARM_REG_FPINST = 5
-uc.ARM_REG_FPSCR = 6
-uc.ARM_REG_FPSCR_NZCV = 7
-uc.ARM_REG_FPSID = 8
-uc.ARM_REG_ITSTATE = 9
-uc.ARM_REG_LR = 10
-uc.ARM_REG_PC = 11
-uc.ARM_REG_SP = 12
-uc.ARM_REG_SPSR = 13
-uc.ARM_REG_D0 = 14
-uc.ARM_REG_D1 = 15
-uc.ARM_REG_D2 = 16
-uc.ARM_REG_D3 = 17
-uc.ARM_REG_D4 = 18
-uc.ARM_REG_D5 = 19
-uc.ARM_REG_D6 = 20
-uc.ARM_REG_D7 = 21
-uc.ARM_REG_D8 = 22
-uc.ARM_REG_D9 = 23
-uc.ARM_REG_D10 = 24
-uc.ARM_REG_D11 = 25
-uc.ARM_REG_D12 = 26
-uc.ARM_REG_D13 = 27
-uc.ARM_REG_D14 = 28
-uc.ARM_REG_D15 = 29
-uc.ARM_REG_D16 = 30
-uc.ARM_REG_D17 = 31
-uc.ARM_REG_D18 = 32
-uc.ARM_REG_D19 = 33
-uc.ARM_REG_D20 = 34
-uc.ARM_REG_D21 = 35
-uc.ARM_REG_D22 = 36
-uc.ARM_REG_D23 = 37
-uc.ARM_REG_D24 = 38
-uc.ARM_REG_D25 = 39
-uc.ARM_REG_D26 = 40
-uc.ARM_REG_D27 = 41
-uc.ARM_REG_D28 = 42
-uc.ARM_REG_D29 = 43
-uc.ARM_REG_D30 = 44
-uc.ARM_REG_D31 = 45
-uc.ARM_REG_FPINST2 = 46
-uc.ARM_REG_MVFR0 = 47
-uc.ARM_REG_MVFR1 = 48
-uc.ARM_REG_MVFR2 = 49
-uc.ARM_REG_Q0 = 50
-uc.ARM_REG_Q1 = 51
-uc.ARM_REG_Q2 = 52
-uc.ARM_REG_Q3 = 53
-uc.ARM_REG_Q4 = 54
-uc.ARM_REG_Q5 = 55
-uc.ARM_REG_Q6 = 56
-uc.ARM_REG_Q7 = 57
-uc.ARM_REG_Q8 = 58
-uc.ARM_REG_Q9 = 59
-uc.ARM_REG_Q10 = 60
-uc.ARM_REG_Q11 = 61
-uc.ARM_REG_Q12 = 62
-uc.ARM_REG_Q13 = 63
-uc.ARM_REG_Q14 = 64
-uc.ARM_REG_Q15 = 65
-uc.ARM_REG_R0 = 66
-uc.ARM_REG_R1 = 67
-uc.ARM_REG_R2 = 68
-uc.ARM_REG_R3 = 69
-uc.ARM_REG_R4 = 70
-uc.ARM_REG_R5 = 71
-uc.ARM_REG_R6 = 72
-uc.ARM_REG_R7 = 73
-uc.ARM_REG_R8 = 74
-uc.ARM_REG_R9 = 75
-uc.ARM_REG_R10 = 76
-uc.ARM_REG_R11 = 77
-uc.ARM_REG_R12 = 78
-uc.ARM_REG_S0 = 79
-uc.ARM_REG_S1 = 80
-uc.ARM_REG_S2 = 81
-uc.ARM_REG_S3 = 82
-uc.ARM_REG_S4 = 83
-uc.ARM_REG_S5 = 84
-uc.ARM_REG_S6 = 85
-uc.ARM_REG_S7 = 86
-uc.ARM_REG_S8 = 87
-uc.ARM_REG_S9 = 88
-uc.ARM_REG_S10 = 89
-uc.ARM_REG_S11 = 90
-uc.ARM_REG_S12 = 91
-uc.ARM_REG_S13 = 92
-uc.ARM_REG_S14 = 93
-uc.ARM_REG_S15 = 94
-uc.ARM_REG_S16 = 95
-uc.ARM_REG_S17 = 96
-uc.ARM_REG_S18 = 97
-uc.ARM_REG_S19 = 98
-uc.ARM_REG_S20 = 99
-uc.ARM_REG_S21 = 100
-uc.ARM_REG_S22 = 101
-uc.ARM_REG_S23 = 102
-uc.ARM_REG_S24 = 103
-uc.ARM_REG_S25 = 104
-uc.ARM_REG_S26 = 105
-uc.ARM_REG_S27 = 106
-uc.ARM_REG_S28 = 107
-uc.ARM_REG_S29 = 108
-uc.ARM_REG_S30 = 109
-uc.ARM_REG_S31 = 110
-uc.ARM_REG_C1_C0_2 = 111
-uc.ARM_REG_C13_C0_2 = 112
-uc.ARM_REG_C13_C0_3 = 113
-uc.ARM_REG_ENDING = 114
-
-// alias registers
-uc.ARM_REG_R13 = 12
-uc.ARM_REG_R14 = 10
-uc.ARM_REG_R15 = 11
-uc.ARM_REG_SB = 75
-uc.ARM_REG_SL = 76
-uc.ARM_REG_FP = 77
-uc.ARM_REG_IP = 78
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [m68k_const.py]
-
-// M68K registers
-
-uc.M68K_REG_INVALID = 0
-uc.M68K_REG_A0 = 1
-uc.M68K_REG_A1 = 2
-uc.M68K_REG_A2 = 3
-uc.M68K_REG_A3 = 4
-uc.M68K_REG_A4 = 5
-uc.M68K_REG_A5 = 6
-uc.M68K_REG_A6 = 7
-uc.M68K_REG_A7 = 8
-uc.M68K_REG_D0 = 9
-uc.M68K_REG_D1 = 10
-uc.M68K_REG_D2 = 11
-uc.M68K_REG_D3 = 12
-uc.M68K_REG_D4 = 13
-uc.M68K_REG_D5 = 14
-uc.M68K_REG_D6 = 15
-uc.M68K_REG_D7 = 16
-uc.M68K_REG_SR = 17
-uc.M68K_REG_PC = 18
-uc.M68K_REG_ENDING = 19
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [mips_const.py]
-
-// MIPS registers
-
-uc.MIPS_REG_INVALID = 0
-
-// General purpose registers
-uc.MIPS_REG_PC = 1
-uc.MIPS_REG_0 = 2
-uc.MIPS_REG_1 = 3
-uc.MIPS_REG_2 = 4
-uc.MIPS_REG_3 = 5
-uc.MIPS_REG_4 = 6
-uc.MIPS_REG_5 = 7
-uc.MIPS_REG_6 = 8
-uc.MIPS_REG_7 = 9
-uc.MIPS_REG_8 = 10
-uc.MIPS_REG_9 = 11
-uc.MIPS_REG_10 = 12
-uc.MIPS_REG_11 = 13
-uc.MIPS_REG_12 = 14
-uc.MIPS_REG_13 = 15
-uc.MIPS_REG_14 = 16
-uc.MIPS_REG_15 = 17
-uc.MIPS_REG_16 = 18
-uc.MIPS_REG_17 = 19
-uc.MIPS_REG_18 = 20
-uc.MIPS_REG_19 = 21
-uc.MIPS_REG_20 = 22
-uc.MIPS_REG_21 = 23
-uc.MIPS_REG_22 = 24
-uc.MIPS_REG_23 = 25
-uc.MIPS_REG_24 = 26
-uc.MIPS_REG_25 = 27
-uc.MIPS_REG_26 = 28
-uc.MIPS_REG_27 = 29
-uc.MIPS_REG_28 = 30
-uc.MIPS_REG_29 = 31
-uc.MIPS_REG_30 = 32
-uc.MIPS_REG_31 = 33
-
-// DSP registers
-uc.MIPS_REG_DSPCCOND = 34
-uc.MIPS_REG_DSPCARRY = 35
-uc.MIPS_REG_DSPEFI = 36
-uc.MIPS_REG_DSPOUTFLAG = 37
-uc.MIPS_REG_DSPOUTFLAG16_19 = 38
-uc.MIPS_REG_DSPOUTFLAG20 = 39
-uc.MIPS_REG_DSPOUTFLAG21 = 40
-uc.MIPS_REG_DSPOUTFLAG22 = 41
-uc.MIPS_REG_DSPOUTFLAG23 = 42
-uc.MIPS_REG_DSPPOS = 43
-uc.MIPS_REG_DSPSCOUNT = 44
-
-// ACC registers
-uc.MIPS_REG_AC0 = 45
-uc.MIPS_REG_AC1 = 46
-uc.MIPS_REG_AC2 = 47
-uc.MIPS_REG_AC3 = 48
-
-// COP registers
-uc.MIPS_REG_CC0 = 49
-uc.MIPS_REG_CC1 = 50
-uc.MIPS_REG_CC2 = 51
-uc.MIPS_REG_CC3 = 52
-uc.MIPS_REG_CC4 = 53
-uc.MIPS_REG_CC5 = 54
-uc.MIPS_REG_CC6 = 55
-uc.MIPS_REG_CC7 = 56
-
-// FPU registers
-uc.MIPS_REG_F0 = 57
-uc.MIPS_REG_F1 = 58
-uc.MIPS_REG_F2 = 59
-uc.MIPS_REG_F3 = 60
-uc.MIPS_REG_F4 = 61
-uc.MIPS_REG_F5 = 62
-uc.MIPS_REG_F6 = 63
-uc.MIPS_REG_F7 = 64
-uc.MIPS_REG_F8 = 65
-uc.MIPS_REG_F9 = 66
-uc.MIPS_REG_F10 = 67
-uc.MIPS_REG_F11 = 68
-uc.MIPS_REG_F12 = 69
-uc.MIPS_REG_F13 = 70
-uc.MIPS_REG_F14 = 71
-uc.MIPS_REG_F15 = 72
-uc.MIPS_REG_F16 = 73
-uc.MIPS_REG_F17 = 74
-uc.MIPS_REG_F18 = 75
-uc.MIPS_REG_F19 = 76
-uc.MIPS_REG_F20 = 77
-uc.MIPS_REG_F21 = 78
-uc.MIPS_REG_F22 = 79
-uc.MIPS_REG_F23 = 80
-uc.MIPS_REG_F24 = 81
-uc.MIPS_REG_F25 = 82
-uc.MIPS_REG_F26 = 83
-uc.MIPS_REG_F27 = 84
-uc.MIPS_REG_F28 = 85
-uc.MIPS_REG_F29 = 86
-uc.MIPS_REG_F30 = 87
-uc.MIPS_REG_F31 = 88
-uc.MIPS_REG_FCC0 = 89
-uc.MIPS_REG_FCC1 = 90
-uc.MIPS_REG_FCC2 = 91
-uc.MIPS_REG_FCC3 = 92
-uc.MIPS_REG_FCC4 = 93
-uc.MIPS_REG_FCC5 = 94
-uc.MIPS_REG_FCC6 = 95
-uc.MIPS_REG_FCC7 = 96
-
-// AFPR128
-uc.MIPS_REG_W0 = 97
-uc.MIPS_REG_W1 = 98
-uc.MIPS_REG_W2 = 99
-uc.MIPS_REG_W3 = 100
-uc.MIPS_REG_W4 = 101
-uc.MIPS_REG_W5 = 102
-uc.MIPS_REG_W6 = 103
-uc.MIPS_REG_W7 = 104
-uc.MIPS_REG_W8 = 105
-uc.MIPS_REG_W9 = 106
-uc.MIPS_REG_W10 = 107
-uc.MIPS_REG_W11 = 108
-uc.MIPS_REG_W12 = 109
-uc.MIPS_REG_W13 = 110
-uc.MIPS_REG_W14 = 111
-uc.MIPS_REG_W15 = 112
-uc.MIPS_REG_W16 = 113
-uc.MIPS_REG_W17 = 114
-uc.MIPS_REG_W18 = 115
-uc.MIPS_REG_W19 = 116
-uc.MIPS_REG_W20 = 117
-uc.MIPS_REG_W21 = 118
-uc.MIPS_REG_W22 = 119
-uc.MIPS_REG_W23 = 120
-uc.MIPS_REG_W24 = 121
-uc.MIPS_REG_W25 = 122
-uc.MIPS_REG_W26 = 123
-uc.MIPS_REG_W27 = 124
-uc.MIPS_REG_W28 = 125
-uc.MIPS_REG_W29 = 126
-uc.MIPS_REG_W30 = 127
-uc.MIPS_REG_W31 = 128
-uc.MIPS_REG_HI = 129
-uc.MIPS_REG_LO = 130
-uc.MIPS_REG_P0 = 131
-uc.MIPS_REG_P1 = 132
-uc.MIPS_REG_P2 = 133
-uc.MIPS_REG_MPL0 = 134
-uc.MIPS_REG_MPL1 = 135
-uc.MIPS_REG_MPL2 = 136
-uc.MIPS_REG_ENDING = 137
-uc.MIPS_REG_ZERO = 2
-uc.MIPS_REG_AT = 3
-uc.MIPS_REG_V0 = 4
-uc.MIPS_REG_V1 = 5
-uc.MIPS_REG_A0 = 6
-uc.MIPS_REG_A1 = 7
-uc.MIPS_REG_A2 = 8
-uc.MIPS_REG_A3 = 9
-uc.MIPS_REG_T0 = 10
-uc.MIPS_REG_T1 = 11
-uc.MIPS_REG_T2 = 12
-uc.MIPS_REG_T3 = 13
-uc.MIPS_REG_T4 = 14
-uc.MIPS_REG_T5 = 15
-uc.MIPS_REG_T6 = 16
-uc.MIPS_REG_T7 = 17
-uc.MIPS_REG_S0 = 18
-uc.MIPS_REG_S1 = 19
-uc.MIPS_REG_S2 = 20
-uc.MIPS_REG_S3 = 21
-uc.MIPS_REG_S4 = 22
-uc.MIPS_REG_S5 = 23
-uc.MIPS_REG_S6 = 24
-uc.MIPS_REG_S7 = 25
-uc.MIPS_REG_T8 = 26
-uc.MIPS_REG_T9 = 27
-uc.MIPS_REG_K0 = 28
-uc.MIPS_REG_K1 = 29
-uc.MIPS_REG_GP = 30
-uc.MIPS_REG_SP = 31
-uc.MIPS_REG_FP = 32
-uc.MIPS_REG_S8 = 32
-uc.MIPS_REG_RA = 33
-uc.MIPS_REG_HI0 = 45
-uc.MIPS_REG_HI1 = 46
-uc.MIPS_REG_HI2 = 47
-uc.MIPS_REG_HI3 = 48
-uc.MIPS_REG_LO0 = 45
-uc.MIPS_REG_LO1 = 46
-uc.MIPS_REG_LO2 = 47
-uc.MIPS_REG_LO3 = 48
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [sparc_const.py]
-
-// SPARC registers
-
-uc.SPARC_REG_INVALID = 0
-uc.SPARC_REG_F0 = 1
-uc.SPARC_REG_F1 = 2
-uc.SPARC_REG_F2 = 3
-uc.SPARC_REG_F3 = 4
-uc.SPARC_REG_F4 = 5
-uc.SPARC_REG_F5 = 6
-uc.SPARC_REG_F6 = 7
-uc.SPARC_REG_F7 = 8
-uc.SPARC_REG_F8 = 9
-uc.SPARC_REG_F9 = 10
-uc.SPARC_REG_F10 = 11
-uc.SPARC_REG_F11 = 12
-uc.SPARC_REG_F12 = 13
-uc.SPARC_REG_F13 = 14
-uc.SPARC_REG_F14 = 15
-uc.SPARC_REG_F15 = 16
-uc.SPARC_REG_F16 = 17
-uc.SPARC_REG_F17 = 18
-uc.SPARC_REG_F18 = 19
-uc.SPARC_REG_F19 = 20
-uc.SPARC_REG_F20 = 21
-uc.SPARC_REG_F21 = 22
-uc.SPARC_REG_F22 = 23
-uc.SPARC_REG_F23 = 24
-uc.SPARC_REG_F24 = 25
-uc.SPARC_REG_F25 = 26
-uc.SPARC_REG_F26 = 27
-uc.SPARC_REG_F27 = 28
-uc.SPARC_REG_F28 = 29
-uc.SPARC_REG_F29 = 30
-uc.SPARC_REG_F30 = 31
-uc.SPARC_REG_F31 = 32
-uc.SPARC_REG_F32 = 33
-uc.SPARC_REG_F34 = 34
-uc.SPARC_REG_F36 = 35
-uc.SPARC_REG_F38 = 36
-uc.SPARC_REG_F40 = 37
-uc.SPARC_REG_F42 = 38
-uc.SPARC_REG_F44 = 39
-uc.SPARC_REG_F46 = 40
-uc.SPARC_REG_F48 = 41
-uc.SPARC_REG_F50 = 42
-uc.SPARC_REG_F52 = 43
-uc.SPARC_REG_F54 = 44
-uc.SPARC_REG_F56 = 45
-uc.SPARC_REG_F58 = 46
-uc.SPARC_REG_F60 = 47
-uc.SPARC_REG_F62 = 48
-uc.SPARC_REG_FCC0 = 49
-uc.SPARC_REG_FCC1 = 50
-uc.SPARC_REG_FCC2 = 51
-uc.SPARC_REG_FCC3 = 52
-uc.SPARC_REG_G0 = 53
-uc.SPARC_REG_G1 = 54
-uc.SPARC_REG_G2 = 55
-uc.SPARC_REG_G3 = 56
-uc.SPARC_REG_G4 = 57
-uc.SPARC_REG_G5 = 58
-uc.SPARC_REG_G6 = 59
-uc.SPARC_REG_G7 = 60
-uc.SPARC_REG_I0 = 61
-uc.SPARC_REG_I1 = 62
-uc.SPARC_REG_I2 = 63
-uc.SPARC_REG_I3 = 64
-uc.SPARC_REG_I4 = 65
-uc.SPARC_REG_I5 = 66
-uc.SPARC_REG_FP = 67
-uc.SPARC_REG_I7 = 68
-uc.SPARC_REG_ICC = 69
-uc.SPARC_REG_L0 = 70
-uc.SPARC_REG_L1 = 71
-uc.SPARC_REG_L2 = 72
-uc.SPARC_REG_L3 = 73
-uc.SPARC_REG_L4 = 74
-uc.SPARC_REG_L5 = 75
-uc.SPARC_REG_L6 = 76
-uc.SPARC_REG_L7 = 77
-uc.SPARC_REG_O0 = 78
-uc.SPARC_REG_O1 = 79
-uc.SPARC_REG_O2 = 80
-uc.SPARC_REG_O3 = 81
-uc.SPARC_REG_O4 = 82
-uc.SPARC_REG_O5 = 83
-uc.SPARC_REG_SP = 84
-uc.SPARC_REG_O7 = 85
-uc.SPARC_REG_Y = 86
-uc.SPARC_REG_XCC = 87
-uc.SPARC_REG_PC = 88
-uc.SPARC_REG_ENDING = 89
-uc.SPARC_REG_O6 = 84
-uc.SPARC_REG_I6 = 67
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [x86_const.py]
-
-// X86 registers
-
-uc.X86_REG_INVALID = 0
-uc.X86_REG_AH = 1
-uc.X86_REG_AL = 2
-uc.X86_REG_AX = 3
-uc.X86_REG_BH = 4
-uc.X86_REG_BL = 5
-uc.X86_REG_BP = 6
-uc.X86_REG_BPL = 7
-uc.X86_REG_BX = 8
-uc.X86_REG_CH = 9
-uc.X86_REG_CL = 10
-uc.X86_REG_CS = 11
-uc.X86_REG_CX = 12
-uc.X86_REG_DH = 13
-uc.X86_REG_DI = 14
-uc.X86_REG_DIL = 15
-uc.X86_REG_DL = 16
-uc.X86_REG_DS = 17
-uc.X86_REG_DX = 18
-uc.X86_REG_EAX = 19
-uc.X86_REG_EBP = 20
-uc.X86_REG_EBX = 21
-uc.X86_REG_ECX = 22
-uc.X86_REG_EDI = 23
-uc.X86_REG_EDX = 24
-uc.X86_REG_EFLAGS = 25
-uc.X86_REG_EIP = 26
-uc.X86_REG_EIZ = 27
-uc.X86_REG_ES = 28
-uc.X86_REG_ESI = 29
-uc.X86_REG_ESP = 30
-uc.X86_REG_FPSW = 31
-uc.X86_REG_FS = 32
-uc.X86_REG_GS = 33
-uc.X86_REG_IP = 34
-uc.X86_REG_RAX = 35
-uc.X86_REG_RBP = 36
-uc.X86_REG_RBX = 37
-uc.X86_REG_RCX = 38
-uc.X86_REG_RDI = 39
-uc.X86_REG_RDX = 40
-uc.X86_REG_RIP = 41
-uc.X86_REG_RIZ = 42
-uc.X86_REG_RSI = 43
-uc.X86_REG_RSP = 44
-uc.X86_REG_SI = 45
-uc.X86_REG_SIL = 46
-uc.X86_REG_SP = 47
-uc.X86_REG_SPL = 48
-uc.X86_REG_SS = 49
-uc.X86_REG_CR0 = 50
-uc.X86_REG_CR1 = 51
-uc.X86_REG_CR2 = 52
-uc.X86_REG_CR3 = 53
-uc.X86_REG_CR4 = 54
-uc.X86_REG_CR5 = 55
-uc.X86_REG_CR6 = 56
-uc.X86_REG_CR7 = 57
-uc.X86_REG_CR8 = 58
-uc.X86_REG_CR9 = 59
-uc.X86_REG_CR10 = 60
-uc.X86_REG_CR11 = 61
-uc.X86_REG_CR12 = 62
-uc.X86_REG_CR13 = 63
-uc.X86_REG_CR14 = 64
-uc.X86_REG_CR15 = 65
-uc.X86_REG_DR0 = 66
-uc.X86_REG_DR1 = 67
-uc.X86_REG_DR2 = 68
-uc.X86_REG_DR3 = 69
-uc.X86_REG_DR4 = 70
-uc.X86_REG_DR5 = 71
-uc.X86_REG_DR6 = 72
-uc.X86_REG_DR7 = 73
-uc.X86_REG_DR8 = 74
-uc.X86_REG_DR9 = 75
-uc.X86_REG_DR10 = 76
-uc.X86_REG_DR11 = 77
-uc.X86_REG_DR12 = 78
-uc.X86_REG_DR13 = 79
-uc.X86_REG_DR14 = 80
-uc.X86_REG_DR15 = 81
-uc.X86_REG_FP0 = 82
-uc.X86_REG_FP1 = 83
-uc.X86_REG_FP2 = 84
-uc.X86_REG_FP3 = 85
-uc.X86_REG_FP4 = 86
-uc.X86_REG_FP5 = 87
-uc.X86_REG_FP6 = 88
-uc.X86_REG_FP7 = 89
-uc.X86_REG_K0 = 90
-uc.X86_REG_K1 = 91
-uc.X86_REG_K2 = 92
-uc.X86_REG_K3 = 93
-uc.X86_REG_K4 = 94
-uc.X86_REG_K5 = 95
-uc.X86_REG_K6 = 96
-uc.X86_REG_K7 = 97
-uc.X86_REG_MM0 = 98
-uc.X86_REG_MM1 = 99
-uc.X86_REG_MM2 = 100
-uc.X86_REG_MM3 = 101
-uc.X86_REG_MM4 = 102
-uc.X86_REG_MM5 = 103
-uc.X86_REG_MM6 = 104
-uc.X86_REG_MM7 = 105
-uc.X86_REG_R8 = 106
-uc.X86_REG_R9 = 107
-uc.X86_REG_R10 = 108
-uc.X86_REG_R11 = 109
-uc.X86_REG_R12 = 110
-uc.X86_REG_R13 = 111
-uc.X86_REG_R14 = 112
-uc.X86_REG_R15 = 113
-uc.X86_REG_ST0 = 114
-uc.X86_REG_ST1 = 115
-uc.X86_REG_ST2 = 116
-uc.X86_REG_ST3 = 117
-uc.X86_REG_ST4 = 118
-uc.X86_REG_ST5 = 119
-uc.X86_REG_ST6 = 120
-uc.X86_REG_ST7 = 121
-uc.X86_REG_XMM0 = 122
-uc.X86_REG_XMM1 = 123
-uc.X86_REG_XMM2 = 124
-uc.X86_REG_XMM3 = 125
-uc.X86_REG_XMM4 = 126
-uc.X86_REG_XMM5 = 127
-uc.X86_REG_XMM6 = 128
-uc.X86_REG_XMM7 = 129
-uc.X86_REG_XMM8 = 130
-uc.X86_REG_XMM9 = 131
-uc.X86_REG_XMM10 = 132
-uc.X86_REG_XMM11 = 133
-uc.X86_REG_XMM12 = 134
-uc.X86_REG_XMM13 = 135
-uc.X86_REG_XMM14 = 136
-uc.X86_REG_XMM15 = 137
-uc.X86_REG_XMM16 = 138
-uc.X86_REG_XMM17 = 139
-uc.X86_REG_XMM18 = 140
-uc.X86_REG_XMM19 = 141
-uc.X86_REG_XMM20 = 142
-uc.X86_REG_XMM21 = 143
-uc.X86_REG_XMM22 = 144
-uc.X86_REG_XMM23 = 145
-uc.X86_REG_XMM24 = 146
-uc.X86_REG_XMM25 = 147
-uc.X86_REG_XMM26 = 148
-uc.X86_REG_XMM27 = 149
-uc.X86_REG_XMM28 = 150
-uc.X86_REG_XMM29 = 151
-uc.X86_REG_XMM30 = 152
-uc.X86_REG_XMM31 = 153
-uc.X86_REG_YMM0 = 154
-uc.X86_REG_YMM1 = 155
-uc.X86_REG_YMM2 = 156
-uc.X86_REG_YMM3 = 157
-uc.X86_REG_YMM4 = 158
-uc.X86_REG_YMM5 = 159
-uc.X86_REG_YMM6 = 160
-uc.X86_REG_YMM7 = 161
-uc.X86_REG_YMM8 = 162
-uc.X86_REG_YMM9 = 163
-uc.X86_REG_YMM10 = 164
-uc.X86_REG_YMM11 = 165
-uc.X86_REG_YMM12 = 166
-uc.X86_REG_YMM13 = 167
-uc.X86_REG_YMM14 = 168
-uc.X86_REG_YMM15 = 169
-uc.X86_REG_YMM16 = 170
-uc.X86_REG_YMM17 = 171
-uc.X86_REG_YMM18 = 172
-uc.X86_REG_YMM19 = 173
-uc.X86_REG_YMM20 = 174
-uc.X86_REG_YMM21 = 175
-uc.X86_REG_YMM22 = 176
-uc.X86_REG_YMM23 = 177
-uc.X86_REG_YMM24 = 178
-uc.X86_REG_YMM25 = 179
-uc.X86_REG_YMM26 = 180
-uc.X86_REG_YMM27 = 181
-uc.X86_REG_YMM28 = 182
-uc.X86_REG_YMM29 = 183
-uc.X86_REG_YMM30 = 184
-uc.X86_REG_YMM31 = 185
-uc.X86_REG_ZMM0 = 186
-uc.X86_REG_ZMM1 = 187
-uc.X86_REG_ZMM2 = 188
-uc.X86_REG_ZMM3 = 189
-uc.X86_REG_ZMM4 = 190
-uc.X86_REG_ZMM5 = 191
-uc.X86_REG_ZMM6 = 192
-uc.X86_REG_ZMM7 = 193
-uc.X86_REG_ZMM8 = 194
-uc.X86_REG_ZMM9 = 195
-uc.X86_REG_ZMM10 = 196
-uc.X86_REG_ZMM11 = 197
-uc.X86_REG_ZMM12 = 198
-uc.X86_REG_ZMM13 = 199
-uc.X86_REG_ZMM14 = 200
-uc.X86_REG_ZMM15 = 201
-uc.X86_REG_ZMM16 = 202
-uc.X86_REG_ZMM17 = 203
-uc.X86_REG_ZMM18 = 204
-uc.X86_REG_ZMM19 = 205
-uc.X86_REG_ZMM20 = 206
-uc.X86_REG_ZMM21 = 207
-uc.X86_REG_ZMM22 = 208
-uc.X86_REG_ZMM23 = 209
-uc.X86_REG_ZMM24 = 210
-uc.X86_REG_ZMM25 = 211
-uc.X86_REG_ZMM26 = 212
-uc.X86_REG_ZMM27 = 213
-uc.X86_REG_ZMM28 = 214
-uc.X86_REG_ZMM29 = 215
-uc.X86_REG_ZMM30 = 216
-uc.X86_REG_ZMM31 = 217
-uc.X86_REG_R8B = 218
-uc.X86_REG_R9B = 219
-uc.X86_REG_R10B = 220
-uc.X86_REG_R11B = 221
-uc.X86_REG_R12B = 222
-uc.X86_REG_R13B = 223
-uc.X86_REG_R14B = 224
-uc.X86_REG_R15B = 225
-uc.X86_REG_R8D = 226
-uc.X86_REG_R9D = 227
-uc.X86_REG_R10D = 228
-uc.X86_REG_R11D = 229
-uc.X86_REG_R12D = 230
-uc.X86_REG_R13D = 231
-uc.X86_REG_R14D = 232
-uc.X86_REG_R15D = 233
-uc.X86_REG_R8W = 234
-uc.X86_REG_R9W = 235
-uc.X86_REG_R10W = 236
-uc.X86_REG_R11W = 237
-uc.X86_REG_R12W = 238
-uc.X86_REG_R13W = 239
-uc.X86_REG_R14W = 240
-uc.X86_REG_R15W = 241
-uc.X86_REG_IDTR = 242
-uc.X86_REG_GDTR = 243
-uc.X86_REG_LDTR = 244
-uc.X86_REG_TR = 245
-uc.X86_REG_FPCW = 246
-uc.X86_REG_FPTAG = 247
-uc.X86_REG_MSR = 248
-uc.X86_REG_ENDING = 249
-
-// X86 instructions
-
-uc.X86_INS_INVALID = 0
-uc.X86_INS_AAA = 1
-uc.X86_INS_AAD = 2
-uc.X86_INS_AAM = 3
-uc.X86_INS_AAS = 4
-uc.X86_INS_FABS = 5
-uc.X86_INS_ADC = 6
-uc.X86_INS_ADCX = 7
-uc.X86_INS_ADD = 8
-uc.X86_INS_ADDPD = 9
-uc.X86_INS_ADDPS = 10
-uc.X86_INS_ADDSD = 11
-uc.X86_INS_ADDSS = 12
-uc.X86_INS_ADDSUBPD = 13
-uc.X86_INS_ADDSUBPS = 14
-uc.X86_INS_FADD = 15
-uc.X86_INS_FIADD = 16
-uc.X86_INS_FADDP = 17
-uc.X86_INS_ADOX = 18
-uc.X86_INS_AESDECLAST = 19
-uc.X86_INS_AESDEC = 20
-uc.X86_INS_AESENCLAST = 21
-uc.X86_INS_AESENC = 22
-uc.X86_INS_AESIMC = 23
-uc.X86_INS_AESKEYGENASSIST = 24
-uc.X86_INS_AND = 25
-uc.X86_INS_ANDN = 26
-uc.X86_INS_ANDNPD = 27
-uc.X86_INS_ANDNPS = 28
-uc.X86_INS_ANDPD = 29
-uc.X86_INS_ANDPS = 30
-uc.X86_INS_ARPL = 31
-uc.X86_INS_BEXTR = 32
-uc.X86_INS_BLCFILL = 33
-uc.X86_INS_BLCI = 34
-uc.X86_INS_BLCIC = 35
-uc.X86_INS_BLCMSK = 36
-uc.X86_INS_BLCS = 37
-uc.X86_INS_BLENDPD = 38
-uc.X86_INS_BLENDPS = 39
-uc.X86_INS_BLENDVPD = 40
-uc.X86_INS_BLENDVPS = 41
-uc.X86_INS_BLSFILL = 42
-uc.X86_INS_BLSI = 43
-uc.X86_INS_BLSIC = 44
-uc.X86_INS_BLSMSK = 45
-uc.X86_INS_BLSR = 46
-uc.X86_INS_BOUND = 47
-uc.X86_INS_BSF = 48
-uc.X86_INS_BSR = 49
-uc.X86_INS_BSWAP = 50
-uc.X86_INS_BT = 51
-uc.X86_INS_BTC = 52
-uc.X86_INS_BTR = 53
-uc.X86_INS_BTS = 54
-uc.X86_INS_BZHI = 55
-uc.X86_INS_CALL = 56
-uc.X86_INS_CBW = 57
-uc.X86_INS_CDQ = 58
-uc.X86_INS_CDQE = 59
-uc.X86_INS_FCHS = 60
-uc.X86_INS_CLAC = 61
-uc.X86_INS_CLC = 62
-uc.X86_INS_CLD = 63
-uc.X86_INS_CLFLUSH = 64
-uc.X86_INS_CLFLUSHOPT = 65
-uc.X86_INS_CLGI = 66
-uc.X86_INS_CLI = 67
-uc.X86_INS_CLTS = 68
-uc.X86_INS_CLWB = 69
-uc.X86_INS_CMC = 70
-uc.X86_INS_CMOVA = 71
-uc.X86_INS_CMOVAE = 72
-uc.X86_INS_CMOVB = 73
-uc.X86_INS_CMOVBE = 74
-uc.X86_INS_FCMOVBE = 75
-uc.X86_INS_FCMOVB = 76
-uc.X86_INS_CMOVE = 77
-uc.X86_INS_FCMOVE = 78
-uc.X86_INS_CMOVG = 79
-uc.X86_INS_CMOVGE = 80
-uc.X86_INS_CMOVL = 81
-uc.X86_INS_CMOVLE = 82
-uc.X86_INS_FCMOVNBE = 83
-uc.X86_INS_FCMOVNB = 84
-uc.X86_INS_CMOVNE = 85
-uc.X86_INS_FCMOVNE = 86
-uc.X86_INS_CMOVNO = 87
-uc.X86_INS_CMOVNP = 88
-uc.X86_INS_FCMOVNU = 89
-uc.X86_INS_CMOVNS = 90
-uc.X86_INS_CMOVO = 91
-uc.X86_INS_CMOVP = 92
-uc.X86_INS_FCMOVU = 93
-uc.X86_INS_CMOVS = 94
-uc.X86_INS_CMP = 95
-uc.X86_INS_CMPPD = 96
-uc.X86_INS_CMPPS = 97
-uc.X86_INS_CMPSB = 98
-uc.X86_INS_CMPSD = 99
-uc.X86_INS_CMPSQ = 100
-uc.X86_INS_CMPSS = 101
-uc.X86_INS_CMPSW = 102
-uc.X86_INS_CMPXCHG16B = 103
-uc.X86_INS_CMPXCHG = 104
-uc.X86_INS_CMPXCHG8B = 105
-uc.X86_INS_COMISD = 106
-uc.X86_INS_COMISS = 107
-uc.X86_INS_FCOMP = 108
-uc.X86_INS_FCOMPI = 109
-uc.X86_INS_FCOMI = 110
-uc.X86_INS_FCOM = 111
-uc.X86_INS_FCOS = 112
-uc.X86_INS_CPUID = 113
-uc.X86_INS_CQO = 114
-uc.X86_INS_CRC32 = 115
-uc.X86_INS_CVTDQ2PD = 116
-uc.X86_INS_CVTDQ2PS = 117
-uc.X86_INS_CVTPD2DQ = 118
-uc.X86_INS_CVTPD2PS = 119
-uc.X86_INS_CVTPS2DQ = 120
-uc.X86_INS_CVTPS2PD = 121
-uc.X86_INS_CVTSD2SI = 122
-uc.X86_INS_CVTSD2SS = 123
-uc.X86_INS_CVTSI2SD = 124
-uc.X86_INS_CVTSI2SS = 125
-uc.X86_INS_CVTSS2SD = 126
-uc.X86_INS_CVTSS2SI = 127
-uc.X86_INS_CVTTPD2DQ = 128
-uc.X86_INS_CVTTPS2DQ = 129
-uc.X86_INS_CVTTSD2SI = 130
-uc.X86_INS_CVTTSS2SI = 131
-uc.X86_INS_CWD = 132
-uc.X86_INS_CWDE = 133
-uc.X86_INS_DAA = 134
-uc.X86_INS_DAS = 135
-uc.X86_INS_DATA16 = 136
-uc.X86_INS_DEC = 137
-uc.X86_INS_DIV = 138
-uc.X86_INS_DIVPD = 139
-uc.X86_INS_DIVPS = 140
-uc.X86_INS_FDIVR = 141
-uc.X86_INS_FIDIVR = 142
-uc.X86_INS_FDIVRP = 143
-uc.X86_INS_DIVSD = 144
-uc.X86_INS_DIVSS = 145
-uc.X86_INS_FDIV = 146
-uc.X86_INS_FIDIV = 147
-uc.X86_INS_FDIVP = 148
-uc.X86_INS_DPPD = 149
-uc.X86_INS_DPPS = 150
-uc.X86_INS_RET = 151
-uc.X86_INS_ENCLS = 152
-uc.X86_INS_ENCLU = 153
-uc.X86_INS_ENTER = 154
-uc.X86_INS_EXTRACTPS = 155
-uc.X86_INS_EXTRQ = 156
-uc.X86_INS_F2XM1 = 157
-uc.X86_INS_LCALL = 158
-uc.X86_INS_LJMP = 159
-uc.X86_INS_FBLD = 160
-uc.X86_INS_FBSTP = 161
-uc.X86_INS_FCOMPP = 162
-uc.X86_INS_FDECSTP = 163
-uc.X86_INS_FEMMS = 164
-uc.X86_INS_FFREE = 165
-uc.X86_INS_FICOM = 166
-uc.X86_INS_FICOMP = 167
-uc.X86_INS_FINCSTP = 168
-uc.X86_INS_FLDCW = 169
-uc.X86_INS_FLDENV = 170
-uc.X86_INS_FLDL2E = 171
-uc.X86_INS_FLDL2T = 172
-uc.X86_INS_FLDLG2 = 173
-uc.X86_INS_FLDLN2 = 174
-uc.X86_INS_FLDPI = 175
-uc.X86_INS_FNCLEX = 176
-uc.X86_INS_FNINIT = 177
-uc.X86_INS_FNOP = 178
-uc.X86_INS_FNSTCW = 179
-uc.X86_INS_FNSTSW = 180
-uc.X86_INS_FPATAN = 181
-uc.X86_INS_FPREM = 182
-uc.X86_INS_FPREM1 = 183
-uc.X86_INS_FPTAN = 184
-uc.X86_INS_FFREEP = 185
-uc.X86_INS_FRNDINT = 186
-uc.X86_INS_FRSTOR = 187
-uc.X86_INS_FNSAVE = 188
-uc.X86_INS_FSCALE = 189
-uc.X86_INS_FSETPM = 190
-uc.X86_INS_FSINCOS = 191
-uc.X86_INS_FNSTENV = 192
-uc.X86_INS_FXAM = 193
-uc.X86_INS_FXRSTOR = 194
-uc.X86_INS_FXRSTOR64 = 195
-uc.X86_INS_FXSAVE = 196
-uc.X86_INS_FXSAVE64 = 197
-uc.X86_INS_FXTRACT = 198
-uc.X86_INS_FYL2X = 199
-uc.X86_INS_FYL2XP1 = 200
-uc.X86_INS_MOVAPD = 201
-uc.X86_INS_MOVAPS = 202
-uc.X86_INS_ORPD = 203
-uc.X86_INS_ORPS = 204
-uc.X86_INS_VMOVAPD = 205
-uc.X86_INS_VMOVAPS = 206
-uc.X86_INS_XORPD = 207
-uc.X86_INS_XORPS = 208
-uc.X86_INS_GETSEC = 209
-uc.X86_INS_HADDPD = 210
-uc.X86_INS_HADDPS = 211
-uc.X86_INS_HLT = 212
-uc.X86_INS_HSUBPD = 213
-uc.X86_INS_HSUBPS = 214
-uc.X86_INS_IDIV = 215
-uc.X86_INS_FILD = 216
-uc.X86_INS_IMUL = 217
-uc.X86_INS_IN = 218
-uc.X86_INS_INC = 219
-uc.X86_INS_INSB = 220
-uc.X86_INS_INSERTPS = 221
-uc.X86_INS_INSERTQ = 222
-uc.X86_INS_INSD = 223
-uc.X86_INS_INSW = 224
-uc.X86_INS_INT = 225
-uc.X86_INS_INT1 = 226
-uc.X86_INS_INT3 = 227
-uc.X86_INS_INTO = 228
-uc.X86_INS_INVD = 229
-uc.X86_INS_INVEPT = 230
-uc.X86_INS_INVLPG = 231
-uc.X86_INS_INVLPGA = 232
-uc.X86_INS_INVPCID = 233
-uc.X86_INS_INVVPID = 234
-uc.X86_INS_IRET = 235
-uc.X86_INS_IRETD = 236
-uc.X86_INS_IRETQ = 237
-uc.X86_INS_FISTTP = 238
-uc.X86_INS_FIST = 239
-uc.X86_INS_FISTP = 240
-uc.X86_INS_UCOMISD = 241
-uc.X86_INS_UCOMISS = 242
-uc.X86_INS_VCOMISD = 243
-uc.X86_INS_VCOMISS = 244
-uc.X86_INS_VCVTSD2SS = 245
-uc.X86_INS_VCVTSI2SD = 246
-uc.X86_INS_VCVTSI2SS = 247
-uc.X86_INS_VCVTSS2SD = 248
-uc.X86_INS_VCVTTSD2SI = 249
-uc.X86_INS_VCVTTSD2USI = 250
-uc.X86_INS_VCVTTSS2SI = 251
-uc.X86_INS_VCVTTSS2USI = 252
-uc.X86_INS_VCVTUSI2SD = 253
-uc.X86_INS_VCVTUSI2SS = 254
-uc.X86_INS_VUCOMISD = 255
-uc.X86_INS_VUCOMISS = 256
-uc.X86_INS_JAE = 257
-uc.X86_INS_JA = 258
-uc.X86_INS_JBE = 259
-uc.X86_INS_JB = 260
-uc.X86_INS_JCXZ = 261
-uc.X86_INS_JECXZ = 262
-uc.X86_INS_JE = 263
-uc.X86_INS_JGE = 264
-uc.X86_INS_JG = 265
-uc.X86_INS_JLE = 266
-uc.X86_INS_JL = 267
-uc.X86_INS_JMP = 268
-uc.X86_INS_JNE = 269
-uc.X86_INS_JNO = 270
-uc.X86_INS_JNP = 271
-uc.X86_INS_JNS = 272
-uc.X86_INS_JO = 273
-uc.X86_INS_JP = 274
-uc.X86_INS_JRCXZ = 275
-uc.X86_INS_JS = 276
-uc.X86_INS_KANDB = 277
-uc.X86_INS_KANDD = 278
-uc.X86_INS_KANDNB = 279
-uc.X86_INS_KANDND = 280
-uc.X86_INS_KANDNQ = 281
-uc.X86_INS_KANDNW = 282
-uc.X86_INS_KANDQ = 283
-uc.X86_INS_KANDW = 284
-uc.X86_INS_KMOVB = 285
-uc.X86_INS_KMOVD = 286
-uc.X86_INS_KMOVQ = 287
-uc.X86_INS_KMOVW = 288
-uc.X86_INS_KNOTB = 289
-uc.X86_INS_KNOTD = 290
-uc.X86_INS_KNOTQ = 291
-uc.X86_INS_KNOTW = 292
-uc.X86_INS_KORB = 293
-uc.X86_INS_KORD = 294
-uc.X86_INS_KORQ = 295
-uc.X86_INS_KORTESTB = 296
-uc.X86_INS_KORTESTD = 297
-uc.X86_INS_KORTESTQ = 298
-uc.X86_INS_KORTESTW = 299
-uc.X86_INS_KORW = 300
-uc.X86_INS_KSHIFTLB = 301
-uc.X86_INS_KSHIFTLD = 302
-uc.X86_INS_KSHIFTLQ = 303
-uc.X86_INS_KSHIFTLW = 304
-uc.X86_INS_KSHIFTRB = 305
-uc.X86_INS_KSHIFTRD = 306
-uc.X86_INS_KSHIFTRQ = 307
-uc.X86_INS_KSHIFTRW = 308
-uc.X86_INS_KUNPCKBW = 309
-uc.X86_INS_KXNORB = 310
-uc.X86_INS_KXNORD = 311
-uc.X86_INS_KXNORQ = 312
-uc.X86_INS_KXNORW = 313
-uc.X86_INS_KXORB = 314
-uc.X86_INS_KXORD = 315
-uc.X86_INS_KXORQ = 316
-uc.X86_INS_KXORW = 317
-uc.X86_INS_LAHF = 318
-uc.X86_INS_LAR = 319
-uc.X86_INS_LDDQU = 320
-uc.X86_INS_LDMXCSR = 321
-uc.X86_INS_LDS = 322
-uc.X86_INS_FLDZ = 323
-uc.X86_INS_FLD1 = 324
-uc.X86_INS_FLD = 325
-uc.X86_INS_LEA = 326
-uc.X86_INS_LEAVE = 327
-uc.X86_INS_LES = 328
-uc.X86_INS_LFENCE = 329
-uc.X86_INS_LFS = 330
-uc.X86_INS_LGDT = 331
-uc.X86_INS_LGS = 332
-uc.X86_INS_LIDT = 333
-uc.X86_INS_LLDT = 334
-uc.X86_INS_LMSW = 335
-uc.X86_INS_OR = 336
-uc.X86_INS_SUB = 337
-uc.X86_INS_XOR = 338
-uc.X86_INS_LODSB = 339
-uc.X86_INS_LODSD = 340
-uc.X86_INS_LODSQ = 341
-uc.X86_INS_LODSW = 342
-uc.X86_INS_LOOP = 343
-uc.X86_INS_LOOPE = 344
-uc.X86_INS_LOOPNE = 345
-uc.X86_INS_RETF = 346
-uc.X86_INS_RETFQ = 347
-uc.X86_INS_LSL = 348
-uc.X86_INS_LSS = 349
-uc.X86_INS_LTR = 350
-uc.X86_INS_XADD = 351
-uc.X86_INS_LZCNT = 352
-uc.X86_INS_MASKMOVDQU = 353
-uc.X86_INS_MAXPD = 354
-uc.X86_INS_MAXPS = 355
-uc.X86_INS_MAXSD = 356
-uc.X86_INS_MAXSS = 357
-uc.X86_INS_MFENCE = 358
-uc.X86_INS_MINPD = 359
-uc.X86_INS_MINPS = 360
-uc.X86_INS_MINSD = 361
-uc.X86_INS_MINSS = 362
-uc.X86_INS_CVTPD2PI = 363
-uc.X86_INS_CVTPI2PD = 364
-uc.X86_INS_CVTPI2PS = 365
-uc.X86_INS_CVTPS2PI = 366
-uc.X86_INS_CVTTPD2PI = 367
-uc.X86_INS_CVTTPS2PI = 368
-uc.X86_INS_EMMS = 369
-uc.X86_INS_MASKMOVQ = 370
-uc.X86_INS_MOVD = 371
-uc.X86_INS_MOVDQ2Q = 372
-uc.X86_INS_MOVNTQ = 373
-uc.X86_INS_MOVQ2DQ = 374
-uc.X86_INS_MOVQ = 375
-uc.X86_INS_PABSB = 376
-uc.X86_INS_PABSD = 377
-uc.X86_INS_PABSW = 378
-uc.X86_INS_PACKSSDW = 379
-uc.X86_INS_PACKSSWB = 380
-uc.X86_INS_PACKUSWB = 381
-uc.X86_INS_PADDB = 382
-uc.X86_INS_PADDD = 383
-uc.X86_INS_PADDQ = 384
-uc.X86_INS_PADDSB = 385
-uc.X86_INS_PADDSW = 386
-uc.X86_INS_PADDUSB = 387
-uc.X86_INS_PADDUSW = 388
-uc.X86_INS_PADDW = 389
-uc.X86_INS_PALIGNR = 390
-uc.X86_INS_PANDN = 391
-uc.X86_INS_PAND = 392
-uc.X86_INS_PAVGB = 393
-uc.X86_INS_PAVGW = 394
-uc.X86_INS_PCMPEQB = 395
-uc.X86_INS_PCMPEQD = 396
-uc.X86_INS_PCMPEQW = 397
-uc.X86_INS_PCMPGTB = 398
-uc.X86_INS_PCMPGTD = 399
-uc.X86_INS_PCMPGTW = 400
-uc.X86_INS_PEXTRW = 401
-uc.X86_INS_PHADDSW = 402
-uc.X86_INS_PHADDW = 403
-uc.X86_INS_PHADDD = 404
-uc.X86_INS_PHSUBD = 405
-uc.X86_INS_PHSUBSW = 406
-uc.X86_INS_PHSUBW = 407
-uc.X86_INS_PINSRW = 408
-uc.X86_INS_PMADDUBSW = 409
-uc.X86_INS_PMADDWD = 410
-uc.X86_INS_PMAXSW = 411
-uc.X86_INS_PMAXUB = 412
-uc.X86_INS_PMINSW = 413
-uc.X86_INS_PMINUB = 414
-uc.X86_INS_PMOVMSKB = 415
-uc.X86_INS_PMULHRSW = 416
-uc.X86_INS_PMULHUW = 417
-uc.X86_INS_PMULHW = 418
-uc.X86_INS_PMULLW = 419
-uc.X86_INS_PMULUDQ = 420
-uc.X86_INS_POR = 421
-uc.X86_INS_PSADBW = 422
-uc.X86_INS_PSHUFB = 423
-uc.X86_INS_PSHUFW = 424
-uc.X86_INS_PSIGNB = 425
-uc.X86_INS_PSIGND = 426
-uc.X86_INS_PSIGNW = 427
-uc.X86_INS_PSLLD = 428
-uc.X86_INS_PSLLQ = 429
-uc.X86_INS_PSLLW = 430
-uc.X86_INS_PSRAD = 431
-uc.X86_INS_PSRAW = 432
-uc.X86_INS_PSRLD = 433
-uc.X86_INS_PSRLQ = 434
-uc.X86_INS_PSRLW = 435
-uc.X86_INS_PSUBB = 436
-uc.X86_INS_PSUBD = 437
-uc.X86_INS_PSUBQ = 438
-uc.X86_INS_PSUBSB = 439
-uc.X86_INS_PSUBSW = 440
-uc.X86_INS_PSUBUSB = 441
-uc.X86_INS_PSUBUSW = 442
-uc.X86_INS_PSUBW = 443
-uc.X86_INS_PUNPCKHBW = 444
-uc.X86_INS_PUNPCKHDQ = 445
-uc.X86_INS_PUNPCKHWD = 446
-uc.X86_INS_PUNPCKLBW = 447
-uc.X86_INS_PUNPCKLDQ = 448
-uc.X86_INS_PUNPCKLWD = 449
-uc.X86_INS_PXOR = 450
-uc.X86_INS_MONITOR = 451
-uc.X86_INS_MONTMUL = 452
-uc.X86_INS_MOV = 453
-uc.X86_INS_MOVABS = 454
-uc.X86_INS_MOVBE = 455
-uc.X86_INS_MOVDDUP = 456
-uc.X86_INS_MOVDQA = 457
-uc.X86_INS_MOVDQU = 458
-uc.X86_INS_MOVHLPS = 459
-uc.X86_INS_MOVHPD = 460
-uc.X86_INS_MOVHPS = 461
-uc.X86_INS_MOVLHPS = 462
-uc.X86_INS_MOVLPD = 463
-uc.X86_INS_MOVLPS = 464
-uc.X86_INS_MOVMSKPD = 465
-uc.X86_INS_MOVMSKPS = 466
-uc.X86_INS_MOVNTDQA = 467
-uc.X86_INS_MOVNTDQ = 468
-uc.X86_INS_MOVNTI = 469
-uc.X86_INS_MOVNTPD = 470
-uc.X86_INS_MOVNTPS = 471
-uc.X86_INS_MOVNTSD = 472
-uc.X86_INS_MOVNTSS = 473
-uc.X86_INS_MOVSB = 474
-uc.X86_INS_MOVSD = 475
-uc.X86_INS_MOVSHDUP = 476
-uc.X86_INS_MOVSLDUP = 477
-uc.X86_INS_MOVSQ = 478
-uc.X86_INS_MOVSS = 479
-uc.X86_INS_MOVSW = 480
-uc.X86_INS_MOVSX = 481
-uc.X86_INS_MOVSXD = 482
-uc.X86_INS_MOVUPD = 483
-uc.X86_INS_MOVUPS = 484
-uc.X86_INS_MOVZX = 485
-uc.X86_INS_MPSADBW = 486
-uc.X86_INS_MUL = 487
-uc.X86_INS_MULPD = 488
-uc.X86_INS_MULPS = 489
-uc.X86_INS_MULSD = 490
-uc.X86_INS_MULSS = 491
-uc.X86_INS_MULX = 492
-uc.X86_INS_FMUL = 493
-uc.X86_INS_FIMUL = 494
-uc.X86_INS_FMULP = 495
-uc.X86_INS_MWAIT = 496
-uc.X86_INS_NEG = 497
-uc.X86_INS_NOP = 498
-uc.X86_INS_NOT = 499
-uc.X86_INS_OUT = 500
-uc.X86_INS_OUTSB = 501
-uc.X86_INS_OUTSD = 502
-uc.X86_INS_OUTSW = 503
-uc.X86_INS_PACKUSDW = 504
-uc.X86_INS_PAUSE = 505
-uc.X86_INS_PAVGUSB = 506
-uc.X86_INS_PBLENDVB = 507
-uc.X86_INS_PBLENDW = 508
-uc.X86_INS_PCLMULQDQ = 509
-uc.X86_INS_PCMPEQQ = 510
-uc.X86_INS_PCMPESTRI = 511
-uc.X86_INS_PCMPESTRM = 512
-uc.X86_INS_PCMPGTQ = 513
-uc.X86_INS_PCMPISTRI = 514
-uc.X86_INS_PCMPISTRM = 515
-uc.X86_INS_PCOMMIT = 516
-uc.X86_INS_PDEP = 517
-uc.X86_INS_PEXT = 518
-uc.X86_INS_PEXTRB = 519
-uc.X86_INS_PEXTRD = 520
-uc.X86_INS_PEXTRQ = 521
-uc.X86_INS_PF2ID = 522
-uc.X86_INS_PF2IW = 523
-uc.X86_INS_PFACC = 524
-uc.X86_INS_PFADD = 525
-uc.X86_INS_PFCMPEQ = 526
-uc.X86_INS_PFCMPGE = 527
-uc.X86_INS_PFCMPGT = 528
-uc.X86_INS_PFMAX = 529
-uc.X86_INS_PFMIN = 530
-uc.X86_INS_PFMUL = 531
-uc.X86_INS_PFNACC = 532
-uc.X86_INS_PFPNACC = 533
-uc.X86_INS_PFRCPIT1 = 534
-uc.X86_INS_PFRCPIT2 = 535
-uc.X86_INS_PFRCP = 536
-uc.X86_INS_PFRSQIT1 = 537
-uc.X86_INS_PFRSQRT = 538
-uc.X86_INS_PFSUBR = 539
-uc.X86_INS_PFSUB = 540
-uc.X86_INS_PHMINPOSUW = 541
-uc.X86_INS_PI2FD = 542
-uc.X86_INS_PI2FW = 543
-uc.X86_INS_PINSRB = 544
-uc.X86_INS_PINSRD = 545
-uc.X86_INS_PINSRQ = 546
-uc.X86_INS_PMAXSB = 547
-uc.X86_INS_PMAXSD = 548
-uc.X86_INS_PMAXUD = 549
-uc.X86_INS_PMAXUW = 550
-uc.X86_INS_PMINSB = 551
-uc.X86_INS_PMINSD = 552
-uc.X86_INS_PMINUD = 553
-uc.X86_INS_PMINUW = 554
-uc.X86_INS_PMOVSXBD = 555
-uc.X86_INS_PMOVSXBQ = 556
-uc.X86_INS_PMOVSXBW = 557
-uc.X86_INS_PMOVSXDQ = 558
-uc.X86_INS_PMOVSXWD = 559
-uc.X86_INS_PMOVSXWQ = 560
-uc.X86_INS_PMOVZXBD = 561
-uc.X86_INS_PMOVZXBQ = 562
-uc.X86_INS_PMOVZXBW = 563
-uc.X86_INS_PMOVZXDQ = 564
-uc.X86_INS_PMOVZXWD = 565
-uc.X86_INS_PMOVZXWQ = 566
-uc.X86_INS_PMULDQ = 567
-uc.X86_INS_PMULHRW = 568
-uc.X86_INS_PMULLD = 569
-uc.X86_INS_POP = 570
-uc.X86_INS_POPAW = 571
-uc.X86_INS_POPAL = 572
-uc.X86_INS_POPCNT = 573
-uc.X86_INS_POPF = 574
-uc.X86_INS_POPFD = 575
-uc.X86_INS_POPFQ = 576
-uc.X86_INS_PREFETCH = 577
-uc.X86_INS_PREFETCHNTA = 578
-uc.X86_INS_PREFETCHT0 = 579
-uc.X86_INS_PREFETCHT1 = 580
-uc.X86_INS_PREFETCHT2 = 581
-uc.X86_INS_PREFETCHW = 582
-uc.X86_INS_PSHUFD = 583
-uc.X86_INS_PSHUFHW = 584
-uc.X86_INS_PSHUFLW = 585
-uc.X86_INS_PSLLDQ = 586
-uc.X86_INS_PSRLDQ = 587
-uc.X86_INS_PSWAPD = 588
-uc.X86_INS_PTEST = 589
-uc.X86_INS_PUNPCKHQDQ = 590
-uc.X86_INS_PUNPCKLQDQ = 591
-uc.X86_INS_PUSH = 592
-uc.X86_INS_PUSHAW = 593
-uc.X86_INS_PUSHAL = 594
-uc.X86_INS_PUSHF = 595
-uc.X86_INS_PUSHFD = 596
-uc.X86_INS_PUSHFQ = 597
-uc.X86_INS_RCL = 598
-uc.X86_INS_RCPPS = 599
-uc.X86_INS_RCPSS = 600
-uc.X86_INS_RCR = 601
-uc.X86_INS_RDFSBASE = 602
-uc.X86_INS_RDGSBASE = 603
-uc.X86_INS_RDMSR = 604
-uc.X86_INS_RDPMC = 605
-uc.X86_INS_RDRAND = 606
-uc.X86_INS_RDSEED = 607
-uc.X86_INS_RDTSC = 608
-uc.X86_INS_RDTSCP = 609
-uc.X86_INS_ROL = 610
-uc.X86_INS_ROR = 611
-uc.X86_INS_RORX = 612
-uc.X86_INS_ROUNDPD = 613
-uc.X86_INS_ROUNDPS = 614
-uc.X86_INS_ROUNDSD = 615
-uc.X86_INS_ROUNDSS = 616
-uc.X86_INS_RSM = 617
-uc.X86_INS_RSQRTPS = 618
-uc.X86_INS_RSQRTSS = 619
-uc.X86_INS_SAHF = 620
-uc.X86_INS_SAL = 621
-uc.X86_INS_SALC = 622
-uc.X86_INS_SAR = 623
-uc.X86_INS_SARX = 624
-uc.X86_INS_SBB = 625
-uc.X86_INS_SCASB = 626
-uc.X86_INS_SCASD = 627
-uc.X86_INS_SCASQ = 628
-uc.X86_INS_SCASW = 629
-uc.X86_INS_SETAE = 630
-uc.X86_INS_SETA = 631
-uc.X86_INS_SETBE = 632
-uc.X86_INS_SETB = 633
-uc.X86_INS_SETE = 634
-uc.X86_INS_SETGE = 635
-uc.X86_INS_SETG = 636
-uc.X86_INS_SETLE = 637
-uc.X86_INS_SETL = 638
-uc.X86_INS_SETNE = 639
-uc.X86_INS_SETNO = 640
-uc.X86_INS_SETNP = 641
-uc.X86_INS_SETNS = 642
-uc.X86_INS_SETO = 643
-uc.X86_INS_SETP = 644
-uc.X86_INS_SETS = 645
-uc.X86_INS_SFENCE = 646
-uc.X86_INS_SGDT = 647
-uc.X86_INS_SHA1MSG1 = 648
-uc.X86_INS_SHA1MSG2 = 649
-uc.X86_INS_SHA1NEXTE = 650
-uc.X86_INS_SHA1RNDS4 = 651
-uc.X86_INS_SHA256MSG1 = 652
-uc.X86_INS_SHA256MSG2 = 653
-uc.X86_INS_SHA256RNDS2 = 654
-uc.X86_INS_SHL = 655
-uc.X86_INS_SHLD = 656
-uc.X86_INS_SHLX = 657
-uc.X86_INS_SHR = 658
-uc.X86_INS_SHRD = 659
-uc.X86_INS_SHRX = 660
-uc.X86_INS_SHUFPD = 661
-uc.X86_INS_SHUFPS = 662
-uc.X86_INS_SIDT = 663
-uc.X86_INS_FSIN = 664
-uc.X86_INS_SKINIT = 665
-uc.X86_INS_SLDT = 666
-uc.X86_INS_SMSW = 667
-uc.X86_INS_SQRTPD = 668
-uc.X86_INS_SQRTPS = 669
-uc.X86_INS_SQRTSD = 670
-uc.X86_INS_SQRTSS = 671
-uc.X86_INS_FSQRT = 672
-uc.X86_INS_STAC = 673
-uc.X86_INS_STC = 674
-uc.X86_INS_STD = 675
-uc.X86_INS_STGI = 676
-uc.X86_INS_STI = 677
-uc.X86_INS_STMXCSR = 678
-uc.X86_INS_STOSB = 679
-uc.X86_INS_STOSD = 680
-uc.X86_INS_STOSQ = 681
-uc.X86_INS_STOSW = 682
-uc.X86_INS_STR = 683
-uc.X86_INS_FST = 684
-uc.X86_INS_FSTP = 685
-uc.X86_INS_FSTPNCE = 686
-uc.X86_INS_FXCH = 687
-uc.X86_INS_SUBPD = 688
-uc.X86_INS_SUBPS = 689
-uc.X86_INS_FSUBR = 690
-uc.X86_INS_FISUBR = 691
-uc.X86_INS_FSUBRP = 692
-uc.X86_INS_SUBSD = 693
-uc.X86_INS_SUBSS = 694
-uc.X86_INS_FSUB = 695
-uc.X86_INS_FISUB = 696
-uc.X86_INS_FSUBP = 697
-uc.X86_INS_SWAPGS = 698
-uc.X86_INS_SYSCALL = 699
-uc.X86_INS_SYSENTER = 700
-uc.X86_INS_SYSEXIT = 701
-uc.X86_INS_SYSRET = 702
-uc.X86_INS_T1MSKC = 703
-uc.X86_INS_TEST = 704
-uc.X86_INS_UD2 = 705
-uc.X86_INS_FTST = 706
-uc.X86_INS_TZCNT = 707
-uc.X86_INS_TZMSK = 708
-uc.X86_INS_FUCOMPI = 709
-uc.X86_INS_FUCOMI = 710
-uc.X86_INS_FUCOMPP = 711
-uc.X86_INS_FUCOMP = 712
-uc.X86_INS_FUCOM = 713
-uc.X86_INS_UD2B = 714
-uc.X86_INS_UNPCKHPD = 715
-uc.X86_INS_UNPCKHPS = 716
-uc.X86_INS_UNPCKLPD = 717
-uc.X86_INS_UNPCKLPS = 718
-uc.X86_INS_VADDPD = 719
-uc.X86_INS_VADDPS = 720
-uc.X86_INS_VADDSD = 721
-uc.X86_INS_VADDSS = 722
-uc.X86_INS_VADDSUBPD = 723
-uc.X86_INS_VADDSUBPS = 724
-uc.X86_INS_VAESDECLAST = 725
-uc.X86_INS_VAESDEC = 726
-uc.X86_INS_VAESENCLAST = 727
-uc.X86_INS_VAESENC = 728
-uc.X86_INS_VAESIMC = 729
-uc.X86_INS_VAESKEYGENASSIST = 730
-uc.X86_INS_VALIGND = 731
-uc.X86_INS_VALIGNQ = 732
-uc.X86_INS_VANDNPD = 733
-uc.X86_INS_VANDNPS = 734
-uc.X86_INS_VANDPD = 735
-uc.X86_INS_VANDPS = 736
-uc.X86_INS_VBLENDMPD = 737
-uc.X86_INS_VBLENDMPS = 738
-uc.X86_INS_VBLENDPD = 739
-uc.X86_INS_VBLENDPS = 740
-uc.X86_INS_VBLENDVPD = 741
-uc.X86_INS_VBLENDVPS = 742
-uc.X86_INS_VBROADCASTF128 = 743
-uc.X86_INS_VBROADCASTI32X4 = 744
-uc.X86_INS_VBROADCASTI64X4 = 745
-uc.X86_INS_VBROADCASTSD = 746
-uc.X86_INS_VBROADCASTSS = 747
-uc.X86_INS_VCMPPD = 748
-uc.X86_INS_VCMPPS = 749
-uc.X86_INS_VCMPSD = 750
-uc.X86_INS_VCMPSS = 751
-uc.X86_INS_VCOMPRESSPD = 752
-uc.X86_INS_VCOMPRESSPS = 753
-uc.X86_INS_VCVTDQ2PD = 754
-uc.X86_INS_VCVTDQ2PS = 755
-uc.X86_INS_VCVTPD2DQX = 756
-uc.X86_INS_VCVTPD2DQ = 757
-uc.X86_INS_VCVTPD2PSX = 758
-uc.X86_INS_VCVTPD2PS = 759
-uc.X86_INS_VCVTPD2UDQ = 760
-uc.X86_INS_VCVTPH2PS = 761
-uc.X86_INS_VCVTPS2DQ = 762
-uc.X86_INS_VCVTPS2PD = 763
-uc.X86_INS_VCVTPS2PH = 764
-uc.X86_INS_VCVTPS2UDQ = 765
-uc.X86_INS_VCVTSD2SI = 766
-uc.X86_INS_VCVTSD2USI = 767
-uc.X86_INS_VCVTSS2SI = 768
-uc.X86_INS_VCVTSS2USI = 769
-uc.X86_INS_VCVTTPD2DQX = 770
-uc.X86_INS_VCVTTPD2DQ = 771
-uc.X86_INS_VCVTTPD2UDQ = 772
-uc.X86_INS_VCVTTPS2DQ = 773
-uc.X86_INS_VCVTTPS2UDQ = 774
-uc.X86_INS_VCVTUDQ2PD = 775
-uc.X86_INS_VCVTUDQ2PS = 776
-uc.X86_INS_VDIVPD = 777
-uc.X86_INS_VDIVPS = 778
-uc.X86_INS_VDIVSD = 779
-uc.X86_INS_VDIVSS = 780
-uc.X86_INS_VDPPD = 781
-uc.X86_INS_VDPPS = 782
-uc.X86_INS_VERR = 783
-uc.X86_INS_VERW = 784
-uc.X86_INS_VEXP2PD = 785
-uc.X86_INS_VEXP2PS = 786
-uc.X86_INS_VEXPANDPD = 787
-uc.X86_INS_VEXPANDPS = 788
-uc.X86_INS_VEXTRACTF128 = 789
-uc.X86_INS_VEXTRACTF32X4 = 790
-uc.X86_INS_VEXTRACTF64X4 = 791
-uc.X86_INS_VEXTRACTI128 = 792
-uc.X86_INS_VEXTRACTI32X4 = 793
-uc.X86_INS_VEXTRACTI64X4 = 794
-uc.X86_INS_VEXTRACTPS = 795
-uc.X86_INS_VFMADD132PD = 796
-uc.X86_INS_VFMADD132PS = 797
-uc.X86_INS_VFMADDPD = 798
-uc.X86_INS_VFMADD213PD = 799
-uc.X86_INS_VFMADD231PD = 800
-uc.X86_INS_VFMADDPS = 801
-uc.X86_INS_VFMADD213PS = 802
-uc.X86_INS_VFMADD231PS = 803
-uc.X86_INS_VFMADDSD = 804
-uc.X86_INS_VFMADD213SD = 805
-uc.X86_INS_VFMADD132SD = 806
-uc.X86_INS_VFMADD231SD = 807
-uc.X86_INS_VFMADDSS = 808
-uc.X86_INS_VFMADD213SS = 809
-uc.X86_INS_VFMADD132SS = 810
-uc.X86_INS_VFMADD231SS = 811
-uc.X86_INS_VFMADDSUB132PD = 812
-uc.X86_INS_VFMADDSUB132PS = 813
-uc.X86_INS_VFMADDSUBPD = 814
-uc.X86_INS_VFMADDSUB213PD = 815
-uc.X86_INS_VFMADDSUB231PD = 816
-uc.X86_INS_VFMADDSUBPS = 817
-uc.X86_INS_VFMADDSUB213PS = 818
-uc.X86_INS_VFMADDSUB231PS = 819
-uc.X86_INS_VFMSUB132PD = 820
-uc.X86_INS_VFMSUB132PS = 821
-uc.X86_INS_VFMSUBADD132PD = 822
-uc.X86_INS_VFMSUBADD132PS = 823
-uc.X86_INS_VFMSUBADDPD = 824
-uc.X86_INS_VFMSUBADD213PD = 825
-uc.X86_INS_VFMSUBADD231PD = 826
-uc.X86_INS_VFMSUBADDPS = 827
-uc.X86_INS_VFMSUBADD213PS = 828
-uc.X86_INS_VFMSUBADD231PS = 829
-uc.X86_INS_VFMSUBPD = 830
-uc.X86_INS_VFMSUB213PD = 831
-uc.X86_INS_VFMSUB231PD = 832
-uc.X86_INS_VFMSUBPS = 833
-uc.X86_INS_VFMSUB213PS = 834
-uc.X86_INS_VFMSUB231PS = 835
-uc.X86_INS_VFMSUBSD = 836
-uc.X86_INS_VFMSUB213SD = 837
-uc.X86_INS_VFMSUB132SD = 838
-uc.X86_INS_VFMSUB231SD = 839
-uc.X86_INS_VFMSUBSS = 840
-uc.X86_INS_VFMSUB213SS = 841
-uc.X86_INS_VFMSUB132SS = 842
-uc.X86_INS_VFMSUB231SS = 843
-uc.X86_INS_VFNMADD132PD = 844
-uc.X86_INS_VFNMADD132PS = 845
-uc.X86_INS_VFNMADDPD = 846
-uc.X86_INS_VFNMADD213PD = 847
-uc.X86_INS_VFNMADD231PD = 848
-uc.X86_INS_VFNMADDPS = 849
-uc.X86_INS_VFNMADD213PS = 850
-uc.X86_INS_VFNMADD231PS = 851
-uc.X86_INS_VFNMADDSD = 852
-uc.X86_INS_VFNMADD213SD = 853
-uc.X86_INS_VFNMADD132SD = 854
-uc.X86_INS_VFNMADD231SD = 855
-uc.X86_INS_VFNMADDSS = 856
-uc.X86_INS_VFNMADD213SS = 857
-uc.X86_INS_VFNMADD132SS = 858
-uc.X86_INS_VFNMADD231SS = 859
-uc.X86_INS_VFNMSUB132PD = 860
-uc.X86_INS_VFNMSUB132PS = 861
-uc.X86_INS_VFNMSUBPD = 862
-uc.X86_INS_VFNMSUB213PD = 863
-uc.X86_INS_VFNMSUB231PD = 864
-uc.X86_INS_VFNMSUBPS = 865
-uc.X86_INS_VFNMSUB213PS = 866
-uc.X86_INS_VFNMSUB231PS = 867
-uc.X86_INS_VFNMSUBSD = 868
-uc.X86_INS_VFNMSUB213SD = 869
-uc.X86_INS_VFNMSUB132SD = 870
-uc.X86_INS_VFNMSUB231SD = 871
-uc.X86_INS_VFNMSUBSS = 872
-uc.X86_INS_VFNMSUB213SS = 873
-uc.X86_INS_VFNMSUB132SS = 874
-uc.X86_INS_VFNMSUB231SS = 875
-uc.X86_INS_VFRCZPD = 876
-uc.X86_INS_VFRCZPS = 877
-uc.X86_INS_VFRCZSD = 878
-uc.X86_INS_VFRCZSS = 879
-uc.X86_INS_VORPD = 880
-uc.X86_INS_VORPS = 881
-uc.X86_INS_VXORPD = 882
-uc.X86_INS_VXORPS = 883
-uc.X86_INS_VGATHERDPD = 884
-uc.X86_INS_VGATHERDPS = 885
-uc.X86_INS_VGATHERPF0DPD = 886
-uc.X86_INS_VGATHERPF0DPS = 887
-uc.X86_INS_VGATHERPF0QPD = 888
-uc.X86_INS_VGATHERPF0QPS = 889
-uc.X86_INS_VGATHERPF1DPD = 890
-uc.X86_INS_VGATHERPF1DPS = 891
-uc.X86_INS_VGATHERPF1QPD = 892
-uc.X86_INS_VGATHERPF1QPS = 893
-uc.X86_INS_VGATHERQPD = 894
-uc.X86_INS_VGATHERQPS = 895
-uc.X86_INS_VHADDPD = 896
-uc.X86_INS_VHADDPS = 897
-uc.X86_INS_VHSUBPD = 898
-uc.X86_INS_VHSUBPS = 899
-uc.X86_INS_VINSERTF128 = 900
-uc.X86_INS_VINSERTF32X4 = 901
-uc.X86_INS_VINSERTF32X8 = 902
-uc.X86_INS_VINSERTF64X2 = 903
-uc.X86_INS_VINSERTF64X4 = 904
-uc.X86_INS_VINSERTI128 = 905
-uc.X86_INS_VINSERTI32X4 = 906
-uc.X86_INS_VINSERTI32X8 = 907
-uc.X86_INS_VINSERTI64X2 = 908
-uc.X86_INS_VINSERTI64X4 = 909
-uc.X86_INS_VINSERTPS = 910
-uc.X86_INS_VLDDQU = 911
-uc.X86_INS_VLDMXCSR = 912
-uc.X86_INS_VMASKMOVDQU = 913
-uc.X86_INS_VMASKMOVPD = 914
-uc.X86_INS_VMASKMOVPS = 915
-uc.X86_INS_VMAXPD = 916
-uc.X86_INS_VMAXPS = 917
-uc.X86_INS_VMAXSD = 918
-uc.X86_INS_VMAXSS = 919
-uc.X86_INS_VMCALL = 920
-uc.X86_INS_VMCLEAR = 921
-uc.X86_INS_VMFUNC = 922
-uc.X86_INS_VMINPD = 923
-uc.X86_INS_VMINPS = 924
-uc.X86_INS_VMINSD = 925
-uc.X86_INS_VMINSS = 926
-uc.X86_INS_VMLAUNCH = 927
-uc.X86_INS_VMLOAD = 928
-uc.X86_INS_VMMCALL = 929
-uc.X86_INS_VMOVQ = 930
-uc.X86_INS_VMOVDDUP = 931
-uc.X86_INS_VMOVD = 932
-uc.X86_INS_VMOVDQA32 = 933
-uc.X86_INS_VMOVDQA64 = 934
-uc.X86_INS_VMOVDQA = 935
-uc.X86_INS_VMOVDQU16 = 936
-uc.X86_INS_VMOVDQU32 = 937
-uc.X86_INS_VMOVDQU64 = 938
-uc.X86_INS_VMOVDQU8 = 939
-uc.X86_INS_VMOVDQU = 940
-uc.X86_INS_VMOVHLPS = 941
-uc.X86_INS_VMOVHPD = 942
-uc.X86_INS_VMOVHPS = 943
-uc.X86_INS_VMOVLHPS = 944
-uc.X86_INS_VMOVLPD = 945
-uc.X86_INS_VMOVLPS = 946
-uc.X86_INS_VMOVMSKPD = 947
-uc.X86_INS_VMOVMSKPS = 948
-uc.X86_INS_VMOVNTDQA = 949
-uc.X86_INS_VMOVNTDQ = 950
-uc.X86_INS_VMOVNTPD = 951
-uc.X86_INS_VMOVNTPS = 952
-uc.X86_INS_VMOVSD = 953
-uc.X86_INS_VMOVSHDUP = 954
-uc.X86_INS_VMOVSLDUP = 955
-uc.X86_INS_VMOVSS = 956
-uc.X86_INS_VMOVUPD = 957
-uc.X86_INS_VMOVUPS = 958
-uc.X86_INS_VMPSADBW = 959
-uc.X86_INS_VMPTRLD = 960
-uc.X86_INS_VMPTRST = 961
-uc.X86_INS_VMREAD = 962
-uc.X86_INS_VMRESUME = 963
-uc.X86_INS_VMRUN = 964
-uc.X86_INS_VMSAVE = 965
-uc.X86_INS_VMULPD = 966
-uc.X86_INS_VMULPS = 967
-uc.X86_INS_VMULSD = 968
-uc.X86_INS_VMULSS = 969
-uc.X86_INS_VMWRITE = 970
-uc.X86_INS_VMXOFF = 971
-uc.X86_INS_VMXON = 972
-uc.X86_INS_VPABSB = 973
-uc.X86_INS_VPABSD = 974
-uc.X86_INS_VPABSQ = 975
-uc.X86_INS_VPABSW = 976
-uc.X86_INS_VPACKSSDW = 977
-uc.X86_INS_VPACKSSWB = 978
-uc.X86_INS_VPACKUSDW = 979
-uc.X86_INS_VPACKUSWB = 980
-uc.X86_INS_VPADDB = 981
-uc.X86_INS_VPADDD = 982
-uc.X86_INS_VPADDQ = 983
-uc.X86_INS_VPADDSB = 984
-uc.X86_INS_VPADDSW = 985
-uc.X86_INS_VPADDUSB = 986
-uc.X86_INS_VPADDUSW = 987
-uc.X86_INS_VPADDW = 988
-uc.X86_INS_VPALIGNR = 989
-uc.X86_INS_VPANDD = 990
-uc.X86_INS_VPANDND = 991
-uc.X86_INS_VPANDNQ = 992
-uc.X86_INS_VPANDN = 993
-uc.X86_INS_VPANDQ = 994
-uc.X86_INS_VPAND = 995
-uc.X86_INS_VPAVGB = 996
-uc.X86_INS_VPAVGW = 997
-uc.X86_INS_VPBLENDD = 998
-uc.X86_INS_VPBLENDMB = 999
-uc.X86_INS_VPBLENDMD = 1000
-uc.X86_INS_VPBLENDMQ = 1001
-uc.X86_INS_VPBLENDMW = 1002
-uc.X86_INS_VPBLENDVB = 1003
-uc.X86_INS_VPBLENDW = 1004
-uc.X86_INS_VPBROADCASTB = 1005
-uc.X86_INS_VPBROADCASTD = 1006
-uc.X86_INS_VPBROADCASTMB2Q = 1007
-uc.X86_INS_VPBROADCASTMW2D = 1008
-uc.X86_INS_VPBROADCASTQ = 1009
-uc.X86_INS_VPBROADCASTW = 1010
-uc.X86_INS_VPCLMULQDQ = 1011
-uc.X86_INS_VPCMOV = 1012
-uc.X86_INS_VPCMPB = 1013
-uc.X86_INS_VPCMPD = 1014
-uc.X86_INS_VPCMPEQB = 1015
-uc.X86_INS_VPCMPEQD = 1016
-uc.X86_INS_VPCMPEQQ = 1017
-uc.X86_INS_VPCMPEQW = 1018
-uc.X86_INS_VPCMPESTRI = 1019
-uc.X86_INS_VPCMPESTRM = 1020
-uc.X86_INS_VPCMPGTB = 1021
-uc.X86_INS_VPCMPGTD = 1022
-uc.X86_INS_VPCMPGTQ = 1023
-uc.X86_INS_VPCMPGTW = 1024
-uc.X86_INS_VPCMPISTRI = 1025
-uc.X86_INS_VPCMPISTRM = 1026
-uc.X86_INS_VPCMPQ = 1027
-uc.X86_INS_VPCMPUB = 1028
-uc.X86_INS_VPCMPUD = 1029
-uc.X86_INS_VPCMPUQ = 1030
-uc.X86_INS_VPCMPUW = 1031
-uc.X86_INS_VPCMPW = 1032
-uc.X86_INS_VPCOMB = 1033
-uc.X86_INS_VPCOMD = 1034
-uc.X86_INS_VPCOMPRESSD = 1035
-uc.X86_INS_VPCOMPRESSQ = 1036
-uc.X86_INS_VPCOMQ = 1037
-uc.X86_INS_VPCOMUB = 1038
-uc.X86_INS_VPCOMUD = 1039
-uc.X86_INS_VPCOMUQ = 1040
-uc.X86_INS_VPCOMUW = 1041
-uc.X86_INS_VPCOMW = 1042
-uc.X86_INS_VPCONFLICTD = 1043
-uc.X86_INS_VPCONFLICTQ = 1044
-uc.X86_INS_VPERM2F128 = 1045
-uc.X86_INS_VPERM2I128 = 1046
-uc.X86_INS_VPERMD = 1047
-uc.X86_INS_VPERMI2D = 1048
-uc.X86_INS_VPERMI2PD = 1049
-uc.X86_INS_VPERMI2PS = 1050
-uc.X86_INS_VPERMI2Q = 1051
-uc.X86_INS_VPERMIL2PD = 1052
-uc.X86_INS_VPERMIL2PS = 1053
-uc.X86_INS_VPERMILPD = 1054
-uc.X86_INS_VPERMILPS = 1055
-uc.X86_INS_VPERMPD = 1056
-uc.X86_INS_VPERMPS = 1057
-uc.X86_INS_VPERMQ = 1058
-uc.X86_INS_VPERMT2D = 1059
-uc.X86_INS_VPERMT2PD = 1060
-uc.X86_INS_VPERMT2PS = 1061
-uc.X86_INS_VPERMT2Q = 1062
-uc.X86_INS_VPEXPANDD = 1063
-uc.X86_INS_VPEXPANDQ = 1064
-uc.X86_INS_VPEXTRB = 1065
-uc.X86_INS_VPEXTRD = 1066
-uc.X86_INS_VPEXTRQ = 1067
-uc.X86_INS_VPEXTRW = 1068
-uc.X86_INS_VPGATHERDD = 1069
-uc.X86_INS_VPGATHERDQ = 1070
-uc.X86_INS_VPGATHERQD = 1071
-uc.X86_INS_VPGATHERQQ = 1072
-uc.X86_INS_VPHADDBD = 1073
-uc.X86_INS_VPHADDBQ = 1074
-uc.X86_INS_VPHADDBW = 1075
-uc.X86_INS_VPHADDDQ = 1076
-uc.X86_INS_VPHADDD = 1077
-uc.X86_INS_VPHADDSW = 1078
-uc.X86_INS_VPHADDUBD = 1079
-uc.X86_INS_VPHADDUBQ = 1080
-uc.X86_INS_VPHADDUBW = 1081
-uc.X86_INS_VPHADDUDQ = 1082
-uc.X86_INS_VPHADDUWD = 1083
-uc.X86_INS_VPHADDUWQ = 1084
-uc.X86_INS_VPHADDWD = 1085
-uc.X86_INS_VPHADDWQ = 1086
-uc.X86_INS_VPHADDW = 1087
-uc.X86_INS_VPHMINPOSUW = 1088
-uc.X86_INS_VPHSUBBW = 1089
-uc.X86_INS_VPHSUBDQ = 1090
-uc.X86_INS_VPHSUBD = 1091
-uc.X86_INS_VPHSUBSW = 1092
-uc.X86_INS_VPHSUBWD = 1093
-uc.X86_INS_VPHSUBW = 1094
-uc.X86_INS_VPINSRB = 1095
-uc.X86_INS_VPINSRD = 1096
-uc.X86_INS_VPINSRQ = 1097
-uc.X86_INS_VPINSRW = 1098
-uc.X86_INS_VPLZCNTD = 1099
-uc.X86_INS_VPLZCNTQ = 1100
-uc.X86_INS_VPMACSDD = 1101
-uc.X86_INS_VPMACSDQH = 1102
-uc.X86_INS_VPMACSDQL = 1103
-uc.X86_INS_VPMACSSDD = 1104
-uc.X86_INS_VPMACSSDQH = 1105
-uc.X86_INS_VPMACSSDQL = 1106
-uc.X86_INS_VPMACSSWD = 1107
-uc.X86_INS_VPMACSSWW = 1108
-uc.X86_INS_VPMACSWD = 1109
-uc.X86_INS_VPMACSWW = 1110
-uc.X86_INS_VPMADCSSWD = 1111
-uc.X86_INS_VPMADCSWD = 1112
-uc.X86_INS_VPMADDUBSW = 1113
-uc.X86_INS_VPMADDWD = 1114
-uc.X86_INS_VPMASKMOVD = 1115
-uc.X86_INS_VPMASKMOVQ = 1116
-uc.X86_INS_VPMAXSB = 1117
-uc.X86_INS_VPMAXSD = 1118
-uc.X86_INS_VPMAXSQ = 1119
-uc.X86_INS_VPMAXSW = 1120
-uc.X86_INS_VPMAXUB = 1121
-uc.X86_INS_VPMAXUD = 1122
-uc.X86_INS_VPMAXUQ = 1123
-uc.X86_INS_VPMAXUW = 1124
-uc.X86_INS_VPMINSB = 1125
-uc.X86_INS_VPMINSD = 1126
-uc.X86_INS_VPMINSQ = 1127
-uc.X86_INS_VPMINSW = 1128
-uc.X86_INS_VPMINUB = 1129
-uc.X86_INS_VPMINUD = 1130
-uc.X86_INS_VPMINUQ = 1131
-uc.X86_INS_VPMINUW = 1132
-uc.X86_INS_VPMOVDB = 1133
-uc.X86_INS_VPMOVDW = 1134
-uc.X86_INS_VPMOVM2B = 1135
-uc.X86_INS_VPMOVM2D = 1136
-uc.X86_INS_VPMOVM2Q = 1137
-uc.X86_INS_VPMOVM2W = 1138
-uc.X86_INS_VPMOVMSKB = 1139
-uc.X86_INS_VPMOVQB = 1140
-uc.X86_INS_VPMOVQD = 1141
-uc.X86_INS_VPMOVQW = 1142
-uc.X86_INS_VPMOVSDB = 1143
-uc.X86_INS_VPMOVSDW = 1144
-uc.X86_INS_VPMOVSQB = 1145
-uc.X86_INS_VPMOVSQD = 1146
-uc.X86_INS_VPMOVSQW = 1147
-uc.X86_INS_VPMOVSXBD = 1148
-uc.X86_INS_VPMOVSXBQ = 1149
-uc.X86_INS_VPMOVSXBW = 1150
-uc.X86_INS_VPMOVSXDQ = 1151
-uc.X86_INS_VPMOVSXWD = 1152
-uc.X86_INS_VPMOVSXWQ = 1153
-uc.X86_INS_VPMOVUSDB = 1154
-uc.X86_INS_VPMOVUSDW = 1155
-uc.X86_INS_VPMOVUSQB = 1156
-uc.X86_INS_VPMOVUSQD = 1157
-uc.X86_INS_VPMOVUSQW = 1158
-uc.X86_INS_VPMOVZXBD = 1159
-uc.X86_INS_VPMOVZXBQ = 1160
-uc.X86_INS_VPMOVZXBW = 1161
-uc.X86_INS_VPMOVZXDQ = 1162
-uc.X86_INS_VPMOVZXWD = 1163
-uc.X86_INS_VPMOVZXWQ = 1164
-uc.X86_INS_VPMULDQ = 1165
-uc.X86_INS_VPMULHRSW = 1166
-uc.X86_INS_VPMULHUW = 1167
-uc.X86_INS_VPMULHW = 1168
-uc.X86_INS_VPMULLD = 1169
-uc.X86_INS_VPMULLQ = 1170
-uc.X86_INS_VPMULLW = 1171
-uc.X86_INS_VPMULUDQ = 1172
-uc.X86_INS_VPORD = 1173
-uc.X86_INS_VPORQ = 1174
-uc.X86_INS_VPOR = 1175
-uc.X86_INS_VPPERM = 1176
-uc.X86_INS_VPROTB = 1177
-uc.X86_INS_VPROTD = 1178
-uc.X86_INS_VPROTQ = 1179
-uc.X86_INS_VPROTW = 1180
-uc.X86_INS_VPSADBW = 1181
-uc.X86_INS_VPSCATTERDD = 1182
-uc.X86_INS_VPSCATTERDQ = 1183
-uc.X86_INS_VPSCATTERQD = 1184
-uc.X86_INS_VPSCATTERQQ = 1185
-uc.X86_INS_VPSHAB = 1186
-uc.X86_INS_VPSHAD = 1187
-uc.X86_INS_VPSHAQ = 1188
-uc.X86_INS_VPSHAW = 1189
-uc.X86_INS_VPSHLB = 1190
-uc.X86_INS_VPSHLD = 1191
-uc.X86_INS_VPSHLQ = 1192
-uc.X86_INS_VPSHLW = 1193
-uc.X86_INS_VPSHUFB = 1194
-uc.X86_INS_VPSHUFD = 1195
-uc.X86_INS_VPSHUFHW = 1196
-uc.X86_INS_VPSHUFLW = 1197
-uc.X86_INS_VPSIGNB = 1198
-uc.X86_INS_VPSIGND = 1199
-uc.X86_INS_VPSIGNW = 1200
-uc.X86_INS_VPSLLDQ = 1201
-uc.X86_INS_VPSLLD = 1202
-uc.X86_INS_VPSLLQ = 1203
-uc.X86_INS_VPSLLVD = 1204
-uc.X86_INS_VPSLLVQ = 1205
-uc.X86_INS_VPSLLW = 1206
-uc.X86_INS_VPSRAD = 1207
-uc.X86_INS_VPSRAQ = 1208
-uc.X86_INS_VPSRAVD = 1209
-uc.X86_INS_VPSRAVQ = 1210
-uc.X86_INS_VPSRAW = 1211
-uc.X86_INS_VPSRLDQ = 1212
-uc.X86_INS_VPSRLD = 1213
-uc.X86_INS_VPSRLQ = 1214
-uc.X86_INS_VPSRLVD = 1215
-uc.X86_INS_VPSRLVQ = 1216
-uc.X86_INS_VPSRLW = 1217
-uc.X86_INS_VPSUBB = 1218
-uc.X86_INS_VPSUBD = 1219
-uc.X86_INS_VPSUBQ = 1220
-uc.X86_INS_VPSUBSB = 1221
-uc.X86_INS_VPSUBSW = 1222
-uc.X86_INS_VPSUBUSB = 1223
-uc.X86_INS_VPSUBUSW = 1224
-uc.X86_INS_VPSUBW = 1225
-uc.X86_INS_VPTESTMD = 1226
-uc.X86_INS_VPTESTMQ = 1227
-uc.X86_INS_VPTESTNMD = 1228
-uc.X86_INS_VPTESTNMQ = 1229
-uc.X86_INS_VPTEST = 1230
-uc.X86_INS_VPUNPCKHBW = 1231
-uc.X86_INS_VPUNPCKHDQ = 1232
-uc.X86_INS_VPUNPCKHQDQ = 1233
-uc.X86_INS_VPUNPCKHWD = 1234
-uc.X86_INS_VPUNPCKLBW = 1235
-uc.X86_INS_VPUNPCKLDQ = 1236
-uc.X86_INS_VPUNPCKLQDQ = 1237
-uc.X86_INS_VPUNPCKLWD = 1238
-uc.X86_INS_VPXORD = 1239
-uc.X86_INS_VPXORQ = 1240
-uc.X86_INS_VPXOR = 1241
-uc.X86_INS_VRCP14PD = 1242
-uc.X86_INS_VRCP14PS = 1243
-uc.X86_INS_VRCP14SD = 1244
-uc.X86_INS_VRCP14SS = 1245
-uc.X86_INS_VRCP28PD = 1246
-uc.X86_INS_VRCP28PS = 1247
-uc.X86_INS_VRCP28SD = 1248
-uc.X86_INS_VRCP28SS = 1249
-uc.X86_INS_VRCPPS = 1250
-uc.X86_INS_VRCPSS = 1251
-uc.X86_INS_VRNDSCALEPD = 1252
-uc.X86_INS_VRNDSCALEPS = 1253
-uc.X86_INS_VRNDSCALESD = 1254
-uc.X86_INS_VRNDSCALESS = 1255
-uc.X86_INS_VROUNDPD = 1256
-uc.X86_INS_VROUNDPS = 1257
-uc.X86_INS_VROUNDSD = 1258
-uc.X86_INS_VROUNDSS = 1259
-uc.X86_INS_VRSQRT14PD = 1260
-uc.X86_INS_VRSQRT14PS = 1261
-uc.X86_INS_VRSQRT14SD = 1262
-uc.X86_INS_VRSQRT14SS = 1263
-uc.X86_INS_VRSQRT28PD = 1264
-uc.X86_INS_VRSQRT28PS = 1265
-uc.X86_INS_VRSQRT28SD = 1266
-uc.X86_INS_VRSQRT28SS = 1267
-uc.X86_INS_VRSQRTPS = 1268
-uc.X86_INS_VRSQRTSS = 1269
-uc.X86_INS_VSCATTERDPD = 1270
-uc.X86_INS_VSCATTERDPS = 1271
-uc.X86_INS_VSCATTERPF0DPD = 1272
-uc.X86_INS_VSCATTERPF0DPS = 1273
-uc.X86_INS_VSCATTERPF0QPD = 1274
-uc.X86_INS_VSCATTERPF0QPS = 1275
-uc.X86_INS_VSCATTERPF1DPD = 1276
-uc.X86_INS_VSCATTERPF1DPS = 1277
-uc.X86_INS_VSCATTERPF1QPD = 1278
-uc.X86_INS_VSCATTERPF1QPS = 1279
-uc.X86_INS_VSCATTERQPD = 1280
-uc.X86_INS_VSCATTERQPS = 1281
-uc.X86_INS_VSHUFPD = 1282
-uc.X86_INS_VSHUFPS = 1283
-uc.X86_INS_VSQRTPD = 1284
-uc.X86_INS_VSQRTPS = 1285
-uc.X86_INS_VSQRTSD = 1286
-uc.X86_INS_VSQRTSS = 1287
-uc.X86_INS_VSTMXCSR = 1288
-uc.X86_INS_VSUBPD = 1289
-uc.X86_INS_VSUBPS = 1290
-uc.X86_INS_VSUBSD = 1291
-uc.X86_INS_VSUBSS = 1292
-uc.X86_INS_VTESTPD = 1293
-uc.X86_INS_VTESTPS = 1294
-uc.X86_INS_VUNPCKHPD = 1295
-uc.X86_INS_VUNPCKHPS = 1296
-uc.X86_INS_VUNPCKLPD = 1297
-uc.X86_INS_VUNPCKLPS = 1298
-uc.X86_INS_VZEROALL = 1299
-uc.X86_INS_VZEROUPPER = 1300
-uc.X86_INS_WAIT = 1301
-uc.X86_INS_WBINVD = 1302
-uc.X86_INS_WRFSBASE = 1303
-uc.X86_INS_WRGSBASE = 1304
-uc.X86_INS_WRMSR = 1305
-uc.X86_INS_XABORT = 1306
-uc.X86_INS_XACQUIRE = 1307
-uc.X86_INS_XBEGIN = 1308
-uc.X86_INS_XCHG = 1309
-uc.X86_INS_XCRYPTCBC = 1310
-uc.X86_INS_XCRYPTCFB = 1311
-uc.X86_INS_XCRYPTCTR = 1312
-uc.X86_INS_XCRYPTECB = 1313
-uc.X86_INS_XCRYPTOFB = 1314
-uc.X86_INS_XEND = 1315
-uc.X86_INS_XGETBV = 1316
-uc.X86_INS_XLATB = 1317
-uc.X86_INS_XRELEASE = 1318
-uc.X86_INS_XRSTOR = 1319
-uc.X86_INS_XRSTOR64 = 1320
-uc.X86_INS_XRSTORS = 1321
-uc.X86_INS_XRSTORS64 = 1322
-uc.X86_INS_XSAVE = 1323
-uc.X86_INS_XSAVE64 = 1324
-uc.X86_INS_XSAVEC = 1325
-uc.X86_INS_XSAVEC64 = 1326
-uc.X86_INS_XSAVEOPT = 1327
-uc.X86_INS_XSAVEOPT64 = 1328
-uc.X86_INS_XSAVES = 1329
-uc.X86_INS_XSAVES64 = 1330
-uc.X86_INS_XSETBV = 1331
-uc.X86_INS_XSHA1 = 1332
-uc.X86_INS_XSHA256 = 1333
-uc.X86_INS_XSTORE = 1334
-uc.X86_INS_XTEST = 1335
-uc.X86_INS_FDISI8087_NOP = 1336
-uc.X86_INS_FENI8087_NOP = 1337
-uc.X86_INS_ENDING = 1338
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [unicorn_const.py]
-uc.API_MAJOR = 1
-
-uc.API_MINOR = 0
-uc.VERSION_MAJOR = 1
-
-uc.VERSION_MINOR = 0
-uc.VERSION_EXTRA = 1
-uc.SECOND_SCALE = 1000000
-uc.MILISECOND_SCALE = 1000
-uc.ARCH_ARM = 1
-uc.ARCH_ARM64 = 2
-uc.ARCH_MIPS = 3
-uc.ARCH_X86 = 4
-uc.ARCH_PPC = 5
-uc.ARCH_SPARC = 6
-uc.ARCH_M68K = 7
-uc.ARCH_MAX = 8
-
-uc.MODE_LITTLE_ENDIAN = 0
-uc.MODE_BIG_ENDIAN = 1073741824
-
-uc.MODE_ARM = 0
-uc.MODE_THUMB = 16
-uc.MODE_MCLASS = 32
-uc.MODE_V8 = 64
-uc.MODE_MICRO = 16
-uc.MODE_MIPS3 = 32
-uc.MODE_MIPS32R6 = 64
-uc.MODE_MIPS32 = 4
-uc.MODE_MIPS64 = 8
-uc.MODE_16 = 2
-uc.MODE_32 = 4
-uc.MODE_64 = 8
-uc.MODE_PPC32 = 4
-uc.MODE_PPC64 = 8
-uc.MODE_QPX = 16
-uc.MODE_SPARC32 = 4
-uc.MODE_SPARC64 = 8
-uc.MODE_V9 = 16
-
-uc.ERR_OK = 0
-uc.ERR_NOMEM = 1
-uc.ERR_ARCH = 2
-uc.ERR_HANDLE = 3
-uc.ERR_MODE = 4
-uc.ERR_VERSION = 5
-uc.ERR_READ_UNMAPPED = 6
-uc.ERR_WRITE_UNMAPPED = 7
-uc.ERR_FETCH_UNMAPPED = 8
-uc.ERR_HOOK = 9
-uc.ERR_INSN_INVALID = 10
-uc.ERR_MAP = 11
-uc.ERR_WRITE_PROT = 12
-uc.ERR_READ_PROT = 13
-uc.ERR_FETCH_PROT = 14
-uc.ERR_ARG = 15
-uc.ERR_READ_UNALIGNED = 16
-uc.ERR_WRITE_UNALIGNED = 17
-uc.ERR_FETCH_UNALIGNED = 18
-uc.ERR_HOOK_EXIST = 19
-uc.ERR_RESOURCE = 20
-uc.ERR_EXCEPTION = 21
-uc.MEM_READ = 16
-uc.MEM_WRITE = 17
-uc.MEM_FETCH = 18
-uc.MEM_READ_UNMAPPED = 19
-uc.MEM_WRITE_UNMAPPED = 20
-uc.MEM_FETCH_UNMAPPED = 21
-uc.MEM_WRITE_PROT = 22
-uc.MEM_READ_PROT = 23
-uc.MEM_FETCH_PROT = 24
-uc.MEM_READ_AFTER = 25
-uc.HOOK_INTR = 1
-uc.HOOK_INSN = 2
-uc.HOOK_CODE = 4
-uc.HOOK_BLOCK = 8
-uc.HOOK_MEM_READ_UNMAPPED = 16
-uc.HOOK_MEM_WRITE_UNMAPPED = 32
-uc.HOOK_MEM_FETCH_UNMAPPED = 64
-uc.HOOK_MEM_READ_PROT = 128
-uc.HOOK_MEM_WRITE_PROT = 256
-uc.HOOK_MEM_FETCH_PROT = 512
-uc.HOOK_MEM_READ = 1024
-uc.HOOK_MEM_WRITE = 2048
-uc.HOOK_MEM_FETCH = 4096
-uc.HOOK_MEM_READ_AFTER = 8192
-uc.HOOK_MEM_UNMAPPED = 112
-uc.HOOK_MEM_PROT = 896
-uc.HOOK_MEM_READ_INVALID = 144
-uc.HOOK_MEM_WRITE_INVALID = 288
-uc.HOOK_MEM_FETCH_INVALID = 576
-uc.HOOK_MEM_INVALID = 1008
-uc.HOOK_MEM_VALID = 7168
-uc.QUERY_MODE = 1
-uc.QUERY_PAGE_SIZE = 2
-
-uc.PROT_NONE = 0
-uc.PROT_READ = 1
-uc.PROT_WRITE = 2
-uc.PROT_EXEC = 4
-uc.PROT_ALL = 7
-// For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [arm64_const.py]
-
-// ARM64 registers
-
-uc.ARM64_REG_INVALID = 0
-uc.ARM64_REG_X29 = 1
-uc.ARM64_REG_X30 = 2
-uc.ARM64_REG_NZCV = 3
-uc.ARM64_REG_SP = 4
-uc.ARM64_REG_WSP = 5
-uc.ARM64_REG_WZR = 6
-uc.ARM64_REG_XZR = 7
-uc.ARM64_REG_B0 = 8
-uc.ARM64_REG_B1 = 9
-uc.ARM64_REG_B2 = 10
-uc.ARM64_REG_B3 = 11
-uc.ARM64_REG_B4 = 12
-uc.ARM64_REG_B5 = 13
-uc.ARM64_REG_B6 = 14
-uc.ARM64_REG_B7 = 15
-uc.ARM64_REG_B8 = 16
-uc.ARM64_REG_B9 = 17
-uc.ARM64_REG_B10 = 18
-uc.ARM64_REG_B11 = 19
-uc.ARM64_REG_B12 = 20
-uc.ARM64_REG_B13 = 21
-uc.ARM64_REG_B14 = 22
-uc.ARM64_REG_B15 = 23
-uc.ARM64_REG_B16 = 24
-uc.ARM64_REG_B17 = 25
-uc.ARM64_REG_B18 = 26
-uc.ARM64_REG_B19 = 27
-uc.ARM64_REG_B20 = 28
-uc.ARM64_REG_B21 = 29
-uc.ARM64_REG_B22 = 30
-uc.ARM64_REG_B23 = 31
-uc.ARM64_REG_B24 = 32
-uc.ARM64_REG_B25 = 33
-uc.ARM64_REG_B26 = 34
-uc.ARM64_REG_B27 = 35
-uc.ARM64_REG_B28 = 36
-uc.ARM64_REG_B29 = 37
-uc.ARM64_REG_B30 = 38
-uc.ARM64_REG_B31 = 39
-uc.ARM64_REG_D0 = 40
-uc.ARM64_REG_D1 = 41
-uc.ARM64_REG_D2 = 42
-uc.ARM64_REG_D3 = 43
-uc.ARM64_REG_D4 = 44
-uc.ARM64_REG_D5 = 45
-uc.ARM64_REG_D6 = 46
-uc.ARM64_REG_D7 = 47
-uc.ARM64_REG_D8 = 48
-uc.ARM64_REG_D9 = 49
-uc.ARM64_REG_D10 = 50
-uc.ARM64_REG_D11 = 51
-uc.ARM64_REG_D12 = 52
-uc.ARM64_REG_D13 = 53
-uc.ARM64_REG_D14 = 54
-uc.ARM64_REG_D15 = 55
-uc.ARM64_REG_D16 = 56
-uc.ARM64_REG_D17 = 57
-uc.ARM64_REG_D18 = 58
-uc.ARM64_REG_D19 = 59
-uc.ARM64_REG_D20 = 60
-uc.ARM64_REG_D21 = 61
-uc.ARM64_REG_D22 = 62
-uc.ARM64_REG_D23 = 63
-uc.ARM64_REG_D24 = 64
-uc.ARM64_REG_D25 = 65
-uc.ARM64_REG_D26 = 66
-uc.ARM64_REG_D27 = 67
-uc.ARM64_REG_D28 = 68
-uc.ARM64_REG_D29 = 69
-uc.ARM64_REG_D30 = 70
-uc.ARM64_REG_D31 = 71
-uc.ARM64_REG_H0 = 72
-uc.ARM64_REG_H1 = 73
-uc.ARM64_REG_H2 = 74
-uc.ARM64_REG_H3 = 75
-uc.ARM64_REG_H4 = 76
-uc.ARM64_REG_H5 = 77
-uc.ARM64_REG_H6 = 78
-uc.ARM64_REG_H7 = 79
-uc.ARM64_REG_H8 = 80
-uc.ARM64_REG_H9 = 81
-uc.ARM64_REG_H10 = 82
-uc.ARM64_REG_H11 = 83
-uc.ARM64_REG_H12 = 84
-uc.ARM64_REG_H13 = 85
-uc.ARM64_REG_H14 = 86
-uc.ARM64_REG_H15 = 87
-uc.ARM64_REG_H16 = 88
-uc.ARM64_REG_H17 = 89
-uc.ARM64_REG_H18 = 90
-uc.ARM64_REG_H19 = 91
-uc.ARM64_REG_H20 = 92
-uc.ARM64_REG_H21 = 93
-uc.ARM64_REG_H22 = 94
-uc.ARM64_REG_H23 = 95
-uc.ARM64_REG_H24 = 96
-uc.ARM64_REG_H25 = 97
-uc.ARM64_REG_H26 = 98
-uc.ARM64_REG_H27 = 99
-uc.ARM64_REG_H28 = 100
-uc.ARM64_REG_H29 = 101
-uc.ARM64_REG_H30 = 102
-uc.ARM64_REG_H31 = 103
-uc.ARM64_REG_Q0 = 104
-uc.ARM64_REG_Q1 = 105
-uc.ARM64_REG_Q2 = 106
-uc.ARM64_REG_Q3 = 107
-uc.ARM64_REG_Q4 = 108
-uc.ARM64_REG_Q5 = 109
-uc.ARM64_REG_Q6 = 110
-uc.ARM64_REG_Q7 = 111
-uc.ARM64_REG_Q8 = 112
-uc.ARM64_REG_Q9 = 113
-uc.ARM64_REG_Q10 = 114
-uc.ARM64_REG_Q11 = 115
-uc.ARM64_REG_Q12 = 116
-uc.ARM64_REG_Q13 = 117
-uc.ARM64_REG_Q14 = 118
-uc.ARM64_REG_Q15 = 119
-uc.ARM64_REG_Q16 = 120
-uc.ARM64_REG_Q17 = 121
-uc.ARM64_REG_Q18 = 122
-uc.ARM64_REG_Q19 = 123
-uc.ARM64_REG_Q20 = 124
-uc.ARM64_REG_Q21 = 125
-uc.ARM64_REG_Q22 = 126
-uc.ARM64_REG_Q23 = 127
-uc.ARM64_REG_Q24 = 128
-uc.ARM64_REG_Q25 = 129
-uc.ARM64_REG_Q26 = 130
-uc.ARM64_REG_Q27 = 131
-uc.ARM64_REG_Q28 = 132
-uc.ARM64_REG_Q29 = 133
-uc.ARM64_REG_Q30 = 134
-uc.ARM64_REG_Q31 = 135
-uc.ARM64_REG_S0 = 136
-uc.ARM64_REG_S1 = 137
-uc.ARM64_REG_S2 = 138
-uc.ARM64_REG_S3 = 139
-uc.ARM64_REG_S4 = 140
-uc.ARM64_REG_S5 = 141
-uc.ARM64_REG_S6 = 142
-uc.ARM64_REG_S7 = 143
-uc.ARM64_REG_S8 = 144
-uc.ARM64_REG_S9 = 145
-uc.ARM64_REG_S10 = 146
-uc.ARM64_REG_S11 = 147
-uc.ARM64_REG_S12 = 148
-uc.ARM64_REG_S13 = 149
-uc.ARM64_REG_S14 = 150
-uc.ARM64_REG_S15 = 151
-uc.ARM64_REG_S16 = 152
-uc.ARM64_REG_S17 = 153
-uc.ARM64_REG_S18 = 154
-uc.ARM64_REG_S19 = 155
-uc.ARM64_REG_S20 = 156
-uc.ARM64_REG_S21 = 157
-uc.ARM64_REG_S22 = 158
-uc.ARM64_REG_S23 = 159
-uc.ARM64_REG_S24 = 160
-uc.ARM64_REG_S25 = 161
-uc.ARM64_REG_S26 = 162
-uc.ARM64_REG_S27 = 163
-uc.ARM64_REG_S28 = 164
-uc.ARM64_REG_S29 = 165
-uc.ARM64_REG_S30 = 166
-uc.ARM64_REG_S31 = 167
-uc.ARM64_REG_W0 = 168
-uc.ARM64_REG_W1 = 169
-uc.ARM64_REG_W2 = 170
-uc.ARM64_REG_W3 = 171
-uc.ARM64_REG_W4 = 172
-uc.ARM64_REG_W5 = 173
-uc.ARM64_REG_W6 = 174
-uc.ARM64_REG_W7 = 175
-uc.ARM64_REG_W8 = 176
-uc.ARM64_REG_W9 = 177
-uc.ARM64_REG_W10 = 178
-uc.ARM64_REG_W11 = 179
-uc.ARM64_REG_W12 = 180
-uc.ARM64_REG_W13 = 181
-uc.ARM64_REG_W14 = 182
-uc.ARM64_REG_W15 = 183
-uc.ARM64_REG_W16 = 184
-uc.ARM64_REG_W17 = 185
-uc.ARM64_REG_W18 = 186
-uc.ARM64_REG_W19 = 187
-uc.ARM64_REG_W20 = 188
-uc.ARM64_REG_W21 = 189
-uc.ARM64_REG_W22 = 190
-uc.ARM64_REG_W23 = 191
-uc.ARM64_REG_W24 = 192
-uc.ARM64_REG_W25 = 193
-uc.ARM64_REG_W26 = 194
-uc.ARM64_REG_W27 = 195
-uc.ARM64_REG_W28 = 196
-uc.ARM64_REG_W29 = 197
-uc.ARM64_REG_W30 = 198
-uc.ARM64_REG_X0 = 199
-uc.ARM64_REG_X1 = 200
-uc.ARM64_REG_X2 = 201
-uc.ARM64_REG_X3 = 202
-uc.ARM64_REG_X4 = 203
-uc.ARM64_REG_X5 = 204
-uc.ARM64_REG_X6 = 205
-uc.ARM64_REG_X7 = 206
-uc.ARM64_REG_X8 = 207
-uc.ARM64_REG_X9 = 208
-uc.ARM64_REG_X10 = 209
-uc.ARM64_REG_X11 = 210
-uc.ARM64_REG_X12 = 211
-uc.ARM64_REG_X13 = 212
-uc.ARM64_REG_X14 = 213
-uc.ARM64_REG_X15 = 214
-uc.ARM64_REG_X16 = 215
-uc.ARM64_REG_X17 = 216
-uc.ARM64_REG_X18 = 217
-uc.ARM64_REG_X19 = 218
-uc.ARM64_REG_X20 = 219
-uc.ARM64_REG_X21 = 220
-uc.ARM64_REG_X22 = 221
-uc.ARM64_REG_X23 = 222
-uc.ARM64_REG_X24 = 223
-uc.ARM64_REG_X25 = 224
-uc.ARM64_REG_X26 = 225
-uc.ARM64_REG_X27 = 226
-uc.ARM64_REG_X28 = 227
-uc.ARM64_REG_V0 = 228
-uc.ARM64_REG_V1 = 229
-uc.ARM64_REG_V2 = 230
-uc.ARM64_REG_V3 = 231
-uc.ARM64_REG_V4 = 232
-uc.ARM64_REG_V5 = 233
-uc.ARM64_REG_V6 = 234
-uc.ARM64_REG_V7 = 235
-uc.ARM64_REG_V8 = 236
-uc.ARM64_REG_V9 = 237
-uc.ARM64_REG_V10 = 238
-uc.ARM64_REG_V11 = 239
-uc.ARM64_REG_V12 = 240
-uc.ARM64_REG_V13 = 241
-uc.ARM64_REG_V14 = 242
-uc.ARM64_REG_V15 = 243
-uc.ARM64_REG_V16 = 244
-uc.ARM64_REG_V17 = 245
-uc.ARM64_REG_V18 = 246
-uc.ARM64_REG_V19 = 247
-uc.ARM64_REG_V20 = 248
-uc.ARM64_REG_V21 = 249
-uc.ARM64_REG_V22 = 250
-uc.ARM64_REG_V23 = 251
-uc.ARM64_REG_V24 = 252
-uc.ARM64_REG_V25 = 253
-uc.ARM64_REG_V26 = 254
-uc.ARM64_REG_V27 = 255
-uc.ARM64_REG_V28 = 256
-uc.ARM64_REG_V29 = 257
-uc.ARM64_REG_V30 = 258
-uc.ARM64_REG_V31 = 259
-
-// pseudo registers
-uc.ARM64_REG_PC = 260
-uc.ARM64_REG_ENDING = 261
-
-// alias registers
-uc.ARM64_REG_IP1 = 215
-uc.ARM64_REG_IP0 = 216
-uc.ARM64_REG_FP = 1
-uc.ARM64_REG_LR = 2
+// Unicorn.js constants [core, aarch64, arm, m68k, mips, sparc, x86]. AUTO-GENERATED FILE, DO NOT EDIT
+(function (define) {
+uc.API_MAJOR = 1;
+uc.API_MINOR = 0;
+uc.VERSION_MAJOR = 1;
+uc.VERSION_MINOR = 0;
+uc.VERSION_EXTRA = 1;
+uc.SECOND_SCALE = 1000000;
+uc.MILISECOND_SCALE = 1000;
+define('ARCH_', 1, 'ARM ARM64 MIPS X86 PPC SPARC M68K MAX');
+uc.MODE_LITTLE_ENDIAN = 0;
+uc.MODE_BIG_ENDIAN = 1073741824;
+uc.MODE_ARM = 0;
+uc.MODE_THUMB = 16;
+uc.MODE_MCLASS = 32;
+uc.MODE_V8 = 64;
+uc.MODE_MICRO = 16;
+uc.MODE_MIPS3 = 32;
+uc.MODE_MIPS32R6 = 64;
+uc.MODE_MIPS32 = 4;
+uc.MODE_MIPS64 = 8;
+uc.MODE_16 = 2;
+uc.MODE_32 = 4;
+uc.MODE_64 = 8;
+uc.MODE_PPC32 = 4;
+uc.MODE_PPC64 = 8;
+uc.MODE_QPX = 16;
+uc.MODE_SPARC32 = 4;
+uc.MODE_SPARC64 = 8;
+uc.MODE_V9 = 16;
+define('ERR_', 0, 'OK NOMEM ARCH HANDLE MODE VERSION READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED HOOK INSN_INVALID MAP WRITE_PROT READ_PROT FETCH_PROT ARG READ_UNALIGNED WRITE_UNALIGNED FETCH_UNALIGNED HOOK_EXIST RESOURCE EXCEPTION');
+define('MEM_', 16, 'READ WRITE FETCH READ_UNMAPPED WRITE_UNMAPPED FETCH_UNMAPPED WRITE_PROT READ_PROT FETCH_PROT READ_AFTER');
+uc.HOOK_INTR = 1;
+uc.HOOK_INSN = 2;
+uc.HOOK_CODE = 4;
+uc.HOOK_BLOCK = 8;
+uc.HOOK_MEM_READ_UNMAPPED = 16;
+uc.HOOK_MEM_WRITE_UNMAPPED = 32;
+uc.HOOK_MEM_FETCH_UNMAPPED = 64;
+uc.HOOK_MEM_READ_PROT = 128;
+uc.HOOK_MEM_WRITE_PROT = 256;
+uc.HOOK_MEM_FETCH_PROT = 512;
+uc.HOOK_MEM_READ = 1024;
+uc.HOOK_MEM_WRITE = 2048;
+uc.HOOK_MEM_FETCH = 4096;
+uc.HOOK_MEM_READ_AFTER = 8192;
+uc.HOOK_MEM_UNMAPPED = 112;
+uc.HOOK_MEM_PROT = 896;
+uc.HOOK_MEM_READ_INVALID = 144;
+uc.HOOK_MEM_WRITE_INVALID = 288;
+uc.HOOK_MEM_FETCH_INVALID = 576;
+uc.HOOK_MEM_INVALID = 1008;
+uc.HOOK_MEM_VALID = 7168;
+uc.QUERY_MODE = 1;
+uc.QUERY_PAGE_SIZE = 2;
+uc.PROT_NONE = 0;
+uc.PROT_READ = 1;
+uc.PROT_WRITE = 2;
+uc.PROT_EXEC = 4;
+uc.PROT_ALL = 7;
+define('ARM64_REG_', 0, 'INVALID X29 X30 NZCV SP WSP WZR XZR B0 B1 B2 B3 B4 B5 B6 B7 B8 B9 B10 B11 B12 B13 B14 B15 B16 B17 B18 B19 B20 B21 B22 B23 B24 B25 B26 B27 B28 B29 B30 B31 D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 H0 H1 H2 H3 H4 H5 H6 H7 H8 H9 H10 H11 H12 H13 H14 H15 H16 H17 H18 H19 H20 H21 H22 H23 H24 H25 H26 H27 H28 H29 H30 H31 Q0 Q1 Q2 Q3 Q4 Q5 Q6 Q7 Q8 Q9 Q10 Q11 Q12 Q13 Q14 Q15 Q16 Q17 Q18 Q19 Q20 Q21 Q22 Q23 Q24 Q25 Q26 Q27 Q28 Q29 Q30 Q31 S0 S1 S2 S3 S4 S5 S6 S7 S8 S9 S10 S11 S12 S13 S14 S15 S16 S17 S18 S19 S20 S21 S22 S23 S24 S25 S26 S27 S28 S29 S30 S31 W0 W1 W2 W3 W4 W5 W6 W7 W8 W9 W10 W11 W12 W13 W14 W15 W16 W17 W18 W19 W20 W21 W22 W23 W24 W25 W26 W27 W28 W29 W30 X0 X1 X2 X3 X4 X5 X6 X7 X8 X9 X10 X11 X12 X13 X14 X15 X16 X17 X18 X19 X20 X21 X22 X23 X24 X25 X26 X27 X28 V0 V1 V2 V3 V4 V5 V6 V7 V8 V9 V10 V11 V12 V13 V14 V15 V16 V17 V18 V19 V20 V21 V22 V23 V24 V25 V26 V27 V28 V29 V30 V31 PC ENDING');
+uc.ARM64_REG_IP1 = 215;
+uc.ARM64_REG_IP0 = 216;
+uc.ARM64_REG_FP = 1;
+uc.ARM64_REG_LR = 2;
+define('ARM_REG_', 0, 'INVALID APSR APSR_NZCV CPSR FPEXC FPINST FPSCR FPSCR_NZCV FPSID ITSTATE LR PC SP SPSR D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 FPINST2 MVFR0 MVFR1 MVFR2 Q0 Q1 Q2 Q3 Q4 Q5 Q6 Q7 Q8 Q9 Q10 Q11 Q12 Q13 Q14 Q15 R0 R1 R2 R3 R4 R5 R6 R7 R8 R9 R10 R11 R12 S0 S1 S2 S3 S4 S5 S6 S7 S8 S9 S10 S11 S12 S13 S14 S15 S16 S17 S18 S19 S20 S21 S22 S23 S24 S25 S26 S27 S28 S29 S30 S31 C1_C0_2 C13_C0_2 C13_C0_3 ENDING');
+uc.ARM_REG_R13 = 12;
+uc.ARM_REG_R14 = 10;
+uc.ARM_REG_R15 = 11;
+define('ARM_REG_', 75, 'SB SL FP IP');
+define('M68K_REG_', 0, 'INVALID A0 A1 A2 A3 A4 A5 A6 A7 D0 D1 D2 D3 D4 D5 D6 D7 SR PC ENDING');
+define('MIPS_REG_', 0, 'INVALID PC 0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 DSPCCOND DSPCARRY DSPEFI DSPOUTFLAG DSPOUTFLAG16_19 DSPOUTFLAG20 DSPOUTFLAG21 DSPOUTFLAG22 DSPOUTFLAG23 DSPPOS DSPSCOUNT AC0 AC1 AC2 AC3 CC0 CC1 CC2 CC3 CC4 CC5 CC6 CC7 F0 F1 F2 F3 F4 F5 F6 F7 F8 F9 F10 F11 F12 F13 F14 F15 F16 F17 F18 F19 F20 F21 F22 F23 F24 F25 F26 F27 F28 F29 F30 F31 FCC0 FCC1 FCC2 FCC3 FCC4 FCC5 FCC6 FCC7 W0 W1 W2 W3 W4 W5 W6 W7 W8 W9 W10 W11 W12 W13 W14 W15 W16 W17 W18 W19 W20 W21 W22 W23 W24 W25 W26 W27 W28 W29 W30 W31 HI LO P0 P1 P2 MPL0 MPL1 MPL2 ENDING');
+define('MIPS_REG_', 2, 'ZERO AT V0 V1 A0 A1 A2 A3 T0 T1 T2 T3 T4 T5 T6 T7 S0 S1 S2 S3 S4 S5 S6 S7 T8 T9 K0 K1 GP SP FP');
+uc.MIPS_REG_S8 = 32;
+uc.MIPS_REG_RA = 33;
+define('MIPS_REG_', 45, 'HI0 HI1 HI2 HI3');
+define('MIPS_REG_', 45, 'LO0 LO1 LO2 LO3');
+define('SPARC_REG_', 0, 'INVALID F0 F1 F2 F3 F4 F5 F6 F7 F8 F9 F10 F11 F12 F13 F14 F15 F16 F17 F18 F19 F20 F21 F22 F23 F24 F25 F26 F27 F28 F29 F30 F31 F32 F34 F36 F38 F40 F42 F44 F46 F48 F50 F52 F54 F56 F58 F60 F62 FCC0 FCC1 FCC2 FCC3 G0 G1 G2 G3 G4 G5 G6 G7 I0 I1 I2 I3 I4 I5 FP I7 ICC L0 L1 L2 L3 L4 L5 L6 L7 O0 O1 O2 O3 O4 O5 SP O7 Y XCC PC ENDING');
+uc.SPARC_REG_O6 = 84;
+uc.SPARC_REG_I6 = 67;
+define('X86_REG_', 0, 'INVALID AH AL AX BH BL BP BPL BX CH CL CS CX DH DI DIL DL DS DX EAX EBP EBX ECX EDI EDX EFLAGS EIP EIZ ES ESI ESP FPSW FS GS IP RAX RBP RBX RCX RDI RDX RIP RIZ RSI RSP SI SIL SP SPL SS CR0 CR1 CR2 CR3 CR4 CR5 CR6 CR7 CR8 CR9 CR10 CR11 CR12 CR13 CR14 CR15 DR0 DR1 DR2 DR3 DR4 DR5 DR6 DR7 DR8 DR9 DR10 DR11 DR12 DR13 DR14 DR15 FP0 FP1 FP2 FP3 FP4 FP5 FP6 FP7 K0 K1 K2 K3 K4 K5 K6 K7 MM0 MM1 MM2 MM3 MM4 MM5 MM6 MM7 R8 R9 R10 R11 R12 R13 R14 R15 ST0 ST1 ST2 ST3 ST4 ST5 ST6 ST7 XMM0 XMM1 XMM2 XMM3 XMM4 XMM5 XMM6 XMM7 XMM8 XMM9 XMM10 XMM11 XMM12 XMM13 XMM14 XMM15 XMM16 XMM17 XMM18 XMM19 XMM20 XMM21 XMM22 XMM23 XMM24 XMM25 XMM26 XMM27 XMM28 XMM29 XMM30 XMM31 YMM0 YMM1 YMM2 YMM3 YMM4 YMM5 YMM6 YMM7 YMM8 YMM9 YMM10 YMM11 YMM12 YMM13 YMM14 YMM15 YMM16 YMM17 YMM18 YMM19 YMM20 YMM21 YMM22 YMM23 YMM24 YMM25 YMM26 YMM27 YMM28 YMM29 YMM30 YMM31 ZMM0 ZMM1 ZMM2 ZMM3 ZMM4 ZMM5 ZMM6 ZMM7 ZMM8 ZMM9 ZMM10 ZMM11 ZMM12 ZMM13 ZMM14 ZMM15 ZMM16 ZMM17 ZMM18 ZMM19 ZMM20 ZMM21 ZMM22 ZMM23 ZMM24 ZMM25 ZMM26 ZMM27 ZMM28 ZMM29 ZMM30 ZMM31 R8B R9B R10B R11B R12B R13B R14B R15B R8D R9D R10D R11D R12D R13D R14D R15D R8W R9W R10W R11W R12W R13W R14W R15W IDTR GDTR LDTR TR FPCW FPTAG MSR ENDING');
+define('X86_INS_', 0, 'INVALID AAA AAD AAM AAS FABS ADC ADCX ADD ADDPD ADDPS ADDSD ADDSS ADDSUBPD ADDSUBPS FADD FIADD FADDP ADOX AESDECLAST AESDEC AESENCLAST AESENC AESIMC AESKEYGENASSIST AND ANDN ANDNPD ANDNPS ANDPD ANDPS ARPL BEXTR BLCFILL BLCI BLCIC BLCMSK BLCS BLENDPD BLENDPS BLENDVPD BLENDVPS BLSFILL BLSI BLSIC BLSMSK BLSR BOUND BSF BSR BSWAP BT BTC BTR BTS BZHI CALL CBW CDQ CDQE FCHS CLAC CLC CLD CLFLUSH CLFLUSHOPT CLGI CLI CLTS CLWB CMC CMOVA CMOVAE CMOVB CMOVBE FCMOVBE FCMOVB CMOVE FCMOVE CMOVG CMOVGE CMOVL CMOVLE FCMOVNBE FCMOVNB CMOVNE FCMOVNE CMOVNO CMOVNP FCMOVNU CMOVNS CMOVO CMOVP FCMOVU CMOVS CMP CMPPD CMPPS CMPSB CMPSD CMPSQ CMPSS CMPSW CMPXCHG16B CMPXCHG CMPXCHG8B COMISD COMISS FCOMP FCOMPI FCOMI FCOM FCOS CPUID CQO CRC32 CVTDQ2PD CVTDQ2PS CVTPD2DQ CVTPD2PS CVTPS2DQ CVTPS2PD CVTSD2SI CVTSD2SS CVTSI2SD CVTSI2SS CVTSS2SD CVTSS2SI CVTTPD2DQ CVTTPS2DQ CVTTSD2SI CVTTSS2SI CWD CWDE DAA DAS DATA16 DEC DIV DIVPD DIVPS FDIVR FIDIVR FDIVRP DIVSD DIVSS FDIV FIDIV FDIVP DPPD DPPS RET ENCLS ENCLU ENTER EXTRACTPS EXTRQ F2XM1 LCALL LJMP FBLD FBSTP FCOMPP FDECSTP FEMMS FFREE FICOM FICOMP FINCSTP FLDCW FLDENV FLDL2E FLDL2T FLDLG2 FLDLN2 FLDPI FNCLEX FNINIT FNOP FNSTCW FNSTSW FPATAN FPREM FPREM1 FPTAN FFREEP FRNDINT FRSTOR FNSAVE FSCALE FSETPM FSINCOS FNSTENV FXAM FXRSTOR FXRSTOR64 FXSAVE FXSAVE64 FXTRACT FYL2X FYL2XP1 MOVAPD MOVAPS ORPD ORPS VMOVAPD VMOVAPS XORPD XORPS GETSEC HADDPD HADDPS HLT HSUBPD HSUBPS IDIV FILD IMUL IN INC INSB INSERTPS INSERTQ INSD INSW INT INT1 INT3 INTO INVD INVEPT INVLPG INVLPGA INVPCID INVVPID IRET IRETD IRETQ FISTTP FIST FISTP UCOMISD UCOMISS VCOMISD VCOMISS VCVTSD2SS VCVTSI2SD VCVTSI2SS VCVTSS2SD VCVTTSD2SI VCVTTSD2USI VCVTTSS2SI VCVTTSS2USI VCVTUSI2SD VCVTUSI2SS VUCOMISD VUCOMISS JAE JA JBE JB JCXZ JECXZ JE JGE JG JLE JL JMP JNE JNO JNP JNS JO JP JRCXZ JS KANDB KANDD KANDNB KANDND KANDNQ KANDNW KANDQ KANDW KMOVB KMOVD KMOVQ KMOVW KNOTB KNOTD KNOTQ KNOTW KORB KORD KORQ KORTESTB KORTESTD KORTESTQ KORTESTW KORW KSHIFTLB KSHIFTLD KSHIFTLQ KSHIFTLW KSHIFTRB KSHIFTRD KSHIFTRQ KSHIFTRW KUNPCKBW KXNORB KXNORD KXNORQ KXNORW KXORB KXORD KXORQ KXORW LAHF LAR LDDQU LDMXCSR LDS FLDZ FLD1 FLD LEA LEAVE LES LFENCE LFS LGDT LGS LIDT LLDT LMSW OR SUB XOR LODSB LODSD LODSQ LODSW LOOP LOOPE LOOPNE RETF RETFQ LSL LSS LTR XADD LZCNT MASKMOVDQU MAXPD MAXPS MAXSD MAXSS MFENCE MINPD MINPS MINSD MINSS CVTPD2PI CVTPI2PD CVTPI2PS CVTPS2PI CVTTPD2PI CVTTPS2PI EMMS MASKMOVQ MOVD MOVDQ2Q MOVNTQ MOVQ2DQ MOVQ PABSB PABSD PABSW PACKSSDW PACKSSWB PACKUSWB PADDB PADDD PADDQ PADDSB PADDSW PADDUSB PADDUSW PADDW PALIGNR PANDN PAND PAVGB PAVGW PCMPEQB PCMPEQD PCMPEQW PCMPGTB PCMPGTD PCMPGTW PEXTRW PHADDSW PHADDW PHADDD PHSUBD PHSUBSW PHSUBW PINSRW PMADDUBSW PMADDWD PMAXSW PMAXUB PMINSW PMINUB PMOVMSKB PMULHRSW PMULHUW PMULHW PMULLW PMULUDQ POR PSADBW PSHUFB PSHUFW PSIGNB PSIGND PSIGNW PSLLD PSLLQ PSLLW PSRAD PSRAW PSRLD PSRLQ PSRLW PSUBB PSUBD PSUBQ PSUBSB PSUBSW PSUBUSB PSUBUSW PSUBW PUNPCKHBW PUNPCKHDQ PUNPCKHWD PUNPCKLBW PUNPCKLDQ PUNPCKLWD PXOR MONITOR MONTMUL MOV MOVABS MOVBE MOVDDUP MOVDQA MOVDQU MOVHLPS MOVHPD MOVHPS MOVLHPS MOVLPD MOVLPS MOVMSKPD MOVMSKPS MOVNTDQA MOVNTDQ MOVNTI MOVNTPD MOVNTPS MOVNTSD MOVNTSS MOVSB MOVSD MOVSHDUP MOVSLDUP MOVSQ MOVSS MOVSW MOVSX MOVSXD MOVUPD MOVUPS MOVZX MPSADBW MUL MULPD MULPS MULSD MULSS MULX FMUL FIMUL FMULP MWAIT NEG NOP NOT OUT OUTSB OUTSD OUTSW PACKUSDW PAUSE PAVGUSB PBLENDVB PBLENDW PCLMULQDQ PCMPEQQ PCMPESTRI PCMPESTRM PCMPGTQ PCMPISTRI PCMPISTRM PCOMMIT PDEP PEXT PEXTRB PEXTRD PEXTRQ PF2ID PF2IW PFACC PFADD PFCMPEQ PFCMPGE PFCMPGT PFMAX PFMIN PFMUL PFNACC PFPNACC PFRCPIT1 PFRCPIT2 PFRCP PFRSQIT1 PFRSQRT PFSUBR PFSUB PHMINPOSUW PI2FD PI2FW PINSRB PINSRD PINSRQ PMAXSB PMAXSD PMAXUD PMAXUW PMINSB PMINSD PMINUD PMINUW PMOVSXBD PMOVSXBQ PMOVSXBW PMOVSXDQ PMOVSXWD PMOVSXWQ PMOVZXBD PMOVZXBQ PMOVZXBW PMOVZXDQ PMOVZXWD PMOVZXWQ PMULDQ PMULHRW PMULLD POP POPAW POPAL POPCNT POPF POPFD POPFQ PREFETCH PREFETCHNTA PREFETCHT0 PREFETCHT1 PREFETCHT2 PREFETCHW PSHUFD PSHUFHW PSHUFLW PSLLDQ PSRLDQ PSWAPD PTEST PUNPCKHQDQ PUNPCKLQDQ PUSH PUSHAW PUSHAL PUSHF PUSHFD PUSHFQ RCL RCPPS RCPSS RCR RDFSBASE RDGSBASE RDMSR RDPMC RDRAND RDSEED RDTSC RDTSCP ROL ROR RORX ROUNDPD ROUNDPS ROUNDSD ROUNDSS RSM RSQRTPS RSQRTSS SAHF SAL SALC SAR SARX SBB SCASB SCASD SCASQ SCASW SETAE SETA SETBE SETB SETE SETGE SETG SETLE SETL SETNE SETNO SETNP SETNS SETO SETP SETS SFENCE SGDT SHA1MSG1 SHA1MSG2 SHA1NEXTE SHA1RNDS4 SHA256MSG1 SHA256MSG2 SHA256RNDS2 SHL SHLD SHLX SHR SHRD SHRX SHUFPD SHUFPS SIDT FSIN SKINIT SLDT SMSW SQRTPD SQRTPS SQRTSD SQRTSS FSQRT STAC STC STD STGI STI STMXCSR STOSB STOSD STOSQ STOSW STR FST FSTP FSTPNCE FXCH SUBPD SUBPS FSUBR FISUBR FSUBRP SUBSD SUBSS FSUB FISUB FSUBP SWAPGS SYSCALL SYSENTER SYSEXIT SYSRET T1MSKC TEST UD2 FTST TZCNT TZMSK FUCOMPI FUCOMI FUCOMPP FUCOMP FUCOM UD2B UNPCKHPD UNPCKHPS UNPCKLPD UNPCKLPS VADDPD VADDPS VADDSD VADDSS VADDSUBPD VADDSUBPS VAESDECLAST VAESDEC VAESENCLAST VAESENC VAESIMC VAESKEYGENASSIST VALIGND VALIGNQ VANDNPD VANDNPS VANDPD VANDPS VBLENDMPD VBLENDMPS VBLENDPD VBLENDPS VBLENDVPD VBLENDVPS VBROADCASTF128 VBROADCASTI32X4 VBROADCASTI64X4 VBROADCASTSD VBROADCASTSS VCMPPD VCMPPS VCMPSD VCMPSS VCOMPRESSPD VCOMPRESSPS VCVTDQ2PD VCVTDQ2PS VCVTPD2DQX VCVTPD2DQ VCVTPD2PSX VCVTPD2PS VCVTPD2UDQ VCVTPH2PS VCVTPS2DQ VCVTPS2PD VCVTPS2PH VCVTPS2UDQ VCVTSD2SI VCVTSD2USI VCVTSS2SI VCVTSS2USI VCVTTPD2DQX VCVTTPD2DQ VCVTTPD2UDQ VCVTTPS2DQ VCVTTPS2UDQ VCVTUDQ2PD VCVTUDQ2PS VDIVPD VDIVPS VDIVSD VDIVSS VDPPD VDPPS VERR VERW VEXP2PD VEXP2PS VEXPANDPD VEXPANDPS VEXTRACTF128 VEXTRACTF32X4 VEXTRACTF64X4 VEXTRACTI128 VEXTRACTI32X4 VEXTRACTI64X4 VEXTRACTPS VFMADD132PD VFMADD132PS VFMADDPD VFMADD213PD VFMADD231PD VFMADDPS VFMADD213PS VFMADD231PS VFMADDSD VFMADD213SD VFMADD132SD VFMADD231SD VFMADDSS VFMADD213SS VFMADD132SS VFMADD231SS VFMADDSUB132PD VFMADDSUB132PS VFMADDSUBPD VFMADDSUB213PD VFMADDSUB231PD VFMADDSUBPS VFMADDSUB213PS VFMADDSUB231PS VFMSUB132PD VFMSUB132PS VFMSUBADD132PD VFMSUBADD132PS VFMSUBADDPD VFMSUBADD213PD VFMSUBADD231PD VFMSUBADDPS VFMSUBADD213PS VFMSUBADD231PS VFMSUBPD VFMSUB213PD VFMSUB231PD VFMSUBPS VFMSUB213PS VFMSUB231PS VFMSUBSD VFMSUB213SD VFMSUB132SD VFMSUB231SD VFMSUBSS VFMSUB213SS VFMSUB132SS VFMSUB231SS VFNMADD132PD VFNMADD132PS VFNMADDPD VFNMADD213PD VFNMADD231PD VFNMADDPS VFNMADD213PS VFNMADD231PS VFNMADDSD VFNMADD213SD VFNMADD132SD VFNMADD231SD VFNMADDSS VFNMADD213SS VFNMADD132SS VFNMADD231SS VFNMSUB132PD VFNMSUB132PS VFNMSUBPD VFNMSUB213PD VFNMSUB231PD VFNMSUBPS VFNMSUB213PS VFNMSUB231PS VFNMSUBSD VFNMSUB213SD VFNMSUB132SD VFNMSUB231SD VFNMSUBSS VFNMSUB213SS VFNMSUB132SS VFNMSUB231SS VFRCZPD VFRCZPS VFRCZSD VFRCZSS VORPD VORPS VXORPD VXORPS VGATHERDPD VGATHERDPS VGATHERPF0DPD VGATHERPF0DPS VGATHERPF0QPD VGATHERPF0QPS VGATHERPF1DPD VGATHERPF1DPS VGATHERPF1QPD VGATHERPF1QPS VGATHERQPD VGATHERQPS VHADDPD VHADDPS VHSUBPD VHSUBPS VINSERTF128 VINSERTF32X4 VINSERTF32X8 VINSERTF64X2 VINSERTF64X4 VINSERTI128 VINSERTI32X4 VINSERTI32X8 VINSERTI64X2 VINSERTI64X4 VINSERTPS VLDDQU VLDMXCSR VMASKMOVDQU VMASKMOVPD VMASKMOVPS VMAXPD VMAXPS VMAXSD VMAXSS VMCALL VMCLEAR VMFUNC VMINPD VMINPS VMINSD VMINSS VMLAUNCH VMLOAD VMMCALL VMOVQ VMOVDDUP VMOVD VMOVDQA32 VMOVDQA64 VMOVDQA VMOVDQU16 VMOVDQU32 VMOVDQU64 VMOVDQU8 VMOVDQU VMOVHLPS VMOVHPD VMOVHPS VMOVLHPS VMOVLPD VMOVLPS VMOVMSKPD VMOVMSKPS VMOVNTDQA VMOVNTDQ VMOVNTPD VMOVNTPS VMOVSD VMOVSHDUP VMOVSLDUP VMOVSS VMOVUPD VMOVUPS VMPSADBW VMPTRLD VMPTRST VMREAD VMRESUME VMRUN VMSAVE VMULPD VMULPS VMULSD VMULSS VMWRITE VMXOFF VMXON VPABSB VPABSD VPABSQ VPABSW VPACKSSDW VPACKSSWB VPACKUSDW VPACKUSWB VPADDB VPADDD VPADDQ VPADDSB VPADDSW VPADDUSB VPADDUSW VPADDW VPALIGNR VPANDD VPANDND VPANDNQ VPANDN VPANDQ VPAND VPAVGB VPAVGW VPBLENDD VPBLENDMB VPBLENDMD VPBLENDMQ VPBLENDMW VPBLENDVB VPBLENDW VPBROADCASTB VPBROADCASTD VPBROADCASTMB2Q VPBROADCASTMW2D VPBROADCASTQ VPBROADCASTW VPCLMULQDQ VPCMOV VPCMPB VPCMPD VPCMPEQB VPCMPEQD VPCMPEQQ VPCMPEQW VPCMPESTRI VPCMPESTRM VPCMPGTB VPCMPGTD VPCMPGTQ VPCMPGTW VPCMPISTRI VPCMPISTRM VPCMPQ VPCMPUB VPCMPUD VPCMPUQ VPCMPUW VPCMPW VPCOMB VPCOMD VPCOMPRESSD VPCOMPRESSQ VPCOMQ VPCOMUB VPCOMUD VPCOMUQ VPCOMUW VPCOMW VPCONFLICTD VPCONFLICTQ VPERM2F128 VPERM2I128 VPERMD VPERMI2D VPERMI2PD VPERMI2PS VPERMI2Q VPERMIL2PD VPERMIL2PS VPERMILPD VPERMILPS VPERMPD VPERMPS VPERMQ VPERMT2D VPERMT2PD VPERMT2PS VPERMT2Q VPEXPANDD VPEXPANDQ VPEXTRB VPEXTRD VPEXTRQ VPEXTRW VPGATHERDD VPGATHERDQ VPGATHERQD VPGATHERQQ VPHADDBD VPHADDBQ VPHADDBW VPHADDDQ VPHADDD VPHADDSW VPHADDUBD VPHADDUBQ VPHADDUBW VPHADDUDQ VPHADDUWD VPHADDUWQ VPHADDWD VPHADDWQ VPHADDW VPHMINPOSUW VPHSUBBW VPHSUBDQ VPHSUBD VPHSUBSW VPHSUBWD VPHSUBW VPINSRB VPINSRD VPINSRQ VPINSRW VPLZCNTD VPLZCNTQ VPMACSDD VPMACSDQH VPMACSDQL VPMACSSDD VPMACSSDQH VPMACSSDQL VPMACSSWD VPMACSSWW VPMACSWD VPMACSWW VPMADCSSWD VPMADCSWD VPMADDUBSW VPMADDWD VPMASKMOVD VPMASKMOVQ VPMAXSB VPMAXSD VPMAXSQ VPMAXSW VPMAXUB VPMAXUD VPMAXUQ VPMAXUW VPMINSB VPMINSD VPMINSQ VPMINSW VPMINUB VPMINUD VPMINUQ VPMINUW VPMOVDB VPMOVDW VPMOVM2B VPMOVM2D VPMOVM2Q VPMOVM2W VPMOVMSKB VPMOVQB VPMOVQD VPMOVQW VPMOVSDB VPMOVSDW VPMOVSQB VPMOVSQD VPMOVSQW VPMOVSXBD VPMOVSXBQ VPMOVSXBW VPMOVSXDQ VPMOVSXWD VPMOVSXWQ VPMOVUSDB VPMOVUSDW VPMOVUSQB VPMOVUSQD VPMOVUSQW VPMOVZXBD VPMOVZXBQ VPMOVZXBW VPMOVZXDQ VPMOVZXWD VPMOVZXWQ VPMULDQ VPMULHRSW VPMULHUW VPMULHW VPMULLD VPMULLQ VPMULLW VPMULUDQ VPORD VPORQ VPOR VPPERM VPROTB VPROTD VPROTQ VPROTW VPSADBW VPSCATTERDD VPSCATTERDQ VPSCATTERQD VPSCATTERQQ VPSHAB VPSHAD VPSHAQ VPSHAW VPSHLB VPSHLD VPSHLQ VPSHLW VPSHUFB VPSHUFD VPSHUFHW VPSHUFLW VPSIGNB VPSIGND VPSIGNW VPSLLDQ VPSLLD VPSLLQ VPSLLVD VPSLLVQ VPSLLW VPSRAD VPSRAQ VPSRAVD VPSRAVQ VPSRAW VPSRLDQ VPSRLD VPSRLQ VPSRLVD VPSRLVQ VPSRLW VPSUBB VPSUBD VPSUBQ VPSUBSB VPSUBSW VPSUBUSB VPSUBUSW VPSUBW VPTESTMD VPTESTMQ VPTESTNMD VPTESTNMQ VPTEST VPUNPCKHBW VPUNPCKHDQ VPUNPCKHQDQ VPUNPCKHWD VPUNPCKLBW VPUNPCKLDQ VPUNPCKLQDQ VPUNPCKLWD VPXORD VPXORQ VPXOR VRCP14PD VRCP14PS VRCP14SD VRCP14SS VRCP28PD VRCP28PS VRCP28SD VRCP28SS VRCPPS VRCPSS VRNDSCALEPD VRNDSCALEPS VRNDSCALESD VRNDSCALESS VROUNDPD VROUNDPS VROUNDSD VROUNDSS VRSQRT14PD VRSQRT14PS VRSQRT14SD VRSQRT14SS VRSQRT28PD VRSQRT28PS VRSQRT28SD VRSQRT28SS VRSQRTPS VRSQRTSS VSCATTERDPD VSCATTERDPS VSCATTERPF0DPD VSCATTERPF0DPS VSCATTERPF0QPD VSCATTERPF0QPS VSCATTERPF1DPD VSCATTERPF1DPS VSCATTERPF1QPD VSCATTERPF1QPS VSCATTERQPD VSCATTERQPS VSHUFPD VSHUFPS VSQRTPD VSQRTPS VSQRTSD VSQRTSS VSTMXCSR VSUBPD VSUBPS VSUBSD VSUBSS VTESTPD VTESTPS VUNPCKHPD VUNPCKHPS VUNPCKLPD VUNPCKLPS VZEROALL VZEROUPPER WAIT WBINVD WRFSBASE WRGSBASE WRMSR XABORT XACQUIRE XBEGIN XCHG XCRYPTCBC XCRYPTCFB XCRYPTCTR XCRYPTECB XCRYPTOFB XEND XGETBV XLATB XRELEASE XRSTOR XRSTOR64 XRSTORS XRSTORS64 XSAVE XSAVE64 XSAVEC XSAVEC64 XSAVEOPT XSAVEOPT64 XSAVES XSAVES64 XSETBV XSHA1 XSHA256 XSTORE XTEST FDISI8087_NOP FENI8087_NOP ENDING');
+})(function (prefix, value, names) {
+    names = names.split(' ');
+    for (var i = 0; i < names.length; i++) {
+        uc[prefix + names[i]] = value + i;
+    }
+});
@@ -0,0 +1,175 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Loader that fetches the library of each architecture the first time it is used.
+ *
+ * Node.js:  var uc = require('./unicorn-loader.min.js');
+ * Browsers: <script src="unicorn-loader.min.js"></script>
+ */
+
+var uc = (function () {
+'use strict';
+
+var isNode = (typeof process === 'object' && process.versions && process.versions.node &&
+    typeof require === 'function');
+
+// Library of each architecture, by the name of its constant
+var LIBRARIES = {
+    ARCH_ARM: 'arm',
+    ARCH_ARM64: 'aarch64',
+    ARCH_M68K: 'm68k',
+    ARCH_MIPS: 'mips',
+    ARCH_SPARC: 'sparc',
+    ARCH_X86: 'x86'
+};
+
+// Libraries being loaded (Promises of their `uc` object), and loaded ones
+var pending = {};
+var loaded = {};
+
+// Libraries are looked up next to the loader by default
+function defaultBase() {
+    if (isNode) {
+        return __dirname + '/';
+    }
+    if (typeof document !== 'undefined' && document.currentScript) {
+        var src = document.currentScript.src;
+        return src.slice(0, src.lastIndexOf('/') + 1);
+    }
+    return '';
+}
+
+function libraryName(arch) {
+    for (var key in LIBRARIES) {
+        if (uc[key] === arch) {
+            return LIBRARIES[key];
+        }
+    }
+    throw 'Unicorn.js: Unsupported architecture: ' + arch;
+}
+
+function readText(url) {
+    if (isNode) {
+        return new Promise(function (resolve, reject) {
+            require('fs').readFile(url, 'utf8', function (error, text) {
+                if (error) {
+                    reject('Unicorn.js: Could not load ' + url + ': ' + error.message);
+                } else {
+                    resolve(text);
+                }
+            });
+        });
+    }
+    return fetch(url).then(function (response) {
+        if (!response.ok) {
+            throw 'Unicorn.js: Could not load ' + url + ': ' + response.status;
+        }
+        return response.text();
+    });
+}
+
+/**
+ * Evaluates a library in its own scope and returns its `uc` object, so that
+ * libraries of different architectures do not replace each other's globals.
+ * The Emscripten module options are passed as MUnicornOptions.
+ */
+function evaluate(source, file, options) {
+    if (isNode) {
+        var vm = require('vm');
+        var context = vm.createContext({
+            console: console,
+            process: process,
+            require: require,
+            setTimeout: setTimeout,
+            clearTimeout: clearTimeout,
+            setImmediate: setImmediate,
+            MUnicornOptions: options
+        });
+        vm.runInContext(source, context, {filename: file});
+        return context.uc;
+    }
+    return new Function('MUnicornOptions', source + '\nreturn uc;')(options);
+}
+
+var uc = {
+    // Directory of the unicorn-<arch>.min.js libraries
+    base: defaultBase(),
+
+    /**
+     * Loads the library of an architecture, unless it was already loaded.
+     * Returns a Promise of its `uc` object. The registers and instructions
+     * of the architecture are also added to this `uc` object.
+     */
+    load: function (arch) {
+        var name = libraryName(arch);
+        if (pending[name]) {
+            return pending[name];
+        }
+        var file = uc.base + 'unicorn-' + name + '.min.js';
+        var wasm = uc.base + 'unicorn-' + name + '.wasm';
+        pending[name] = readText(file).then(function (source) {
+            var library = evaluate(source, file, {
+                locateFile: function (path) {
+                    return (path.slice(-5) === '.wasm') ? wasm : uc.base + path;
+                }
+            });
+            // WebAssembly libraries are instantiated asynchronously, asm.js
+            // libraries built before uc.ready was added are ready already
+            if (typeof library.ready !== 'function') {
+                return library;
+            }
+            return new Promise(function (resolve) {
+                library.ready(function () {
+                    resolve(library);
+                });
+            });
+        }).then(function (library) {
+            Object.keys(library).forEach(function (key) {
+                if (/^[A-Z0-9_]+$/.test(key) && !(key in uc)) {
+                    uc[key] = library[key];
+                }
+            });
+            loaded[name] = library;
+            return library;
+        }, function (error) {
+            // Allow retrying, e.g. after a network error
+            delete pending[name];
+            throw error;
+        });
+        return pending[name];
+    },
+
+    // Whether the library of an architecture is loaded
+    loaded: function (arch) {
+        return !!loaded[libraryName(arch)];
+    },
+
+    // Returns a Promise of a new engine, loading its library if needed
+    open: function (arch, mode, options) {
+        return uc.load(arch).then(function (library) {
+            return new library.Unicorn(arch, mode, options);
+        });
+    },
+
+    /**
+     * Creates an engine of an architecture loaded with load or open.
+     * Engines are instances of the uc.Unicorn class of their library.
+     */
+    Unicorn: function (arch, mode, options) {
+        var library = loaded[libraryName(arch)];
+        if (!library) {
+            throw 'Unicorn.js: Architecture ' + arch + ' is not loaded, use uc.open or uc.load';
+        }
+        return new library.Unicorn(arch, mode, options);
+    },
+
+    // Loads an image into an engine, see uc.load_image of the libraries
+    load_image: function (engine, buffer, options) {
+        return loaded[libraryName(engine.arch)].load_image(engine, buffer, options);
+    }
+};
+
+if (isNode) {
+    module.exports = uc;
+}
+return uc;
+})();
@@ -0,0 +1,282 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Pool of workers, each running its own instance of a Unicorn.js bundle.
+ *
+ * Node.js:  var UnicornPool = require('./unicorn-pool.js');
+ * Browsers: <script src="unicorn-pool.js"></script>
+ */
+
+(function () {
+'use strict';
+
+var isNode = (typeof process === 'object' && process.versions && process.versions.node &&
+    typeof require === 'function');
+
+/**
+ * Runs a job and returns its results, along with the ArrayBuffers that can be
+ * transferred back to the pool. Opening an engine costs far more than most
+ * jobs, so each worker keeps one engine per architecture and mode in
+ * `engines`, and resets it after every job: the mapped regions are unmapped
+ * and the CPU context saved after opening it is restored.
+ *
+ * Jobs are objects with the following properties:
+ *  - arch, mode:      Engine architecture and mode.
+ *  - memory:          Regions to map: [{address, size, perms, data}], where data
+ *                     is an optional ArrayBuffer or typed array.
+ *  - regs, regType:   Initial register values: {regid: value}, of type regType
+ *                     ('i32' by default).
+ *  - begin, until:    Emulation range.
+ *  - timeout, count:  Emulation limits, as in emu_start.
+ *  - output:          What to read back: {regs: [regid], memory: [{address, size}]}.
+ */
+function runJob(uc, engines, job) {
+    var key = job.arch + '/' + job.mode;
+    if (!engines[key]) {
+        var engine = new uc.Unicorn(job.arch, job.mode);
+        engines[key] = {engine: engine, context: engine.context_save()};
+    }
+    var e = engines[key].engine;
+    var result = {error: null, regs: null, memory: []};
+    var transfer = [];
+    var mapped = [];
+    try {
+        (job.memory || []).forEach(function (region) {
+            var perms = (typeof region.perms === 'undefined') ? uc.PROT_ALL : region.perms;
+            e.mem_map(region.address, region.size, perms);
+            mapped.push(region);
+            if (region.data) {
+                e.mem_write(region.address, ArrayBuffer.isView(region.data) ? region.data
+                    : new Uint8Array(region.data));
+            }
+        });
+        var regType = job.regType || 'i32';
+        var regids = Object.keys(job.regs || {});
+        if (regids.length) {
+            e.reg_write_batch(regids.map(Number), regids.map(function (regid) {
+                return job.regs[regid];
+            }), regType);
+        }
+        try {
+            e.emu_start(job.begin, job.until, job.timeout || 0, job.count || 0);
+        } catch (error) {
+            // Still read the output, which helps to triage crashes
+            result.error = String(error);
+        }
+        var output = job.output || {};
+        if (output.regs && output.regs.length) {
+            result.regs = e.reg_read_batch(output.regs, regType);
+            transfer.push(result.regs.buffer);
+        }
+        (output.memory || []).forEach(function (region) {
+            var bytes = e.mem_read(region.address, region.size);
+            result.memory.push(bytes.buffer);
+            transfer.push(bytes.buffer);
+        });
+    } catch (error) {
+        result.error = String(error);
+    }
+    try {
+        mapped.forEach(function (region) {
+            e.mem_unmap(region.address, region.size);
+        });
+        e.context_restore(engines[key].context);
+        // The next job might run other code at the same addresses
+        e.tb_flush();
+    } catch (error) {
+        // Start over with a new engine
+        delete engines[key];
+        e.close();
+    }
+    // Emscripten modules cannot be used after an abort
+    var fatal = /^abort\(/.test(result.error);
+    return {result: result, transfer: transfer, fatal: fatal};
+}
+
+// Message loop of a worker
+function serveJobs(uc, receive, post) {
+    var engines = {};
+    receive(function (message) {
+        var reply;
+        try {
+            reply = runJob(uc, engines, message.job);
+        } catch (error) {
+            reply = {result: {error: String(error), regs: null, memory: []}, transfer: [], fatal: true};
+        }
+        post({id: message.id, result: reply.result, fatal: reply.fatal}, reply.transfer);
+    });
+    post({ready: true}, []);
+}
+
+// Evaluate a bundle in its own context and return its `uc` object
+function loadBundle(file) {
+    var fs = require('fs');
+    var vm = require('vm');
+    var context = vm.createContext({
+        console: console,
+        process: process,
+        require: require,
+        setTimeout: setTimeout,
+        clearTimeout: clearTimeout,
+        setImmediate: setImmediate
+    });
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, {filename: file});
+    return context.uc;
+}
+
+// Source of the browser workers, which load the bundle with importScripts
+function browserWorkerSource(bundle) {
+    return 'importScripts(' + JSON.stringify(bundle) + ');\n' +
+        runJob.toString() + '\n' +
+        serveJobs.toString() + '\n' +
+        'serveJobs(uc, function (callback) {\n' +
+        '    self.onmessage = function (event) { callback(event.data); };\n' +
+        '}, function (message, transfer) {\n' +
+        '    self.postMessage(message, transfer);\n' +
+        '});\n';
+}
+
+/**
+ * Pool of `size` workers (the number of CPU cores by default), each with its
+ * own instance of the given bundle, e.g. 'dist/unicorn-x86.min.js'.
+ * Jobs are queued and run by the first idle worker.
+ */
+function UnicornPool(bundle, size) {
+    if (typeof size === 'undefined') {
+        size = isNode ? require('os').cpus().length
+            : (navigator.hardwareConcurrency || 4);
+    }
+    this.bundle = bundle;
+    this.queue = [];
+    this.workers = [];
+    this.closed = false;
+    if (!isNode) {
+        var url = new URL(bundle, location.href).href;
+        this.source = URL.createObjectURL(new Blob([browserWorkerSource(url)],
+            {type: 'application/javascript'}));
+    }
+    for (var i = 0; i < Math.max(size, 1); i++) {
+        this.workers.push(this._spawn());
+    }
+}
+
+UnicornPool.prototype = {
+    constructor: UnicornPool,
+
+    /**
+     * Queues a job (see runJob) and returns a Promise of its results:
+     * {error, regs, memory}, where regs is a typed array with the values of
+     * output.regs and memory an array of ArrayBuffers with output.memory.
+     * The optional transfer list moves ArrayBuffers of the job to the worker
+     * instead of copying them.
+     */
+    run: function (job, transfer) {
+        var self = this;
+        if (this.closed) {
+            return Promise.reject('Unicorn.js: Pool is closed');
+        }
+        return new Promise(function (resolve, reject) {
+            self.queue.push({job: job, transfer: transfer || [], resolve: resolve, reject: reject});
+            self._dispatch();
+        });
+    },
+
+    // Terminates the workers, rejecting queued and running jobs
+    close: function () {
+        this.closed = true;
+        this.queue.splice(0).forEach(function (task) {
+            task.reject('Unicorn.js: Pool is closed');
+        });
+        this.workers.forEach(function (worker) {
+            if (worker.task) {
+                worker.task.reject('Unicorn.js: Pool is closed');
+                worker.task = null;
+            }
+            worker.thread.terminate();
+        });
+        this.workers = [];
+        if (this.source) {
+            URL.revokeObjectURL(this.source);
+        }
+    },
+
+    // Helpers
+    _spawn: function () {
+        var self = this;
+        var worker = {thread: null, ready: false, task: null, nextId: 0};
+        var onMessage = function (message) {
+            if (message.ready) {
+                worker.ready = true;
+            } else if (worker.task && message.id == worker.task.id) {
+                var task = worker.task;
+                worker.task = null;
+                task.resolve(message.result);
+                if (message.fatal) {
+                    replace();
+                }
+            }
+            self._dispatch();
+        };
+        var replace = function () {
+            var index = self.workers.indexOf(worker);
+            if (index >= 0 && !self.closed) {
+                worker.thread.terminate();
+                self.workers[index] = self._spawn();
+            }
+        };
+        // Replace workers that crash, failing the job they were running
+        var onError = function (error) {
+            if (worker.task) {
+                worker.task.reject('Unicorn.js: Worker failed: ' + (error && error.message || error));
+                worker.task = null;
+            }
+            replace();
+        };
+        if (isNode) {
+            var Worker = require('worker_threads').Worker;
+            worker.thread = new Worker(__filename, {workerData: {unicornPoolBundle: this.bundle}});
+            worker.thread.on('message', onMessage);
+            worker.thread.on('error', onError);
+            worker.thread.on('exit', function (code) {
+                if (code !== 0) {
+                    onError('exited with code ' + code);
+                }
+            });
+        } else {
+            worker.thread = new Worker(this.source);
+            worker.thread.onmessage = function (event) { onMessage(event.data); };
+            worker.thread.onerror = function (event) {
+                event.preventDefault();
+                onError(event.message);
+            };
+        }
+        return worker;
+    },
+
+    _dispatch: function () {
+        for (var i = 0; i < this.workers.length && this.queue.length; i++) {
+            var worker = this.workers[i];
+            if (!worker.ready || worker.task) {
+                continue;
+            }
+            var task = this.queue.shift();
+            task.id = worker.nextId++;
+            worker.task = task;
+            worker.thread.postMessage({id: task.id, job: task.job}, task.transfer);
+        }
+    }
+};
+
+if (isNode) {
+    var threads = require('worker_threads');
+    if (!threads.isMainThread && threads.workerData && threads.workerData.unicornPoolBundle) {
+        serveJobs(loadBundle(threads.workerData.unicornPoolBundle), function (callback) {
+            threads.parentPort.on('message', callback);
+        }, function (message, transfer) {
+            threads.parentPort.postMessage(message, transfer);
+        });
+    }
+    module.exports = UnicornPool;
+} else {
+    self.UnicornPool = UnicornPool;
+}
+})();
@@ -3,25 +3,22 @@
  * Wrapper made by Alexandro Sanchez Bach.
  */
 
-// Emscripten demodularize
-var MUnicorn = new MUnicorn();
+// Emscripten demodularize, with the module options given by unicorn-loader.js
+var MUnicorn = new MUnicorn(typeof MUnicornOptions !== 'undefined' ? MUnicornOptions : {});
 
 var uc = {
     // Static
     version: function() {
-        major_ptr = MUnicorn._malloc(4);
-        minor_ptr = MUnicorn._malloc(4);
-        var ret = MUnicorn.ccall('uc_version', 'number',
-            ['pointer', 'pointer'], [major_ptr, minor_ptr]);
-        major = MUnicorn.getValue(major_ptr, 'i32');
-        minor = MUnicorn.getValue(minor_ptr, 'i32');
+        var major_ptr = MUnicorn._malloc(4);
+        var minor_ptr = MUnicorn._malloc(4);
+        var ret = MUnicorn._uc_version(major_ptr, minor_ptr);
         MUnicorn._free(major_ptr);
         MUnicorn._free(minor_ptr);
         return ret;
     },
 
     arch_supported: function(arch) {
-        var ret = MUnicorn.ccall('uc_arch_supported', 'number', ['number'], [arch]);
+        var ret = MUnicorn._uc_arch_supported(arch);
         return ret;
     },
 
@@ -30,401 +27,1287 @@ var uc = {
         return ret;
     },
 
+    // WebAssembly builds are instantiated asynchronously
+    ready: function(callback) {
+        if (MUnicorn.calledRun) {
+            callback();
+            return;
+        }
+        var previous = MUnicorn.onRuntimeInitialized;
+        MUnicorn.onRuntimeInitialized = function () {
+            if (previous) {
+                previous();
+            }
+            callback();
+        };
+    },
+
+    // Byte offsets of the profiling counters, in the order of ucjs_profile_offset
+    _profile_offsets: function () {
+        if (!uc._profile_offset_cache) {
+            var names = ['ops', 'tlb_misses', 'tb_flushes', 'nb_ops', 'helpers', 'nb_helpers',
+                'blocks', 'nb_blocks', 'helper_size', 'helper_calls', 'block_size', 'block_pc',
+                'block_execs', 'block_translations'];
+            var offsets = {};
+            names.forEach(function (name, field) {
+                offsets[name] = MUnicorn._ucjs_profile_offset(field);
+            });
+            uc._profile_offset_cache = offsets;
+        }
+        return uc._profile_offset_cache;
+    },
+
+    // High word of an address, for the 64-bit arguments of the C API
+    _high32: function (value) {
+        return (value > 0xFFFFFFFF) ? Math.floor(value / 0x100000000) >>> 0 : 0;
+    },
+
+    // Run a function after yielding to the event loop
+    _yield: (typeof setImmediate === 'function')
+        ? function (callback) { setImmediate(callback); }
+        : function (callback) { setTimeout(callback, 0); },
+
     /**
-     * Unicorn object
+     * Loads an image from an ArrayBuffer or typed array into the guest
+     * memory of an engine, and returns its entry point. Options:
+     *  - format: 'elf' or 'raw' (detected from the ELF magic by default).
+     *  - base:   Address of raw images, or load bias of position-independent
+     *            ELF images (0 by default).
+     *  - perms:  Permissions of raw images (uc.PROT_ALL by default).
+     *
+     * Each PT_LOAD segment of ELF images is mapped with its permissions, and
+     * segments sharing a page are mapped together. Mappings are backed by
+     * the Emscripten heap, as with mem_map_ptr, so file bytes are copied
+     * once from the buffer into guest memory. The rest of each mapping,
+     * e.g. BSS, is zero-filled in place.
      */
-    Unicorn: function (arch, mode) {
-        this.arch = arch;
-        this.mode = mode;
-        this.handle_ptr = MUnicorn._malloc(4);
-
-        // Methods
-        this.reg_write = function (regid, bytes) {
-            // Allocate bytes buffer and copy data
-            var buffer_len = bytes.length;
-            var buffer_ptr = MUnicorn._malloc(buffer_len);
-            MUnicorn.writeArrayToMemory(bytes, buffer_ptr);
-            // Register write
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_reg_write', 'number',
-                ['pointer', 'number', 'pointer'],
-                [handle, regid, buffer_ptr]
-            );
-            // Free memory and handle return code
-            MUnicorn._free(buffer_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_reg_write failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+    load_image: function (engine, buffer, options) {
+        options = options || {};
+        var bytes = ArrayBuffer.isView(buffer)
+            ? new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength)
+            : new Uint8Array(buffer);
+        var base = options.base || 0;
+        var format = options.format || (uc._elf_magic(bytes) ? 'elf' : 'raw');
+        var image;
+        if (format === 'elf') {
+            image = uc._elf_parse(engine, bytes, base);
+        } else if (format === 'raw') {
+            var perms = (typeof options.perms === 'undefined') ? uc.PROT_ALL : options.perms;
+            image = {
+                entry: base,
+                segments: [{address: base, size: bytes.length, offset: 0, filesz: bytes.length, perms: perms}]
+            };
+        } else {
+            throw 'Unicorn.js: Unknown image format: ' + format;
+        }
+        // Page-aligned mappings, each with the segments inside it
+        var regions = [];
+        image.segments.sort(function (a, b) { return a.address - b.address; });
+        image.segments.forEach(function (segment) {
+            var begin = Math.floor(segment.address / uc.IMAGE_PAGE_SIZE) * uc.IMAGE_PAGE_SIZE;
+            var end = Math.ceil((segment.address + segment.size) / uc.IMAGE_PAGE_SIZE) * uc.IMAGE_PAGE_SIZE;
+            var last = regions[regions.length - 1];
+            if (last && begin < last.end) {
+                last.end = Math.max(last.end, end);
+                last.perms |= segment.perms;
+                last.segments.push(segment);
+            } else {
+                regions.push({begin: begin, end: end, perms: segment.perms, segments: [segment]});
             }
+        });
+        if (!regions.length) {
+            throw 'Unicorn.js: Image has nothing to load';
+        }
+        // Addresses are numbers, exact up to 2^53
+        if (regions[regions.length - 1].end > 0x20000000000000) {
+            throw 'Unicorn.js: Image addresses do not fit in 53 bits';
+        }
+        var mapped = [];
+        try {
+            regions.forEach(function (region) {
+                var size = region.end - region.begin;
+                var ptr = engine._mem_map_heap(region.begin, size, region.perms);
+                mapped.push(region);
+                // The heap might have grown while mapping
+                var heap = MUnicorn.HEAPU8;
+                var zeroed = ptr;
+                region.segments.forEach(function (segment) {
+                    var dest = ptr + (segment.address - region.begin);
+                    if (dest > zeroed) {
+                        heap.fill(0, zeroed, dest);
+                    }
+                    heap.set(bytes.subarray(segment.offset, segment.offset + segment.filesz), dest);
+                    zeroed = Math.max(zeroed, dest + segment.filesz);
+                    if (dest + segment.size > zeroed) {
+                        heap.fill(0, zeroed, dest + segment.size);
+                        zeroed = dest + segment.size;
+                    }
+                });
+                heap.fill(0, zeroed, ptr + size);
+                engine._snapshots_mark(region.begin, size);
+            });
+        } catch (error) {
+            mapped.forEach(function (region) {
+                engine.mem_unmap(region.begin, region.end - region.begin);
+            });
+            throw error;
         }
+        return image.entry;
+    },
 
-        this.reg_read = function (regid, size) {
-            // Allocate space for the output value
-            var buffer_ptr = MUnicorn._malloc(size);
-            for (var i = 0; i < size; i++) {
-                MUnicorn.setValue(buffer_ptr + i, 0, 'i8');
-            }
-            // Register read
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_reg_read', 'number',
-                ['pointer', 'number', 'pointer'],
-                [handle, regid, buffer_ptr]
-            );
-            // Get register value, free memory and handle return code
-            var value = new Uint8Array(size);
-            for (var i = 0; i < size; i++) {
-                value[i] = MUnicorn.getValue(buffer_ptr + i, 'i8');
+    _elf_magic: function (bytes) {
+        return bytes.length >= 4 &&
+            bytes[0] == 0x7F && bytes[1] == 0x45 && bytes[2] == 0x4C && bytes[3] == 0x46;
+    },
+
+    // Reads the entry point and PT_LOAD segments of an ELF32/ELF64 image
+    _elf_parse: function (engine, bytes, base) {
+        if (!uc._elf_magic(bytes) || bytes.length < 52) {
+            throw 'Unicorn.js: Not an ELF image';
+        }
+        var is64 = (bytes[4] == 2);
+        var le = (bytes[5] == 1);
+        if ((bytes[4] != 1 && !is64) || (bytes[5] != 1 && bytes[5] != 2) || (is64 && bytes.length < 64)) {
+            throw 'Unicorn.js: Unsupported ELF class or data encoding';
+        }
+        var view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        var u16 = function (offset) { return view.getUint16(offset, le); };
+        var u32 = function (offset) { return view.getUint32(offset, le); };
+        var word = !is64 ? u32 : function (offset) {
+            var lo = view.getUint32(offset + (le ? 0 : 4), le);
+            var hi = view.getUint32(offset + (le ? 4 : 0), le);
+            return hi * 0x100000000 + lo;
+        };
+        var arch = uc._elf_machines[u16(18)];
+        if (typeof arch === 'undefined' || uc[arch] !== engine.arch) {
+            throw 'Unicorn.js: ELF machine ' + u16(18) + ' does not match the engine architecture';
+        }
+        // Only position-independent images (ET_DYN) are relocated
+        var bias = (u16(16) == 3) ? base : 0;
+        var entry = word(24);
+        var phoff = is64 ? word(32) : u32(28);
+        var phentsize = u16(is64 ? 54 : 42);
+        var phnum = u16(is64 ? 56 : 44);
+        if (phentsize < (is64 ? 56 : 32) || phoff + phnum * phentsize > bytes.length) {
+            throw 'Unicorn.js: Invalid ELF program headers';
+        }
+        var segments = [];
+        for (var i = 0; i < phnum; i++) {
+            var ph = phoff + i * phentsize;
+            // PT_LOAD
+            if (u32(ph) != 1) {
+                continue;
             }
-            MUnicorn._free(buffer_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_reg_read failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+            var segment = is64 ? {
+                flags: u32(ph + 4), offset: word(ph + 8), vaddr: word(ph + 16),
+                filesz: word(ph + 32), memsz: word(ph + 40)
+            } : {
+                offset: u32(ph + 4), vaddr: u32(ph + 8),
+                filesz: u32(ph + 16), memsz: u32(ph + 20), flags: u32(ph + 24)
+            };
+            if (segment.memsz == 0) {
+                continue;
             }
-            return value;
-        }
-
-        this.mem_write = function (address, bytes) {
-            // Allocate bytes buffer and copy data
-            var buffer_len = bytes.length;
-            var buffer_ptr = MUnicorn._malloc(buffer_len);
-            MUnicorn.writeArrayToMemory(bytes, buffer_ptr);
-
-            // Write to memory
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_mem_write', 'number',
-                ['pointer', 'number', 'number', 'pointer', 'number'],
-                [handle, address, 0, buffer_ptr, buffer_len]
-            );
-            // Free memory and handle return code
-            MUnicorn._free(buffer_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_write failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+            if (segment.filesz > segment.memsz || segment.offset + segment.filesz > bytes.length) {
+                throw 'Unicorn.js: Invalid ELF segment ' + i;
             }
+            segments.push({
+                address: segment.vaddr + bias,
+                size: segment.memsz,
+                offset: segment.offset,
+                filesz: segment.filesz,
+                perms: ((segment.flags & 4) ? uc.PROT_READ : 0) |   // PF_R
+                       ((segment.flags & 2) ? uc.PROT_WRITE : 0) |  // PF_W
+                       ((segment.flags & 1) ? uc.PROT_EXEC : 0)     // PF_X
+            });
         }
+        return {entry: entry + bias, segments: segments};
+    },
 
-        this.mem_read = function (address, size) {
-            // Allocate space for the output value
-            var buffer_ptr = MUnicorn._malloc(size);
-            for (var i = 0; i < size; i++) {
-                MUnicorn.setValue(buffer_ptr + i, 0, 'i8');
-            }
+    // Architecture constant of each ELF machine
+    _elf_machines: {
+        2: 'ARCH_SPARC',        // EM_SPARC
+        3: 'ARCH_X86',          // EM_386
+        4: 'ARCH_M68K',         // EM_68K
+        8: 'ARCH_MIPS',         // EM_MIPS
+        18: 'ARCH_SPARC',       // EM_SPARC32PLUS
+        40: 'ARCH_ARM',         // EM_ARM
+        43: 'ARCH_SPARC',       // EM_SPARCV9
+        62: 'ARCH_X86',         // EM_X86_64
+        183: 'ARCH_ARM64'       // EM_AARCH64
+    },
+
+    /**
+     * Unicorn object. Options:
+     *  - tb_size: Size of the translation buffer in bytes (8 MB by default,
+     *             at least 1 MB). Smaller buffers save memory, but are
+     *             flushed more often.
+     */
+    Unicorn: function (arch, mode, options) {
+        options = options || {};
+        this.arch = arch;
+        this.mode = mode;
+        this.handle = 0;
+
+        // Scratch buffer in the Emscripten heap reused by memory transfers
+        // and single register accesses
+        this.scratch_ptr = 0;
+        this.scratch_len = 0;
+
+        // Register batch buffer in the Emscripten heap
+        this.batch_ptr = 0;
+        this.batch_len = 0;
+
+        // State of the emulation started by emu_start_async
+        this.async_run = null;
+
+        // Trace buffer started by trace_start
+        this.trace = null;
+
+        // Edge coverage started by coverage_start, and its bitmap view
+        this.coverage = 0;
+        this.coverage_view = null;
+
+        // Snapshots taken by snapshot, freed by snapshot_free or close
+        this.snapshots = [];
+
+        // Guest memory mapped by mem_map_ptr, backed by the Emscripten heap
+        this.ptr_regions = [];
+
+        // Hooks added by hook_add and contexts allocated by context_alloc,
+        // released by close
+        this.hooks = [];
+        this.contexts = [];
+
+        // Word holding the handle, allocated by the handle_ptr getter
+        this.handle_cell = 0;
+
+        // Constructor
+        var handle_ptr = MUnicorn._malloc(4);
+        var ret = MUnicorn._ucjs_open(arch, mode, options.tb_size || 0, handle_ptr);
+        this.handle = MUnicorn.HEAPU32[handle_ptr >> 2];
+        MUnicorn._free(handle_ptr);
+        if (ret != uc.ERR_OK) {
+            this.handle = 0;
+            var error = 'Unicorn.js: Function uc_open failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    }
+};
+
+// Transfers larger than SCRATCH_LIMIT bytes are split in chunks
+uc.Unicorn.SCRATCH_LIMIT = 0x100000;
+
+// Smallest guest page size, the granularity at which mem_unmap releases
+// memory mapped by mem_map_ptr
+uc.Unicorn.PTR_PAGE_SIZE = 0x400;
 
-            // Read from memory
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_mem_read', 'number',
-                ['pointer', 'number', 'number', 'pointer', 'number'],
-                [handle, address, 0, buffer_ptr, size]
-            );
-            // Get register value, free memory and handle return code
-            var buffer = new Uint8Array(size);
-            for (var i = 0; i < size; i++) {
-                buffer[i] = MUnicorn.getValue(buffer_ptr + i, 'i8');
+// Granularity of the mappings made by uc.load_image
+uc.IMAGE_PAGE_SIZE = 0x1000;
+
+// Register batches use an array of register IDs, an array of pointers to
+// the values, and one slot per value. Slots are large enough for any
+// register read as a vector.
+uc.Unicorn.BATCH_SLOT_SIZE = 16;
+
+// Default number of instructions emulated by emu_start_async between yields
+uc.Unicorn.SLICE_INSTRUCTIONS = 100000;
+
+// Default number of records held by the trace buffer (16 bytes each)
+uc.Unicorn.TRACE_CAPACITY = 0x10000;
+
+// Size of the edge coverage bitmap in bytes
+uc.Unicorn.COVERAGE_SIZE = 0x10000;
+
+uc.Unicorn.prototype = {
+    constructor: uc.Unicorn,
+
+    // Methods
+    reg_write: function (regid, bytes) {
+        var buffer_ptr = this._scratch(bytes.length);
+        MUnicorn.HEAPU8.set(bytes, buffer_ptr);
+        var ret = MUnicorn._uc_reg_write(this.handle, regid, buffer_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_write failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    reg_read: function (regid, size) {
+        var buffer_ptr = this._scratch(size);
+        MUnicorn.HEAPU8.fill(0, buffer_ptr, buffer_ptr + size);
+        var ret = MUnicorn._uc_reg_read(this.handle, regid, buffer_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_read failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        return MUnicorn.HEAPU8.slice(buffer_ptr, buffer_ptr + size);
+    },
+
+    reg_write_batch: function (regids, values, type) {
+        var count = regids.length;
+        var values_ptr = this._batch(regids, type);
+        var heap = this._batch_heap(type);
+        var stride = uc.Unicorn.BATCH_SLOT_SIZE / heap.BYTES_PER_ELEMENT;
+        var index = values_ptr / heap.BYTES_PER_ELEMENT;
+        for (var i = 0; i < count; i++, index += stride) {
+            if (type == 'i64') {
+                heap[index] = values[i] >>> 0;
+                heap[index + 1] = Math.floor(values[i] / 4294967296) >>> 0;
+            } else {
+                heap[index] = values[i];
             }
-            MUnicorn._free(buffer_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_read failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+        }
+        // Register write
+        var ret = MUnicorn._uc_reg_write_batch(this.handle,
+            this.batch_ptr, this.batch_ptr + 4 * this.batch_len, count);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_write_batch failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    reg_read_batch: function (regids, type) {
+        var count = regids.length;
+        var values_ptr = this._batch(regids, type);
+        // Register read
+        var ret = MUnicorn._uc_reg_read_batch(this.handle,
+            this.batch_ptr, this.batch_ptr + 4 * this.batch_len, count);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_read_batch failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        // Get register values
+        var heap = this._batch_heap(type);
+        var stride = uc.Unicorn.BATCH_SLOT_SIZE / heap.BYTES_PER_ELEMENT;
+        var index = values_ptr / heap.BYTES_PER_ELEMENT;
+        var values = (type == 'i64') ? new Float64Array(count) : new heap.constructor(count);
+        for (var i = 0; i < count; i++, index += stride) {
+            if (type == 'i64') {
+                values[i] = heap[index] + heap[index + 1] * 4294967296;
+            } else {
+                values[i] = heap[index];
             }
-            return buffer;
         }
+        return values;
+    },
 
-        this.mem_map = function (address, size, perms) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_mem_map', 'number',
-                ['pointer', 'number', 'number', 'number', 'number'],
-                [handle, address, 0, size, perms]
-            );
+    mem_write: function (address, bytes) {
+        var limit = uc.Unicorn.SCRATCH_LIMIT;
+        var length = bytes.length;
+        var buffer_ptr = this._scratch(Math.min(length, limit));
+        // Copy data through the scratch buffer, in chunks for large writes
+        for (var offset = 0; offset < length; offset += limit) {
+            var chunk_len = Math.min(length - offset, limit);
+            var chunk = (typeof bytes.subarray === 'function')
+                ? bytes.subarray(offset, offset + chunk_len)
+                : bytes.slice(offset, offset + chunk_len);
+            MUnicorn.HEAPU8.set(chunk, buffer_ptr);
+            var ret = MUnicorn._uc_mem_write(this.handle, address + offset, uc._high32(address + offset),
+                buffer_ptr, chunk_len);
             if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_map failed with code ' + ret + ':\n' + uc.strerror(ret);
+                var error = 'Unicorn.js: Function uc_mem_write failed with code ' + ret + ':\n' + uc.strerror(ret);
                 throw error;
             }
         }
+    },
 
-        this.mem_protect = function (address, size, perms) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_mem_protect', 'number',
-                ['pointer', 'number', 'number', 'number', 'number'],
-                [handle, address, 0, size, perms]
-            );
+    mem_read_into: function (address, target) {
+        // Accept any typed array, and fill its bytes
+        var bytes = (target instanceof Uint8Array) ? target
+            : new Uint8Array(target.buffer, target.byteOffset, target.byteLength);
+        var limit = uc.Unicorn.SCRATCH_LIMIT;
+        var length = bytes.length;
+        var buffer_ptr = this._scratch(Math.min(length, limit));
+        // Copy data through the scratch buffer, in chunks for large reads
+        for (var offset = 0; offset < length; offset += limit) {
+            var chunk_len = Math.min(length - offset, limit);
+            var ret = MUnicorn._uc_mem_read(this.handle, address + offset, uc._high32(address + offset),
+                buffer_ptr, chunk_len);
             if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_protect failed with code ' + ret + ':\n' + uc.strerror(ret);
+                var error = 'Unicorn.js: Function uc_mem_read failed with code ' + ret + ':\n' + uc.strerror(ret);
                 throw error;
             }
+            bytes.set(MUnicorn.HEAPU8.subarray(buffer_ptr, buffer_ptr + chunk_len), offset);
         }
+        return target;
+    },
 
-        this.mem_regions = function () {
-            console.error("Unicorn.js: Method mem_regions unimplemented");
+    mem_read: function (address, size) {
+        return this.mem_read_into(address, new Uint8Array(size));
+    },
+
+    mem_map: function (address, size, perms) {
+        var ret = MUnicorn._uc_mem_map(this.handle, address, uc._high32(address), size, perms);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_mem_map failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
+    },
 
-        this.mem_unmap = function (address, size) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_mem_unmap', 'number',
-                ['pointer', 'number', 'number', 'number'],
-                [handle, address, 0, size]
-            );
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_unmap failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+    /**
+     * Maps guest memory backed by page-aligned storage in the Emscripten
+     * heap, and returns a Uint8Array view aliased to it. The view is
+     * detached if the heap grows: use mem_view to get a new one.
+     */
+    mem_map_ptr: function (address, size, perms) {
+        var ptr = this._mem_map_heap(address, size, perms);
+        this.ptr_regions[this.ptr_regions.length - 1].viewed = true;
+        MUnicorn.HEAPU8.fill(0, ptr, ptr + size);
+        return MUnicorn.HEAPU8.subarray(ptr, ptr + size);
+    },
+
+    // Returns a view of guest memory mapped by mem_map_ptr, or null if the
+    // range is not inside one of those mappings, or was partly unmapped
+    mem_view: function (address, size) {
+        for (var i = 0; i < this.ptr_regions.length; i++) {
+            var region = this.ptr_regions[i];
+            var offset = address - region.address;
+            if (offset >= 0 && offset + size <= region.size) {
+                var first = Math.floor(offset / uc.Unicorn.PTR_PAGE_SIZE);
+                var last = Math.ceil((offset + size) / uc.Unicorn.PTR_PAGE_SIZE);
+                if (region.pages.subarray(first, last).indexOf(0) !== -1) {
+                    continue;
+                }
+                region.viewed = true;
+                return MUnicorn.HEAPU8.subarray(region.ptr + offset, region.ptr + offset + size);
             }
         }
+        return null;
+    },
+
+    mem_protect: function (address, size, perms) {
+        var ret = MUnicorn._uc_mem_protect(this.handle, address, uc._high32(address), size, perms);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_mem_protect failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    mem_regions: function () {
+        console.error("Unicorn.js: Method mem_regions unimplemented");
+    },
 
-        this.hook_add = function (type, user_callback, user_data, begin, end) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            // Default arguments
-            if (typeof user_data === 'undefined') {
-                user_data = {}
+    mem_unmap: function (address, size) {
+        var ret = MUnicorn._uc_mem_unmap(this.handle, address, uc._high32(address), size);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_mem_unmap failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        // Free the storage of mem_map_ptr regions once all their pages are
+        // unmapped. Pages are only counted once, as the range might have
+        // been mapped again since.
+        for (var i = this.ptr_regions.length - 1; i >= 0; i--) {
+            var region = this.ptr_regions[i];
+            var begin = Math.max(address, region.address) - region.address;
+            var end = Math.min(address + size, region.address + region.size) - region.address;
+            for (var page = begin / uc.Unicorn.PTR_PAGE_SIZE; page < end / uc.Unicorn.PTR_PAGE_SIZE; page++) {
+                if (region.pages[page]) {
+                    region.pages[page] = 0;
+                    region.mapped--;
+                }
             }
-            if (typeof begin === 'undefined' &&
-                typeof end === 'undefined') {
-                begin = 1;
-                end = 0;
+            if (region.mapped == 0) {
+                MUnicorn._free(region.storage);
+                this.ptr_regions.splice(i, 1);
             }
-            // Wrap callback
-            switch (type) {
-                case uc.HOOK_INSN:
-                    var callback = (function (handle, user_data) {
-                        return function (_, _) {
-                            user_callback(handle, user_data);
-                        }
-                    })(this, user_data);
-                    break;
-                // uc_cb_hookintr_t
-                case uc.HOOK_INTR:
+        }
+    },
+
+    hook_add: function (type, user_callback, user_data, begin, end) {
+        // Default arguments
+        if (typeof user_data === 'undefined') {
+            user_data = {}
+        }
+        if (typeof begin === 'undefined' &&
+            typeof end === 'undefined') {
+            begin = 1;
+            end = 0;
+        }
+        // Wrap callback
+        switch (type) {
+            case uc.HOOK_INSN:
+                var callback = (function (handle, user_data) {
+                    return function (_, _) {
+                        user_callback(handle, user_data);
+                    }
+                })(this, user_data);
+                break;
+            // uc_cb_hookintr_t
+            case uc.HOOK_INTR:
+                var callback = (function (handle, user_data) {
+                    return function (_, intno, _) {
+                        user_callback(handle, intno, user_data);
+                    }
+                })(this, user_data);
+                break;
+            // uc_cb_hookcode_t
+            case uc.HOOK_CODE:
+            case uc.HOOK_BLOCK:
+                var callback = (function (handle, user_data) {
+                    return function (_, addr_lo, addr_hi, size, _) {
+                        user_callback(handle, addr_lo, addr_hi, size, user_data);
+                    }
+                })(this, user_data);
+                break;
+            default:
+                // uc_cb_hookmem_t
+                if ((type & uc.HOOK_MEM_READ) ||
+                    (type & uc.HOOK_MEM_WRITE) ||
+                    (type & uc.HOOK_MEM_FETCH) ||
+                    (type & uc.HOOK_MEM_READ_AFTER)) {
                     var callback = (function (handle, user_data) {
-                        return function (_, intno, _) {
-                            user_callback(handle, intno, user_data);
+                        return function (_, type, addr_lo, addr_hi, size, value_lo, value_hi, _) {
+                            user_callback(handle, type, addr_lo, addr_hi, size, value_lo, value_hi, user_data);
                         }
                     })(this, user_data);
-                    break;
-                // uc_cb_hookcode_t
-                case uc.HOOK_CODE:
-                case uc.HOOK_BLOCK:
+                }
+                // uc_cb_eventmem_t
+                if ((type & uc.HOOK_MEM_READ_UNMAPPED) ||
+                    (type & uc.HOOK_MEM_WRITE_UNMAPPED) ||
+                    (type & uc.HOOK_MEM_FETCH_UNMAPPED) ||
+                    (type & uc.HOOK_MEM_READ_PROT) ||
+                    (type & uc.HOOK_MEM_WRITE_PROT) ||
+                    (type & uc.HOOK_MEM_FETCH_PROT)) {
                     var callback = (function (handle, user_data) {
-                        return function (_, addr_lo, addr_hi, size, _) {
-                            user_callback(handle, addr_lo, addr_hi, size, user_data);
+                        return function (_, type, addr_lo, addr_hi, size, value_lo, value_hi, _) {
+                            return user_callback(handle, type, addr_lo, addr_hi, size, value_lo, value_hi, user_data);
                         }
                     })(this, user_data);
-                    break;
-                default:
-                    // uc_cb_hookmem_t
-                    if ((type & uc.HOOK_MEM_READ) ||
-                        (type & uc.HOOK_MEM_WRITE) ||
-                        (type & uc.HOOK_MEM_FETCH) ||
-                        (type & uc.HOOK_MEM_READ_AFTER)) {
-                        var callback = (function (handle, user_data) {
-                            return function (_, type, addr_lo, addr_hi, size, value_lo, value_hi, _) {
-                                user_callback(handle, type, addr_lo, addr_hi, size, value_lo, value_hi, user_data);
-                            }
-                        })(this, user_data);
-                    }
-                    // uc_cb_eventmem_t
-                    if ((type & uc.HOOK_MEM_READ_UNMAPPED) ||
-                        (type & uc.HOOK_MEM_WRITE_UNMAPPED) ||
-                        (type & uc.HOOK_MEM_FETCH_UNMAPPED) ||
-                        (type & uc.HOOK_MEM_READ_PROT) ||
-                        (type & uc.HOOK_MEM_WRITE_PROT) ||
-                        (type & uc.HOOK_MEM_FETCH_PROT)) {
-                        var callback = (function (handle, user_data) {
-                            return function (_, type, addr_lo, addr_hi, size, value_lo, value_hi, _) {
-                                return user_callback(handle, type, addr_lo, addr_hi, size, value_lo, value_hi, user_data);
-                            }
-                        })(this, user_data);
-                    }
-            }
-            if (typeof callback === 'undefined') {
-                throw 'Unicorn.js: Unimplemented hook type'
-            }
-            // Set hook
-            var callback_ptr = MUnicorn.Runtime.addFunction(callback);
-            var hook_ptr = MUnicorn._malloc(4);
-            var ret = MUnicorn.ccall('uc_hook_add', 'number',
-                ['pointer', 'pointer', 'number', 'pointer', 'pointer',
-                    'number', 'number', 'number', 'number'],
-                [handle, hook_ptr, type, callback_ptr, 0,
-                    begin, 0, end, 0]
-            );
-            if (ret != uc.ERR_OK) {
-                MUnicorn.Runtime.removeFunction(callback_ptr);
-                MUnicorn._free(hook_ptr);
-                var error = 'Unicorn.js: Function uc_mem_unmap failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+                }
+        }
+        if (typeof callback === 'undefined') {
+            throw 'Unicorn.js: Unimplemented hook type'
+        }
+        // Set hook
+        var callback_ptr = MUnicorn.Runtime.addFunction(callback);
+        var hook_ptr = this._scratch(4);
+        var ret = MUnicorn._uc_hook_add(this.handle, hook_ptr, type, callback_ptr, 0,
+            begin, uc._high32(begin), end, uc._high32(end));
+        if (ret != uc.ERR_OK) {
+            MUnicorn.Runtime.removeFunction(callback_ptr);
+            var error = 'Unicorn.js: Function uc_hook_add failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        var hook = {
+            handle: MUnicorn.HEAPU32[hook_ptr >> 2],
+            callback: callback_ptr
+        };
+        this.hooks.push(hook);
+        return hook
+    },
+
+    hook_del: function (hook) {
+        var ret = MUnicorn._uc_hook_del(this.handle, hook.handle);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_hook_del failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        MUnicorn.Runtime.removeFunction(hook.callback);
+        var index = this.hooks.indexOf(hook);
+        if (index >= 0) {
+            this.hooks.splice(index, 1);
+        }
+    },
+
+    /**
+     * Records executed instructions (uc.HOOK_CODE) and/or blocks
+     * (uc.HOOK_BLOCK) in a buffer of the Emscripten heap, without calling
+     * JavaScript for each of them. Records are passed in bulk to
+     * callback(records, count, dropped), where records is a Uint32Array view
+     * with 4 words per record: address (low, high), size and hook type.
+     * The view is only valid during the call.
+     *
+     * The buffer is drained when it fills, after emu_start returns, after
+     * each emu_start_async slice and on trace_drain. With options.ring, it
+     * is only drained on trace_drain and trace_stop, and the oldest records
+     * are overwritten when it fills.
+     */
+    trace_start: function (type, callback, options) {
+        var self = this;
+        options = options || {};
+        if (this.trace) {
+            throw 'Unicorn.js: Trace is already running';
+        }
+        var capacity = options.capacity || uc.Unicorn.TRACE_CAPACITY;
+        var begin = options.begin;
+        var end = options.end;
+        if (typeof begin === 'undefined' &&
+            typeof end === 'undefined') {
+            begin = 1;
+            end = 0;
+        }
+        var trace = {
+            ptr: 0,
+            flush: 0,
+            ring: !!options.ring,
+            callback: callback
+        };
+        if (!trace.ring) {
+            trace.flush = MUnicorn.Runtime.addFunction(function (_) {
+                self.trace_drain();
+            });
+        }
+        var trace_ptr = this._scratch(4);
+        var ret = MUnicorn._ucjs_trace_open(this.handle, trace_ptr, type, capacity, trace.flush,
+            begin, uc._high32(begin), end, uc._high32(end));
+        if (ret != uc.ERR_OK) {
+            if (trace.flush) {
+                MUnicorn.Runtime.removeFunction(trace.flush);
             }
-            var hook = {
-                handle: MUnicorn.getValue(hook_ptr, '*'),
-                callback: callback_ptr
+            var error = 'Unicorn.js: Function ucjs_trace_open failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        trace.ptr = MUnicorn.HEAPU32[trace_ptr >> 2];
+        this.trace = trace;
+    },
+
+    // Passes the pending trace records to the callback, oldest first.
+    // Returns the number of records drained.
+    trace_drain: function () {
+        var trace = this.trace;
+        if (!trace) {
+            return 0;
+        }
+        // Views are replaced when the heap grows, so get them on every drain
+        var heap = MUnicorn.HEAPU32;
+        var fields = trace.ptr >> 2;
+        var records = heap[fields] >> 2;
+        var capacity = heap[fields + 1];
+        var head = heap[fields + 2];
+        var count = heap[fields + 3];
+        var dropped = heap[fields + 4];
+        if (count == 0) {
+            return 0;
+        }
+        heap[fields + 3] = 0;
+        heap[fields + 4] = 0;
+        // Pending records may wrap around the end of the buffer
+        var start = (head + capacity - count) % capacity;
+        var first = Math.min(count, capacity - start);
+        trace.callback(heap.subarray(records + 4 * start, records + 4 * (start + first)), first, dropped);
+        if (count > first) {
+            trace.callback(heap.subarray(records, records + 4 * (count - first)), count - first, 0);
+        }
+        return count;
+    },
+
+    trace_stop: function () {
+        if (!this.trace) {
+            return;
+        }
+        this.trace_drain();
+        this._trace_close();
+    },
+
+    /**
+     * Records AFL-style edge coverage in a bitmap of the Emscripten heap:
+     * each pair of consecutive blocks increments one of its bytes. Blocks
+     * are hashed natively, without calling JavaScript.
+     */
+    coverage_start: function (options) {
+        options = options || {};
+        if (this.coverage) {
+            throw 'Unicorn.js: Coverage is already running';
+        }
+        var begin = options.begin;
+        var end = options.end;
+        if (typeof begin === 'undefined' &&
+            typeof end === 'undefined') {
+            begin = 1;
+            end = 0;
+        }
+        var coverage_ptr = this._scratch(4);
+        var ret = MUnicorn._ucjs_coverage_open(this.handle, coverage_ptr,
+            begin, uc._high32(begin), end, uc._high32(end));
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_coverage_open failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        this.coverage = MUnicorn.HEAPU32[coverage_ptr >> 2];
+        return this.coverage_bitmap();
+    },
+
+    // Returns a Uint8Array view of the coverage bitmap
+    coverage_bitmap: function () {
+        if (!this.coverage) {
+            return null;
+        }
+        // Views are detached when the heap grows
+        if (!this.coverage_view || this.coverage_view.buffer !== MUnicorn.HEAPU8.buffer) {
+            this.coverage_view = MUnicorn.HEAPU8.subarray(this.coverage,
+                this.coverage + uc.Unicorn.COVERAGE_SIZE);
+        }
+        return this.coverage_view;
+    },
+
+    // Clears the bitmap before a new execution. With `virgin`, also forgets
+    // the coverage counted by coverage_new_bits.
+    coverage_reset: function (virgin) {
+        if (this.coverage) {
+            MUnicorn._ucjs_coverage_reset(this.coverage, virgin ? 1 : 0);
+        }
+    },
+
+    // Returns how many bitmap bytes reached a hit count bucket (1, 2, 3,
+    // 4-7, 8-15, 16-31, 32-127, 128+) not seen since the last full reset.
+    coverage_new_bits: function () {
+        if (!this.coverage) {
+            return 0;
+        }
+        return MUnicorn._ucjs_coverage_new_bits(this.coverage);
+    },
+
+    coverage_stop: function () {
+        if (!this.coverage) {
+            return;
+        }
+        var coverage = this.coverage;
+        this.coverage = 0;
+        this.coverage_view = null;
+        var ret = MUnicorn._ucjs_coverage_close(this.handle, coverage);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_coverage_close failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    emu_start: function (begin, until, timeout, count) {
+        var ret = MUnicorn._uc_emu_start(this.handle, begin, uc._high32(begin),
+            until, uc._high32(until), timeout, 0, count);
+        if (this.trace && !this.trace.ring) {
+            this.trace_drain();
+        }
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_emu_start failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    /**
+     * Emulates in slices of sliceInstructions instructions, or of about
+     * sliceMs milliseconds, yielding to the event loop between slices.
+     * Returns a Promise resolved once `until` is reached or emu_stop is called.
+     */
+    emu_start_async: function (begin, until, options) {
+        var self = this;
+        options = options || {};
+        var slice = options.sliceInstructions || uc.Unicorn.SLICE_INSTRUCTIONS;
+        var slice_ms = options.sliceMs;
+        if (this.async_run) {
+            return Promise.reject('Unicorn.js: Emulation is already running');
+        }
+        var run = this.async_run = {stopped: false};
+        return new Promise(function (resolve, reject) {
+            var pc = begin;
+            var step = function () {
+                if (run.stopped || !self.handle) {
+                    self.async_run = null;
+                    resolve();
+                    return;
+                }
+                var start = Date.now();
+                var ret = MUnicorn._uc_emu_start(self.handle, pc, uc._high32(pc),
+                    until, uc._high32(until), 0, 0, slice);
+                var elapsed = Date.now() - start;
+                if (self.trace && !self.trace.ring) {
+                    self.trace_drain();
+                }
+                if (ret != uc.ERR_OK) {
+                    self.async_run = null;
+                    reject('Unicorn.js: Function uc_emu_start failed with code ' + ret + ':\n' + uc.strerror(ret));
+                    return;
+                }
+                pc = self._pc_read();
+                if (run.stopped || self._pc_equal(pc, until) || self._emu_ended_early(slice)) {
+                    self.async_run = null;
+                    resolve();
+                    return;
+                }
+                // Scale the slice to the requested duration
+                if (slice_ms) {
+                    var scale = slice_ms / Math.max(elapsed, 1);
+                    slice = Math.max(Math.floor(slice * Math.min(scale, 10)), 1000);
+                }
+                uc._yield(step);
             };
-            MUnicorn._free(hook_ptr);
-            return hook
+            uc._yield(step);
+        });
+    },
+
+    emu_stop: function () {
+        if (this.async_run) {
+            this.async_run.stopped = true;
+        }
+        var ret = MUnicorn._uc_emu_stop(this.handle);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_emu_stop failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
+    },
 
-        this.hook_del = function (hook) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_hook_del', 'number',
-                ['pointer', 'pointer'],
-                [handle, hook.handle]
-            );
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_mem_unmap failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
-            }
-            MUnicorn.Runtime.removeFunction(hook.callback);
+    context_alloc: function () {
+        var context_ptr = this._scratch(4);
+        var ret = MUnicorn._uc_context_alloc(this.handle, context_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_context_alloc failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
+        var context = MUnicorn.HEAPU32[context_ptr >> 2];
+        this.contexts.push(context);
+        return context;
+    },
 
-        this.emu_start = function (begin, until, timeout, count) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_emu_start', 'number',
-                ['pointer', 'number', 'number', 'number', 'number', 'number', 'number', 'number'],
-                [handle, begin, 0, until, 0, timeout, 0, count]
-            );
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_emu_start failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
-            }
+    context_free: function (context) {
+        var ret = MUnicorn._uc_free(context);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_free failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        var index = this.contexts.indexOf(context);
+        if (index >= 0) {
+            this.contexts.splice(index, 1);
         }
+    },
 
-        this.emu_stop = function (begin, until, timeout, count) {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_emu_stop', 'number', ['pointer'], [handle]);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_emu_stop failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+    // Saves the CPU context, in a new context unless one is given
+    context_save: function (context) {
+        if (typeof context === 'undefined') {
+            context = this.context_alloc();
+        }
+        var ret = MUnicorn._uc_context_save(this.handle, context);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_context_save failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        return context;
+    },
+
+    context_restore: function (context) {
+        var ret = MUnicorn._uc_context_restore(this.handle, context);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_context_restore failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+
+    /**
+     * Saves the CPU context and the contents of all mapped memory. Pages
+     * written afterwards, by the guest or by mem_write, are tracked so that
+     * snapshot_restore copies back only those. Writes through the views of
+     * mem_map_ptr and mem_view cannot be tracked: memory with views is
+     * copied back entirely. Mapping and unmapping memory after the
+     * snapshot makes snapshot_restore fail with uc.ERR_MAP, while
+     * protection changes are allowed.
+     */
+    snapshot: function () {
+        var snapshot_ptr = this._scratch(4);
+        var ret = MUnicorn._ucjs_snapshot_take(this.handle, snapshot_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_snapshot_take failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        var snapshot = MUnicorn.HEAPU32[snapshot_ptr >> 2];
+        this.snapshots.push(snapshot);
+        return snapshot;
+    },
+
+    // Restores a snapshot. Returns the number of pages copied back.
+    snapshot_restore: function (snapshot) {
+        for (var i = 0; i < this.ptr_regions.length; i++) {
+            var region = this.ptr_regions[i];
+            if (region.viewed) {
+                MUnicorn._ucjs_snapshot_mark(snapshot, region.address, uc._high32(region.address), region.size);
             }
         }
+        var pages = MUnicorn._ucjs_snapshot_dirty(snapshot);
+        var ret = MUnicorn._ucjs_snapshot_restore(this.handle, snapshot);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_snapshot_restore failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        return pages;
+    },
+
+    snapshot_free: function (snapshot) {
+        var index = this.snapshots.indexOf(snapshot);
+        if (index < 0) {
+            return;
+        }
+        this.snapshots.splice(index, 1);
+        var ret = MUnicorn._ucjs_snapshot_free(this.handle, snapshot);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_snapshot_free failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
 
-        this.context_alloc = function () {
-            console.error('Unicorn.js: Contexts not implemented');
+    /**
+     * Returns a snapshot of the interpreter profiling counters of bundles
+     * built with `build.py --profiling`, or null in other bundles:
+     *  - ops, op_names:         Executions of each TCG opcode.
+     *  - helpers, helper_names: Calls of each helper.
+     *  - blocks:                3 values per block: guest PC, executions
+     *                           and translations.
+     *  - tlb_misses, tb_flushes
+     * Counts are stored in Float64Arrays, exact up to 2^53.
+     */
+    profile: function () {
+        if (typeof MUnicorn._ucjs_profile_get !== 'function') {
+            return null;
         }
+        var profile = MUnicorn._ucjs_profile_get(this.handle);
+        if (!profile) {
+            throw 'Unicorn.js: Profiling counters could not be allocated';
+        }
+        var heap = MUnicorn.HEAPU32;
+        var offset = uc._profile_offsets();
+        var u32 = function (address) {
+            return heap[address >> 2];
+        };
+        var u64 = function (address) {
+            return heap[address >> 2] + heap[(address >> 2) + 1] * 0x100000000;
+        };
+        var nb_ops = u32(profile + offset.nb_ops);
+        var helpers = u32(profile + offset.helpers);
+        var nb_helpers = u32(profile + offset.nb_helpers);
+        var blocks = u32(profile + offset.blocks);
+        var nb_blocks = u32(profile + offset.nb_blocks);
+        var result = {
+            ops: new Float64Array(nb_ops),
+            op_names: [],
+            helpers: new Float64Array(nb_helpers),
+            helper_names: [],
+            blocks: new Float64Array(3 * nb_blocks),
+            tlb_misses: u64(profile + offset.tlb_misses),
+            tb_flushes: u64(profile + offset.tb_flushes)
+        };
+        var i, block;
+        for (i = 0; i < nb_ops; i++) {
+            result.ops[i] = u64(profile + offset.ops + 8 * i);
+            result.op_names.push(MUnicorn.ccall('ucjs_profile_op_name', 'string',
+                ['number', 'number'], [profile, i]));
+        }
+        for (i = 0; i < nb_helpers; i++) {
+            result.helpers[i] = u64(helpers + offset.helper_size * i + offset.helper_calls);
+            result.helper_names.push(MUnicorn.ccall('ucjs_profile_helper_name', 'string',
+                ['number', 'number'], [profile, i]));
+        }
+        for (i = 0; i < nb_blocks; i++) {
+            block = blocks + offset.block_size * i;
+            result.blocks[3 * i] = u64(block + offset.block_pc);
+            result.blocks[3 * i + 1] = u64(block + offset.block_execs);
+            result.blocks[3 * i + 2] = u64(block + offset.block_translations);
+        }
+        return result;
+    },
 
-        this.context_free = function () {
-            console.error('Unicorn.js: Contexts not implemented');
+    // Clears the profiling counters
+    profile_reset: function () {
+        if (typeof MUnicorn._ucjs_profile_get !== 'function') {
+            return;
         }
+        var profile = MUnicorn._ucjs_profile_get(this.handle);
+        if (profile) {
+            MUnicorn._ucjs_profile_reset(profile);
+        }
+    },
+
+    /**
+     * Returns the memory held by the engine: bytes of mapped guest memory
+     * and number of regions, size and bytes used of the translation buffer,
+     * number of translated blocks and of buffer flushes, and bytes of the
+     * wrapper's transfer buffers. heap_size is the size of the Emscripten
+     * heap, which is shared by all engines.
+     */
+    memory_usage: function () {
+        var usage_ptr = this._scratch(28);
+        MUnicorn._ucjs_memory_usage_get(this.handle, usage_ptr);
+        var usage = MUnicorn.HEAPU32.subarray(usage_ptr >> 2, (usage_ptr >> 2) + 7);
+        return {
+            mapped: usage[0] + usage[1] * 0x100000000,
+            regions: usage[2],
+            tb_size: usage[3],
+            tb_used: usage[4],
+            tb_blocks: usage[5],
+            tb_flushes: usage[6],
+            buffers: this.scratch_len + this.batch_len,
+            heap_size: MUnicorn.HEAPU8.length
+        };
+    },
+
+    // Drops translated blocks, so code written since at the same addresses
+    // is translated again
+    tb_flush: function () {
+        MUnicorn._ucjs_tb_flush(this.handle);
+    },
 
-        this.context_save = function () {
-            console.error('Unicorn.js: Contexts not implemented');
+    errno: function() {
+        var ret = MUnicorn._uc_errno(this.handle);
+        return ret;
+    },
+
+    close: function() {
+        this._trace_close();
+        this.coverage_stop();
+        while (this.snapshots.length) {
+            this.snapshot_free(this.snapshots[0]);
+        }
+        var ret = MUnicorn._uc_close(this.handle);
+        this.handle = 0;
+        // uc_close frees the hooks, but not their callbacks
+        for (var i = 0; i < this.hooks.length; i++) {
+            MUnicorn.Runtime.removeFunction(this.hooks[i].callback);
+        }
+        this.hooks = [];
+        for (var i = 0; i < this.contexts.length; i++) {
+            MUnicorn._uc_free(this.contexts[i]);
+        }
+        this.contexts = [];
+        for (var i = 0; i < this.ptr_regions.length; i++) {
+            MUnicorn._free(this.ptr_regions[i].storage);
+        }
+        this.ptr_regions = [];
+        MUnicorn._free(this.scratch_ptr);
+        MUnicorn._free(this.batch_ptr);
+        this.scratch_ptr = 0;
+        this.scratch_len = 0;
+        this.batch_ptr = 0;
+        this.batch_len = 0;
+        MUnicorn._free(this.handle_cell);
+        this.handle_cell = 0;
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_close failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
+    },
 
-        this.context_restore = function () {
-            console.error('Unicorn.js: Contexts not implemented');
+    // Helpers
+    _pc_read: function () {
+        switch (this.arch) {
+            case uc.ARCH_ARM:
+                // Resume Thumb code with the lowest bit set
+                var pc = this.reg_read_i32(uc.ARM_REG_PC);
+                if (this.reg_read_i32(uc.ARM_REG_CPSR) & 0x20) {
+                    pc |= 1;
+                }
+                return pc >>> 0;
+            case uc.ARCH_ARM64:
+                return this._reg_read_u64(uc.ARM64_REG_PC);
+            case uc.ARCH_M68K:
+                return this.reg_read_i32(uc.M68K_REG_PC) >>> 0;
+            case uc.ARCH_MIPS:
+                return this.reg_read_i32(uc.MIPS_REG_PC) >>> 0;
+            case uc.ARCH_SPARC:
+                return this.reg_read_i32(uc.SPARC_REG_PC) >>> 0;
+            case uc.ARCH_X86:
+                if (this.mode & uc.MODE_64) {
+                    return this._reg_read_u64(uc.X86_REG_RIP);
+                }
+                if (this.mode & uc.MODE_16) {
+                    return this.reg_read_i16(uc.X86_REG_IP) & 0xFFFF;
+                }
+                return this.reg_read_i32(uc.X86_REG_EIP) >>> 0;
         }
+        throw 'Unicorn.js: Unsupported architecture';
+    },
+    // Whether the last emu_start stopped before running `count` instructions,
+    // as when the guest halts, or a native hook or an exception handled by a
+    // hook stops it. Libraries without ucjs_emu_counter cannot tell.
+    _emu_ended_early: function (count) {
+        return typeof MUnicorn._ucjs_emu_counter === 'function' &&
+            MUnicorn._ucjs_emu_counter(this.handle) <= count;
+    },
 
-        this.errno = function() {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_errno', 'number', ['pointer'], [handle]);
-            return ret;
+    // Compares a value of _pc_read with an `until` address
+    _pc_equal: function (pc, until) {
+        if (until <= 0xFFFFFFFF) {
+            until = until >>> 0;
         }
+        if (this.arch == uc.ARCH_ARM) {
+            // Ignore the Thumb bit
+            return ((pc & ~1) >>> 0) == ((until & ~1) >>> 0);
+        }
+        return pc == until;
+    },
+    // Reads a 64-bit register as an unsigned number, exact up to 2^53
+    _reg_read_u64: function (regid) {
+        var value_ptr = this._scratch(8);
+        MUnicorn.HEAPU32.fill(0, value_ptr >> 2, (value_ptr >> 2) + 2);
+        var ret = MUnicorn._uc_reg_read(this.handle, regid, value_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_read failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        return MUnicorn.HEAPU32[value_ptr >> 2] + MUnicorn.HEAPU32[(value_ptr >> 2) + 1] * 0x100000000;
+    },
+    _trace_close: function () {
+        var trace = this.trace;
+        if (!trace) {
+            return;
+        }
+        this.trace = null;
+        var ret = MUnicorn._ucjs_trace_close(this.handle, trace.ptr);
+        if (trace.flush) {
+            MUnicorn.Runtime.removeFunction(trace.flush);
+        }
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function ucjs_trace_close failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+    },
+    // Marks memory written directly in the Emscripten heap in all snapshots
+    _snapshots_mark: function (address, size) {
+        for (var i = 0; i < this.snapshots.length; i++) {
+            MUnicorn._ucjs_snapshot_mark(this.snapshots[i], address, uc._high32(address), size);
+        }
+    },
 
-        this.close = function() {
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_close', 'number', ['pointer'], [handle]);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_close failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
-            }
+    // Maps guest memory backed by page-aligned storage in the Emscripten
+    // heap, without clearing it, and returns its address in the heap
+    _mem_map_heap: function (address, size, perms) {
+        var storage = MUnicorn._malloc(size + 0xFFF);
+        if (!storage) {
+            throw 'Unicorn.js: Cannot allocate ' + size + ' bytes of guest memory';
+        }
+        var ptr = (storage + 0xFFF) & ~0xFFF;
+        var ret = MUnicorn._uc_mem_map_ptr(this.handle, address, uc._high32(address), size, perms, ptr);
+        if (ret != uc.ERR_OK) {
+            MUnicorn._free(storage);
+            var error = 'Unicorn.js: Function uc_mem_map_ptr failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
+        // Mapped pages of the region, and their number
+        var pages = new Uint8Array(Math.ceil(size / uc.Unicorn.PTR_PAGE_SIZE));
+        pages.fill(1);
+        this.ptr_regions.push({
+            address: address,
+            size: size,
+            pages: pages,
+            mapped: pages.length,
+            // Whether views were handed out, whose writes are not tracked
+            viewed: false,
+            storage: storage,
+            ptr: ptr
+        });
+        return ptr;
+    },
 
-        // Helpers
-        this._sizeof = function (type) {
-            switch (type) {
-                case 'i8':     return 1;
-                case 'i16':    return 2;
-                case 'i32':    return 4;
-                case 'i64':    return 8;
-                case 'float':  return 4;
-                case 'double': return 8;
-                default:       return 0;
-            }
+    _scratch: function (size) {
+        if (size > this.scratch_len) {
+            MUnicorn._free(this.scratch_ptr);
+            // Grow at least twofold to avoid reallocating on every larger transfer
+            var len = Math.max(size, Math.min(2 * this.scratch_len, uc.Unicorn.SCRATCH_LIMIT), 0x1000);
+            this.scratch_ptr = MUnicorn._malloc(len);
+            this.scratch_len = len;
         }
-        this.reg_write_type = function (regid, type, value) {
-            // Allocate space for the output value
-            var value_size = this._sizeof(type);
-            var value_ptr = MUnicorn._malloc(value_size);
-            MUnicorn.setValue(value_ptr, value, type);
-            // Register write
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_reg_write', 'number',
-                ['pointer', 'number', 'pointer'],
-                [handle, regid, value_ptr]
-            );
-            // Free memory and handle return code
-            MUnicorn._free(value_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_reg_write failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
+        return this.scratch_ptr;
+    },
+    _batch: function (regids, type) {
+        this._batch_heap(type);
+        var count = regids.length;
+        var slot_size = uc.Unicorn.BATCH_SLOT_SIZE;
+        if (count > this.batch_len) {
+            MUnicorn._free(this.batch_ptr);
+            var len = Math.max(count, 2 * this.batch_len, 32);
+            this.batch_ptr = MUnicorn._malloc(len * (8 + slot_size));
+            this.batch_len = len;
+            // Value pointers never change for a given buffer
+            var slots_ptr = this.batch_ptr + 8 * len;
+            for (var i = 0; i < len; i++) {
+                MUnicorn.HEAPU32[(this.batch_ptr + 4 * (len + i)) >> 2] = slots_ptr + slot_size * i;
             }
         }
-        this.reg_write_i8     = function (regid, value) { this.reg_write_type(regid, 'i8', value); }
-        this.reg_write_i16    = function (regid, value) { this.reg_write_type(regid, 'i16', value); }
-        this.reg_write_i32    = function (regid, value) { this.reg_write_type(regid, 'i32', value); }
-        this.reg_write_i64    = function (regid, value) { this.reg_write_type(regid, 'i64', value); }
-        this.reg_write_float  = function (regid, value) { this.reg_write_type(regid, 'float', value); }
-        this.reg_write_double = function (regid, value) { this.reg_write_type(regid, 'double', value); }
-
-        this.reg_read_type = function (regid, type) {
-            // Allocate space for the output value
-            var value_size = this._sizeof(type);
-            var value_ptr = MUnicorn._malloc(value_size);
-            MUnicorn.setValue(value_ptr, 0, type);
-
-            // Register read
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_reg_read', 'number',
-                ['pointer', 'number', 'pointer'],
-                [handle, regid, value_ptr]
-            );
-            // Get register value, free memory and handle return code
-            var value = MUnicorn.getValue(value_ptr, type);
-            MUnicorn._free(value_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_reg_read failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
-            }
-            return value;
-        }
-        this.reg_read_i8      = function (regid) { return this.reg_read_type(regid, 'i8'); }
-        this.reg_read_i16     = function (regid) { return this.reg_read_type(regid, 'i16'); }
-        this.reg_read_i32     = function (regid) { return this.reg_read_type(regid, 'i32'); }
-        this.reg_read_i64     = function (regid) { return this.reg_read_type(regid, 'i64'); }
-        this.reg_read_float   = function (regid) { return this.reg_read_type(regid, 'float'); }
-        this.reg_read_double  = function (regid) { return this.reg_read_type(regid, 'double'); }
-
-        this.query_type = function (query_type, result_type) {
-            // Allocate space for the output value
-            var result_size = this._sizeof(result_type);
-            var result_ptr = MUnicorn._malloc(result_size);
-            MUnicorn.setValue(value_ptr, 0, result_type);
-            // Make query
-            var handle = MUnicorn.getValue(this.handle_ptr, '*');
-            var ret = MUnicorn.ccall('uc_query', 'number',
-                ['pointer', 'number', 'pointer'],
-                [handle, query_type, result_ptr]
-            );
-            // Get result value, free memory and handle return code
-            var result = MUnicorn.getValue(result_ptr, result_type);
-            MUnicorn._free(result_ptr);
-            if (ret != uc.ERR_OK) {
-                var error = 'Unicorn.js: Function uc_query failed with code ' + ret + ':\n' + uc.strerror(ret);
-                throw error;
-            }
-            return result;
+        MUnicorn.HEAP32.set(regids, this.batch_ptr >> 2);
+        // Clear the value slots
+        var values_ptr = this.batch_ptr + 8 * this.batch_len;
+        MUnicorn.HEAPU8.fill(0, values_ptr, values_ptr + slot_size * count);
+        return values_ptr;
+    },
+    _batch_heap: function (type) {
+        switch (type) {
+            case 'i8':     return MUnicorn.HEAP8;
+            case 'i16':    return MUnicorn.HEAP16;
+            case 'i32':    return MUnicorn.HEAP32;
+            case 'i64':    return MUnicorn.HEAPU32;
+            case 'float':  return MUnicorn.HEAPF32;
+            case 'double': return MUnicorn.HEAPF64;
+            default:
+                throw 'Unicorn.js: Unsupported register batch type: ' + type;
+        }
+    },
+    _sizeof: function (type) {
+        switch (type) {
+            case 'i8':     return 1;
+            case 'i16':    return 2;
+            case 'i32':    return 4;
+            case 'i64':    return 8;
+            case 'float':  return 4;
+            case 'double': return 8;
+            default:       return 0;
+        }
+    },
+    reg_write_type: function (regid, type, value) {
+        var value_ptr = this._scratch(8);
+        MUnicorn.setValue(value_ptr, value, type);
+        var ret = MUnicorn._uc_reg_write(this.handle, regid, value_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_write failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
         }
-        this.query_i8      = function (type) { return this.query_type(type, 'i8'); }
-        this.query_i16     = function (type) { return this.query_type(type, 'i16'); }
-        this.query_i32     = function (type) { return this.query_type(type, 'i32'); }
-        this.query_i64     = function (type) { return this.query_type(type, 'i64'); }
-        this.query_float   = function (type) { return this.query_type(type, 'float'); }
-        this.query_double  = function (type) { return this.query_type(type, 'double'); }
+    },
+    reg_write_i8:     function (regid, value) { this.reg_write_type(regid, 'i8', value); },
+    reg_write_i16:    function (regid, value) { this.reg_write_type(regid, 'i16', value); },
+    reg_write_i32:    function (regid, value) { this.reg_write_type(regid, 'i32', value); },
+    reg_write_i64:    function (regid, value) { this.reg_write_type(regid, 'i64', value); },
+    reg_write_float:  function (regid, value) { this.reg_write_type(regid, 'float', value); },
+    reg_write_double: function (regid, value) { this.reg_write_type(regid, 'double', value); },
 
+    reg_read_type: function (regid, type) {
+        // Registers wider than the type are written whole, so clear a full slot
+        var value_ptr = this._scratch(uc.Unicorn.BATCH_SLOT_SIZE);
+        MUnicorn.HEAPU8.fill(0, value_ptr, value_ptr + uc.Unicorn.BATCH_SLOT_SIZE);
+        var ret = MUnicorn._uc_reg_read(this.handle, regid, value_ptr);
+        if (ret != uc.ERR_OK) {
+            var error = 'Unicorn.js: Function uc_reg_read failed with code ' + ret + ':\n' + uc.strerror(ret);
+            throw error;
+        }
+        return MUnicorn.getValue(value_ptr, type);
+    },
+    reg_read_i8:      function (regid) { return this.reg_read_type(regid, 'i8'); },
+    reg_read_i16:     function (regid) { return this.reg_read_type(regid, 'i16'); },
+    reg_read_i32:     function (regid) { return this.reg_read_type(regid, 'i32'); },
+    reg_read_i64:     function (regid) { return this.reg_read_type(regid, 'i64'); },
+    reg_read_float:   function (regid) { return this.reg_read_type(regid, 'float'); },
+    reg_read_double:  function (regid) { return this.reg_read_type(regid, 'double'); },
 
-        // Constructor
-        var ret = MUnicorn.ccall('uc_open', 'number',
-            ['number', 'number', 'pointer'],
-            [this.arch, this.mode, this.handle_ptr]
-        );
+    query_type: function (query_type, result_type) {
+        var result_ptr = this._scratch(8);
+        MUnicorn.setValue(result_ptr, 0, result_type);
+        var ret = MUnicorn._uc_query(this.handle, query_type, result_ptr);
         if (ret != uc.ERR_OK) {
-            MUnicorn.setValue(this.handle_ptr, 0, '*');
-            var error = 'Unicorn.js: Function uc_open failed with code ' + ret + ':\n' + uc.strerror(ret);
+            var error = 'Unicorn.js: Function uc_query failed with code ' + ret + ':\n' + uc.strerror(ret);
             throw error;
         }
-    }
+        return MUnicorn.getValue(result_ptr, result_type);
+    },
+    query_i8:      function (type) { return this.query_type(type, 'i8'); },
+    query_i16:     function (type) { return this.query_type(type, 'i16'); },
+    query_i32:     function (type) { return this.query_type(type, 'i32'); },
+    query_i64:     function (type) { return this.query_type(type, 'i64'); },
+    query_float:   function (type) { return this.query_type(type, 'float'); },
+    query_double:  function (type) { return this.query_type(type, 'double'); }
 };
+
+// Deprecated: pointer to a word in the Emscripten heap holding the engine
+// handle, as used by code written against earlier versions of the wrapper.
+// New code should use this.handle.
+Object.defineProperty(uc.Unicorn.prototype, 'handle_ptr', {
+    get: function () {
+        if (!this.handle_cell) {
+            this.handle_cell = MUnicorn._malloc(4);
+        }
+        MUnicorn.HEAPU32[this.handle_cell >> 2] = this.handle;
+        return this.handle_cell;
+    }
+});
@@ -0,0 +1,110 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Helpers shared by the tests in test/test-*.js.
+ */
+
+'use strict';
+
+var fs = require('fs');
+var path = require('path');
+var vm = require('vm');
+
+// Bundles under test, built by `grunt build` or `grunt release`
+var DIST_DIR = process.env.UNICORN_DIST || path.join(__dirname, '..', 'dist');
+
+// Thrown by skip() to mark a test as skipped
+function Skip(reason) {
+    this.reason = reason;
+}
+
+function skip(reason) {
+    throw new Skip(reason);
+}
+
+function createContext(globals) {
+    var context = {
+        console: console,
+        process: process,
+        require: require,
+        setImmediate: setImmediate,
+        setTimeout: setTimeout,
+        clearTimeout: clearTimeout
+    };
+    Object.keys(globals || {}).forEach(function (name) {
+        context[name] = globals[name];
+    });
+    return vm.createContext(context);
+}
+
+/**
+ * Evaluates dist/unicorn-<arch>.min.js (or dist/unicorn.min.js without an
+ * architecture) in its own context, and returns its `uc` object. Skips the
+ * calling test if the bundle was not built.
+ */
+var bundles = {};
+function loadBundle(arch) {
+    var file = path.join(DIST_DIR, 'unicorn' + (arch ? '-' + arch : '') + '.min.js');
+    if (!(file in bundles)) {
+        if (!fs.existsSync(file)) {
+            skip(path.basename(file) + ' not built');
+        }
+        var context = createContext();
+        vm.runInContext(fs.readFileSync(file, 'utf8'), context, {filename: file});
+        bundles[file] = {uc: context.uc, module: context.MUnicorn};
+    }
+    return bundles[file];
+}
+
+/**
+ * Returns the `uc` object of a bundle whose wrapper has all of the given
+ * Unicorn methods and whose library exports all of the given C functions.
+ * Bundles built before a feature was added skip the calling test.
+ */
+function requireBundle(arch, methods, exports) {
+    var bundle = loadBundle(arch);
+    (methods || []).forEach(function (name) {
+        if (typeof bundle.uc.Unicorn.prototype[name] !== 'function') {
+            skip('bundle predates Unicorn.' + name);
+        }
+    });
+    (exports || []).forEach(function (name) {
+        if (typeof bundle.module['_' + name] !== 'function') {
+            skip('bundle does not export ' + name);
+        }
+    });
+    return bundle.uc;
+}
+
+/**
+ * Evaluates src/unicorn-wrapper.js and the constants against a stand-in for
+ * the Emscripten module, and returns the context. Used to test the parts of
+ * the wrapper that do not depend on the emulator.
+ */
+function loadWrapper(Module) {
+    var context = createContext({MUnicorn: Module});
+    ['unicorn-wrapper.js', 'unicorn-constants.js'].forEach(function (name) {
+        var file = path.join(__dirname, '..', 'src', name);
+        vm.runInContext(fs.readFileSync(file, 'utf8'), context, {filename: file});
+    });
+    return context;
+}
+
+function hexToBytes(hex) {
+    hex = hex.replace(/\s+/g, '');
+    var bytes = new Uint8Array(hex.length / 2);
+    for (var i = 0; i < bytes.length; i++) {
+        bytes[i] = parseInt(hex.substr(2 * i, 2), 16);
+    }
+    return bytes;
+}
+
+module.exports = {
+    DIST_DIR: DIST_DIR,
+    Skip: Skip,
+    skip: skip,
+    createContext: createContext,
+    loadBundle: loadBundle,
+    requireBundle: requireBundle,
+    loadWrapper: loadWrapper,
+    hexToBytes: hexToBytes
+};
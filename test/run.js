@@ -0,0 +1,66 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Runs the tests in test/test-*.js. Each file exports named test functions,
+ * which may return a Promise. Tests that need a feature missing from the
+ * bundles in dist/ are skipped.
+ *
+ * Usage: node test/run.js [filter]
+ */
+
+'use strict';
+
+var fs = require('fs');
+var path = require('path');
+
+var common = require('./common.js');
+
+var filter = process.argv[2] || '';
+var tests = [];
+fs.readdirSync(__dirname).sort().forEach(function (file) {
+    if (!/^test-.*\.js$/.test(file)) {
+        return;
+    }
+    var suite = require(path.join(__dirname, file));
+    Object.keys(suite).forEach(function (name) {
+        var id = file.replace(/\.js$/, '') + ': ' + name;
+        if (id.indexOf(filter) !== -1) {
+            tests.push({id: id, run: suite[name]});
+        }
+    });
+});
+
+var passed = 0, skipped = 0, failed = 0;
+function next(index) {
+    if (index == tests.length) {
+        console.log('\n%d passed, %d skipped, %d failed', passed, skipped, failed);
+        process.exit(failed ? 1 : 0);
+    }
+    var test = tests[index];
+    var done = function (error) {
+        if (!error) {
+            passed++;
+            console.log('ok   ' + test.id);
+        } else if (error instanceof common.Skip) {
+            skipped++;
+            console.log('skip ' + test.id + ' (' + error.reason + ')');
+        } else {
+            failed++;
+            console.log('FAIL ' + test.id);
+            console.log('     ' + String(error && error.stack || error).replace(/\n/g, '\n     '));
+        }
+        next(index + 1);
+    };
+    var result;
+    try {
+        result = test.run();
+    } catch (error) {
+        done(error);
+        return;
+    }
+    if (result && typeof result.then === 'function') {
+        result.then(function () { done(null); }, function (error) { done(error || 'rejected'); });
+    } else {
+        done(null);
+    }
+}
+next(0);
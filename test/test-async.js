@@ -0,0 +1,87 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * emu_start_async must end in the same state as emu_start, and resolve when
+ * the guest stops before `until`.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// Counting loops of 100000 iterations, resumed many times by small slices
+var LOOPS = {
+    x86: {
+        arch: 'ARCH_X86', mode: 'MODE_32', address: 0x10000,
+        // xor eax, eax; mov ecx, 100000; l: inc eax; dec ecx; jnz l
+        code: '31c0 b9a0860100 40 49 75fc',
+        regs: ['X86_REG_EAX', 'X86_REG_ECX', 'X86_REG_EIP'],
+        result: 'X86_REG_EAX'
+    },
+    x86_64: {
+        arch: 'ARCH_X86', mode: 'MODE_64', address: 0x100000000,
+        // xor eax, eax; mov ecx, 100000; l: inc rax; dec ecx; jnz l
+        code: '31c0 b9a0860100 48ffc0 ffc9 75f9',
+        regs: ['X86_REG_RAX', 'X86_REG_RCX', 'X86_REG_RIP'],
+        result: 'X86_REG_RAX'
+    },
+    aarch64: {
+        arch: 'ARCH_ARM64', mode: 'MODE_ARM', address: 0x100000000,
+        // mov x0, #0; mov w1, #100000; l: add x0, x0, #1; subs w1, w1, #1; b.ne l
+        code: '000080d2 01d49052 2100a072 00040091 21040071 c1ffff54',
+        regs: ['ARM64_REG_X0', 'ARM64_REG_X1', 'ARM64_REG_PC'],
+        result: 'ARM64_REG_X0'
+    }
+};
+
+function run(uc, spec, async) {
+    var e = new uc.Unicorn(uc[spec.arch], uc[spec.mode]);
+    var code = common.hexToBytes(spec.code);
+    var end = spec.address + code.length;
+    var regids = spec.regs.map(function (name) { return uc[name]; });
+    e.mem_map(spec.address, 0x1000, uc.PROT_ALL);
+    e.mem_write(spec.address, code);
+    var finish = function () {
+        var regs = Array.prototype.slice.call(e.reg_read_batch(regids, 'i64'));
+        e.close();
+        return regs;
+    };
+    if (!async) {
+        e.emu_start(spec.address, end, 0, 0);
+        return Promise.resolve(finish());
+    }
+    return e.emu_start_async(spec.address, end, {sliceInstructions: 1000}).then(finish);
+}
+
+function compare(arch, name) {
+    return function () {
+        var uc = common.requireBundle(arch, ['emu_start_async', 'reg_read_batch']);
+        var spec = LOOPS[name];
+        return run(uc, spec, false).then(function (sync) {
+            return run(uc, spec, true).then(function (async) {
+                assert.strictEqual(sync[0], 100000, 'loop result');
+                assert.strictEqual(sync[2], spec.address + common.hexToBytes(spec.code).length);
+                assert.deepEqual(async, sync);
+            });
+        });
+    };
+}
+
+module.exports = {
+    'x86 loop ends in the same state': compare('x86', 'x86'),
+    'x86-64 loop above 4 GB ends in the same state': compare('x86', 'x86_64'),
+    'aarch64 loop above 4 GB ends in the same state': compare('aarch64', 'aarch64'),
+
+    'guests halting before until resolve': function () {
+        var uc = common.requireBundle('x86', ['emu_start_async'], ['ucjs_emu_counter']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        // The x86 loop, then hlt, far from `until`
+        var code = common.hexToBytes(LOOPS.x86.code + 'f4');
+        e.mem_map(0x10000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x10000, code);
+        return e.emu_start_async(0x10000, 0x10800, {sliceInstructions: 1000}).then(function () {
+            assert.strictEqual(e.reg_read_i32(uc.X86_REG_EAX), 100000);
+            e.close();
+        });
+    }
+};
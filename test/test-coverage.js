@@ -0,0 +1,45 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Edge coverage bitmap.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// mov ecx, 3; l: dec ecx; jnz l
+var LOOP = common.hexToBytes('b903000000 49 75fd');
+
+function edges(bitmap) {
+    var count = 0;
+    for (var i = 0; i < bitmap.length; i++) {
+        count += (bitmap[i] != 0);
+    }
+    return count;
+}
+
+module.exports = {
+    'edges are counted until reset': function () {
+        var uc = common.requireBundle('x86', ['coverage_start'], ['ucjs_coverage_open']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, LOOP);
+        var bitmap = e.coverage_start();
+        assert.strictEqual(bitmap.length, uc.Unicorn.COVERAGE_SIZE);
+        e.emu_start(0x1000, 0x1000 + LOOP.length, 0, 0);
+        // Entry into the first block, then into the loop, and the loop edge
+        assert.strictEqual(edges(e.coverage_bitmap()), 3);
+        assert.strictEqual(e.coverage_new_bits(), 3);
+        e.coverage_reset();
+        assert.strictEqual(edges(e.coverage_bitmap()), 0);
+        e.emu_start(0x1000, 0x1000 + LOOP.length, 0, 0);
+        assert.strictEqual(e.coverage_new_bits(), 0);
+        e.coverage_reset(true);
+        e.emu_start(0x1000, 0x1000 + LOOP.length, 0, 0);
+        assert.strictEqual(e.coverage_new_bits(), 3);
+        e.coverage_stop();
+        assert.strictEqual(e.coverage_bitmap(), null);
+        e.close();
+    }
+};
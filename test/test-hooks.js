@@ -0,0 +1,66 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Hooks looked up by address range, and deleted while hooks run.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// str r0, [r1]; str r0, [r1, #4]; mov r0, r0
+var CODE = common.hexToBytes('000081e5 040081e5 0000a0e1');
+
+// Only libraries built with the hook index are tested: they are the ones
+// exporting ucjs_open, which came after it. Older ones scan every hook and
+// free hooks deleted by callbacks while hook loops still use them.
+function engine() {
+    var uc = common.requireBundle('arm', [], ['ucjs_open']);
+    var e = new uc.Unicorn(uc.ARCH_ARM, uc.MODE_ARM);
+    e.mem_map(0x1000, 0x2000, uc.PROT_ALL);
+    e.mem_write(0x1000, CODE);
+    e.reg_write_i32(uc.ARM_REG_R1, 0x2000);
+    return {uc: uc, e: e};
+}
+
+module.exports = {
+    'hooks only see addresses in their range': function () {
+        var t = engine();
+        var code = [], writes = [];
+        t.e.hook_add(t.uc.HOOK_CODE, function (e, address) { code.push(address); }, {}, 0x1004, 0x1007);
+        t.e.hook_add(t.uc.HOOK_MEM_WRITE, function (e, type, address) { writes.push(address); }, {}, 0x2004, 0x2fff);
+        t.e.emu_start(0x1000, 0x1000 + CODE.length, 0, 0);
+        assert.deepEqual(code, [0x1004]);
+        assert.deepEqual(writes, [0x2004]);
+        t.e.close();
+    },
+
+    'hooks deleted by callbacks stop without skipping others': function () {
+        var t = engine();
+        var code = [0, 0, 0], writes = [0, 0, 0];
+        var code_hooks = [], write_hooks = [];
+        function on_code(e, address_lo, address_hi, size, i) {
+            code[i]++;
+            // The first code hook deletes an unrelated write hook on the first instruction
+            if (i == 0 && code[0] == 1) {
+                e.hook_del(write_hooks[2]);
+            }
+        }
+        function on_write(e, type, address_lo, address_hi, size, value_lo, value_hi, i) {
+            writes[i]++;
+            // The first write hook deletes an unrelated code hook, then itself
+            if (i == 0 && writes[0] == 1) {
+                e.hook_del(code_hooks[2]);
+                e.hook_del(write_hooks[0]);
+            }
+        }
+        for (var i = 0; i < 3; i++) {
+            code_hooks.push(t.e.hook_add(t.uc.HOOK_CODE, on_code, i));
+            write_hooks.push(t.e.hook_add(t.uc.HOOK_MEM_WRITE, on_write, i));
+        }
+        t.e.emu_start(0x1000, 0x1000 + CODE.length, 0, 0);
+        assert.deepEqual(code, [3, 3, 1]);
+        assert.deepEqual(writes, [1, 2, 0]);
+        t.e.close();
+    }
+};
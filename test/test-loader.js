@@ -0,0 +1,107 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Loader fetching the library of each architecture on demand.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var fs = require('fs');
+var os = require('os');
+var path = require('path');
+var vm = require('vm');
+var common = require('./common.js');
+
+// Evaluates src/unicorn-loader.js and the core constants, as bundled in
+// dist/unicorn-loader.min.js, as if it was in directory dir
+function loader(dir) {
+    var context = common.createContext({__dirname: dir, module: {}});
+    ['unicorn-loader.js', 'unicorn-constants-core.js'].forEach(function (name) {
+        var file = path.join(__dirname, '..', 'src', name);
+        vm.runInContext(fs.readFileSync(file, 'utf8'), context, {filename: file});
+    });
+    return context.uc;
+}
+
+// Writes a stand-in library for ARM, whose engines record their arguments
+function library(dir, extra) {
+    fs.writeFileSync(path.join(dir, 'unicorn-arm.min.js'),
+        'var uc = {ARCH_ARM: 1, MODE_ARM: 0, ARM_REG_R0: 66,\n' +
+        '    options: MUnicornOptions,\n' +
+        '    Unicorn: function (arch, mode, options) { this.arch = arch; this.mode = mode; this.options = options; },\n' +
+        '    load_image: function (engine, buffer) { return buffer.length; }};\n' + (extra || ''));
+}
+
+function tempDir() {
+    return fs.mkdtempSync(path.join(os.tmpdir(), 'unicornjs-'));
+}
+
+module.exports = {
+    'libraries are loaded once and their constants added': function () {
+        var dir = tempDir();
+        library(dir);
+        var uc = loader(dir);
+        assert.strictEqual(uc.base, dir + '/');
+        assert.strictEqual(uc.ARM_REG_R0, undefined);
+        assert.strictEqual(uc.loaded(uc.ARCH_ARM), false);
+        assert.throws(function () { new uc.Unicorn(uc.ARCH_ARM, uc.MODE_ARM); }, /not loaded/);
+        var loading = uc.load(uc.ARCH_ARM);
+        assert.strictEqual(uc.load(uc.ARCH_ARM), loading);
+        var first;
+        return loading.then(function (arm) {
+            first = arm;
+            assert.strictEqual(uc.ARM_REG_R0, 66);
+            // Core constants of the loader are kept
+            assert.strictEqual(uc.ARCH_ARM, 1);
+            assert.strictEqual(uc.loaded(uc.ARCH_ARM), true);
+            assert.strictEqual(arm.options.locateFile('unicorn-arm.wasm'), dir + '/unicorn-arm.wasm');
+            var e = new uc.Unicorn(uc.ARCH_ARM, uc.MODE_ARM, {tb_size: 1 << 20});
+            assert.ok(e instanceof arm.Unicorn);
+            assert.deepEqual([e.arch, e.mode, e.options.tb_size], [uc.ARCH_ARM, uc.MODE_ARM, 1 << 20]);
+            assert.strictEqual(uc.load_image(e, [1, 2, 3]), 3);
+            return uc.open(uc.ARCH_ARM, uc.MODE_ARM);
+        }).then(function (e) {
+            assert.strictEqual(e.arch, uc.ARCH_ARM);
+            return uc.load(uc.ARCH_ARM);
+        }).then(function (arm) {
+            assert.strictEqual(arm, first);
+        });
+    },
+
+    'libraries are returned once ready': function () {
+        var dir = tempDir();
+        library(dir, 'var callbacks = []; uc.ready = function (callback) { callbacks.push(callback); };\n' +
+            'setTimeout(function () { uc.initialized = true; callbacks.forEach(function (f) { f(); }); }, 10);\n');
+        var uc = loader(dir);
+        return uc.load(uc.ARCH_ARM).then(function (arm) {
+            assert.strictEqual(arm.initialized, true);
+        });
+    },
+
+    'failed loads can be retried': function () {
+        var dir = tempDir();
+        var uc = loader(dir);
+        assert.throws(function () { uc.load(1234); }, /Unsupported architecture/);
+        return uc.load(uc.ARCH_ARM).then(function () {
+            throw new Error('loaded a missing library');
+        }, function (error) {
+            assert.ok(/Could not load .*unicorn-arm\.min\.js/.test(error));
+            library(dir);
+            return uc.load(uc.ARCH_ARM);
+        }).then(function (arm) {
+            assert.strictEqual(arm.ARM_REG_R0, 66);
+        });
+    },
+
+    'engines of dist libraries run code': function () {
+        common.loadBundle('arm');
+        var uc = loader(common.DIST_DIR);
+        return uc.open(uc.ARCH_ARM, uc.MODE_ARM).then(function (e) {
+            e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+            e.mem_write(0x1000, common.hexToBytes('2a00a0e3'));     // mov r0, #42
+            e.emu_start(0x1000, 0x1004, 0, 0);
+            assert.strictEqual(e.reg_read_i32(uc.ARM_REG_R0), 42);
+            e.close();
+        });
+    }
+};
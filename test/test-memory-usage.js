@@ -0,0 +1,63 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Per-engine translation buffer size and memory usage counters.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+module.exports = {
+    'tb_size is passed to ucjs_open and counters are decoded': function () {
+        var heap = new ArrayBuffer(0x1000);
+        var opened = [];
+        var Module = {
+            HEAPU8: new Uint8Array(heap),
+            HEAPU32: new Uint32Array(heap),
+            _malloc: function () { return 0x100; },
+            _free: function () {},
+            _ucjs_open: function (arch, mode, tb_size, handle_ptr) {
+                opened.push(tb_size);
+                Module.HEAPU32[handle_ptr >> 2] = 1;
+                return 0;
+            },
+            _ucjs_memory_usage_get: function (handle, usage_ptr) {
+                // mapped (low, high), regions, tb_size, tb_used, tb_blocks, tb_flushes
+                Module.HEAPU32.set([0x1000, 1, 2, 0x100000, 0x400, 3, 4], usage_ptr >> 2);
+            }
+        };
+        var uc = common.loadWrapper(function () { return Module; }).uc;
+        new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32, {tb_size: 1 << 20});
+        assert.deepEqual(opened, [0, 1 << 20]);
+        var usage = e.memory_usage();
+        assert.strictEqual(usage.mapped, 0x100001000);
+        assert.strictEqual(usage.regions, 2);
+        assert.strictEqual(usage.tb_size, 0x100000);
+        assert.strictEqual(usage.tb_used, 0x400);
+        assert.strictEqual(usage.tb_blocks, 3);
+        assert.strictEqual(usage.tb_flushes, 4);
+        assert.strictEqual(usage.buffers, e.scratch_len + e.batch_len);
+        assert.strictEqual(usage.heap_size, 0x1000);
+    },
+
+    'engines use the translation buffer size they ask for': function () {
+        var uc = common.requireBundle('x86', ['memory_usage'], ['ucjs_open']);
+        var small = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32, {tb_size: 1 << 20});
+        var large = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        small.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        // mov ecx, 3; l: dec ecx; jnz l
+        small.mem_write(0x1000, common.hexToBytes('b903000000 49 75fd'));
+        small.emu_start(0x1000, 0x1008, 0, 0);
+        var usage = small.memory_usage();
+        assert.strictEqual(usage.mapped, 0x1000);
+        assert.strictEqual(usage.regions, 1);
+        // QEMU keeps a guard area at the end of the buffer
+        assert.ok(usage.tb_size > 0 && usage.tb_size <= 1 << 20);
+        assert.ok(large.memory_usage().tb_size > 1 << 20);
+        assert.strictEqual(large.memory_usage().mapped, 0);
+        small.close();
+        large.close();
+    }
+};
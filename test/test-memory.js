@@ -0,0 +1,94 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Guest memory backed by the Emscripten heap: mem_map_ptr, mem_view and
+ * load_image.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// ELF64 x86-64 executable loading its own file at address, with a page of
+// BSS after it, and starting with code after the headers
+function elf64(address, code) {
+    var bytes = new Uint8Array(0x78 + code.length);
+    var view = new DataView(bytes.buffer);
+    var set64 = function (offset, value) {
+        view.setUint32(offset, value % 0x100000000, true);
+        view.setUint32(offset + 4, Math.floor(value / 0x100000000), true);
+    };
+    bytes.set([0x7F, 0x45, 0x4C, 0x46, 2, 1, 1]);
+    view.setUint16(16, 2, true);            // ET_EXEC
+    view.setUint16(18, 62, true);           // EM_X86_64
+    view.setUint32(20, 1, true);
+    set64(24, address + 0x78);              // Entry point
+    set64(32, 0x40);                        // Program headers
+    view.setUint16(52, 0x40, true);
+    view.setUint16(54, 0x38, true);
+    view.setUint16(56, 1, true);
+    view.setUint32(0x40, 1, true);          // PT_LOAD
+    view.setUint32(0x44, 7, true);          // PF_R | PF_W | PF_X
+    set64(0x50, address);
+    set64(0x60, bytes.length);
+    set64(0x68, 0x2000);
+    bytes.set(code, 0x78);
+    return bytes;
+}
+
+function engine() {
+    var uc = common.requireBundle('x86', ['mem_map_ptr', 'mem_view'], ['uc_mem_map_ptr']);
+    return {uc: uc, e: new uc.Unicorn(uc.ARCH_X86, uc.MODE_32)};
+}
+
+module.exports = {
+    'views alias guest memory': function () {
+        var t = engine();
+        var view = t.e.mem_map_ptr(0x10000, 0x2000, t.uc.PROT_ALL);
+        view[0x1234] = 0x5a;
+        assert.strictEqual(t.e.mem_read(0x11234, 1)[0], 0x5a);
+        t.e.mem_write(0x10010, [1, 2]);
+        assert.deepEqual(Array.prototype.slice.call(t.e.mem_view(0x10010, 2)), [1, 2]);
+        t.e.close();
+    },
+
+    'partly unmapped ranges have no view': function () {
+        var t = engine();
+        t.e.mem_map_ptr(0x10000, 0x3000, t.uc.PROT_ALL);
+        t.e.mem_unmap(0x11000, 0x1000);
+        assert.strictEqual(t.e.mem_view(0x10000, 0x3000), null);
+        assert.strictEqual(t.e.mem_view(0x11000, 0x10), null);
+        assert.ok(t.e.mem_view(0x10000, 0x1000));
+        assert.ok(t.e.mem_view(0x12000, 0x1000));
+        t.e.close();
+    },
+
+    'storage outlives unmapping a range mapped again': function () {
+        var t = engine();
+        t.e.mem_map_ptr(0x10000, 0x3000, t.uc.PROT_ALL);
+        t.e.mem_unmap(0x11000, 0x1000);
+        t.e.mem_map(0x11000, 0x1000, t.uc.PROT_ALL);
+        t.e.mem_unmap(0x11000, 0x1000);
+        // The first and last pages are still mapped by mem_map_ptr
+        assert.strictEqual(t.e.ptr_regions.length, 1);
+        t.e.mem_write(0x12ffc, [1, 2, 3, 4]);
+        assert.deepEqual(Array.prototype.slice.call(t.e.mem_view(0x12ffc, 4)), [1, 2, 3, 4]);
+        t.e.mem_unmap(0x10000, 0x1000);
+        t.e.mem_unmap(0x12000, 0x1000);
+        assert.strictEqual(t.e.ptr_regions.length, 0);
+        t.e.close();
+    },
+
+    'ELF64 images are loaded above 4 GB': function () {
+        var uc = common.requireBundle('x86', ['mem_map_ptr'], ['uc_mem_map_ptr']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_64);
+        // mov eax, 42; mov [rip + 0x1000], eax
+        var code = common.hexToBytes('b82a000000 890500100000');
+        var entry = uc.load_image(e, elf64(0x200000000, code));
+        assert.strictEqual(entry, 0x200000078);
+        e.emu_start(entry, entry + code.length, 0, 0);
+        assert.deepEqual(Array.prototype.slice.call(e.mem_read(entry + code.length + 0x1000, 4)), [42, 0, 0, 0]);
+        assert.deepEqual(Array.prototype.slice.call(e.mem_view(0x200000000, 4)), [0x7F, 0x45, 0x4C, 0x46]);
+        e.close();
+    }
+};
@@ -0,0 +1,133 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Worker pool running jobs on engines that are reset between jobs.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var path = require('path');
+var common = require('./common.js');
+var UnicornPool = require('../src/unicorn-pool.js');
+
+// mov eax, [0x2000]; add eax, ebx; mov [0x2004], eax
+var CODE = common.hexToBytes('a100200000 01d8 a304200000');
+// The same, with sub eax, ebx
+var SUB_CODE = common.hexToBytes('a100200000 29d8 a304200000');
+
+function pool(size) {
+    var uc = common.requireBundle('x86', ['reg_read_batch', 'context_save', 'tb_flush'], ['ucjs_tb_flush']);
+    return {uc: uc, pool: new UnicornPool(path.join(common.DIST_DIR, 'unicorn-x86.min.js'), size)};
+}
+
+function job(uc, regs) {
+    return {
+        arch: uc.ARCH_X86,
+        mode: uc.MODE_32,
+        memory: [
+            {address: 0x1000, size: 0x1000, data: CODE},
+            {address: 0x2000, size: 0x1000, perms: uc.PROT_READ | uc.PROT_WRITE, data: new Uint8Array([2]).buffer}
+        ],
+        regs: regs,
+        begin: 0x1000,
+        until: 0x1000 + CODE.length,
+        output: {regs: [uc.X86_REG_EAX, uc.X86_REG_EBX, uc.X86_REG_ECX], memory: [{address: 0x2004, size: 4}]}
+    };
+}
+
+// Runs fn(t) with a pool, closing it afterwards
+function withPool(size, fn) {
+    var t = pool(size);
+    return fn(t).then(function () {
+        t.pool.close();
+    }, function (error) {
+        t.pool.close();
+        throw error;
+    });
+}
+
+module.exports = {
+    'jobs return registers and memory': function () {
+        return withPool(2, function (t) {
+            var regs = {};
+            regs[t.uc.X86_REG_EBX] = 40;
+            return Promise.all([t.pool.run(job(t.uc, regs)), t.pool.run(job(t.uc, regs))]).then(function (results) {
+                results.forEach(function (result) {
+                    assert.strictEqual(result.error, null);
+                    assert.deepEqual(Array.prototype.slice.call(result.regs), [42, 40, 0]);
+                    assert.deepEqual(Array.prototype.slice.call(new Uint8Array(result.memory[0])), [42, 0, 0, 0]);
+                });
+            });
+        });
+    },
+
+    'engines are reset between jobs': function () {
+        return withPool(1, function (t) {
+            var regs = {};
+            regs[t.uc.X86_REG_EBX] = 1;
+            regs[t.uc.X86_REG_ECX] = 7;
+            return t.pool.run(job(t.uc, regs)).then(function (result) {
+                assert.deepEqual(Array.prototype.slice.call(result.regs), [3, 1, 7]);
+                // Same regions, mapped again, and registers back to their initial values
+                return t.pool.run(job(t.uc, {}));
+            }).then(function (result) {
+                assert.strictEqual(result.error, null);
+                assert.deepEqual(Array.prototype.slice.call(result.regs), [2, 0, 0]);
+                // Nothing mapped at all
+                var empty = job(t.uc, {});
+                empty.memory = [];
+                empty.output.memory = [];
+                return t.pool.run(empty);
+            }).then(function (result) {
+                assert.ok(new RegExp('code ' + t.uc.ERR_FETCH_UNMAPPED).test(result.error));
+            });
+        });
+    },
+
+    'jobs run their own code at the same addresses': function () {
+        return withPool(1, function (t) {
+            var regs = {};
+            regs[t.uc.X86_REG_EBX] = 1;
+            return t.pool.run(job(t.uc, regs)).then(function (result) {
+                assert.deepEqual(Array.prototype.slice.call(result.regs), [3, 1, 0]);
+                var sub = job(t.uc, regs);
+                sub.memory[0].data = SUB_CODE;
+                return t.pool.run(sub);
+            }).then(function (result) {
+                assert.strictEqual(result.error, null);
+                assert.deepEqual(Array.prototype.slice.call(result.regs), [1, 1, 0]);
+            });
+        });
+    },
+
+    'failed jobs still return their output': function () {
+        return withPool(1, function (t) {
+            var faulting = job(t.uc, {});
+            faulting.memory[1].perms = t.uc.PROT_READ;
+            return t.pool.run(faulting).then(function (result) {
+                assert.ok(new RegExp('code ' + t.uc.ERR_WRITE_PROT).test(result.error));
+                assert.deepEqual(Array.prototype.slice.call(result.regs), [2, 0, 0]);
+                return t.pool.run(job(t.uc, {}));
+            }).then(function (result) {
+                assert.strictEqual(result.error, null);
+                assert.deepEqual(Array.prototype.slice.call(new Uint8Array(result.memory[0])), [2, 0, 0, 0]);
+            });
+        });
+    },
+
+    'closed pools reject jobs': function () {
+        var t = pool(1);
+        var queued = t.pool.run(job(t.uc, {}));
+        t.pool.close();
+        return queued.then(function () {
+            throw new Error('ran a job after close');
+        }, function (error) {
+            assert.ok(/closed/.test(error));
+            return t.pool.run(job(t.uc, {}));
+        }).then(function () {
+            throw new Error('ran a job after close');
+        }, function (error) {
+            assert.ok(/closed/.test(error));
+        });
+    }
+};
@@ -0,0 +1,73 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Unicorn.profile reads the counters at the offsets given by the library.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// Counters laid out at offsets unlike those of any real build
+var OFFSETS = [64, 8, 16, 0, 40, 4, 48, 32, 20, 12, 28, 4, 12, 20];
+
+function mockModule() {
+    var heap = new Uint32Array(256);
+    var profile = 0x100, helpers = 0x200, blocks = 0x300;
+    var set = function (address, value) {
+        heap[address >> 2] = value;
+    };
+    set(profile + 0, 2);                // nb_ops
+    set(profile + 64, 7);               // ops[0]
+    set(profile + 72, 1);               // ops[1]
+    set(profile + 76, 1);               // ops[1], high word
+    set(profile + 8, 3);                // tlb_misses
+    set(profile + 16, 4);               // tb_flushes
+    set(profile + 40, helpers);
+    set(profile + 4, 1);                // nb_helpers
+    set(helpers + 12, 9);               // helpers[0].calls
+    set(profile + 48, blocks);
+    set(profile + 32, 2);               // nb_blocks
+    [[0x1000, 5, 1], [0x1008, 6, 2]].forEach(function (block, i) {
+        set(blocks + 28 * i + 4, block[0]);
+        set(blocks + 28 * i + 12, block[1]);
+        set(blocks + 28 * i + 20, block[2]);
+    });
+    var Module = {
+        HEAPU32: heap,
+        _ucjs_profile_get: function () { return profile; },
+        _ucjs_profile_offset: function (field) { return OFFSETS[field] || 0; },
+        ccall: function (name, type, types, args) { return name + ' ' + args[1]; }
+    };
+    return function () { return Module; };
+}
+
+module.exports = {
+    'counters are read at the exported offsets': function () {
+        var uc = common.loadWrapper(mockModule()).uc;
+        var profile = uc.Unicorn.prototype.profile.call({handle: 1});
+        assert.deepEqual(Array.prototype.slice.call(profile.ops), [7, 0x100000001]);
+        assert.deepEqual(profile.op_names, ['ucjs_profile_op_name 0', 'ucjs_profile_op_name 1']);
+        assert.deepEqual(Array.prototype.slice.call(profile.helpers), [9]);
+        assert.deepEqual(Array.prototype.slice.call(profile.blocks), [0x1000, 5, 1, 0x1008, 6, 2]);
+        assert.strictEqual(profile.tlb_misses, 3);
+        assert.strictEqual(profile.tb_flushes, 4);
+    },
+
+    'profiling bundles count executed blocks': function () {
+        var uc = common.requireBundle('x86', ['profile'], ['ucjs_profile_get', 'ucjs_profile_offset']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        // mov ecx, 10; l: dec ecx; jnz l
+        var code = common.hexToBytes('b90a000000 49 75fd');
+        e.mem_map(0x10000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x10000, code);
+        e.emu_start(0x10000, 0x10000 + code.length, 0, 0);
+        var profile = e.profile();
+        e.close();
+        var execs = 0;
+        for (var i = 0; i < profile.blocks.length; i += 3) {
+            execs += profile.blocks[i + 1];
+        }
+        assert.ok(execs >= 10, 'block executions: ' + execs);
+    }
+};
@@ -0,0 +1,126 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * snapshot_restore copies back memory written in any way since the snapshot.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+var BASE = 0x10000;
+
+function engine() {
+    var uc = common.requireBundle('x86', ['snapshot', 'mem_map_ptr'], ['ucjs_snapshot_dirty']);
+    var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+    e.mem_map(BASE, 0x1000, uc.PROT_ALL);
+    e.mem_map(BASE + 0x1000, 0x2000, uc.PROT_ALL);
+    // mov [ebx], eax; hlt
+    e.mem_write(BASE, common.hexToBytes('8903 f4'));
+    return {uc: uc, e: e};
+}
+
+function read32(e, address) {
+    var bytes = e.mem_read(address, 4);
+    return (bytes[0] | bytes[1] << 8 | bytes[2] << 16 | bytes[3] << 24) >>> 0;
+}
+
+// Runs code that stores value at address, twice so the second store hits
+// the TLB inline
+function store(t, address, value) {
+    t.e.reg_write_i32(t.uc.X86_REG_EBX, address);
+    t.e.reg_write_i32(t.uc.X86_REG_EAX, value);
+    t.e.emu_start(BASE, BASE + 2, 0, 0);
+    t.e.emu_start(BASE, BASE + 2, 0, 0);
+}
+
+module.exports = {
+    'memory with views is marked before restoring': function () {
+        var marked = [];
+        var Module = {
+            _ucjs_snapshot_mark: function () { marked.push(Array.prototype.slice.call(arguments)); },
+            _ucjs_snapshot_dirty: function () { return 3; },
+            _ucjs_snapshot_restore: function () { return 0; }
+        };
+        var uc = common.loadWrapper(function () { return Module; }).uc;
+        var pages = uc.Unicorn.prototype.snapshot_restore.call({
+            handle: 1,
+            ptr_regions: [
+                {address: 0x100000000, size: 0x2000, viewed: true},
+                {address: 0x1000, size: 0x1000, viewed: false}
+            ]
+        }, 42);
+        // The module keeps the low 32 bits of the address argument
+        assert.deepEqual(marked, [[42, 0x100000000, 1, 0x2000]]);
+        assert.strictEqual(pages, 3);
+    },
+
+    'guest stores are restored': function () {
+        var t = engine();
+        store(t, BASE + 0x1800, 0x11223344);
+        var snapshot = t.e.snapshot();
+        store(t, BASE + 0x1800, 0x55667788);
+        assert.strictEqual(read32(t.e, BASE + 0x1800), 0x55667788);
+        assert.strictEqual(t.e.snapshot_restore(snapshot), 1);
+        assert.strictEqual(read32(t.e, BASE + 0x1800), 0x11223344);
+        t.e.close();
+    },
+
+    'mem_write is restored': function () {
+        var t = engine();
+        var snapshot = t.e.snapshot();
+        t.e.mem_write(BASE + 0x2ffe, [1, 2]);
+        assert.strictEqual(t.e.snapshot_restore(snapshot), 1);
+        assert.deepEqual(Array.prototype.slice.call(t.e.mem_read(BASE + 0x2ffe, 2)), [0, 0]);
+        t.e.close();
+    },
+
+    'writes through views are restored': function () {
+        var t = engine();
+        var view = t.e.mem_map_ptr(0x20000, 0x2000, t.uc.PROT_ALL);
+        var snapshot = t.e.snapshot();
+        view[0x10] = 1;
+        t.e.mem_view(0x21000, 0x10)[0] = 2;
+        t.e.snapshot_restore(snapshot);
+        assert.strictEqual(t.e.mem_read(0x20010, 1)[0], 0);
+        assert.strictEqual(t.e.mem_read(0x21000, 1)[0], 0);
+        t.e.close();
+    },
+
+    'loaded images are restored': function () {
+        var t = engine();
+        t.uc.load_image(t.e, new Uint8Array([0x90, 0x90]), {format: 'raw', base: 0x40000});
+        var snapshot = t.e.snapshot();
+        t.e.mem_view(0x40000, 2).set([0xcc, 0xcc]);
+        store(t, 0x40800, 0x12345678);
+        t.e.snapshot_restore(snapshot);
+        assert.deepEqual(Array.prototype.slice.call(t.e.mem_read(0x40000, 2)), [0x90, 0x90]);
+        assert.strictEqual(read32(t.e, 0x40800), 0);
+        t.e.close();
+    },
+
+    'newer snapshots see pages restored from older ones': function () {
+        var t = engine();
+        var older = t.e.snapshot();
+        t.e.mem_write(BASE + 0x1000, [1]);
+        var newer = t.e.snapshot();
+        t.e.snapshot_restore(older);
+        assert.strictEqual(t.e.mem_read(BASE + 0x1000, 1)[0], 0);
+        t.e.snapshot_restore(newer);
+        assert.strictEqual(t.e.mem_read(BASE + 0x1000, 1)[0], 1);
+        t.e.close();
+    },
+
+    'mapping changes make restoring fail': function () {
+        var t = engine();
+        var snapshot = t.e.snapshot();
+        t.e.mem_protect(BASE + 0x2000, 0x1000, t.uc.PROT_READ);
+        t.e.snapshot_restore(snapshot);
+        t.e.mem_map(0x30000, 0x1000, t.uc.PROT_ALL);
+        assert.throws(function () { t.e.snapshot_restore(snapshot); }, new RegExp('code ' + t.uc.ERR_MAP));
+        t.e.mem_unmap(0x30000, 0x1000);
+        t.e.mem_unmap(BASE + 0x2000, 0x1000);
+        assert.throws(function () { t.e.snapshot_restore(snapshot); }, new RegExp('code ' + t.uc.ERR_MAP));
+        t.e.close();
+    }
+};
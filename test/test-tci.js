@@ -0,0 +1,118 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Guest code run by the TCG interpreter, checked against known results.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+module.exports = {
+    'x86-64 loop computes fib(50)': function () {
+        var uc = common.requireBundle('x86', ['reg_read_batch'], ['ucjs_open']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_64);
+        var code = common.hexToBytes(
+            '31c0' +            // xor eax, eax
+            'ba01000000' +      // mov edx, 1
+            'b932000000' +      // mov ecx, 50
+            '488d1c10' +        // l: lea rbx, [rax + rdx]
+            '4889d0' +          // mov rax, rdx
+            '4889da' +          // mov rdx, rbx
+            'ffc9' +            // dec ecx
+            '75f2');            // jnz l
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.emu_start(0x1000, 0x1000 + code.length, 0, 0);
+        assert.strictEqual(e.reg_read_batch([uc.X86_REG_RAX], 'i64')[0], 12586269025);
+        e.close();
+    },
+
+    'ARM loop computes fib(40)': function () {
+        var uc = common.requireBundle('arm', [], ['ucjs_open']);
+        var e = new uc.Unicorn(uc.ARCH_ARM, uc.MODE_ARM);
+        var code = common.hexToBytes(
+            '0000a0e3' +        // mov r0, #0
+            '0110a0e3' +        // mov r1, #1
+            '2820a0e3' +        // mov r2, #40
+            '013080e0' +        // l: add r3, r0, r1
+            '0100a0e1' +        // mov r0, r1
+            '0310a0e1' +        // mov r1, r3
+            '012052e2' +        // subs r2, r2, #1
+            'faffff1a');        // bne l
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.emu_start(0x1000, 0x1000 + code.length, 0, 0);
+        assert.strictEqual(e.reg_read_i32(uc.ARM_REG_R0), 102334155);
+        e.close();
+    },
+
+    'x86 helpers take 32-bit and 64-bit arguments': function () {
+        var uc = common.requireBundle('x86', ['reg_read_batch'], ['ucjs_open']);
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        var code = common.hexToBytes(
+            'ba01000000' +      // mov edx, 1
+            'b807000000' +      // mov eax, 7
+            'b903000000' +      // mov ecx, 3
+            'f7f1');            // div ecx
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.emu_start(0x1000, 0x1000 + code.length, 0, 0);
+        assert.deepEqual(Array.prototype.slice.call(e.reg_read_batch([uc.X86_REG_EAX, uc.X86_REG_EDX], 'i32')),
+            [0x55555557, 2]);
+        e.close();
+        e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_64);
+        code = common.hexToBytes(
+            '48b82301efcdab896745' +    // mov rax, 0x456789abcdef0123
+            'ba23010000' +              // mov edx, 0x123
+            '48b90000000010000000' +    // mov rcx, 0x1000000000
+            '48f7f1');                  // div rcx
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.emu_start(0x1000, 0x1000 + code.length, 0, 0);
+        assert.deepEqual(Array.prototype.slice.call(e.reg_read_batch([uc.X86_REG_RAX, uc.X86_REG_RDX], 'i64')),
+            [0x123456789a, 0xbcdef0123]);
+        e.close();
+    },
+
+    'aarch64 helpers take five argument words': function () {
+        var uc = common.requireBundle('aarch64', [], ['ucjs_open']);
+        var e = new uc.Unicorn(uc.ARCH_ARM64, uc.MODE_ARM);
+        var code = common.hexToBytes(
+            'e1bd99d2' +        // movz x1, #0xcdef
+            '6135b1f2' +        // movk x1, #0x89ab, lsl #16
+            'e1acc8f2' +        // movk x1, #0x4567, lsl #32
+            '6124e0f2' +        // movk x1, #0x0123, lsl #48
+            '00cf8a52' +        // movz w0, #0x5678
+            '8046a272' +        // movk w0, #0x1234, lsl #16
+            '005cc19a');        // crc32cx w0, w0, x1
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.emu_start(0x1000, 0x1000 + code.length, 0, 0);
+        // helper_crc32c_64(acc, val, bytes): 64-bit, 64-bit and 32-bit words
+        assert.strictEqual(e.reg_read_i32(uc.ARM64_REG_W0) >>> 0, 0xa3d207be);
+        e.close();
+    },
+
+    'stores to translated code invalidate it': function () {
+        var uc = common.requireBundle('x86');
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        var code = common.hexToBytes(
+            'b902000000' +      // mov ecx, 2
+            'e80b000000' +      // l: call f
+            'c6051510000040' +  // mov byte [f], 0x40 (inc eax)
+            '49' +              // dec ecx
+            '75f1' +            // jnz l
+            'f4' +              // hlt
+            '90' +              // f: nop
+            'c3');              // ret
+        e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+        e.mem_map(0x8000, 0x1000, uc.PROT_ALL);
+        e.mem_write(0x1000, code);
+        e.reg_write_i32(uc.X86_REG_ESP, 0x8800);
+        e.emu_start(0x1000, 0x1014, 0, 0);
+        // The second call runs the patched instruction
+        assert.strictEqual(e.reg_read_i32(uc.X86_REG_EAX), 1);
+        e.close();
+    }
+};
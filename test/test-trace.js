@@ -0,0 +1,61 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Trace buffer of executed instructions and blocks.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+// mov ecx, 3; l: dec ecx; jnz l
+var LOOP = common.hexToBytes('b903000000 49 75fd');
+
+function engine() {
+    var uc = common.requireBundle('x86', ['trace_start'], ['ucjs_trace_open']);
+    var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+    e.mem_map(0x1000, 0x1000, uc.PROT_ALL);
+    e.mem_write(0x1000, LOOP);
+    return {uc: uc, e: e};
+}
+
+// Copies records out of the views passed to the trace callback
+function collect(records) {
+    return function (view, count, dropped) {
+        records.dropped = (records.dropped || 0) + dropped;
+        for (var i = 0; i < count; i++) {
+            records.push({address: view[4 * i], size: view[4 * i + 2], type: view[4 * i + 3]});
+        }
+    };
+}
+
+module.exports = {
+    'instructions and blocks are recorded in order': function () {
+        var t = engine();
+        var records = [];
+        t.e.trace_start(t.uc.HOOK_CODE | t.uc.HOOK_BLOCK, collect(records), {capacity: 4});
+        t.e.emu_start(0x1000, 0x1000 + LOOP.length, 0, 0);
+        t.e.trace_stop();
+        var blocks = records.filter(function (r) { return r.type == t.uc.HOOK_BLOCK; });
+        var code = records.filter(function (r) { return r.type == t.uc.HOOK_CODE; });
+        assert.deepEqual(blocks.map(function (r) { return r.address; }), [0x1000, 0x1005, 0x1005]);
+        assert.deepEqual(code.map(function (r) { return r.address; }),
+            [0x1000, 0x1005, 0x1006, 0x1005, 0x1006, 0x1005, 0x1006]);
+        assert.strictEqual(code[0].size, 5);
+        assert.strictEqual(records.dropped, 0);
+        t.e.close();
+    },
+
+    'ring buffers keep the newest records': function () {
+        var t = engine();
+        var records = [];
+        t.e.trace_start(t.uc.HOOK_CODE, collect(records), {capacity: 4, ring: true});
+        t.e.emu_start(0x1000, 0x1000 + LOOP.length, 0, 0);
+        assert.strictEqual(records.length, 0);
+        assert.strictEqual(t.e.trace_drain(), 4);
+        assert.deepEqual(records.map(function (r) { return r.address; }), [0x1005, 0x1006, 0x1005, 0x1006]);
+        assert.strictEqual(records.dropped, 3);
+        t.e.trace_stop();
+        t.e.close();
+    }
+};
@@ -0,0 +1,23 @@
+/**
+ * (c) 2016-2017 Unicorn.JS
+ * Unicorn object API kept for code written against earlier wrappers.
+ */
+
+'use strict';
+
+var assert = require('assert');
+var common = require('./common.js');
+
+module.exports = {
+    'handle_ptr points to the engine handle': function () {
+        var bundle = common.loadBundle('x86');
+        var uc = bundle.uc;
+        var e = new uc.Unicorn(uc.ARCH_X86, uc.MODE_32);
+        var handle = bundle.module.getValue(e.handle_ptr, '*');
+        assert.ok(handle);
+        assert.strictEqual(bundle.module._uc_mem_map(handle, 0x1000, 0, 0x1000, uc.PROT_ALL), uc.ERR_OK);
+        e.mem_write(0x1000, [1, 2, 3, 4]);
+        assert.deepEqual(Array.prototype.slice.call(e.mem_read(0x1000, 4)), [1, 2, 3, 4]);
+        e.close();
+    }
+};
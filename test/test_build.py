@@ -0,0 +1,298 @@
+#!/usr/bin/python
+
+# INFORMATION:
+# Tests of the patching, manifest, report and constants helpers of build.py.
+# They run in a temporary folder, which build.py sees as the current directory.
+#
+# Usage: python test/test_build.py
+
+import StringIO
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+build = None
+work_dir = None
+saved_dir = None
+
+def setUpModule():
+    global build, work_dir, saved_dir
+    saved_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp()
+    os.chdir(work_dir)
+    os.makedirs('unicorn')
+    sys.path.insert(0, ROOT_DIR)
+    sys.dont_write_bytecode = True
+    import build
+
+def tearDownModule():
+    os.chdir(saved_dir)
+    shutil.rmtree(work_dir)
+
+def writeFile(path, data):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def readFile(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+class PatchPlanTest(unittest.TestCase):
+    def test_edits_are_applied_in_one_pass(self):
+        plan = build.PatchPlan([
+            ('replace', (('foo', 'bar'),)),
+            ('insert', '  int x;  ', ('int y;',)),
+            ('insert', 'int x;', ('int z;',)),
+            ('prepend', '// first\n'),
+            ('append', '// last\n'),
+        ])
+        code, counts = plan.apply(['foo(foo);\n', 'int x;\n'])
+        self.assertEqual(code, '// first\nbar(bar);\nint x;\nint y;\nint z;\n// last\n')
+        self.assertEqual(counts, {'foo': 2, 'int x;': 1})
+
+    def test_longest_pattern_wins(self):
+        plan = build.PatchPlan([('replace', (('ab', 'x'), ('abc', 'y')))])
+        self.assertEqual(plan.apply(['abcab\n']), ('yx\n', {'ab': 1, 'abc': 1}))
+
+    def test_replacements_may_add_lines(self):
+        plan = build.PatchPlan([('replace', (('a;', 'a;\nb;'),))])
+        self.assertEqual(plan.apply(['a;\n'])[0], 'a;\nb;\n')
+
+    def test_inserts_match_the_original_line(self):
+        plan = build.PatchPlan([('replace', (('x', 'y'),)), ('insert', 'x', ('z',))])
+        self.assertEqual(plan.apply(['x\n'])[0], 'y\nz\n')
+
+    def test_unmatched_patterns_are_counted(self):
+        plan = build.PatchPlan([('replace', (('gone', 'x'),)), ('insert', 'also gone', ('y',))])
+        self.assertEqual(plan.apply(['a\n']), ('a\n', {'gone': 0, 'also gone': 0}))
+
+    def test_invalid_edits(self):
+        self.assertRaises(build.PatchError, build.PatchPlan, [('replace', (('a\nb', 'c'),))])
+        self.assertRaises(build.PatchError, build.PatchPlan,
+            [('replace', (('a', 'b'),)), ('replace', (('a', 'c'),))])
+        # The same replacement from two patches is fine
+        build.PatchPlan([('replace', (('a', 'b'),)), ('replace', (('a', 'b'),))])
+
+class ApplyPatchesTest(unittest.TestCase):
+    def setUp(self):
+        self.stdout = sys.stdout
+        sys.stdout = StringIO.StringIO()
+        self.path = os.path.join(build.UNICORN_DIR, 'patch.c')
+        writeFile(self.path, 'int a;\nint b;\n')
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        for path in [self.path, self.path + '.bak']:
+            if os.path.exists(path):
+                os.remove(path)
+        build.saveManifest({})
+
+    def test_patches_are_applied_and_recorded(self):
+        build.replace(self.path, {'int a;': 'long a;'})
+        build.insert(self.path, 'int b;', ['int c;'])
+        build.applyPatches()
+        self.assertEqual(build.PATCHES, {})
+        self.assertEqual(readFile(self.path), 'long a;\nint b;\nint c;\n')
+        manifest = build.loadManifest()
+        self.assertIn('patch.c', manifest['files'])
+        self.assertEqual(manifest['matches']['patch.c'], {'int a;': 1, 'int b;': 1})
+
+    def test_stale_patterns_fail(self):
+        build.replace(self.path, {'int a;': 'long a;', 'int gone;': 'long gone;'})
+        build.replace(os.path.join(build.UNICORN_DIR, 'missing.c'), {'a': 'b'})
+        try:
+            build.applyPatches()
+            self.fail('PatchError not raised')
+        except build.PatchError as e:
+            self.assertIn('patch.c: pattern not found: int gone;', str(e))
+            self.assertIn('missing.c: file not found', str(e))
+        self.assertEqual(build.PATCHES, {})
+        # The file is left as it was, and patched again on the next run
+        self.assertEqual(readFile(self.path), 'int a;\nint b;\n')
+        self.assertNotIn('patch.c', build.loadManifest()['files'])
+
+class ManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(dir=work_dir)
+
+    def test_missing_manifest_is_empty(self):
+        self.assertEqual(build.loadManifest(self.dir), {})
+
+    def test_manifest_round_trip(self):
+        manifest = {'files': {'uc.c': 'abc'}, 'matches': {'uc.c': {'x': 1}}}
+        build.saveManifest(manifest, self.dir)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, build.MANIFEST_NAME)))
+        self.assertEqual(build.loadManifest(self.dir), manifest)
+
+    def test_patched_file_is_skipped_until_source_or_edits_change(self):
+        path = os.path.join(self.dir, 'a.c')
+        writeFile(path, 'int a;\n')
+        edits = [('replace', (('int a;', 'long a;'),))]
+        _, digest, counts, changed = build.patchFile((path, edits, None))
+        self.assertTrue(changed)
+        self.assertEqual(counts, {'int a;': 1})
+        self.assertEqual(readFile(path), 'long a;\n')
+        self.assertEqual(readFile(path + '.bak'), 'int a;\n')
+        # Same pristine source and edits
+        self.assertEqual(build.patchFile((path, edits, digest)), (path, digest, None, False))
+        # Deleted outputs are written again
+        os.remove(path)
+        self.assertTrue(build.patchFile((path, edits, digest))[3])
+        # New edits are applied to the pristine source
+        edits = [('replace', (('int a;', 'short a;'),))]
+        _, other, _, changed = build.patchFile((path, edits, digest))
+        self.assertNotEqual(other, digest)
+        self.assertTrue(changed)
+        self.assertEqual(readFile(path), 'short a;\n')
+
+    def test_missing_file(self):
+        path = os.path.join(self.dir, 'missing.c')
+        self.assertEqual(build.patchFile((path, [], None)), (path, None, None, False))
+
+class CopytreeTest(unittest.TestCase):
+    def setUp(self):
+        self.src = tempfile.mkdtemp(dir=work_dir)
+        self.dst = tempfile.mkdtemp(dir=work_dir)
+        writeFile(os.path.join(self.src, 'tci.c'), 'tci 1\n')
+        writeFile(os.path.join(self.src, 'tcg', 'tci', 'tcg-target.c'), 'target 1\n')
+
+    def test_files_are_copied_and_recorded(self):
+        copied = {}
+        build.copytree(self.src, self.dst, copied)
+        self.assertEqual(readFile(os.path.join(self.dst, 'tcg', 'tci', 'tcg-target.c')), 'target 1\n')
+        self.assertEqual(sorted(copied), ['tcg/tci/tcg-target.c', 'tci.c'])
+        self.assertEqual(copied['tci.c'], build.hashFiles([os.path.join(self.src, 'tci.c')]))
+
+    def test_changed_sources_update_copied_files(self):
+        copied = {}
+        build.copytree(self.src, self.dst, copied)
+        writeFile(os.path.join(self.src, 'tci.c'), 'tci 2\n')
+        build.copytree(self.src, self.dst, copied)
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c')), 'tci 2\n')
+
+    def test_patched_files_are_updated_through_their_backup(self):
+        copied = {}
+        build.copytree(self.src, self.dst, copied)
+        shutil.copy2(os.path.join(self.dst, 'tci.c'), os.path.join(self.dst, 'tci.c.bak'))
+        writeFile(os.path.join(self.dst, 'tci.c'), 'patched\n')
+        writeFile(os.path.join(self.src, 'tci.c'), 'tci 2\n')
+        build.copytree(self.src, self.dst, copied)
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c.bak')), 'tci 2\n')
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c')), 'patched\n')
+
+    def test_files_not_copied_in_are_left_alone(self):
+        writeFile(os.path.join(self.dst, 'tci.c'), 'own\n')
+        build.copytree(self.src, self.dst, {})
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c')), 'own\n')
+        build.copytree(self.src, self.dst, {}, tracked=set(['tci.c']))
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c')), 'own\n')
+
+    def test_untracked_files_of_earlier_trees_are_updated(self):
+        writeFile(os.path.join(self.dst, 'tci.c'), 'tci 0\n')
+        copied = {}
+        build.copytree(self.src, self.dst, copied, tracked=set())
+        self.assertEqual(readFile(os.path.join(self.dst, 'tci.c')), 'tci 1\n')
+        self.assertIn('tci.c', copied)
+
+class CompareReportsTest(unittest.TestCase):
+    def setUp(self):
+        self.stdout = sys.stdout
+        sys.stdout = StringIO.StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+
+    def report(self, patch, compile, size, gzip):
+        return {
+            'phases': {'patch': patch},
+            'targets': {'x86': {
+                'phases': {'compile': compile},
+                'artifacts': {'libunicorn-x86.out.js': {'size': size, 'gzip': gzip}},
+            }},
+        }
+
+    def test_equal_reports(self):
+        report = self.report(1.0, 60.0, 1000, 300)
+        self.assertEqual(build.compareReports(report, report), [])
+
+    def test_sizes_above_threshold(self):
+        old = self.report(1.0, 60.0, 1000, 300)
+        new = self.report(1.0, 60.0, 1040, 320)
+        self.assertEqual(build.compareReports(old, new),
+            ['x86: libunicorn-x86.out.js (gzip)'])
+        self.assertEqual(build.compareReports(old, new, threshold=3.0),
+            ['x86: libunicorn-x86.out.js (size)', 'x86: libunicorn-x86.out.js (gzip)'])
+
+    def test_times_above_threshold_and_slack(self):
+        # The patch phase grows by half, but by less than TIME_SLACK seconds
+        old = self.report(1.0, 60.0, 1000, 300)
+        new = self.report(1.5, 90.0, 1000, 300)
+        self.assertEqual(build.compareReports(old, new), ['x86: phase compile'])
+
+    def test_missing_entries_are_not_regressions(self):
+        old = self.report(1.0, 60.0, 1000, 300)
+        self.assertEqual(build.compareReports(old, {}), [])
+        self.assertIn('x86: missing from new report', sys.stdout.getvalue())
+        new = self.report(1.0, 60.0, 1000, 300)
+        del new['targets']['x86']['artifacts']['libunicorn-x86.out.js']
+        self.assertEqual(build.compareReports(old, new), [])
+
+class ConstantsTest(unittest.TestCase):
+    def setUp(self):
+        self.bindings = os.path.join(build.UNICORN_DIR, 'bindings', 'python', 'unicorn')
+        writeFile(os.path.join(self.bindings, 'unicorn_const.py'), '\n'.join([
+            '# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT',
+            'UC_API_MAJOR = 1',
+            '',
+            'UC_ARCH_ARM = 1',
+            'UC_ARCH_ARM64 = 2',
+            'UC_ARCH_MIPS = 3',
+            'UC_ARCH_X86 = 4',
+            'UC_PROT_ALL = 7',
+            'UC_HOOK_MEM_INVALID = 0x3f0',
+        ]) + '\n')
+        writeFile(os.path.join(self.bindings, 'arm_const.py'),
+            'UC_ARM_REG_R0 = 66\nUC_ARM_REG_R1 = 67\n')
+        writeFile(os.path.join(self.bindings, 'x86_const.py'), 'UC_X86_INS_INVALID = -1\n')
+        if not os.path.exists('src'):
+            os.makedirs('src')
+
+    def tearDown(self):
+        shutil.rmtree(os.path.join(build.UNICORN_DIR, 'bindings'))
+        shutil.rmtree('src')
+
+    def test_constants_of_selected_targets(self):
+        build.generateConstants(['arm'])
+        code = readFile('src/unicorn-constants-arm.js').splitlines()
+        self.assertEqual(code[0], '// Unicorn.js constants [core, arm]. AUTO-GENERATED FILE, DO NOT EDIT')
+        self.assertEqual(code[2:8], [
+            'uc.API_MAJOR = 1;',
+            "define('ARCH_', 1, 'ARM ARM64 MIPS X86');",
+            'uc.PROT_ALL = 7;',
+            'uc.HOOK_MEM_INVALID = 1008;',
+            'uc.ARM_REG_R0 = 66;',
+            'uc.ARM_REG_R1 = 67;',
+        ])
+        core = readFile('src/unicorn-constants-core.js')
+        self.assertIn('[core]', core)
+        self.assertNotIn('ARM_REG', core)
+
+    def test_negative_values(self):
+        self.assertEqual(build.parseConstants(os.path.join(self.bindings, 'x86_const.py')),
+            [('X86_INS_INVALID', -1)])
+
+    def test_invalid_files(self):
+        writeFile(os.path.join(self.bindings, 'x86_const.py'), 'UC_ARM_REG_R0 = 1\n')
+        self.assertRaises(ValueError, build.writeConstants, 'src/unicorn-constants.js', ['arm', 'x86'])
+        writeFile(os.path.join(self.bindings, 'x86_const.py'), 'UC_X86_REG_EAX = UC_X86_REG_AX\n')
+        self.assertRaises(ValueError, build.writeConstants, 'src/unicorn-constants.js', ['x86'])
+
+if __name__ == '__main__':
+    unittest.main()